@@ -0,0 +1,200 @@
+"""
+Shared helpers for the benchmark suite.
+
+Fixture databases are built by executing one real run through the Router
+(so replay invariants hold) and cloning its event stream with fresh run and
+event IDs via executemany. Generated files are cached in the work directory,
+keyed by package version and shape, so large sizes are only built once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import nexus_router
+from nexus_router.event_store import EventStore
+from nexus_router.router import Router
+from nexus_router.synthetic_adapter import SyntheticAdapter
+
+DEFAULT_WORKDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by every benchmark script and run_all.py."""
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=parse_sizes("1e3,1e4,1e5"),
+        help="fixture DB sizes in events, comma-separated (default 1e3,1e4,1e5; up to 1e6)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (default 5)")
+    parser.add_argument("--steps", type=int, default=3, help="steps per fixture run (default 3)")
+    parser.add_argument(
+        "--output-bytes", type=int, default=16384, help="tool output size for export/import"
+    )
+    parser.add_argument("--workdir", default=DEFAULT_WORKDIR, help="fixture DB cache directory")
+
+
+def timeit(fn: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def median_time(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time in seconds (for calls whose inputs vary per iteration)."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def parse_sizes(text: str) -> list[int]:
+    """Parse "1e3,1e4,100000" into ints."""
+    return [int(float(part)) for part in text.split(",") if part.strip()]
+
+
+def make_request(steps: int, *, mode: str = "apply") -> dict[str, Any]:
+    """Run request with `steps` synthetic calls."""
+    request: dict[str, Any] = {
+        "goal": f"bench {steps} steps",
+        "mode": mode,
+        "plan_override": [
+            {
+                "step_id": f"s{i}",
+                "intent": "synthetic",
+                "call": {"tool": "synthetic", "method": "op", "args": {"i": i}},
+            }
+            for i in range(steps)
+        ],
+    }
+    if mode == "apply":
+        request["policy"] = {"allow_apply": True}
+    return request
+
+
+def template_run(
+    steps: int, output_bytes: int
+) -> tuple[dict[str, Any], list[tuple[int, str, str]]]:
+    """Execute one apply run in memory; return its run row and (seq, type, payload_json)."""
+    with EventStore(":memory:") as store:
+        adapter = SyntheticAdapter(output_bytes=output_bytes)
+        run_id = Router(store, adapter=adapter).run(make_request(steps))["run"]["run_id"]
+        store.conn.row_factory = sqlite3.Row
+        run_row = dict(
+            store.conn.execute(
+                "SELECT run_id, mode, goal, status FROM runs WHERE run_id=?", (run_id,)
+            ).fetchone()
+        )
+        events = store.conn.execute(
+            "SELECT seq, type, payload_json FROM events WHERE run_id=? ORDER BY seq", (run_id,)
+        ).fetchall()
+    return run_row, [(e["seq"], e["type"], e["payload_json"]) for e in events]
+
+
+def build_db(path: str, *, events: int, steps: int = 3, output_bytes: int = 64) -> dict[str, Any]:
+    """
+    Create a store at `path` holding at least `events` events.
+
+    Returns:
+        Shape of the generated DB: runs, events, events_per_run, bytes.
+    """
+    run_row, template = template_run(steps, output_bytes)
+    template_id = run_row["run_id"]
+    runs = max(1, -(-events // len(template)))
+
+    with EventStore(path) as store:
+        conn = store.conn
+        conn.execute("PRAGMA synchronous=OFF")
+        batch = 1000
+        with conn:
+            for start in range(0, runs, batch):
+                run_ids = [str(uuid.uuid4()) for _ in range(min(batch, runs - start))]
+                conn.executemany(
+                    "INSERT INTO runs(run_id, mode, goal, status) VALUES (?, ?, ?, ?)",
+                    [(rid, run_row["mode"], run_row["goal"], run_row["status"]) for rid in run_ids],
+                )
+                conn.executemany(
+                    "INSERT INTO events(event_id, run_id, seq, type, payload_json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (str(uuid.uuid4()), rid, seq, etype, pj.replace(template_id, rid))
+                        for rid in run_ids
+                        for seq, etype, pj in template
+                    ],
+                )
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    return {
+        "runs": runs,
+        "events": runs * len(template),
+        "events_per_run": len(template),
+        "bytes": os.path.getsize(path),
+    }
+
+
+def fixture_db(
+    workdir: str, *, events: int, steps: int = 3, output_bytes: int = 64
+) -> tuple[str, dict[str, Any]]:
+    """Path and shape of a cached fixture DB, building it on first use."""
+    os.makedirs(workdir, exist_ok=True)
+    name = f"fixture-v{nexus_router.__version__}-e{events}-s{steps}-o{output_bytes}"
+    path = os.path.join(workdir, name + ".db")
+    meta_path = os.path.join(workdir, name + ".json")
+    if os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            return path, json.load(f)
+    for stale in (path, path + "-wal", path + "-shm"):
+        if os.path.exists(stale):
+            os.remove(stale)
+    shape = build_db(path, events=events, steps=steps, output_bytes=output_bytes)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(shape, f)
+    return path, shape
+
+
+def sample_run_ids(db_path: str, count: int) -> list[str]:
+    """Up to `count` run IDs spread across the DB."""
+    conn = sqlite3.connect(db_path)
+    try:
+        (total,) = conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+        step = max(1, total // max(1, count))
+        rows = conn.execute(
+            "SELECT run_id FROM (SELECT run_id, ROW_NUMBER() OVER (ORDER BY rowid) AS n "
+            "FROM runs) WHERE (n - 1) % ? = 0 LIMIT ?",
+            (step, count),
+        ).fetchall()
+        return [r[0] for r in rows]
+    finally:
+        conn.close()
+
+
+def environment() -> dict[str, Any]:
+    """Versions needed to compare results across releases and machines."""
+    return {
+        "nexus_router": nexus_router.__version__,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def emit(benchmark: str, results: list[dict[str, Any]]) -> None:
+    """Print one benchmark's results as JSON on stdout."""
+    print(json.dumps({"benchmark": benchmark, "results": results}, indent=2))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark: export_run / import_bundle throughput in MB/s.
+
+Exports a run with large tool outputs and imports the bundle into a fresh DB,
+both with the default safety checks (digest verification and replay) and with
+them disabled, to separate serialization cost from verification cost. Every
+fixture run is also moved in bulk both ways: export/import per run versus one
+transfer.copy_runs call (ATTACH + INSERT ... SELECT). Emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_export_import.py [--steps 10] [--output-bytes 16384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any
+
+from _common import add_arguments, emit, fixture_db, sample_run_ids, timeit
+
+from nexus_router.export import export_run
+from nexus_router.import_ import import_bundle
+from nexus_router.transfer import copy_runs
+
+BENCHMARK = "export_import"
+FIXTURE_RUNS = 20
+
+
+def collect(opts: argparse.Namespace) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    # Size the fixture so it holds about FIXTURE_RUNS runs of the requested shape
+    events = FIXTURE_RUNS * (4 * opts.steps + 5)
+    path, _ = fixture_db(
+        opts.workdir, events=events, steps=opts.steps, output_bytes=opts.output_bytes
+    )
+    run_id = sample_run_ids(path, 1)[0]
+
+    bundle = export_run(db_path=path, run_id=run_id)["artifact"]
+    mb = len(json.dumps(bundle, sort_keys=True, separators=(",", ":"))) / 1_000_000
+    sizes = {"events": len(bundle["events"]), "bundle_mb": round(mb, 3)}
+
+    seconds = timeit(lambda: export_run(db_path=path, run_id=run_id), opts.repeat)
+    results.append(
+        {
+            "name": "export_run",
+            **sizes,
+            "seconds": round(seconds, 6),
+            "mb_per_s": round(mb / seconds, 2),
+        }
+    )
+
+    tmp = tempfile.mkdtemp(prefix="nexus-bench-")
+    try:
+        variants = {
+            "verified": {},
+            "unverified": {"verify_digest": False, "replay_after_import": False},
+        }
+        for label, kwargs in variants.items():
+            target = os.path.join(tmp, f"{label}.db")
+
+            def do_import(t: str = target, kw: dict[str, Any] = kwargs) -> None:
+                resp = import_bundle(db_path=t, bundle=bundle, mode="new_run_id", **kw)
+                if resp["status"] != "ok":
+                    raise RuntimeError(f"import failed: {resp}")
+
+            seconds = timeit(do_import, opts.repeat)
+            results.append(
+                {
+                    "name": f"import_bundle.{label}",
+                    **sizes,
+                    "seconds": round(seconds, 6),
+                    "mb_per_s": round(mb / seconds, 2),
+                }
+            )
+
+        # Bulk move of every fixture run: JSON round trip vs. ATTACH copy
+        all_ids = sample_run_ids(path, FIXTURE_RUNS * 2)
+        bulk_mb = mb * len(all_ids)
+        bulk = {"runs": len(all_ids), "bundle_mb": round(bulk_mb, 3)}
+
+        def roundtrip_all(t: str = os.path.join(tmp, "bulk_roundtrip.db")) -> None:
+            for rid in all_ids:
+                artifact = export_run(db_path=path, run_id=rid)["artifact"]
+                resp = import_bundle(db_path=t, bundle=artifact, mode="overwrite")
+                if resp["status"] != "ok":
+                    raise RuntimeError(f"import failed: {resp}")
+
+        def copy_all(t: str = os.path.join(tmp, "bulk_copy.db")) -> None:
+            resp = copy_runs(src_db=path, dst_db=t, run_ids=all_ids, conflict_mode="overwrite")
+            if not resp["ok"]:
+                raise RuntimeError(f"copy failed: {resp}")
+
+        for label, fn in (("bulk.export_import", roundtrip_all), ("bulk.copy_runs", copy_all)):
+            seconds = timeit(fn, opts.repeat)
+            results.append(
+                {
+                    "name": label,
+                    **bulk,
+                    "seconds": round(seconds, 6),
+                    "mb_per_s": round(bulk_mb / seconds, 2),
+                }
+            )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    emit(BENCHMARK, collect(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
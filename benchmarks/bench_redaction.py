@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Benchmark: redaction of large text and args trees.
+
+Compares the single-pass default_redact_text / copy-on-write default_redact_args
+against the legacy four-pass / full-rebuild implementations (kept inline here
+for reference) and emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_redaction.py [--size-mb 4] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from nexus_router.dispatch import default_redact_args, default_redact_text
+
+_LEGACY_KEY_PATTERN = re.compile(
+    r"(?i)(token|secret|password|api[_-]?key|authorization|cookie|credential|private[_-]?key)"
+)
+
+
+def legacy_redact_text(text: str) -> str:
+    """Four-pass implementation shipped up to v1.1."""
+    text = re.sub(r"Bearer\s+[A-Za-z0-9_\-\.]+", "Bearer [REDACTED]", text)
+    text = re.sub(r"(?i)(api[_-]?key[=:]\s*)['\"]?[A-Za-z0-9_\-]+['\"]?", r"\1[REDACTED]", text)
+    text = re.sub(
+        r"(?i)(token|secret|password|cookie)[=:]\s*['\"]?[^\s'\"]+['\"]?",
+        r"\1=[REDACTED]",
+        text,
+    )
+    text = re.sub(
+        r"(?i)authorization[=:]\s*(?!Bearer\s)['\"]?[^\s'\"]+['\"]?",
+        "authorization=[REDACTED]",
+        text,
+    )
+    return text
+
+
+def legacy_redact_args(args: dict[str, Any]) -> dict[str, Any]:
+    """Full-rebuild implementation shipped up to v1.1."""
+
+    def redact(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return {
+                k: "[REDACTED]" if _LEGACY_KEY_PATTERN.search(k) else redact(v)
+                for k, v in obj.items()
+            }
+        if isinstance(obj, list):
+            return [redact(item) for item in obj]
+        return obj
+
+    return redact(args)  # type: ignore[no-any-return]
+
+
+def make_text(size_mb: float, secret_every: int) -> str:
+    """Log-like text with a line containing secrets every `secret_every` lines."""
+    plain = "INFO 2026-01-01T00:00:00Z request ok path=/v1/items id=12345 took 12ms\n"
+    secret = "WARN auth Authorization: Bearer eyJabc.def token=abc123 api_key=zzz\n"
+    block = plain * (secret_every - 1) + secret
+    return block * max(1, int(size_mb * 1_000_000) // len(block))
+
+
+def make_args(width: int, depth: int) -> dict[str, Any]:
+    """Nested args tree with no sensitive keys."""
+    if depth == 0:
+        return {f"field_{i}": i for i in range(width)}
+    return {
+        f"node_{i}": make_args(width, depth - 1) if i == 0 else [i, str(i)] for i in range(width)
+    }
+
+
+def timeit(fn: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    opts = parser.parse_args(argv)
+
+    results: list[dict[str, Any]] = []
+
+    for label, every in (("sparse_secrets", 1000), ("dense_secrets", 10)):
+        text = make_text(opts.size_mb, every)
+        if default_redact_text(text) != legacy_redact_text(text):
+            print(f"output mismatch for {label}", file=sys.stderr)
+            return 1
+        new_s = timeit(lambda t=text: default_redact_text(t), opts.repeat)
+        old_s = timeit(lambda t=text: legacy_redact_text(t), opts.repeat)
+        mb = len(text) / 1_000_000
+        results.append(
+            {
+                "name": f"redact_text.{label}",
+                "bytes": len(text),
+                "seconds": round(new_s, 6),
+                "mb_per_s": round(mb / new_s, 2),
+                "legacy_seconds": round(old_s, 6),
+                "speedup": round(old_s / new_s, 2),
+            }
+        )
+
+    args = make_args(width=20, depth=3)
+    new_s = timeit(lambda: default_redact_args(args), opts.repeat)
+    old_s = timeit(lambda: legacy_redact_args(args), opts.repeat)
+    results.append(
+        {
+            "name": "redact_args.no_sensitive_keys",
+            "seconds": round(new_s, 6),
+            "legacy_seconds": round(old_s, 6),
+            "speedup": round(old_s / new_s, 2),
+        }
+    )
+
+    print(json.dumps({"benchmark": "redaction", "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
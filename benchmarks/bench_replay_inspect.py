@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Benchmark: replay and inspect latency versus DB size.
+
+Replays runs sampled across fixture DBs of increasing size (Python and SQL
+fast path) and times the
+inspect queries (listing, status filter, single run). Latency for a single
+run should stay flat as the DB grows; listing cost grows with run count.
+Emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_replay_inspect.py [--sizes 1e3,1e4,1e5,1e6] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any
+
+from _common import add_arguments, emit, fixture_db, median_time, sample_run_ids
+
+from nexus_router.inspect import inspect
+from nexus_router.replay import replay
+
+BENCHMARK = "replay_inspect"
+SAMPLED_RUNS = 10
+
+
+def collect(opts: argparse.Namespace) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for size in opts.sizes:
+        path, shape = fixture_db(opts.workdir, events=size, steps=opts.steps)
+        run_ids = sample_run_ids(path, SAMPLED_RUNS)
+        shape_fields = {"db_runs": shape["runs"], "db_events": shape["events"]}
+
+        for label, fast in (("replay", False), ("replay_fast", True)):
+
+            def replay_sampled(p: str = path, ids: list[str] = run_ids, f: bool = fast) -> None:
+                for run_id in ids:
+                    if not replay(db_path=p, run_id=run_id, fast=f)["ok"]:
+                        raise RuntimeError(f"fixture run {run_id} failed replay")
+
+            seconds = median_time(replay_sampled, opts.repeat) / len(run_ids)
+            results.append(
+                {
+                    "name": f"{label}.db_{size}",
+                    **shape_fields,
+                    "events_per_run": shape["events_per_run"],
+                    "seconds": round(seconds, 6),
+                }
+            )
+
+        queries: dict[str, dict[str, Any]] = {
+            "list": {},
+            "status": {"status": "COMPLETED"},
+            "run_id": {"run_id": run_ids[-1]},
+        }
+        for label, kwargs in queries.items():
+            seconds = median_time(lambda p=path, kw=kwargs: inspect(db_path=p, **kw), opts.repeat)
+            results.append(
+                {"name": f"inspect.{label}.db_{size}", **shape_fields, "seconds": round(seconds, 6)}
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    emit(BENCHMARK, collect(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
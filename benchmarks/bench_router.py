@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Benchmark: Router.run per-step overhead in dry_run and apply mode.
+
+Runs plans of increasing length against a zero-latency SyntheticAdapter on a
+file-backed store; the per-step figure is the slope between the shortest and
+longest plan, so fixed per-run costs are excluded. tool.run adds schema
+validation and store setup on top. Emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_router.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any
+
+from _common import add_arguments, emit, make_request, median_time
+
+from nexus_router import tool
+from nexus_router.event_store import EventStore
+from nexus_router.router import Router
+from nexus_router.synthetic_adapter import SyntheticAdapter
+
+BENCHMARK = "router"
+PLAN_LENGTHS = (1, 10, 50)
+
+
+def collect(opts: argparse.Namespace) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    tmp = tempfile.mkdtemp(prefix="nexus-bench-")
+    adapter = SyntheticAdapter()
+    try:
+        db_path = os.path.join(tmp, "router.db")
+        for mode in ("dry_run", "apply"):
+            per_run: dict[int, float] = {}
+            with EventStore(db_path) as store:
+                router = Router(store, adapter=adapter)
+                for steps in PLAN_LENGTHS:
+                    request = make_request(steps, mode=mode)
+                    router.run(request)  # Warm up
+                    per_run[steps] = median_time(
+                        lambda r=request, rt=router: rt.run(r), opts.repeat
+                    )
+                    results.append(
+                        {
+                            "name": f"router.run.{mode}.steps_{steps}",
+                            "steps": steps,
+                            "seconds": round(per_run[steps], 6),
+                        }
+                    )
+            lo, hi = PLAN_LENGTHS[0], PLAN_LENGTHS[-1]
+            per_step = (per_run[hi] - per_run[lo]) / (hi - lo)
+            results.append(
+                {
+                    "name": f"router.per_step.{mode}",
+                    "seconds": round(per_step, 6),
+                    "steps_per_s": round(1 / per_step, 1) if per_step > 0 else None,
+                }
+            )
+
+        request = make_request(10)
+        seconds = median_time(
+            lambda: tool.run(request, db_path=db_path, adapter=adapter), opts.repeat
+        )
+        results.append(
+            {"name": "tool.run.apply.steps_10", "steps": 10, "seconds": round(seconds, 6)}
+        )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    emit(BENCHMARK, collect(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
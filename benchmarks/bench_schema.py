@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Benchmark: JSON Schema validation cost of run requests.
+
+Compares schema.validate (the path taken by tool.run, which checks the schema
+and builds a validator on every call) against a validator built once, for
+plans of increasing length. Emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_schema.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any
+
+import jsonschema
+from _common import add_arguments, emit, make_request, timeit
+
+from nexus_router.schema import validate
+from nexus_router.tool import _load_schema
+
+BENCHMARK = "schema"
+PLAN_LENGTHS = (1, 10, 100)
+ITERATIONS = 50
+
+
+def collect(opts: argparse.Namespace) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    schema = _load_schema("nexus-router.run.request.v0.7.json")
+    validator = jsonschema.validators.validator_for(schema)(schema)
+
+    for steps in PLAN_LENGTHS:
+        request = make_request(steps)
+        variants = {
+            "validate": lambda r=request: validate(r, schema),
+            "prebuilt": lambda r=request: validator.validate(r),
+        }
+        for label, fn in variants.items():
+            seconds = timeit(lambda f=fn: [f() for _ in range(ITERATIONS)], opts.repeat)
+            results.append(
+                {
+                    "name": f"schema.{label}.steps_{steps}",
+                    "steps": steps,
+                    "seconds": round(seconds / ITERATIONS, 7),
+                }
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    emit(BENCHMARK, collect(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Benchmark: EventStore append and read throughput versus DB size.
+
+Appends to a fresh DB and to copies of fixture DBs of increasing size, so the
+cost of the per-append MAX(seq) lookup and index maintenance shows up as the
+store grows. Emits JSON results on stdout.
+
+Usage:
+    python benchmarks/bench_store.py [--sizes 1e3,1e4,1e5] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any
+
+from _common import add_arguments, emit, fixture_db, sample_run_ids, timeit
+
+from nexus_router.event_store import EventStore
+
+BENCHMARK = "store"
+APPENDS = 500
+PAYLOAD = {
+    "step_id": "s0",
+    "call": {"tool": "synthetic", "method": "op", "args": {"i": 0, "path": "/v1/items"}},
+    "output": {"status": "ok", "items": list(range(20))},
+}
+
+
+def _append_many(db_path: str) -> float:
+    """Seconds to append APPENDS events to a new run."""
+    with EventStore(db_path) as store:
+        run_id = store.create_run(mode="apply", goal="bench append")
+        return timeit(lambda: [store.append(run_id, "STEP", PAYLOAD) for _ in range(APPENDS)], 1)
+
+
+def collect(opts: argparse.Namespace) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    tmp = tempfile.mkdtemp(prefix="nexus-bench-")
+    try:
+        targets: list[tuple[str, dict[str, Any] | None]] = [("empty", None)]
+        targets += [(f"db_{size}", {"events": size}) for size in opts.sizes]
+
+        for label, spec in targets:
+            best = float("inf")
+            shape: dict[str, Any] = {"runs": 0, "events": 0}
+            for i in range(opts.repeat):
+                path = os.path.join(tmp, f"{label}-{i}.db")
+                if spec is not None:
+                    src, shape = fixture_db(opts.workdir, events=spec["events"], steps=opts.steps)
+                    shutil.copyfile(src, path)
+                best = min(best, _append_many(path))
+                os.remove(path)
+            results.append(
+                {
+                    "name": f"store.append.{label}",
+                    "db_events": shape["events"],
+                    "ops": APPENDS,
+                    "seconds": round(best, 6),
+                    "ops_per_s": round(APPENDS / best, 1),
+                }
+            )
+
+        for size in opts.sizes:
+            path, shape = fixture_db(opts.workdir, events=size, steps=opts.steps)
+            run_ids = sample_run_ids(path, 20)
+            with EventStore(path) as store:
+                best = timeit(
+                    lambda s=store, ids=run_ids: [s.read_events(r) for r in ids], opts.repeat
+                )
+            read = len(run_ids) * shape["events_per_run"]
+            results.append(
+                {
+                    "name": f"store.read_events.db_{size}",
+                    "db_events": shape["events"],
+                    "ops": read,
+                    "seconds": round(best, 6),
+                    "ops_per_s": round(read / best, 1),
+                }
+            )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    emit(BENCHMARK, collect(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Run the benchmark suite and emit one JSON report.
+
+The report carries environment versions so results can be compared across
+releases. With --baseline, every result whose name appears in both reports is
+compared on `seconds`; anything slower than the tolerance is listed under
+"regressions" and the exit status is 1.
+
+Usage:
+    python benchmarks/run_all.py --output bench-1.2.0.json
+    python benchmarks/run_all.py --sizes 1e3,1e4,1e5,1e6 --output full.json
+    python benchmarks/run_all.py --baseline bench-1.1.0.json --tolerance 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any
+
+import bench_export_import
+import bench_replay_inspect
+import bench_router
+import bench_schema
+import bench_store
+from _common import add_arguments, environment
+
+SUITE = {
+    module.BENCHMARK: module
+    for module in (
+        bench_store,
+        bench_router,
+        bench_replay_inspect,
+        bench_export_import,
+        bench_schema,
+    )
+}
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> dict[str, Any]:
+    """Per-result seconds ratio (current / baseline) and the ones beyond tolerance."""
+    old = {r["name"]: r for results in baseline["results"].values() for r in results}
+    ratios: dict[str, float] = {}
+    regressions: list[dict[str, Any]] = []
+    for results in report["results"].values():
+        for result in results:
+            before = old.get(result["name"])
+            if not before or not before.get("seconds") or result.get("seconds") is None:
+                continue
+            ratio = result["seconds"] / before["seconds"]
+            ratios[result["name"]] = round(ratio, 3)
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    {
+                        "name": result["name"],
+                        "baseline_seconds": before["seconds"],
+                        "seconds": result["seconds"],
+                        "ratio": round(ratio, 3),
+                    }
+                )
+    return {
+        "baseline_environment": baseline.get("environment"),
+        "tolerance": tolerance,
+        "ratios": ratios,
+        "regressions": regressions,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_arguments(parser)
+    parser.add_argument(
+        "--only", help=f"comma-separated subset of: {', '.join(SUITE)}", default=None
+    )
+    parser.add_argument("--output", help="also write the report to this file")
+    parser.add_argument("--baseline", help="previous report to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)"
+    )
+    opts = parser.parse_args(argv)
+
+    selected = list(SUITE) if opts.only is None else opts.only.split(",")
+    unknown = [name for name in selected if name not in SUITE]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    started = time.time()
+    report: dict[str, Any] = {
+        "suite": "nexus-router",
+        "environment": environment(),
+        "options": {"sizes": opts.sizes, "repeat": opts.repeat, "steps": opts.steps},
+        "results": {name: SUITE[name].collect(opts) for name in selected},
+    }
+    report["elapsed_s"] = round(time.time() - started, 2)
+
+    status = 0
+    if opts.baseline:
+        with open(opts.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f), opts.tolerance)
+        for reg in report["comparison"]["regressions"]:
+            print(
+                f"REGRESSION {reg['name']}: {reg['baseline_seconds']}s -> {reg['seconds']}s "
+                f"(x{reg['ratio']})",
+                file=sys.stderr,
+            )
+        status = 1 if report["comparison"]["regressions"] else 0
+
+    text = json.dumps(report, indent=2)
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
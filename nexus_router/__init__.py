@@ -1,17 +1,30 @@
 __all__ = [
+    "caching_adapter",
+    "cassette_adapter",
     "dispatch",
     "event_store",
     "events",
     "exceptions",
     "export",
+    "http_adapter",
     "import_",
     "inspect",
+    "loadgen",
+    "mcp_adapter",
+    "metrics",
     "plugins",
     "policy",
+    "profiling",
     "provenance",
     "replay",
+    "rerun",
     "router",
+    "routing_adapter",
     "schema",
+    "synthetic_adapter",
     "tool",
+    "tracing",
+    "transfer",
+    "unix_socket_adapter",
 ]
 __version__ = "1.1.0"
@@ -0,0 +1,255 @@
+"""
+Caching wrapper for dispatch adapters.
+
+The adapter protocol requires adapters to be deterministic given args, so
+identical calls can be served from a cache instead of being re-executed.
+CachingAdapter wraps any DispatchAdapter and memoizes successful results keyed
+by (adapter_id, tool, method, canonical args digest):
+
+- bounded in-memory LRU with optional TTL
+- per-method opt-in ("tool.method" or "tool.*"); default caches everything
+- optional persistence in a SQLite ``tool_cache`` table (survives restarts)
+
+Failures are never cached. The router records whether each call was served
+from the cache as ``cache_hit`` in TOOL_CALL_SUCCEEDED.
+
+Usage:
+    from nexus_router.caching_adapter import CachingAdapter
+
+    adapter = CachingAdapter(HttpAdapter(url), ttl_s=300, methods=["geo.lookup"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .dispatch import DispatchAdapter
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    cache_key TEXT PRIMARY KEY,
+    adapter_id TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    method TEXT NOT NULL,
+    output_json TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def args_cache_digest(args: dict[str, Any]) -> str | None:
+    """
+    Full sha256 of canonical JSON args, or None if args aren't JSON-serializable.
+
+    Unlike the 12-char args_digest in error details, this is collision-safe
+    enough to key cached outputs.
+    """
+    try:
+        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CachingAdapter:
+    """
+    Adapter wrapper that memoizes successful calls.
+
+    Identity and capabilities are those of the wrapped adapter (so it can be
+    registered in place of it); adapter_kind is "caching".
+
+    Outputs are stored as canonical JSON and decoded on every hit, so callers
+    (and the router, which annotates outputs) always get a fresh object.
+    Outputs that aren't JSON-serializable are returned but not cached.
+    """
+
+    def __init__(
+        self,
+        inner: DispatchAdapter,
+        *,
+        max_entries: int = 1024,
+        ttl_s: float | None = None,
+        methods: Iterable[str] | None = None,
+        db_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize CachingAdapter.
+
+        Args:
+            inner: The adapter to wrap.
+            max_entries: Maximum in-memory entries (least recently used evicted).
+            ttl_s: Entry lifetime in seconds. None means entries never expire.
+            methods: Cacheable calls as "tool.method" or "tool.*". None caches all.
+            db_path: SQLite database for the persistent tool_cache table.
+                May be the event store database.
+            clock: Wall-clock source (seconds); persisted entries outlive the process.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError("ttl_s must be positive")
+
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._methods = frozenset(methods) if methods is not None else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (output_json, created_at); most recently used at the end
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db: sqlite3.Connection | None = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.executescript(_CACHE_SCHEMA)
+
+    @property
+    def adapter_id(self) -> str:
+        return self._inner.adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "caching"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._inner.capabilities
+
+    @property
+    def inner(self) -> DispatchAdapter:
+        """The wrapped adapter."""
+        return self._inner
+
+    @property
+    def last_call_cache_hit(self) -> bool | None:
+        """Whether this thread's last call was served from the cache (None if uncacheable)."""
+        hit: bool | None = getattr(self._local, "cache_hit", None)
+        return hit
+
+    @property
+    def last_call_resources(self) -> dict[str, Any] | None:
+        """Resources of the wrapped adapter's last call on this thread (None on a hit)."""
+        resources: dict[str, Any] | None = getattr(self._local, "resources", None)
+        return resources
+
+    def is_cacheable(self, tool: str, method: str) -> bool:
+        """Whether calls to tool.method are cached."""
+        if self._methods is None:
+            return True
+        return f"{tool}.{method}" in self._methods or f"{tool}.*" in self._methods
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters: hits, misses, evictions, size (in-memory entries)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached entries (in memory and persisted)."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM tool_cache")
+
+    def close(self) -> None:
+        """Close the persistent cache database, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        self._local.cache_hit = None
+        self._local.resources = None
+
+        digest = args_cache_digest(args) if self.is_cacheable(tool, method) else None
+        if digest is None:
+            return self._call_inner(tool, method, args)
+
+        key = f"{self.adapter_id}\x1f{tool}\x1f{method}\x1f{digest}"
+        cached = self._lookup(key)
+        if cached is not None:
+            self._local.cache_hit = True
+            output: dict[str, Any] = json.loads(cached)
+            return output
+
+        self._local.cache_hit = False
+        output = self._call_inner(tool, method, args)
+        try:
+            output_json = json.dumps(output, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return output  # Not representable; serve uncached
+        self._store(key, tool, method, output_json)
+        # Return a decoded copy so later mutation can't alias the cached value
+        fresh: dict[str, Any] = json.loads(output_json)
+        return fresh
+
+    def _call_inner(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return self._inner.call(tool, method, args)
+        finally:
+            self._local.resources = getattr(self._inner, "last_call_resources", None)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self._ttl_s is not None and now - created_at >= self._ttl_s
+
+    def _lookup(self, key: str) -> str | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT output_json, created_at FROM tool_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    if not self._expired(row[1], now):
+                        self._insert_locked(key, row[0], row[1])
+                        self.hits += 1
+                        return str(row[0])
+                    self._db.execute("DELETE FROM tool_cache WHERE cache_key = ?", (key,))
+
+            self.misses += 1
+            return None
+
+    def _store(self, key: str, tool: str, method: str, output_json: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._insert_locked(key, output_json, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO tool_cache "
+                    "(cache_key, adapter_id, tool, method, output_json, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, self.adapter_id, tool, method, output_json, now),
+                )
+
+    def _insert_locked(self, key: str, output_json: str, created_at: float) -> None:
+        self._entries[key] = (output_json, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,297 @@
+"""
+Record-and-replay cassette adapter built from the event log.
+
+CassetteAdapter indexes TOOL_CALL_REQUESTED / TOOL_CALL_SUCCEEDED (and
+adapter-level TOOL_CALL_FAILED) pairs from recorded runs by
+(tool, method, args digest) and serves them back with no real execution.
+Production workloads can then be re-run at memory speed for load testing
+and regression comparison.
+
+Sources:
+- an event store database (EventStore.read_events), one or more runs
+- an export bundle (export_run artifact, or a JSON file containing one)
+
+Usage:
+    from nexus_router.cassette_adapter import CassetteAdapter
+
+    cassette = CassetteAdapter.from_event_store("prod.db", run_ids=[run_id])
+    resp = run(request, db_path="replay.db", adapter=cassette)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from . import events as E
+from .caching_adapter import args_cache_digest
+from .dispatch import CAPABILITY_APPLY, DispatchAdapter, _compute_args_digest
+from .event_store import EventRow, EventStore
+from .exceptions import NexusOperationalError
+from .export import load_bundle, verify_bundle_digest
+
+# Failures raised by the router itself, not by the adapter; never replayed
+_ROUTER_ERROR_CODES = frozenset({"CAPABILITY_MISSING", "PERMISSION_DENIED"})
+
+
+class _Recording:
+    """Recorded outcomes for one key, served in order (last one repeats)."""
+
+    __slots__ = ("cursor", "outcomes")
+
+    def __init__(self) -> None:
+        # ("ok", output_json) or ("error", error_code, message)
+        self.outcomes: list[tuple[str, ...]] = []
+        self.cursor = 0
+
+    def next(self) -> tuple[str, ...]:
+        outcome = self.outcomes[min(self.cursor, len(self.outcomes) - 1)]
+        self.cursor += 1
+        return outcome
+
+
+class CassetteAdapter:
+    """
+    Adapter that serves recorded tool call outcomes.
+
+    When a key was recorded more than once (e.g. a run that polled the same
+    call), outcomes are served in recorded order and the last one repeats.
+    Recorded operational failures are re-raised with their original
+    error_code; bug errors and router-level failures are not recorded.
+
+    Error codes:
+    - CASSETTE_MISS: no recording for (tool, method, args) and no fallback
+    - <recorded error_code>: replayed failure
+
+    Capabilities: apply
+    """
+
+    def __init__(
+        self,
+        adapter_id: str = "cassette",
+        *,
+        fallback: DispatchAdapter | None = None,
+        include_failures: bool = True,
+    ) -> None:
+        """
+        Initialize an empty cassette.
+
+        Args:
+            adapter_id: Adapter ID.
+            fallback: Adapter to call (and record from) on a miss. None raises
+                CASSETTE_MISS instead.
+            include_failures: Replay recorded TOOL_CALL_FAILED outcomes.
+        """
+        self._adapter_id = adapter_id
+        self._fallback = fallback
+        self._include_failures = include_failures
+        self._recordings: dict[tuple[str, str, str], _Recording] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_event_store(
+        cls,
+        db_path: str,
+        run_ids: str | Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> CassetteAdapter:
+        """
+        Build a cassette from runs in an event store.
+
+        Args:
+            db_path: Path to the SQLite event store.
+            run_ids: A run ID, several run IDs, or None for every run (oldest first).
+            **kwargs: Passed to CassetteAdapter().
+        """
+        cassette = cls(**kwargs)
+        store = EventStore(db_path)
+        try:
+            if run_ids is None:
+                ids = [
+                    r[0]
+                    for r in store.conn.execute(
+                        "SELECT run_id FROM runs ORDER BY created_at ASC, rowid ASC"
+                    )
+                ]
+            elif isinstance(run_ids, str):
+                ids = [run_ids]
+            else:
+                ids = list(run_ids)
+            for run_id in ids:
+                cassette.add_events(store.read_events(run_id))
+        finally:
+            store.close()
+        return cassette
+
+    @classmethod
+    def from_bundle(
+        cls,
+        bundle: dict[str, Any] | str | Path,
+        *,
+        verify_digest: bool = True,
+        **kwargs: Any,
+    ) -> CassetteAdapter:
+        """
+        Build a cassette from an export bundle.
+
+        Args:
+            bundle: Bundle dict (export_run()["artifact"]) or path to a bundle
+                    file (JSON, or export_run_to_file() output in any compression).
+            verify_digest: Reject bundles whose digest doesn't match.
+            **kwargs: Passed to CassetteAdapter().
+
+        Raises:
+            ValueError: If the bundle is malformed or fails digest verification.
+        """
+        if not isinstance(bundle, dict):
+            # Bundle files are verified while they are read
+            bundle = load_bundle(str(bundle), verify_digest=verify_digest)
+        else:
+            if "events" not in bundle:
+                raise ValueError("Bundle missing 'events'")
+            if verify_digest:
+                error = verify_bundle_digest(bundle)
+                if error is not None:
+                    raise ValueError(error)
+        cassette = cls(**kwargs)
+        cassette.add_events(bundle["events"])
+        return cassette
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "cassette"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return frozenset({CAPABILITY_APPLY})
+
+    def __len__(self) -> int:
+        """Number of distinct recorded (tool, method, args) keys."""
+        return len(self._recordings)
+
+    def add_events(self, events: Iterable[EventRow | dict[str, Any]]) -> int:
+        """
+        Index one run's events (EventRow objects or bundle event dicts, in seq order).
+
+        Returns:
+            Number of outcomes recorded.
+        """
+        requested: dict[str, dict[str, Any]] = {}
+        recorded = 0
+        for event in events:
+            if isinstance(event, EventRow):
+                etype, payload = event.type, event.payload
+            else:
+                etype, payload = event["type"], event["payload"]
+
+            if etype == E.TOOL_CALL_REQUESTED:
+                requested[payload["step_id"]] = payload["call"]
+                continue
+            if etype not in (E.TOOL_CALL_SUCCEEDED, E.TOOL_CALL_FAILED):
+                continue
+            call = requested.pop(payload.get("step_id", ""), None)
+            if call is None:
+                continue
+
+            if etype == E.TOOL_CALL_SUCCEEDED:
+                if payload.get("simulated"):
+                    continue  # dry_run output, not a real result
+                output = dict(payload.get("output", {}))
+                output.pop("adapter_id", None)  # Router annotation; re-added on replay
+                self.record(call["tool"], call["method"], call.get("args", {}), output)
+                recorded += 1
+            elif (
+                self._include_failures
+                and payload.get("error_kind") == "operational"
+                and payload.get("error_code") not in _ROUTER_ERROR_CODES
+            ):
+                self.record_failure(
+                    call["tool"],
+                    call["method"],
+                    call.get("args", {}),
+                    error_code=payload["error_code"],
+                    message=payload.get("message", ""),
+                )
+                recorded += 1
+        return recorded
+
+    def record(self, tool: str, method: str, args: dict[str, Any], output: dict[str, Any]) -> None:
+        """Record a successful outcome."""
+        output_json = json.dumps(output, sort_keys=True, separators=(",", ":"))
+        self._append(tool, method, args, ("ok", output_json))
+
+    def record_failure(
+        self,
+        tool: str,
+        method: str,
+        args: dict[str, Any],
+        *,
+        error_code: str,
+        message: str,
+    ) -> None:
+        """Record an operational failure."""
+        self._append(tool, method, args, ("error", error_code, message))
+
+    def rewind(self) -> None:
+        """Reset every key to its first recorded outcome."""
+        with self._lock:
+            for recording in self._recordings.values():
+                recording.cursor = 0
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        key = self._key(tool, method, args)
+        with self._lock:
+            recording = self._recordings.get(key) if key is not None else None
+            if recording is not None:
+                self.hits += 1
+                outcome = recording.next()
+            else:
+                self.misses += 1
+
+        if recording is None:
+            if self._fallback is not None:
+                output = self._fallback.call(tool, method, args)
+                if key is not None:
+                    self.record(tool, method, args, output)
+                return output
+            raise NexusOperationalError(
+                f"No cassette recording for {tool}.{method}",
+                error_code="CASSETTE_MISS",
+                details={
+                    "tool": tool,
+                    "method": method,
+                    "args_digest": _compute_args_digest(args),
+                },
+            )
+
+        if outcome[0] == "error":
+            raise NexusOperationalError(
+                outcome[2],
+                error_code=outcome[1],
+                details={"replayed": True, "args_digest": _compute_args_digest(args)},
+            )
+        result: dict[str, Any] = json.loads(outcome[1])
+        return result
+
+    def _append(
+        self, tool: str, method: str, args: dict[str, Any], outcome: tuple[str, ...]
+    ) -> None:
+        key = self._key(tool, method, args)
+        if key is None:
+            return  # Unserializable args can't be matched on replay
+        with self._lock:
+            self._recordings.setdefault(key, _Recording()).outcomes.append(outcome)
+
+    @staticmethod
+    def _key(tool: str, method: str, args: dict[str, Any]) -> tuple[str, str, str] | None:
+        digest = args_cache_digest(args)
+        return None if digest is None else (tool, method, digest)
@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import contextvars
 import errno
+import functools
 import hashlib
 import json
 import os
 import re
+import signal
 import stat
 import subprocess
+import sys
 import tempfile
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 from .exceptions import NexusBugError, NexusOperationalError
+from .metrics import FUNCTION_POOL_QUEUED, FUNCTION_POOL_RUNNING, SUBPROCESS_SPAWNS
+from .tracing import current_traceparent
 
 # Standard capability constants
 CAPABILITY_DRY_RUN = "dry_run"  # Adapter supports dry_run mode (simulated output)
@@ -28,53 +39,342 @@ _SENSITIVE_KEY_PATTERN = re.compile(
     r"(?i)(token|secret|password|api[_-]?key|authorization|cookie|credential|private[_-]?key)"
 )
 
+_REDACTED = "[REDACTED]"
+
+# Bearer credential (case-sensitive "Bearer", as in HTTP headers)
+_BEARER = r"(?-i:Bearer)\s+[A-Za-z0-9_\-\.]+"
+
+# Single-pass text redaction pattern. Alternatives, in priority order:
+#   bearer   - "Bearer <token>"
+#   api_key  - "api_key=<value>" / "api-key: <value>" (prefix preserved)
+#   key      - "token|secret|password|cookie=<value>"
+#   (auth)   - "authorization=<value>" when the value is not a Bearer token
+# Values may themselves be Bearer tokens so a single match consumes them whole.
+# The leading lookahead gives the regex engine a two-character prefilter; every
+# alternative starts with one of these pairs (Be, ap, to, se, pa, co, au).
+_TEXT_REDACTION_PATTERN = re.compile(
+    r"(?=[batspc][epoau])(?:"
+    rf"(?P<bearer>{_BEARER})"
+    rf"|(?P<api_key>api[_-]?key[=:]\s*)['\"]?(?:{_BEARER}|[A-Za-z0-9_\-]+)['\"]?"
+    rf"|(?P<key>token|secret|password|cookie)[=:]\s*['\"]?(?:{_BEARER}|[^\s'\"]+)['\"]?"
+    r"|authorization[=:]\s*(?!Bearer\s)['\"]?[^\s'\"]+['\"]?"
+    r")",
+    re.IGNORECASE,
+)
+
+
+def _redact_text_match(m: re.Match[str]) -> str:
+    """Replacement for one _TEXT_REDACTION_PATTERN match."""
+    if m.group("bearer") is not None:
+        return "Bearer " + _REDACTED
+    api_key = m.group("api_key")
+    if api_key is not None:
+        return api_key + _REDACTED
+    key = m.group("key")
+    if key is not None:
+        return key + "=" + _REDACTED
+    return "authorization=" + _REDACTED
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Return True if an args key names a secret (cached per key)."""
+    return _SENSITIVE_KEY_PATTERN.search(key) is not None
+
+
+def _redact_obj(obj: Any) -> Any:
+    """Copy-on-write redaction: returns obj itself when nothing changes."""
+    if isinstance(obj, dict):
+        out: dict[Any, Any] | None = None
+        for key, value in obj.items():
+            new = _REDACTED if _is_sensitive_key(key) else _redact_obj(value)
+            if new is not value:
+                if out is None:
+                    out = dict(obj)
+                out[key] = new
+        return obj if out is None else out
+    if isinstance(obj, list):
+        out_list: list[Any] | None = None
+        for i, item in enumerate(obj):
+            new = _redact_obj(item)
+            if new is not item:
+                if out_list is None:
+                    out_list = list(obj)
+                out_list[i] = new
+        return obj if out_list is None else out_list
+    return obj
+
 
 def default_redact_args(args: dict[str, Any]) -> dict[str, Any]:
     """
     Default redaction function for args.
 
     Replaces values of keys matching sensitive patterns with "[REDACTED]".
-    Recursively handles nested dicts.
+    Recursively handles nested dicts and lists.
+
+    Copy-on-write: only containers on the path to a redacted value are copied,
+    and ``args`` itself is returned when nothing is sensitive. Treat the result
+    as read-only.
+    """
+    return _redact_obj(args)  # type: ignore[no-any-return]
+
+
+def default_redact_text(text: str) -> str:
     """
+    Default redaction function for text output.
 
-    def redact(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: _redact_value(k, v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [redact(item) for item in obj]
-        return obj
+    Redacts common secret patterns in text (Bearer tokens, API keys, etc.)
+    in a single scan over the text.
+    """
+    return _TEXT_REDACTION_PATTERN.sub(_redact_text_match, text)
 
-    def _redact_value(key: str, value: Any) -> Any:
-        if _SENSITIVE_KEY_PATTERN.search(key):
-            return "[REDACTED]"
-        return redact(value)
 
-    return redact(args)  # type: ignore[no-any-return]
+# Chunk size used when draining subprocess pipes
+_PIPE_READ_CHUNK = 64 * 1024
 
 
-def default_redact_text(text: str) -> str:
+@dataclass
+class _CaptureResult:
+    """Outcome of draining a subprocess with bounded stdout/stderr capture."""
+
+    stdout: bytes
+    stderr: bytes
+    returncode: int | None = None
+    timed_out: bool = False
+    overflow_stream: str | None = None  # "stdout" or "stderr" if a cap was hit
+    stdout_bytes: int = 0  # total bytes read (may exceed len(stdout) on overflow)
+    stderr_bytes: int = 0
+    rusage: Any = None  # resource.struct_rusage from os.wait4 (POSIX only)
+
+    def resources(self) -> dict[str, Any]:
+        """Per-call resource accounting recorded in TOOL_CALL_* events."""
+        usage: dict[str, Any] = {
+            "stdout_bytes": self.stdout_bytes,
+            "stderr_bytes": self.stderr_bytes,
+        }
+        if self.rusage is not None:
+            max_rss = self.rusage.ru_maxrss
+            if sys.platform == "darwin":
+                max_rss //= 1024  # macOS reports bytes, Linux kilobytes
+            usage["user_cpu_ms"] = round(self.rusage.ru_utime * 1000, 3)
+            usage["system_cpu_ms"] = round(self.rusage.ru_stime * 1000, 3)
+            usage["max_rss_kb"] = max_rss
+        return usage
+
+
+class _BoundedPipeReader:
     """
-    Default redaction function for text output.
+    Drain a pipe on a background thread, keeping at most ``limit`` bytes.
+
+    Reading stops as soon as the limit is exceeded; the owner is notified
+    through ``cond`` so it can kill the child without waiting for EOF.
+    """
+
+    def __init__(self, pipe: Any, limit: int, cond: threading.Condition) -> None:
+        self._pipe = pipe
+        self._limit = limit
+        self._cond = cond
+        self._chunks: list[bytes] = []
+        self.total = 0
+        self.overflow = False
+        self.done = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def close(self) -> None:
+        self._pipe.close()
+
+    def data(self) -> bytes:
+        return b"".join(self._chunks)
+
+    def _run(self) -> None:
+        fd = self._pipe.fileno()
+        kept = 0
+        try:
+            while True:
+                chunk = os.read(fd, _PIPE_READ_CHUNK)
+                if not chunk:
+                    break
+                self.total += len(chunk)
+                if kept < self._limit:
+                    keep = chunk[: self._limit - kept]
+                    self._chunks.append(keep)
+                    kept += len(keep)
+                if self.total > self._limit:
+                    self.overflow = True
+                    break
+        except OSError:
+            pass  # Pipe closed underneath us (child killed); treat as EOF
+        finally:
+            with self._cond:
+                self.done = True
+                self._cond.notify_all()
+
+
+def _compute_args_digest(args: dict[str, Any]) -> str:
+    """SHA256 of canonical args JSON (first 12 hex chars), for error correlation."""
+    canonical = json.dumps(args, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output for diagnostics (never fails)."""
+    return data.decode("utf-8", errors="replace")
+
+
+def map_spawn_error(
+    command: str, e: OSError, base_details: dict[str, Any]
+) -> NexusOperationalError:
+    """
+    Map an OSError raised while launching a command to the shared error codes.
 
-    Redacts common secret patterns in text (Bearer tokens, API keys, etc.).
+    COMMAND_NOT_FOUND, PERMISSION_DENIED or OS_ERROR. Used by every adapter
+    that starts a process.
     """
-    # Bearer tokens (do this first, before Authorization pattern)
-    text = re.sub(r"Bearer\s+[A-Za-z0-9_\-\.]+", "Bearer [REDACTED]", text)
-    # API key patterns (common formats)
-    text = re.sub(r"(?i)(api[_-]?key[=:]\s*)['\"]?[A-Za-z0-9_\-]+['\"]?", r"\1[REDACTED]", text)
-    # Generic key=value for sensitive keys (skip Authorization: Bearer already handled)
-    text = re.sub(
-        r"(?i)(token|secret|password|cookie)[=:]\s*['\"]?[^\s'\"]+['\"]?",
-        r"\1=[REDACTED]",
-        text,
+    if isinstance(e, FileNotFoundError):
+        return NexusOperationalError(
+            f"Command not found: {command}",
+            error_code="COMMAND_NOT_FOUND",
+            details=base_details,
+        )
+    if isinstance(e, PermissionError):
+        return NexusOperationalError(
+            f"Permission denied executing command: {command}",
+            error_code="PERMISSION_DENIED",
+            details=base_details,
+        )
+    # Map specific errno values
+    if e.errno == errno.EACCES:
+        return NexusOperationalError(
+            f"Permission denied: {e}",
+            error_code="PERMISSION_DENIED",
+            details=base_details,
+        )
+    return NexusOperationalError(
+        f"OS error executing command: {e}",
+        error_code="OS_ERROR",
+        details=base_details,
     )
-    # Authorization header without Bearer (direct value)
-    text = re.sub(
-        r"(?i)authorization[=:]\s*(?!Bearer\s)['\"]?[^\s'\"]+['\"]?",
-        "authorization=[REDACTED]",
-        text,
+
+
+class PendingCall:
+    """
+    A call multiplexed over a persistent connection, waiting for its response.
+
+    The connection's reader thread sets either response (the decoded message)
+    or failure ((error_code, message, details) when the connection failed),
+    then sets event.
+    """
+
+    __slots__ = ("event", "failure", "response")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.response: dict[str, Any] | None = None
+        self.failure: tuple[str, str, dict[str, Any]] | None = None
+
+
+def _wait_with_rusage(proc: subprocess.Popen[bytes], timeout_s: float | None) -> tuple[int, Any]:
+    """
+    Reap ``proc`` via os.wait4 so its rusage can be collected.
+
+    Mirrors Popen.wait(): polls with exponential backoff while a timeout is
+    pending and raises subprocess.TimeoutExpired when it elapses. Falls back
+    to Popen.wait() (rusage None) where os.wait4 is unavailable.
+    """
+    if not hasattr(os, "wait4"):
+        return proc.wait(timeout=timeout_s), None
+
+    try:
+        if timeout_s is None:
+            pid, status, rusage = os.wait4(proc.pid, 0)
+        else:
+            deadline = time.monotonic() + timeout_s
+            delay = 0.0005
+            while True:
+                pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+                if pid == proc.pid:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout_s)
+                delay = min(delay * 2, remaining, 0.05)
+                time.sleep(delay)
+    except ChildProcessError:
+        # Already reaped elsewhere (e.g. SIGCHLD ignored); no rusage available
+        return proc.wait(timeout=timeout_s), None
+
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, rusage
+
+
+def _communicate_bounded(
+    proc: subprocess.Popen[bytes],
+    *,
+    timeout_s: float,
+    max_stdout_bytes: int,
+    max_stderr_bytes: int,
+) -> _CaptureResult:
+    """
+    Stream stdout/stderr from ``proc`` with hard byte caps and a deadline.
+
+    Unlike ``Popen.communicate()``, output is never buffered beyond the caps:
+    the child is killed as soon as either stream exceeds its limit or the
+    timeout elapses. The caller owns error mapping.
+    """
+    deadline = time.monotonic() + timeout_s
+    cond = threading.Condition()
+    out = _BoundedPipeReader(proc.stdout, max_stdout_bytes, cond)
+    err = _BoundedPipeReader(proc.stderr, max_stderr_bytes, cond)
+    out.start()
+    err.start()
+
+    timed_out = False
+    with cond:
+        while not (out.overflow or err.overflow or (out.done and err.done)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            cond.wait(remaining)
+
+    overflow_stream = "stdout" if out.overflow else "stderr" if err.overflow else None
+    returncode: int | None = None
+    rusage: Any = None
+    if not timed_out and overflow_stream is None:
+        try:
+            returncode, rusage = _wait_with_rusage(proc, max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+
+    if timed_out or overflow_stream is not None:
+        with contextlib.suppress(OSError):
+            proc.kill()
+        _, rusage = _wait_with_rusage(proc, None)
+
+    # Readers exit on EOF once the child is gone; bound the join in case a
+    # grandchild inherited the pipes and keeps them open.
+    for reader in (out, err):
+        reader.join(timeout=1.0)
+        if reader.done:
+            with contextlib.suppress(OSError):
+                reader.close()
+
+    return _CaptureResult(
+        stdout=out.data(),
+        stderr=err.data(),
+        returncode=returncode,
+        timed_out=timed_out,
+        overflow_stream=overflow_stream,
+        stdout_bytes=out.total,
+        stderr_bytes=err.total,
+        rusage=rusage,
     )
-    return text
 
 
 class DispatchAdapter(Protocol):
@@ -461,6 +761,280 @@ class FakeAdapter:
         self._call_log.clear()
 
 
+class FunctionAdapter:
+    """
+    Adapter that dispatches (tool, method) to in-process Python callables.
+
+    Avoids a process launch per call for tools written in Python. Each
+    registered function takes the args dict and returns a JSON-serializable
+    dict (the same shape as FakeAdapter.set_response callables).
+
+    Execution:
+    - Inline on the calling thread by default (no dispatch overhead)
+    - offload=True runs the function on the adapter's thread pool
+    - A timeout (per function or adapter default) also runs on the pool and
+      raises TIMEOUT if the function does not finish in time. The timeout
+      starts when the function starts running, not while it waits for a worker.
+    - Python threads cannot be killed: a timed-out function keeps its worker
+      until it returns. If no worker frees up within timeout_s, the call is
+      cancelled before it starts and raises POOL_EXHAUSTED; pool_stats()
+      reports running and queued calls.
+
+    Error mapping (same taxonomy as SubprocessAdapter):
+    - NexusOperationalError / NexusBugError raised by the function pass through
+    - Any other exception -> NexusOperationalError(TOOL_ERROR)
+    - Non-dict return -> NexusOperationalError(INVALID_OUTPUT)
+    - Unregistered (tool, method) -> NexusOperationalError(METHOD_NOT_FOUND)
+    All error details include args_digest; exception text is redacted.
+
+    Capabilities: apply (+ timeout when a default timeout_s is set)
+    """
+
+    ToolFunc = Callable[[dict[str, Any]], dict[str, Any]]
+
+    @dataclass(frozen=True)
+    class _Entry:
+        func: Callable[[dict[str, Any]], dict[str, Any]]
+        timeout_s: float | None
+        offload: bool
+
+    def __init__(
+        self,
+        adapter_id: str = "function",
+        *,
+        timeout_s: float | None = None,
+        max_workers: int = 4,
+        redact_text: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Initialize FunctionAdapter.
+
+        Args:
+            adapter_id: Adapter identifier.
+            timeout_s: Default per-call timeout (None = no timeout, run inline).
+            max_workers: Size of the thread pool used for offloaded/timed calls.
+            redact_text: Redaction applied to exception text in error details.
+                        If None, uses default_redact_text.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self._adapter_id = adapter_id
+        self._timeout_s = timeout_s
+        self._max_workers = max_workers
+        self._redact_text = redact_text if redact_text is not None else default_redact_text
+        self._functions: dict[tuple[str, str], FunctionAdapter._Entry] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._queued_gauge = FUNCTION_POOL_QUEUED.labels(adapter_id)
+        self._running_gauge = FUNCTION_POOL_RUNNING.labels(adapter_id)
+        caps = {CAPABILITY_APPLY}
+        if timeout_s is not None:
+            caps.add(CAPABILITY_TIMEOUT)
+        self._capabilities: frozenset[str] = frozenset(caps)
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "function"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._capabilities
+
+    def register(
+        self,
+        tool: str,
+        method: str,
+        func: ToolFunc,
+        *,
+        timeout_s: float | None = None,
+        offload: bool = False,
+    ) -> None:
+        """
+        Register a callable for a (tool, method) combination.
+
+        Args:
+            tool: Tool identifier
+            method: Method name
+            func: Callable taking the args dict and returning a dict
+            timeout_s: Per-function timeout (overrides the adapter default)
+            offload: Run on the thread pool even without a timeout
+        """
+        if not callable(func):
+            raise TypeError(f"func for {tool}.{method} is not callable")
+        effective_timeout = timeout_s if timeout_s is not None else self._timeout_s
+        self._functions[(tool, method)] = FunctionAdapter._Entry(
+            func=func, timeout_s=effective_timeout, offload=offload
+        )
+
+    def function(
+        self, tool: str, method: str, *, timeout_s: float | None = None, offload: bool = False
+    ) -> Callable[[ToolFunc], ToolFunc]:
+        """Decorator form of register()."""
+
+        def decorator(func: FunctionAdapter.ToolFunc) -> FunctionAdapter.ToolFunc:
+            self.register(tool, method, func, timeout_s=timeout_s, offload=offload)
+            return func
+
+        return decorator
+
+    def list_functions(self) -> list[tuple[str, str]]:
+        """List registered (tool, method) pairs (sorted)."""
+        return sorted(self._functions)
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute the registered function.
+
+        Raises:
+            NexusOperationalError: For unknown methods, tool exceptions,
+                timeouts, or non-dict output.
+            NexusBugError: If the function raises NexusBugError.
+        """
+        entry = self._functions.get((tool, method))
+        if entry is None:
+            raise NexusOperationalError(
+                f"No function registered for {tool}.{method}",
+                error_code="METHOD_NOT_FOUND",
+                details={
+                    "args_digest": _compute_args_digest(args),
+                    "tool": tool,
+                    "method": method,
+                },
+            )
+
+        try:
+            if entry.timeout_s is None and not entry.offload:
+                output = entry.func(args)
+            else:
+                output = self._call_on_pool(tool, method, entry, args)
+        except (NexusOperationalError, NexusBugError):
+            raise
+        except Exception as e:
+            raise NexusOperationalError(
+                f"Function {tool}.{method} raised {type(e).__name__}",
+                error_code="TOOL_ERROR",
+                details={
+                    "args_digest": _compute_args_digest(args),
+                    "exception_type": type(e).__name__,
+                    "message": self._redact_text(str(e)),
+                },
+            ) from e
+
+        if not isinstance(output, dict):
+            raise NexusOperationalError(
+                f"Output is not a dict: {type(output).__name__}",
+                error_code="INVALID_OUTPUT",
+                details={"args_digest": _compute_args_digest(args)},
+            )
+
+        # Shallow copy: the router annotates the returned dict
+        return dict(output)
+
+    def pool_stats(self) -> dict[str, int]:
+        """Thread pool usage: max_workers, running (incl. timed out) and queued calls."""
+        with self._pool_lock:
+            return {
+                "max_workers": self._max_workers,
+                "running": self._running,
+                "queued": self._queued,
+            }
+
+    def close(self) -> None:
+        """Shut down the thread pool (does not wait for timed-out functions)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _call_on_pool(
+        self, tool: str, method: str, entry: FunctionAdapter._Entry, args: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run entry.func on the pool; the timeout counts from when it starts."""
+        started = threading.Event()
+
+        def run() -> dict[str, Any]:
+            with self._pool_lock:
+                self._queued -= 1
+                self._running += 1
+            self._queued_gauge.dec()
+            self._running_gauge.inc()
+            started.set()
+            try:
+                return entry.func(args)
+            finally:
+                with self._pool_lock:
+                    self._running -= 1
+                self._running_gauge.dec()
+
+        def dequeue_if_cancelled(future: Future[dict[str, Any]]) -> None:
+            if future.cancelled():
+                with self._pool_lock:
+                    self._queued -= 1
+                self._queued_gauge.dec()
+
+        with self._pool_lock:
+            self._queued += 1
+        self._queued_gauge.inc()
+        # Worker threads do not inherit context vars; keep the caller's current span
+        future = self._get_executor().submit(contextvars.copy_context().run, run)
+        future.add_done_callback(dequeue_if_cancelled)
+        if entry.timeout_s is None:
+            return future.result()
+
+        if not started.wait(entry.timeout_s) and future.cancel():
+            stats = self.pool_stats()
+            raise NexusOperationalError(
+                f"No worker free for {tool}.{method} within {entry.timeout_s}s "
+                f"({stats['running']} of {stats['max_workers']} busy)",
+                error_code="POOL_EXHAUSTED",
+                details={
+                    "args_digest": _compute_args_digest(args),
+                    "timeout_s": entry.timeout_s,
+                    **stats,
+                },
+            )
+        try:
+            return future.result(timeout=entry.timeout_s)
+        except FutureTimeoutError as e:
+            raise NexusOperationalError(
+                f"Function {tool}.{method} timed out after {entry.timeout_s}s",
+                error_code="TIMEOUT",
+                details={
+                    "args_digest": _compute_args_digest(args),
+                    "timeout_s": entry.timeout_s,
+                },
+            ) from e
+
+    def __enter__(self) -> FunctionAdapter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        self.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix=f"nexus-router-{self._adapter_id}",
+                    )
+        return self._executor
+
+
 class SubprocessAdapter:
     """
     Adapter that calls external commands via subprocess.
@@ -486,6 +1060,16 @@ class SubprocessAdapter:
     - args_digest in all error details for correlation
     - Enhanced timeout/JSON error details
 
+    Bounded capture (v1.2+):
+    - stdout/stderr are streamed with hard byte caps (max_stdout_bytes/max_stderr_bytes)
+    - Exceeding a cap kills the child and raises OUTPUT_TOO_LARGE
+    - JSON is parsed directly from the captured bytes
+
+    Resource accounting (v1.2+):
+    - last_call_resources: CPU time, max RSS (POSIX, via os.wait4) and bytes of
+      stdout/stderr for the last call on the current thread. The router records
+      it as "resources" in TOOL_CALL_SUCCEEDED / TOOL_CALL_FAILED payloads.
+
     Capabilities: apply, timeout, external
     """
 
@@ -507,6 +1091,8 @@ class SubprocessAdapter:
         redact_text: RedactTextFunc | None = None,
         cleanup_retry_delay_s: float = 0.1,
         strict_stderr: bool = False,
+        max_stdout_bytes: int = 64 * 1024 * 1024,
+        max_stderr_bytes: int = 8 * 1024 * 1024,
     ) -> None:
         """
         Initialize SubprocessAdapter.
@@ -526,9 +1112,14 @@ class SubprocessAdapter:
             cleanup_retry_delay_s: Delay before retry if temp file cleanup fails.
             strict_stderr: If True, treat non-empty stderr on success as failure.
                           Default False (ignore stderr on success).
+            max_stdout_bytes: Hard cap on bytes read from stdout. Exceeding it kills
+                             the child and raises OUTPUT_TOO_LARGE.
+            max_stderr_bytes: Hard cap on bytes read from stderr (same behavior).
         """
         if not base_cmd:
             raise ValueError("base_cmd must not be empty")
+        if max_stdout_bytes <= 0 or max_stderr_bytes <= 0:
+            raise ValueError("max_stdout_bytes and max_stderr_bytes must be positive")
 
         self._base_cmd = list(base_cmd)
         self._timeout_s = timeout_s
@@ -536,6 +1127,8 @@ class SubprocessAdapter:
         self._env = env
         self._max_stdout_chars = max_stdout_chars
         self._max_stderr_chars = max_stderr_chars
+        self._max_stdout_bytes = max_stdout_bytes
+        self._max_stderr_bytes = max_stderr_bytes
         self._cleanup_retry_delay_s = cleanup_retry_delay_s
         self._strict_stderr = strict_stderr
         self._capabilities: frozenset[str] = frozenset(
@@ -553,6 +1146,9 @@ class SubprocessAdapter:
         # Track last cleanup status for diagnostics
         self._last_cleanup_failed: bool = False
 
+        # Per-thread resource accounting for the last call
+        self._local = threading.local()
+
         # Derive adapter_id if not provided
         if adapter_id is not None:
             self._adapter_id = adapter_id
@@ -584,6 +1180,16 @@ class SubprocessAdapter:
         """True if the last temp file cleanup failed (diagnostic)."""
         return self._last_cleanup_failed
 
+    @property
+    def last_call_resources(self) -> dict[str, Any] | None:
+        """
+        Resource usage of the last call made on this thread, or None.
+
+        Keys: stdout_bytes, stderr_bytes and, on POSIX, user_cpu_ms,
+        system_cpu_ms and max_rss_kb. None if the process never started.
+        """
+        return getattr(self._local, "resources", None)
+
     def redact_args_for_event(self, args: dict[str, Any]) -> dict[str, Any]:
         """Apply redaction to args for event storage."""
         return self._redact_args(args)
@@ -600,17 +1206,11 @@ class SubprocessAdapter:
             Parsed JSON result from stdout.
 
         Raises:
-            NexusOperationalError: For timeout, non-zero exit, or invalid JSON output.
+            NexusOperationalError: For timeout, non-zero exit, invalid JSON output,
+                or output exceeding the byte caps (OUTPUT_TOO_LARGE).
         """
         self._last_cleanup_failed = False
-
-        # Build payload (full args for the subprocess, NOT redacted)
-        payload = {
-            "tool": tool,
-            "method": method,
-            "args": args,
-        }
-        payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        self._local.resources = None
 
         # Compute args_digest for correlation (non-sensitive)
         args_digest = self._compute_args_digest(args)
@@ -618,163 +1218,204 @@ class SubprocessAdapter:
         # Common error details (added to all errors)
         base_details = self._base_error_details(args_digest)
 
-        # Write payload to temp file
         args_file_path: str | None = None
         try:
-            # Create temp file with identifiable prefix
-            fd, args_file_path = tempfile.mkstemp(suffix=".json", prefix="nexus-router-args-")
-            try:
-                os.write(fd, payload_json.encode("utf-8"))
-            finally:
-                os.close(fd)
-
-            # Set restrictive permissions on POSIX (best-effort)
-            self._secure_temp_file(args_file_path)
-
-            # Build command
-            cmd = [*self._base_cmd, "call", tool, method, "--json-args-file", args_file_path]
-
-            # Validate cwd if specified
-            if self._cwd is not None:
-                self._validate_cwd(self._cwd)
-
-            # Prepare environment
-            run_env: dict[str, str] | None = None
-            if self._env is not None:
-                self._validate_env(self._env)
-                run_env = {**os.environ, **self._env}
+            args_file_path = self._write_args_file(tool, method, args)
+            cmd, run_env = self._prepare_command(tool, method, args_file_path)
 
             # Execute
             try:
-                result = subprocess.run(
+                proc = subprocess.Popen(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=self._timeout_s,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     cwd=self._cwd,
                     env=run_env,
                     shell=False,
                 )
-            except subprocess.TimeoutExpired as e:
-                # Enhanced timeout details
-                details = {
-                    **base_details,
-                    "timeout_s": self._timeout_s,
-                    "cmd_first_token": os.path.basename(self._base_cmd[0]),
-                }
-                if self._cwd:
-                    details["cwd"] = self._cwd
-                # Capture any partial output (may be None or bytes)
-                if e.stdout is not None:
-                    stdout_str = (
-                        e.stdout
-                        if isinstance(e.stdout, str)
-                        else e.stdout.decode("utf-8", errors="replace")
-                    )
-                    details["stdout_excerpt"] = self._redact_text(self._truncate_stdout(stdout_str))
-                if e.stderr is not None:
-                    stderr_str = (
-                        e.stderr
-                        if isinstance(e.stderr, str)
-                        else e.stderr.decode("utf-8", errors="replace")
-                    )
-                    details["stderr_excerpt"] = self._redact_text(self._truncate_stderr(stderr_str))
-                raise NexusOperationalError(
-                    f"Command timed out after {self._timeout_s}s",
-                    error_code="TIMEOUT",
-                    details=details,
-                ) from e
-            except FileNotFoundError as e:
-                raise NexusOperationalError(
-                    f"Command not found: {self._base_cmd[0]}",
-                    error_code="COMMAND_NOT_FOUND",
-                    details=base_details,
-                ) from e
-            except PermissionError as e:
-                raise NexusOperationalError(
-                    f"Permission denied executing command: {self._base_cmd[0]}",
-                    error_code="PERMISSION_DENIED",
-                    details=base_details,
-                ) from e
             except OSError as e:
-                # Map specific errno values
-                if e.errno == errno.EACCES:
-                    raise NexusOperationalError(
-                        f"Permission denied: {e}",
-                        error_code="PERMISSION_DENIED",
-                        details=base_details,
-                    ) from e
-                raise NexusOperationalError(
-                    f"OS error executing command: {e}",
-                    error_code="OS_ERROR",
-                    details=base_details,
-                ) from e
-
-            # Check exit code
-            if result.returncode != 0:
-                stderr_excerpt = self._truncate_stderr(result.stderr)
-                raise NexusOperationalError(
-                    f"Command exited with code {result.returncode}",
-                    error_code="NONZERO_EXIT",
-                    details={
-                        **base_details,
-                        "returncode": result.returncode,
-                        "stderr_excerpt": self._redact_text(stderr_excerpt),
-                    },
-                )
+                raise self._spawn_error(e, base_details) from e
+            SUBPROCESS_SPAWNS.labels(self.adapter_kind).inc()
+
+            result = _communicate_bounded(
+                proc,
+                timeout_s=self._timeout_s,
+                max_stdout_bytes=self._max_stdout_bytes,
+                max_stderr_bytes=self._max_stderr_bytes,
+            )
+            self._local.resources = result.resources()
+            return self._parse_result(result, base_details)
+
+        finally:
+            # Clean up temp file with retry
+            if args_file_path is not None:
+                self._cleanup_temp_file(args_file_path)
 
-            # Parse JSON output (use full stdout, not truncated)
+    def _write_args_file(self, tool: str, method: str, args: dict[str, Any]) -> str:
+        """Write the call payload (full args, NOT redacted) to a private temp file."""
+        payload = {
+            "tool": tool,
+            "method": method,
+            "args": args,
+        }
+        payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+        # Create temp file with identifiable prefix
+        fd, args_file_path = tempfile.mkstemp(suffix=".json", prefix="nexus-router-args-")
+        try:
             try:
-                output = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                # Enhanced JSON error details with head/tail/len
-                stdout_len = len(result.stdout)
-                details = {
+                os.write(fd, payload_json.encode("utf-8"))
+            finally:
+                os.close(fd)
+        except BaseException:
+            self._cleanup_temp_file(args_file_path)
+            raise
+
+        # Set restrictive permissions on POSIX (best-effort)
+        self._secure_temp_file(args_file_path)
+        return args_file_path
+
+    def _prepare_command(
+        self, tool: str, method: str, args_file_path: str
+    ) -> tuple[list[str], dict[str, str] | None]:
+        """Build the command line and validated environment for a call."""
+        cmd = [*self._base_cmd, "call", tool, method, "--json-args-file", args_file_path]
+
+        # Validate cwd if specified
+        if self._cwd is not None:
+            self._validate_cwd(self._cwd)
+
+        # Prepare environment
+        run_env: dict[str, str] | None = None
+        if self._env is not None:
+            self._validate_env(self._env)
+            run_env = {**os.environ, **self._env}
+
+        # Propagate the active trace so tool spans join the run's trace
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            run_env = {
+                **(run_env if run_env is not None else os.environ),
+                "TRACEPARENT": traceparent,
+            }
+
+        return cmd, run_env
+
+    def _spawn_error(self, e: OSError, base_details: dict[str, Any]) -> NexusOperationalError:
+        """Map an OSError raised while launching the command."""
+        return map_spawn_error(self._base_cmd[0], e, base_details)
+
+    def _parse_result(self, result: _CaptureResult, base_details: dict[str, Any]) -> dict[str, Any]:
+        """Map a bounded capture to parsed output or NexusOperationalError."""
+        if result.overflow_stream is not None:
+            limit = (
+                self._max_stdout_bytes
+                if result.overflow_stream == "stdout"
+                else self._max_stderr_bytes
+            )
+            if result.overflow_stream == "stdout":
+                excerpt = self._truncate_stdout(_decode_output(result.stdout))
+            else:
+                excerpt = self._truncate_stderr(_decode_output(result.stderr))
+            raise NexusOperationalError(
+                f"Command {result.overflow_stream} exceeded {limit} bytes",
+                error_code="OUTPUT_TOO_LARGE",
+                details={
                     **base_details,
-                    "stdout_len": stdout_len,
-                    "json_error": str(e),
-                }
-                # Add head/tail excerpts
-                head, tail = self._excerpt_head_tail(result.stdout)
-                details["stdout_head"] = self._redact_text(head)
-                if tail:
-                    details["stdout_tail"] = self._redact_text(tail)
-                raise NexusOperationalError(
-                    f"Invalid JSON output: {e}",
-                    error_code="INVALID_JSON_OUTPUT",
-                    details=details,
-                ) from e
+                    "stream": result.overflow_stream,
+                    "limit_bytes": limit,
+                    "bytes_read": (
+                        result.stdout_bytes
+                        if result.overflow_stream == "stdout"
+                        else result.stderr_bytes
+                    ),
+                    "excerpt": self._redact_text(excerpt),
+                },
+            )
 
-            if not isinstance(output, dict):
-                raise NexusOperationalError(
-                    f"Output is not a JSON object: {type(output).__name__}",
-                    error_code="INVALID_JSON_OUTPUT",
-                    details=base_details,
+        if result.timed_out:
+            # Enhanced timeout details
+            details = {
+                **base_details,
+                "timeout_s": self._timeout_s,
+                "cmd_first_token": os.path.basename(self._base_cmd[0]),
+            }
+            if self._cwd:
+                details["cwd"] = self._cwd
+            # Capture any partial output
+            if result.stdout:
+                details["stdout_excerpt"] = self._redact_text(
+                    self._truncate_stdout(_decode_output(result.stdout))
                 )
-
-            # Check strict_stderr AFTER successful JSON parse
-            if self._strict_stderr and result.stderr.strip():
-                stderr_excerpt = self._truncate_stderr(result.stderr)
-                raise NexusOperationalError(
-                    "Command produced stderr output (strict_stderr mode)",
-                    error_code="STDERR_ON_SUCCESS",
-                    details={
-                        **base_details,
-                        "stderr_excerpt": self._redact_text(stderr_excerpt),
-                    },
+            if result.stderr:
+                details["stderr_excerpt"] = self._redact_text(
+                    self._truncate_stderr(_decode_output(result.stderr))
                 )
+            raise NexusOperationalError(
+                f"Command timed out after {self._timeout_s}s",
+                error_code="TIMEOUT",
+                details=details,
+            )
 
-            return output
+        # Check exit code
+        if result.returncode != 0:
+            stderr_excerpt = self._truncate_stderr(_decode_output(result.stderr))
+            raise NexusOperationalError(
+                f"Command exited with code {result.returncode}",
+                error_code="NONZERO_EXIT",
+                details={
+                    **base_details,
+                    "returncode": result.returncode,
+                    "stderr_excerpt": self._redact_text(stderr_excerpt),
+                },
+            )
 
-        finally:
-            # Clean up temp file with retry
-            if args_file_path is not None:
-                self._cleanup_temp_file(args_file_path)
+        # Parse JSON straight from bytes (json detects UTF-8/16/32)
+        try:
+            output = json.loads(result.stdout)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # Enhanced JSON error details with head/tail/len
+            stdout_text = _decode_output(result.stdout)
+            details = {
+                **base_details,
+                "stdout_len": len(result.stdout),
+                "json_error": str(e),
+            }
+            # Add head/tail excerpts
+            head, tail = self._excerpt_head_tail(stdout_text)
+            details["stdout_head"] = self._redact_text(head)
+            if tail:
+                details["stdout_tail"] = self._redact_text(tail)
+            raise NexusOperationalError(
+                f"Invalid JSON output: {e}",
+                error_code="INVALID_JSON_OUTPUT",
+                details=details,
+            ) from e
+
+        if not isinstance(output, dict):
+            raise NexusOperationalError(
+                f"Output is not a JSON object: {type(output).__name__}",
+                error_code="INVALID_JSON_OUTPUT",
+                details=base_details,
+            )
+
+        # Check strict_stderr AFTER successful JSON parse
+        if self._strict_stderr and result.stderr.strip():
+            stderr_excerpt = self._truncate_stderr(_decode_output(result.stderr))
+            raise NexusOperationalError(
+                "Command produced stderr output (strict_stderr mode)",
+                error_code="STDERR_ON_SUCCESS",
+                details={
+                    **base_details,
+                    "stderr_excerpt": self._redact_text(stderr_excerpt),
+                },
+            )
+
+        return output
 
     def _compute_args_digest(self, args: dict[str, Any]) -> str:
         """Compute SHA256 digest of canonical args JSON (first 12 hex chars)."""
-        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+        return _compute_args_digest(args)
 
     def _base_error_details(self, args_digest: str) -> dict[str, Any]:
         """Build common error details included in all operational errors."""
@@ -860,3 +1501,159 @@ class SubprocessAdapter:
         if len(text) <= head + tail:
             return (text, None)
         return (text[:head], text[-tail:])
+
+
+class _AsyncBoundedReader:
+    """Async counterpart of _BoundedPipeReader for asyncio stream readers."""
+
+    def __init__(self, stream: asyncio.StreamReader, limit: int, on_overflow: Callable[[], None]):
+        self._stream = stream
+        self._limit = limit
+        self._on_overflow = on_overflow
+        self._chunks: list[bytes] = []
+        self.total = 0
+        self.overflow = False
+
+    def data(self) -> bytes:
+        return b"".join(self._chunks)
+
+    async def run(self) -> None:
+        kept = 0
+        while True:
+            chunk = await self._stream.read(_PIPE_READ_CHUNK)
+            if not chunk:
+                return
+            self.total += len(chunk)
+            if kept < self._limit:
+                keep = chunk[: self._limit - kept]
+                self._chunks.append(keep)
+                kept += len(keep)
+            if self.total > self._limit:
+                self.overflow = True
+                self._on_overflow()
+                return
+
+
+class AsyncSubprocessAdapter(SubprocessAdapter):
+    """
+    SubprocessAdapter built on asyncio.create_subprocess_exec.
+
+    Same command contract, configuration, error taxonomy and redaction hooks
+    as SubprocessAdapter, but calls are coroutines (acall) so many concurrent
+    tool processes can be supervised from one event loop.
+
+    On POSIX the child is started in its own session and killed as a process
+    group on timeout, overflow or cancellation, so grandchildren do not leak.
+
+    The synchronous call() runs acall() on a private event loop, so the adapter
+    also works with Router; it must not be used from inside a running loop.
+
+    last_call_resources reports stdout_bytes and stderr_bytes only: asyncio
+    reaps the child itself, so there is no rusage to collect. Concurrent
+    acall()s on one loop share the slot (the last to finish wins).
+
+    Capabilities: apply, timeout, external
+    """
+
+    def _derive_adapter_id(self) -> str:
+        """Derive a stable adapter ID from base_cmd."""
+        return "async-" + super()._derive_adapter_id()
+
+    @property
+    def adapter_kind(self) -> str:
+        return "async_subprocess"
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """Execute a tool call synchronously (see acall)."""
+        return asyncio.run(self.acall(tool, method, args))
+
+    async def acall(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute a tool call via an asyncio subprocess.
+
+        Returns:
+            Parsed JSON result from stdout.
+
+        Raises:
+            NexusOperationalError: Same error codes as SubprocessAdapter.call.
+        """
+        self._last_cleanup_failed = False
+        self._local.resources = None
+
+        args_digest = self._compute_args_digest(args)
+        base_details = self._base_error_details(args_digest)
+
+        args_file_path: str | None = None
+        try:
+            args_file_path = self._write_args_file(tool, method, args)
+            cmd, run_env = self._prepare_command(tool, method, args_file_path)
+
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self._cwd,
+                    env=run_env,
+                    start_new_session=(os.name == "posix"),
+                )
+            except OSError as e:
+                raise self._spawn_error(e, base_details) from e
+            SUBPROCESS_SPAWNS.labels(self.adapter_kind).inc()
+
+            result = await self._communicate(proc)
+            self._local.resources = result.resources()
+            return self._parse_result(result, base_details)
+
+        finally:
+            if args_file_path is not None:
+                self._cleanup_temp_file(args_file_path)
+
+    async def _communicate(self, proc: asyncio.subprocess.Process) -> _CaptureResult:
+        """Drain both pipes under byte caps and the timeout, killing on failure."""
+        assert proc.stdout is not None and proc.stderr is not None
+
+        def kill() -> None:
+            self._kill_process_group(proc)
+
+        out = _AsyncBoundedReader(proc.stdout, self._max_stdout_bytes, kill)
+        err = _AsyncBoundedReader(proc.stderr, self._max_stderr_bytes, kill)
+
+        async def drain() -> int:
+            await asyncio.gather(out.run(), err.run())
+            return await proc.wait()
+
+        timed_out = False
+        returncode: int | None = None
+        try:
+            returncode = await asyncio.wait_for(drain(), timeout=self._timeout_s)
+        except TimeoutError:
+            timed_out = True
+        finally:
+            # Covers timeout, overflow and cancellation of the calling task
+            if proc.returncode is None:
+                kill()
+                await asyncio.shield(proc.wait())
+
+        overflow_stream = "stdout" if out.overflow else "stderr" if err.overflow else None
+        return _CaptureResult(
+            stdout=out.data(),
+            stderr=err.data(),
+            returncode=None if overflow_stream else returncode,
+            timed_out=timed_out and overflow_stream is None,
+            overflow_stream=overflow_stream,
+            stdout_bytes=out.total,
+            stderr_bytes=err.total,
+        )
+
+    @staticmethod
+    def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+        """Kill the child and (on POSIX) its whole process group."""
+        if proc.returncode is not None:
+            return
+        if os.name == "posix":
+            with contextlib.suppress(ProcessLookupError, PermissionError):
+                os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import time
 import uuid
 from dataclasses import dataclass
 from typing import Any
 
+from .metrics import EVENTS_APPENDED, STORE_APPEND_SECONDS
+
 SCHEMA_SQL = """
 PRAGMA journal_mode=WAL;
 PRAGMA foreign_keys=ON;
@@ -79,6 +82,7 @@ class EventStore:
         return run_id
 
     def append(self, run_id: str, event_type: str, payload: dict[str, Any]) -> EventRow:
+        start = time.perf_counter()
         with self.conn:
             (seq,) = self.conn.execute(
                 "SELECT COALESCE(MAX(seq), -1) + 1 FROM events WHERE run_id=?",
@@ -96,6 +100,8 @@ class EventStore:
                 "SELECT ts FROM events WHERE event_id=?",
                 (event_id,),
             ).fetchone()
+        STORE_APPEND_SECONDS.observe(time.perf_counter() - start)
+        EVENTS_APPENDED.labels(event_type).inc()
 
         return EventRow(
             event_id=event_id,
@@ -2,28 +2,55 @@
 
 from __future__ import annotations
 
+import gzip
 import hashlib
+import importlib
+import io
 import json
+import os
 import sqlite3
+import sys
+import zlib
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 
 BUNDLE_VERSION = "0.3"
 
+# Bundle files (export_run_to_file / load_bundle): JSON Lines with a header
+# line, one line per event and a digests trailer, optionally compressed.
+BUNDLE_FILE_FORMAT = "nexus-router.bundle.jsonl"
+BUNDLE_COMPRESSIONS = ("gzip", "zstd", "none")
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_WRITE_CHUNK_BYTES = 1 << 16
+
 
 def export_run(
     *,
     db_path: str,
     run_id: str,
     include_provenance: bool = True,
+    after_seq: int | None = None,
+    prev_digest: str | None = None,
 ) -> dict[str, Any]:
     """
     Export a run as a deterministic, portable bundle.
 
+    With after_seq the bundle is a delta: it carries only the events with
+    seq > after_seq plus a ``delta`` header (after_seq, the event_id at
+    after_seq, prev_digest) that import_bundle(mode="append") checks against
+    the target before appending. ``digests.chain`` links successive bundles of
+    a run: a full bundle's chain is its sha256, a delta's is
+    sha256(delta header + sha256). Pass the previous bundle's chain (or the
+    import response's chain_digest) as prev_digest.
+
     Args:
         db_path: Path to SQLite database file.
         run_id: The run ID to export.
         include_provenance: Whether to include provenance record (default True).
+        after_seq: Export only events after this seq (delta bundle).
+        prev_digest: digests.chain of the bundle this delta follows (optional).
 
     Returns:
         Dict with ok, artifact (bundle), and optional error.
@@ -31,93 +58,547 @@ def export_run(
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     try:
-        # Get run row
-        run_row = conn.execute(
-            "SELECT run_id, mode, goal, status, created_at FROM runs WHERE run_id = ?",
-            (run_id,),
-        ).fetchone()
+        selected = _select_run(conn, run_id, after_seq, prev_digest)
+        if isinstance(selected, dict):
+            return selected
+        run_data, delta = selected
 
-        if run_row is None:
-            return {
-                "ok": False,
-                "error": {"code": "RUN_NOT_FOUND", "message": f"Run {run_id} not found"},
-            }
+        # Get events ordered by seq (only those after after_seq for a delta)
+        event_rows = conn.execute(_EVENTS_SQL, (run_id, _first_seq_bound(after_seq))).fetchall()
+
+        artifact = _build_bundle(run_data, event_rows, delta)
+
+        # Optionally include provenance record
+        if include_provenance:
+            artifact["provenance"] = _provenance(db_path, run_id)
 
-        # Get all events ordered by seq
-        event_rows = conn.execute(
-            "SELECT event_id, run_id, seq, type, payload_json, ts "
-            "FROM events WHERE run_id = ? ORDER BY seq ASC",
-            (run_id,),
-        ).fetchall()
-
-        # Build canonical run object
-        run_data: dict[str, Any] = {
-            "run_id": run_row["run_id"],
-            "mode": run_row["mode"],
-            "goal": run_row["goal"],
-            "status": run_row["status"],
-            "created_at": run_row["created_at"],
+        return {"ok": True, "artifact": artifact}
+
+    finally:
+        conn.close()
+
+
+def export_run_to_file(
+    *,
+    db_path: str,
+    run_id: str,
+    path: str,
+    compression: str = "gzip",
+    include_provenance: bool = True,
+    after_seq: int | None = None,
+    prev_digest: str | None = None,
+) -> dict[str, Any]:
+    """
+    Stream a run into a bundle file, compressed by default.
+
+    The file is JSON Lines: a header (format, bundle_version, exported_at, run
+    and optional delta/provenance), one canonical line per event, and a
+    trailer with digests and event_count. Events are read, hashed and
+    compressed one at a time, so memory stays flat however large the run is.
+    The digests are the ones export_run() would produce (canonical {run,
+    events} JSON). Read it back with load_bundle() or import_bundle_file().
+
+    Args:
+        db_path: Path to SQLite database file.
+        run_id: The run ID to export.
+        path: Output file; written to path + ".tmp" and renamed when complete.
+        compression: "gzip" (default, stdlib), "zstd" (requires the zstandard
+                     package, the [zstd] extra) or "none".
+        include_provenance: Whether to include provenance record (default True).
+        after_seq: Export only events after this seq (delta bundle).
+        prev_digest: digests.chain of the bundle this delta follows (optional).
+
+    Returns:
+        Dict with ok, path, compression, events, bytes (file size) and digests,
+        or ok=False with error.
+    """
+    if compression not in BUNDLE_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {BUNDLE_COMPRESSIONS}, got {compression!r}")
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        selected = _select_run(conn, run_id, after_seq, prev_digest)
+        if isinstance(selected, dict):
+            return selected
+        run_data, delta = selected
+
+        header: dict[str, Any] = {
+            "format": BUNDLE_FILE_FORMAT,
+            "bundle_version": BUNDLE_VERSION,
+            "exported_at": _exported_at(),
+            "run": run_data,
         }
+        if delta is not None:
+            header["delta"] = delta
+        if include_provenance:
+            header["provenance"] = _provenance(db_path, run_id)
 
-        # Build canonical events list
-        events_data: list[dict[str, Any]] = []
-        for row in event_rows:
-            events_data.append(
-                {
-                    "event_id": row["event_id"],
-                    "run_id": row["run_id"],
-                    "seq": row["seq"],
-                    "type": row["type"],
-                    "payload": json.loads(row["payload_json"]),
-                    "ts": row["ts"],
+        digest = _BundleDigest()
+        events = 0
+        tmp_path = path + ".tmp"
+        try:
+            with _open_bundle_writer(tmp_path, compression) as f:
+                buf = [_canonical_json(header).encode("utf-8"), b"\n"]
+                size = 0
+                for row in conn.execute(_EVENTS_SQL, (run_id, _first_seq_bound(after_seq))):
+                    line = _canonical_json(_event_data(row))
+                    digest.update(line)
+                    encoded = line.encode("utf-8")
+                    buf += (encoded, b"\n")
+                    events += 1
+                    size += len(encoded) + 1
+                    if size >= _WRITE_CHUNK_BYTES:
+                        f.write(b"".join(buf))
+                        buf, size = [], 0
+                sha256_digest = digest.hexdigest(run_data)
+                digests = {
+                    "sha256": sha256_digest,
+                    "chain": compute_chain_digest(sha256_digest, delta),
                 }
-            )
+                trailer = {"digests": digests, "event_count": events}
+                buf += (_canonical_json(trailer).encode("utf-8"), b"\n")
+                f.write(b"".join(buf))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
-        # Compute deterministic digest over {run, events} only
-        # Using canonical JSON with sorted keys for reproducibility
-        digest_content = {
-            "run": run_data,
-            "events": events_data,
+        return {
+            "ok": True,
+            "path": path,
+            "compression": compression,
+            "events": events,
+            "bytes": os.path.getsize(path),
+            "digests": digests,
         }
-        digest_json = json.dumps(digest_content, sort_keys=True, separators=(",", ":"))
-        sha256_digest = hashlib.sha256(digest_json.encode("utf-8")).hexdigest()
 
-        # Build bundle
-        exported_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    finally:
+        conn.close()
 
-        artifact: dict[str, Any] = {
-            "bundle_version": BUNDLE_VERSION,
-            "exported_at": exported_at,
-            "run": run_data,
-            "events": events_data,
-            "digests": {
-                "sha256": sha256_digest,
-            },
+
+def load_bundle(path: str, *, verify_digest: bool = True) -> dict[str, Any]:
+    """
+    Load a bundle from a file.
+
+    Accepts files written by export_run_to_file() (gzip, zstd or
+    uncompressed, detected from the content) and plain JSON bundles. Bundle
+    files are decompressed and hashed line by line.
+
+    Args:
+        path: Bundle file path.
+        verify_digest: Check digests.sha256 (and a delta's chain digest).
+
+    Returns:
+        The bundle dict, in the same shape export_run() returns as artifact.
+
+    Raises:
+        ValueError: If the file is malformed or fails digest verification.
+    """
+    bundle, actual = _read_bundle_file(path)
+    for field in ("run", "events"):
+        if field not in bundle:
+            raise ValueError(f"Bundle missing '{field}'")
+    if verify_digest:
+        error = (
+            verify_bundle_digest(bundle)
+            if actual is None
+            else _check_digests(bundle["digests"], actual, bundle.get("delta"))
+        )
+        if error is not None:
+            raise ValueError(error)
+    return bundle
+
+
+_EVENTS_SQL = (
+    "SELECT event_id, run_id, seq, type, payload_json, ts "
+    "FROM events WHERE run_id = ? AND seq > ? ORDER BY seq ASC"
+)
+
+
+def _first_seq_bound(after_seq: int | None) -> int:
+    return after_seq if after_seq is not None else -1
+
+
+def _select_run(
+    conn: sqlite3.Connection,
+    run_id: str,
+    after_seq: int | None,
+    prev_digest: str | None,
+) -> tuple[dict[str, Any], dict[str, Any] | None] | dict[str, Any]:
+    """Canonical run object and delta header for an export, or an error response."""
+    # Get run row
+    run_row = conn.execute(
+        "SELECT run_id, mode, goal, status, created_at FROM runs WHERE run_id = ?",
+        (run_id,),
+    ).fetchone()
+
+    if run_row is None:
+        return {
+            "ok": False,
+            "error": {"code": "RUN_NOT_FOUND", "message": f"Run {run_id} not found"},
         }
 
-        # Optionally include provenance record
-        if include_provenance:
-            artifact["provenance"] = {
-                "export_method": "nexus-router.export",
-                "source_db_path": db_path,
-                "source_run_id": run_id,
-                "export_version": BUNDLE_VERSION,
+    delta: dict[str, Any] | None = None
+    if after_seq is not None:
+        row = conn.execute(
+            "SELECT event_id FROM events WHERE run_id = ? AND seq = ?",
+            (run_id, after_seq),
+        ).fetchone()
+        if row is None:
+            return {
+                "ok": False,
+                "error": {
+                    "code": "SEQ_NOT_FOUND",
+                    "message": f"Run {run_id} has no event at seq {after_seq}",
+                },
             }
+        delta = {
+            "after_seq": after_seq,
+            "after_event_id": row["event_id"],
+            "prev_digest": prev_digest,
+        }
+    return _run_data(run_row), delta
 
-        return {"ok": True, "artifact": artifact}
 
+def _provenance(db_path: str, run_id: str) -> dict[str, Any]:
+    return {
+        "export_method": "nexus-router.export",
+        "source_db_path": db_path,
+        "source_run_id": run_id,
+        "export_version": BUNDLE_VERSION,
+    }
+
+
+def export_runs_since(
+    *,
+    db_path: str,
+    since: str,
+    include_provenance: bool = True,
+) -> dict[str, Any]:
+    """
+    Export full bundles of every run created at or after a timestamp.
+
+    Together with delta bundles for runs already replicated this lets a sync
+    job ship only what changed. The returned ``until`` is the newest
+    created_at seen; use it as the next ``since`` (runs created at exactly that
+    instant are exported again and skipped by an append import).
+
+    Args:
+        db_path: Path to SQLite database file.
+        since: RFC3339 timestamp; runs with created_at >= since are exported.
+        include_provenance: Whether to include provenance records (default True).
+
+    Returns:
+        Dict with ok, artifacts (bundles ordered by created_at) and until.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        run_ids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT run_id FROM runs WHERE created_at >= ? ORDER BY created_at, run_id",
+                (since,),
+            )
+        ]
     finally:
         conn.close()
 
+    artifacts: list[dict[str, Any]] = []
+    for run_id in run_ids:
+        result = export_run(db_path=db_path, run_id=run_id, include_provenance=include_provenance)
+        if result["ok"]:
+            artifacts.append(result["artifact"])
+    until = max((a["run"]["created_at"] for a in artifacts), default=since)
+    return {"ok": True, "artifacts": artifacts, "until": until}
 
-def _compute_bundle_digest(bundle: dict[str, Any]) -> str:
-    """Recompute SHA256 digest for a bundle's {run, events}."""
+
+def _build_bundle(
+    run_data: dict[str, Any],
+    event_rows: list[sqlite3.Row],
+    delta: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Assemble the bundle dict and its digests from run and event rows."""
+    # Build canonical events list
+    events_data = [_event_data(row) for row in event_rows]
+
+    # Compute deterministic digest over {run, events} only
+    # Using canonical JSON with sorted keys for reproducibility
     digest_content = {
-        "run": bundle["run"],
-        "events": bundle["events"],
+        "run": run_data,
+        "events": events_data,
     }
     digest_json = json.dumps(digest_content, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(digest_json.encode("utf-8")).hexdigest()
+    sha256_digest = hashlib.sha256(digest_json.encode("utf-8")).hexdigest()
+
+    # Build bundle
+    artifact: dict[str, Any] = {
+        "bundle_version": BUNDLE_VERSION,
+        "exported_at": _exported_at(),
+        "run": run_data,
+        "events": events_data,
+        "digests": {
+            "sha256": sha256_digest,
+            "chain": compute_chain_digest(sha256_digest, delta),
+        },
+    }
+    if delta is not None:
+        artifact["delta"] = delta
+    return artifact
+
+
+def _run_data(run_row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "run_id": run_row["run_id"],
+        "mode": run_row["mode"],
+        "goal": run_row["goal"],
+        "status": run_row["status"],
+        "created_at": run_row["created_at"],
+    }
+
+
+def _event_data(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "event_id": row["event_id"],
+        "run_id": row["run_id"],
+        "seq": row["seq"],
+        "type": row["type"],
+        "payload": json.loads(row["payload_json"]),
+        "ts": row["ts"],
+    }
+
+
+def _exported_at() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _canonical_json(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+_EVENT_KEYS = frozenset(("event_id", "payload", "run_id", "seq", "ts", "type"))
+
+
+class _BundleDigest:
+    """
+    Incremental form of the bundle digest.
+
+    sha256 of canonical {"events": [...], "run": {...}} JSON, fed one
+    canonical event at a time; sorted keys put "events" before "run".
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256(b'{"events":[')
+        self._first = True
+
+    def update(self, event_json: str) -> None:
+        if not self._first:
+            self._hash.update(b",")
+        self._first = False
+        self._hash.update(event_json.encode("utf-8"))
+
+    def update_event(self, event: dict[str, Any], payload_json: str) -> None:
+        """Add a bundle event whose canonical payload JSON is already at hand."""
+        if event.keys() != _EVENT_KEYS:
+            self.update(_canonical_json(event))
+            return
+        # Splice the payload into the canonical event rather than re-encoding it
+        self.update(
+            f'{{"event_id":{json.dumps(event["event_id"])},"payload":{payload_json},'
+            f'"run_id":{json.dumps(event["run_id"])},"seq":{json.dumps(event["seq"])},'
+            f'"ts":{json.dumps(event["ts"])},"type":{json.dumps(event["type"])}}}'
+        )
+
+    def hexdigest(self, run_data: dict[str, Any]) -> str:
+        h = self._hash.copy()
+        h.update(f'],"run":{_canonical_json(run_data)}}}'.encode())
+        return h.hexdigest()
+
+
+def _zstandard() -> Any:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError as e:
+        raise ImportError(
+            "zstd bundles require the zstandard package (pip install 'nexus-router[zstd]')"
+        ) from e
+
+
+def _open_bundle_writer(path: str, compression: str) -> io.BufferedIOBase:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        compressor = _zstandard().ZstdCompressor(level=3)
+        raw = open(path, "wb")  # noqa: SIM115 - closed with the returned writer
+        writer: io.BufferedIOBase = compressor.stream_writer(raw, closefd=True)
+        return writer
+    return open(path, "wb")
+
+
+def _open_bundle_reader(path: str) -> io.BufferedIOBase:
+    """Open a bundle file for reading, decompressing by its magic bytes."""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic == _ZSTD_MAGIC:
+        raw = open(path, "rb")  # noqa: SIM115 - closed with the returned reader
+        return io.BufferedReader(_zstandard().ZstdDecompressor().stream_reader(raw, closefd=True))
+    return open(path, "rb")
+
+
+def _decode_errors() -> tuple[type[Exception], ...]:
+    """Exceptions a truncated or corrupt compressed stream raises while it is read."""
+    errors: tuple[type[Exception], ...] = (EOFError, zlib.error, gzip.BadGzipFile)
+    zstandard = sys.modules.get("zstandard")
+    if zstandard is not None:
+        errors += (zstandard.ZstdError,)
+    return errors
+
+
+class _BundleFileReader:
+    """
+    Streaming reader for a bundle file.
+
+    A JSON Lines file is read one line at a time: header is the bundle
+    without its events and digests, events() yields each event record as it
+    is decoded, and digests() checks the trailer once events() is exhausted.
+    A plain JSON bundle is parsed whole into bundle instead.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.header: dict[str, Any] = {}
+        self.bundle: dict[str, Any] | None = None
+        self._trailer: dict[str, Any] | None = None
+        self._event_count = 0
+        self._f = _open_bundle_reader(path)
+        try:
+            self._read_header()
+        except BaseException:
+            self._f.close()
+            raise
+
+    def __enter__(self) -> _BundleFileReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._f.close()
+
+    def _read_header(self) -> None:
+        try:
+            first = self._f.readline()
+            try:
+                header = json.loads(first)
+            except ValueError:
+                header = None
+            if not isinstance(header, dict) or header.get("format") != BUNDLE_FILE_FORMAT:
+                # Plain (possibly pretty-printed) JSON bundle
+                try:
+                    bundle = json.loads(first + self._f.read())
+                except ValueError as e:
+                    raise ValueError(f"Bundle file {self.path} is not valid JSON: {e}") from e
+                if not isinstance(bundle, dict):
+                    raise ValueError("Bundle must be a JSON object")
+                self.bundle = bundle
+                return
+        except _decode_errors() as e:
+            raise self._corrupt(e) from e
+
+        if "run" not in header:
+            raise ValueError("Bundle file header missing run")
+        self.header = {k: v for k, v in header.items() if k != "format"}
+
+    def events(self) -> Iterator[dict[str, Any]]:
+        """Yield the event records in file order."""
+        try:
+            for line in self._f:
+                if self._trailer is not None:
+                    raise ValueError("Bundle file has data after its trailer")
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"Bundle file line {self._event_count + 2} is not a JSON object"
+                    )
+                if "event_id" in record:
+                    self._event_count += 1
+                    yield record
+                else:
+                    self._trailer = record
+        except _decode_errors() as e:
+            raise self._corrupt(e) from e
+
+    def digests(self) -> dict[str, Any]:
+        """The trailer's declared digests, after checking its event count."""
+        trailer = self._trailer
+        if trailer is None or "digests" not in trailer:
+            raise ValueError("Bundle file is truncated (no digests trailer)")
+        if trailer.get("event_count") != self._event_count:
+            raise ValueError(
+                f"Bundle file holds {self._event_count} events, "
+                f"trailer says {trailer.get('event_count')}"
+            )
+        digests: dict[str, Any] = trailer["digests"]
+        return digests
+
+    def _corrupt(self, e: Exception) -> ValueError:
+        return ValueError(f"Bundle file {self.path} is truncated or corrupt: {e}")
+
+
+def _read_bundle_file(path: str) -> tuple[dict[str, Any], str | None]:
+    """
+    Parse a bundle file; returns (bundle, computed sha256).
+
+    The computed digest is None for plain JSON bundles, which carry no
+    trailer and are verified by verify_bundle_digest() instead.
+    """
+    with _BundleFileReader(path) as reader:
+        if reader.bundle is not None:
+            return reader.bundle, None
+        digest = _BundleDigest()
+        events: list[dict[str, Any]] = []
+        for record in reader.events():
+            # Re-canonicalize: the digest is defined over canonical JSON
+            digest.update(_canonical_json(record))
+            events.append(record)
+        bundle = {**reader.header, "events": events, "digests": reader.digests()}
+    return bundle, digest.hexdigest(bundle["run"])
+
+
+def _check_digests(
+    digests: dict[str, Any], actual: str, delta: dict[str, Any] | None
+) -> str | None:
+    """Compare declared digests against a computed sha256."""
+    expected = digests.get("sha256")
+    if expected is None:
+        return "Bundle missing digests.sha256"
+    if actual != expected:
+        return f"Digest mismatch: expected {expected}, got {actual}"
+    chain = digests.get("chain")
+    if chain is not None and delta is not None:
+        actual_chain = compute_chain_digest(actual, delta)
+        if actual_chain != chain:
+            return f"Chain digest mismatch: expected {chain}, got {actual_chain}"
+    return None
+
+
+def compute_chain_digest(sha256_digest: str, delta: dict[str, Any] | None) -> str:
+    """Chain digest of a bundle: its sha256, or sha256(delta header + sha256) for a delta."""
+    if delta is None:
+        return sha256_digest
+    chain_json = json.dumps(
+        {"delta": delta, "sha256": sha256_digest}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(chain_json.encode("utf-8")).hexdigest()
+
+
+def _compute_bundle_digest(bundle: dict[str, Any]) -> str:
+    """Recompute SHA256 digest for a bundle's {run, events}, one event at a time."""
+    digest = _BundleDigest()
+    for event in bundle["events"]:
+        digest.update(_canonical_json(event))
+    return digest.hexdigest(bundle["run"])
 
 
 def verify_bundle_digest(bundle: dict[str, Any]) -> str | None:
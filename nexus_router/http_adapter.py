@@ -0,0 +1,539 @@
+"""
+Built-in HTTP dispatch adapter with keep-alive connection pooling.
+
+Stdlib-only (http.client). Each call POSTs the same payload SubprocessAdapter
+writes to its args file:
+
+    POST <base_url><path_template>     e.g. POST http://host:8080/api/{tool}/{method}
+    {"tool": ..., "method": ..., "args": {...}}
+
+and expects a JSON object in a 2xx response body.
+
+Connections are kept alive and reused through a per-origin pool with a size
+limit and idle eviction, so repeated calls avoid a TCP/TLS handshake each.
+
+Usage:
+    from nexus_router.http_adapter import HttpAdapter
+
+    adapter = HttpAdapter("http://127.0.0.1:8080/tools", timeout_s=10)
+    registry.register(adapter)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import http.client
+import json
+import select
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import quote, urlsplit
+
+from .dispatch import (
+    CAPABILITY_APPLY,
+    CAPABILITY_EXTERNAL,
+    CAPABILITY_TIMEOUT,
+    _compute_args_digest,
+    default_redact_text,
+)
+from .exceptions import NexusOperationalError
+from .metrics import HTTP_POOL_WAITERS
+from .tracing import current_traceparent
+
+ADAPTER_MANIFEST = {
+    "schema_version": 1,
+    "kind": "http",
+    "capabilities": ["apply", "external", "timeout"],
+    "supported_router_versions": ">=1.1",
+    "config_schema": {
+        "base_url": {
+            "type": "string",
+            "required": True,
+            "description": "Base URL for HTTP dispatch (http:// or https://)",
+        },
+        "timeout_s": {
+            "type": "number",
+            "required": False,
+            "default": 30.0,
+            "description": "Request timeout in seconds",
+        },
+        "headers": {
+            "type": "object",
+            "required": False,
+            "description": "Additional HTTP headers to include in requests",
+        },
+        "max_connections": {
+            "type": "number",
+            "required": False,
+            "default": 10,
+            "description": "Maximum pooled connections per host",
+        },
+        "idle_timeout_s": {
+            "type": "number",
+            "required": False,
+            "default": 60.0,
+            "description": "Idle connections older than this are evicted",
+        },
+    },
+    "error_codes": [
+        "TIMEOUT",
+        "CONNECTION_FAILED",
+        "HTTP_ERROR",
+        "INVALID_JSON",
+        "OUTPUT_TOO_LARGE",
+    ],
+}
+
+# Chunk size when reading response bodies
+_READ_CHUNK = 64 * 1024
+
+
+class _PoolTimeout(Exception):
+    """No pooled connection became available before the deadline."""
+
+
+class _ConnectionPool:
+    """
+    Keep-alive connection pool for one origin (scheme, host, port).
+
+    Idle connections are reused LIFO (most recently used first, so the
+    warmest socket is picked and cold ones age out). At most ``max_size``
+    connections exist at once; callers wait for a free one until their
+    deadline. With check_stale, an idle connection the peer has already
+    closed is discarded before it is handed out.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        *,
+        max_size: int,
+        idle_timeout_s: float,
+        ssl_context: ssl.SSLContext | None,
+        check_stale: bool = True,
+        waiters_gauge: Any = None,
+    ) -> None:
+        self._scheme = scheme
+        self._host = host
+        self._port = port
+        self._max_size = max_size
+        self._idle_timeout_s = idle_timeout_s
+        self._ssl_context = ssl_context
+        self._check_stale = check_stale
+        self._waiters_gauge = waiters_gauge
+        self._idle: deque[tuple[http.client.HTTPConnection, float]] = deque()
+        self._cond = threading.Condition()
+        self._open = 0  # idle + in use
+        self.created = 0
+        self.reused = 0
+        self.waiting = 0
+
+    def acquire(self, deadline: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused). Raises _PoolTimeout if none frees up."""
+        with self._cond:
+            while True:
+                self._evict_expired_locked()
+                if self._idle:
+                    conn, _ = self._idle.pop()
+                    if self._check_stale and _peer_closed(conn):
+                        self._open -= 1
+                        conn.close()
+                        continue
+                    self.reused += 1
+                    return conn, True
+                if self._open < self._max_size:
+                    self._open += 1
+                    self.created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise _PoolTimeout
+                self.waiting += 1
+                if self._waiters_gauge is not None:
+                    self._waiters_gauge.inc()
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self.waiting -= 1
+                    if self._waiters_gauge is not None:
+                        self._waiters_gauge.dec()
+
+        return self._new_connection(max(deadline - time.monotonic(), 0.001)), False
+
+    def release(self, conn: http.client.HTTPConnection, *, reusable: bool) -> None:
+        """Return a connection to the pool, or close it if it can't be reused."""
+        with self._cond:
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._open -= 1
+                conn.close()
+            self._cond.notify()
+
+    def evict_idle(self) -> int:
+        """Close idle connections past idle_timeout_s. Returns number closed."""
+        with self._cond:
+            return self._evict_expired_locked()
+
+    def close(self) -> None:
+        """Close all idle connections (in-use ones close on release)."""
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._open -= 1
+                conn.close()
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                "waiting": self.waiting,
+            }
+
+    def _evict_expired_locked(self) -> int:
+        cutoff = time.monotonic() - self._idle_timeout_s
+        evicted = 0
+        # Oldest connections sit at the left end
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._open -= 1
+            conn.close()
+            evicted += 1
+        if evicted:
+            self._cond.notify_all()
+        return evicted
+
+    def _new_connection(self, timeout_s: float) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=timeout_s, context=self._ssl_context
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout_s)
+
+
+def _peer_closed(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle keep-alive socket is readable, i.e. the peer closed it."""
+    if conn.sock is None:
+        return True
+    # An idle HTTP/1.1 connection has nothing to read unless the peer hung up
+    if hasattr(select, "poll"):
+        # poll, not select: select() rejects fds >= FD_SETSIZE (1024)
+        poller = select.poll()
+        poller.register(conn.sock, select.POLLIN)
+        return bool(poller.poll(0))
+    # Windows: select() caps the number of sockets, not their fd values
+    readable, _, _ = select.select([conn.sock], [], [], 0)
+    return bool(readable)
+
+
+class HttpAdapter:
+    """
+    Adapter that dispatches tool calls over HTTP with pooled keep-alive connections.
+
+    Mirrors SubprocessAdapter semantics:
+    - timeout_s bounds the whole call (pool wait, connect, send, full body read)
+    - max_response_bytes is a hard cap on the body (OUTPUT_TOO_LARGE)
+    - redaction hooks apply to error details; args_digest is in all errors
+    - all failures map to NexusOperationalError
+
+    Before a pooled connection is reused it is checked for a peer close
+    (idle-timeout reaper) and replaced with a fresh one if so; no bytes have
+    been sent at that point. Once a request has been sent it is never
+    retried: every call is a POST, and the server may have acted on it before
+    the connection dropped.
+    HTTP/1.1 pipelining is not used: http.client does not support it and it
+    is unsafe for non-idempotent POSTs; concurrency comes from the pool.
+
+    Error codes:
+    - TIMEOUT: call exceeded timeout_s (details: timeout_s, phase)
+    - CONNECTION_FAILED: could not connect / connection dropped
+    - HTTP_ERROR: non-2xx status (details: status, body_excerpt)
+    - INVALID_JSON: body is not a JSON object
+    - OUTPUT_TOO_LARGE: body exceeded max_response_bytes
+
+    Capabilities: apply, timeout, external
+    """
+
+    RedactTextFunc = Callable[[str], str]
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        adapter_id: str | None = None,
+        timeout_s: float = 30.0,
+        headers: dict[str, str] | None = None,
+        path_template: str = "/{tool}/{method}",
+        max_connections: int = 10,
+        idle_timeout_s: float = 60.0,
+        max_response_bytes: int = 64 * 1024 * 1024,
+        max_error_body_chars: int = 2_000,
+        redact_text: RedactTextFunc | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        check_stale: bool = True,
+    ) -> None:
+        """
+        Initialize HttpAdapter.
+
+        Args:
+            base_url: Base URL (http:// or https://), optionally with a path prefix.
+            adapter_id: Optional custom adapter ID. Defaults to "http:{host[:port]}".
+            timeout_s: Timeout for the whole call in seconds.
+            headers: Extra request headers.
+            path_template: Path appended to base_url; {tool}/{method} are URL-quoted.
+            max_connections: Maximum connections per host (in use + idle).
+            idle_timeout_s: Idle connections older than this are closed.
+            max_response_bytes: Hard cap on response body size.
+            max_error_body_chars: Max chars of body kept in HTTP_ERROR details.
+            redact_text: Redaction for text in error details (default_redact_text).
+            ssl_context: SSL context for https (default: ssl.create_default_context()).
+            check_stale: Probe idle pooled connections before reuse (without
+                waiting) and discard ones the server already closed. A request
+                is never resent once written.
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"base_url must be an http(s) URL, got: {base_url!r}")
+        if max_connections <= 0:
+            raise ValueError("max_connections must be positive")
+        if max_response_bytes <= 0:
+            raise ValueError("max_response_bytes must be positive")
+
+        self._base_url = base_url.rstrip("/")
+        self._base_path = parts.path.rstrip("/")
+        self._netloc = parts.netloc
+        self._timeout_s = timeout_s
+        self._path_template = path_template
+        self._max_response_bytes = max_response_bytes
+        self._max_error_body_chars = max_error_body_chars
+        self._redact_text: HttpAdapter.RedactTextFunc = (
+            redact_text if redact_text is not None else default_redact_text
+        )
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        self._capabilities: frozenset[str] = frozenset(
+            {CAPABILITY_APPLY, CAPABILITY_TIMEOUT, CAPABILITY_EXTERNAL}
+        )
+        self._adapter_id = adapter_id if adapter_id is not None else f"http:{parts.netloc}"
+
+        if parts.scheme == "https" and ssl_context is None:
+            ssl_context = ssl.create_default_context()
+        self._pool = _ConnectionPool(
+            parts.scheme,
+            parts.hostname,
+            parts.port,
+            max_size=max_connections,
+            idle_timeout_s=idle_timeout_s,
+            ssl_context=ssl_context,
+            check_stale=check_stale,
+            waiters_gauge=HTTP_POOL_WAITERS.labels(self._adapter_id),
+        )
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "http"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._capabilities
+
+    def pool_stats(self) -> dict[str, int]:
+        """Connection pool counters: created, reused, idle, in_use."""
+        return self._pool.stats()
+
+    def evict_idle(self) -> int:
+        """Close idle connections past idle_timeout_s. Returns number closed."""
+        return self._pool.evict_idle()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._pool.close()
+
+    def __enter__(self) -> HttpAdapter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        self.close()
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute a tool call via HTTP POST.
+
+        Returns:
+            Parsed JSON object from the response body.
+
+        Raises:
+            NexusOperationalError: For timeout, connection failure, non-2xx status,
+                invalid JSON, or an oversized body.
+        """
+        deadline = time.monotonic() + self._timeout_s
+        path = self._base_path + self._path_template.format(
+            tool=quote(tool, safe=""), method=quote(method, safe="")
+        )
+        body = json.dumps(
+            {"tool": tool, "method": method, "args": args},
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        base_details: dict[str, Any] = {
+            "args_digest": _compute_args_digest(args),
+            "url": self._base_url.split("://", 1)[0] + "://" + self._netloc + path,
+        }
+
+        try:
+            conn, _ = self._pool.acquire(deadline)
+        except _PoolTimeout:
+            raise self._timeout_error(base_details, "pool_wait") from None
+        except OSError as e:
+            raise self._connection_error(base_details, e) from e
+
+        reusable = False
+        try:
+            status, will_close, data = self._exchange(conn, path, body, deadline, base_details)
+            reusable = not will_close
+        except TimeoutError as e:
+            raise self._timeout_error(base_details, "io") from e
+        except (OSError, http.client.HTTPException) as e:
+            raise self._connection_error(base_details, e) from e
+        finally:
+            self._pool.release(conn, reusable=reusable)
+
+        if not 200 <= status < 300:
+            excerpt = data[: self._max_error_body_chars].decode("utf-8", errors="replace")
+            raise NexusOperationalError(
+                f"HTTP {status} from {base_details['url']}",
+                error_code="HTTP_ERROR",
+                details={
+                    **base_details,
+                    "status": status,
+                    "body_excerpt": self._redact_text(excerpt),
+                },
+            )
+
+        try:
+            output = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            head = data[:500].decode("utf-8", errors="replace")
+            raise NexusOperationalError(
+                f"Invalid JSON response: {e}",
+                error_code="INVALID_JSON",
+                details={
+                    **base_details,
+                    "body_len": len(data),
+                    "json_error": str(e),
+                    "body_head": self._redact_text(head),
+                },
+            ) from e
+
+        if not isinstance(output, dict):
+            raise NexusOperationalError(
+                f"Response is not a JSON object: {type(output).__name__}",
+                error_code="INVALID_JSON",
+                details=base_details,
+            )
+        return output
+
+    def _exchange(
+        self,
+        conn: http.client.HTTPConnection,
+        path: str,
+        body: bytes,
+        deadline: float,
+        base_details: dict[str, Any],
+    ) -> tuple[int, bool, bytes]:
+        """Send one request and read the full (bounded) response body."""
+        self._set_timeout(conn, deadline)
+        headers = self._headers
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            headers = {**headers, "traceparent": traceparent}
+        conn.request("POST", path, body=body, headers=headers)
+        self._set_timeout(conn, deadline)
+        response = conn.getresponse()
+
+        chunks: list[bytes] = []
+        total = 0
+        while True:
+            self._set_timeout(conn, deadline)
+            chunk = response.read(_READ_CHUNK)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > self._max_response_bytes:
+                response.close()
+                conn.close()
+                raise NexusOperationalError(
+                    f"Response body exceeded {self._max_response_bytes} bytes",
+                    error_code="OUTPUT_TOO_LARGE",
+                    details={
+                        **base_details,
+                        "limit_bytes": self._max_response_bytes,
+                        "bytes_read": total,
+                    },
+                )
+            chunks.append(chunk)
+        response.close()
+
+        return response.status, response.will_close, b"".join(chunks)
+
+    def _set_timeout(self, conn: http.client.HTTPConnection, deadline: float) -> None:
+        """Bound the next socket operation by the call's remaining time."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError
+        conn.timeout = remaining
+        if conn.sock is not None:
+            conn.sock.settimeout(remaining)
+
+    def _timeout_error(self, base_details: dict[str, Any], phase: str) -> NexusOperationalError:
+        return NexusOperationalError(
+            f"HTTP call timed out after {self._timeout_s}s",
+            error_code="TIMEOUT",
+            details={**base_details, "timeout_s": self._timeout_s, "phase": phase},
+        )
+
+    def _connection_error(
+        self, base_details: dict[str, Any], e: Exception
+    ) -> NexusOperationalError:
+        return NexusOperationalError(
+            f"Connection failed: {type(e).__name__}",
+            error_code="CONNECTION_FAILED",
+            details={
+                **base_details,
+                "cause_type": type(e).__name__,
+                "cause": self._redact_text(str(e)),
+            },
+        )
+
+
+def create_adapter(*, adapter_id: str | None = None, **config: Any) -> HttpAdapter:
+    """Adapter factory (plugins.load_adapter entry point)."""
+    base_url = config.pop("base_url", None)
+    if not base_url:
+        raise ValueError("base_url is required")
+    with contextlib.suppress(KeyError):
+        config["timeout_s"] = float(config["timeout_s"])
+    return HttpAdapter(base_url, adapter_id=adapter_id, **config)
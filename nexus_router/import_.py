@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import time
 import uuid
+from collections.abc import Callable, Iterable
 from typing import Any
 
-from .export import _compute_bundle_digest
+from .export import _BundleDigest, _BundleFileReader, _check_digests, compute_chain_digest
+from .metrics import IMPORT_SECONDS, IMPORTED_EVENTS, IMPORTS
 from .replay import replay as _replay_impl
 
 
@@ -30,12 +33,110 @@ def import_bundle(
             - "reject_on_conflict": Fail if run_id already exists (default)
             - "new_run_id": Generate or use provided new_run_id
             - "overwrite": Delete existing run and reimport
+            - "append": Incremental sync. A delta bundle (export_run with
+              after_seq) is appended to the existing run once its base seq,
+              event_id and prev_digest match the target; a full bundle is
+              inserted if the run is new and skipped otherwise.
         new_run_id: Only used if mode is "new_run_id". If not provided, generates UUID.
         verify_digest: Verify bundle digest before import (default True).
         replay_after_import: Run replay after import to verify integrity (default True).
 
     Returns:
-        Dict with status, imported_run_id, events_inserted, and optional violations.
+        Dict with status, imported_run_id, events_inserted, chain_digest, and
+        optional violations.
+    """
+    start = time.perf_counter()
+    result = _import_bundle(
+        db_path=db_path,
+        bundle=bundle,
+        read_digests=lambda: bundle.get("digests", {}),
+        mode=mode,
+        new_run_id=new_run_id,
+        verify_digest=verify_digest,
+        replay_after_import=replay_after_import,
+    )
+    _observe_import(start, result)
+    return result
+
+
+def import_bundle_file(
+    *,
+    db_path: str,
+    path: str,
+    mode: str = "reject_on_conflict",
+    new_run_id: str | None = None,
+    verify_digest: bool = True,
+    replay_after_import: bool = True,
+) -> dict[str, Any]:
+    """
+    Import a bundle file (export_run_to_file output or a plain JSON bundle).
+
+    Events are decompressed, hashed and inserted one line at a time, without
+    holding the bundle in memory. The trailer's event count and digests are
+    checked before commit; on mismatch the transaction is rolled back.
+
+    Args:
+        db_path: Path to SQLite database file.
+        path: Bundle file path (gzip, zstd or uncompressed).
+        mode, new_run_id, replay_after_import: As for import_bundle().
+        verify_digest: Verify the bundle digest (default True).
+
+    Returns:
+        Same shape as import_bundle().
+    """
+    start = time.perf_counter()
+    try:
+        with _BundleFileReader(path) as reader:
+            if reader.bundle is not None:
+                # Plain JSON bundle, already parsed whole
+                return import_bundle(
+                    db_path=db_path,
+                    bundle=reader.bundle,
+                    mode=mode,
+                    new_run_id=new_run_id,
+                    verify_digest=verify_digest,
+                    replay_after_import=replay_after_import,
+                )
+            result = _import_bundle(
+                db_path=db_path,
+                bundle={**reader.header, "events": reader.events()},
+                read_digests=reader.digests,
+                mode=mode,
+                new_run_id=new_run_id,
+                verify_digest=verify_digest,
+                replay_after_import=replay_after_import,
+            )
+    except (OSError, ValueError) as e:
+        # Raised by the reader: the open transaction was discarded with its connection
+        result = {
+            "status": "error",
+            "error": {"code": "INVALID_BUNDLE", "message": f"Cannot read {path}: {e}"},
+        }
+    _observe_import(start, result)
+    return result
+
+
+def _observe_import(start: float, result: dict[str, Any]) -> None:
+    IMPORT_SECONDS.observe(time.perf_counter() - start)
+    IMPORTS.labels(result["status"]).inc()
+    IMPORTED_EVENTS.inc(result.get("events_inserted", 0))
+
+
+def _import_bundle(
+    *,
+    db_path: str,
+    bundle: dict[str, Any],
+    read_digests: Callable[[], dict[str, Any]],
+    mode: str = "reject_on_conflict",
+    new_run_id: str | None = None,
+    verify_digest: bool = True,
+    replay_after_import: bool = True,
+) -> dict[str, Any]:
+    """
+    Import a validated bundle whose "events" may be any iterable.
+
+    read_digests() returns the declared digests once the events have been
+    consumed (a bundle file only reaches them in its trailer).
     """
     # Validate bundle structure
     validation_error = _validate_bundle_structure(bundle)
@@ -45,14 +146,23 @@ def import_bundle(
             "error": {"code": "INVALID_BUNDLE", "message": validation_error},
         }
 
-    # Verify digest if requested
-    if verify_digest:
-        digest_error = _verify_digest(bundle)
-        if digest_error:
-            return {
-                "status": "error",
-                "error": {"code": "DIGEST_MISMATCH", "message": digest_error},
-            }
+    delta = bundle.get("delta")
+    if delta is not None and mode != "append":
+        return {
+            "status": "error",
+            "error": {"code": "INVALID_BUNDLE", "message": "Delta bundles require mode=append"},
+        }
+
+    # Verify digest if requested: it is computed while the events are inserted
+    # and the transaction is rolled back on mismatch (see _insert_events)
+    if delta is not None:
+        return _append_delta(
+            db_path=db_path,
+            bundle=bundle,
+            read_digests=read_digests,
+            verify_digest=verify_digest,
+            replay_after_import=replay_after_import,
+        )
 
     run_data = bundle["run"]
     events_data = bundle["events"]
@@ -77,7 +187,7 @@ def import_bundle(
         ).fetchone()
 
         if existing:
-            if mode == "reject_on_conflict":
+            if mode in ("reject_on_conflict", "append"):
                 return {
                     "status": "skipped",
                     "conflict": {
@@ -86,10 +196,10 @@ def import_bundle(
                     },
                 }
             elif mode == "overwrite":
-                # Delete existing run and events
+                # Delete existing run and events (same transaction as the insert,
+                # so a failed import leaves the old run in place)
                 conn.execute("DELETE FROM events WHERE run_id = ?", (target_run_id,))
                 conn.execute("DELETE FROM runs WHERE run_id = ?", (target_run_id,))
-                conn.commit()
             # mode == "new_run_id" with collision: generate new ID
             elif mode == "new_run_id":
                 target_run_id = str(uuid.uuid4())
@@ -106,47 +216,23 @@ def import_bundle(
             ),
         )
 
-        # Insert events with original seq (or remapped run_id)
-        events_inserted = 0
-        for event in events_data:
-            event_run_id = target_run_id  # Always use target run_id
-            event_id = event["event_id"]
-
-            # If we're remapping run_id, generate new event_id to avoid collision
-            if target_run_id != original_run_id:
-                event_id = str(uuid.uuid4())
-
-            payload_json = json.dumps(event["payload"], sort_keys=True, separators=(",", ":"))
-
-            # Remap run_id references in payload if present
-            payload = event["payload"]
-            if target_run_id != original_run_id:
-                payload = _remap_run_id_in_payload(payload, original_run_id, target_run_id)
-                payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-
-            try:
-                conn.execute(
-                    "INSERT INTO events(event_id, run_id, seq, type, payload_json, ts) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        event_id,
-                        event_run_id,
-                        event["seq"],
-                        event["type"],
-                        payload_json,
-                        event["ts"],
-                    ),
-                )
-                events_inserted += 1
-            except sqlite3.IntegrityError as e:
+        digest = _BundleDigest() if verify_digest else None
+        events_inserted, insert_error = _insert_events(
+            conn, events_data, original_run_id, target_run_id, digest
+        )
+        if insert_error:
+            return insert_error
+        digests = read_digests()
+        if digest is not None:
+            digest_error = _check_digests(digests, digest.hexdigest(run_data), None)
+            if digest_error:
                 conn.rollback()
                 return {
                     "status": "error",
-                    "error": {
-                        "code": "SEQ_DUPLICATE",
-                        "message": f"Duplicate seq {event['seq']}: {e}",
-                    },
+                    "error": {"code": "DIGEST_MISMATCH", "message": digest_error},
                 }
+        chain_digest = _import_chain(digests, None)
+        _save_chain(conn, target_run_id, chain_digest)
 
         conn.commit()
 
@@ -155,13 +241,17 @@ def import_bundle(
             "imported_run_id": target_run_id,
             "events_inserted": events_inserted,
         }
+        if chain_digest is not None:
+            result["chain_digest"] = chain_digest
 
         # Optionally run replay to verify integrity
         if replay_after_import:
+            # Append-mode imports keep a replay checkpoint for later deltas
             replay_result = _replay_impl(
                 db_path=db_path,
                 run_id=target_run_id,
                 strict=True,
+                incremental=mode == "append",
             )
             result["replay_ok"] = replay_result["ok"]
             if replay_result.get("violations"):
@@ -173,6 +263,264 @@ def import_bundle(
         conn.close()
 
 
+def _append_delta(
+    *,
+    db_path: str,
+    bundle: dict[str, Any],
+    read_digests: Callable[[], dict[str, Any]],
+    verify_digest: bool,
+    replay_after_import: bool,
+) -> dict[str, Any]:
+    """Append a delta bundle's events to an existing run after checking continuity."""
+    run_data = bundle["run"]
+    events_data = bundle["events"]
+    delta = bundle["delta"]
+    run_id = run_data["run_id"]
+    after_seq = delta["after_seq"]
+
+    if verify_digest and "digests" in bundle:
+        # The header is covered by the chain over the declared sha256; the
+        # sha256 itself is checked against the events as they are inserted.
+        # A bundle file declares its digests last, so its chain is checked then
+        header_error = _check_header(bundle["digests"], delta)
+        if header_error:
+            return {
+                "status": "error",
+                "error": {"code": "DIGEST_MISMATCH", "message": header_error},
+            }
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        _ensure_schema(conn)
+
+        if conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone() is None:
+            return {
+                "status": "error",
+                "error": {
+                    "code": "DELTA_BASE_MISSING",
+                    "message": f"Run {run_id} not found; import its full bundle first",
+                },
+            }
+
+        last_seq = _last_seq(conn, run_id)
+
+        if last_seq is not None and last_seq > after_seq:
+            # Already applied if the delta's final event is present as-is
+            final_seq, final_id = after_seq, delta["after_event_id"]
+            for event in events_data:
+                final_seq, final_id = event.get("seq"), event.get("event_id")
+            header_error = _check_header(read_digests(), delta) if verify_digest else None
+            if header_error:
+                return {
+                    "status": "error",
+                    "error": {"code": "DIGEST_MISMATCH", "message": header_error},
+                }
+            if _event_id_at(conn, run_id, final_seq) == final_id:
+                return {
+                    "status": "skipped",
+                    "conflict": {"reason": "delta_already_applied", "existing_run_id": run_id},
+                }
+        if (
+            last_seq != after_seq
+            or _event_id_at(conn, run_id, after_seq) != delta["after_event_id"]
+        ):
+            return {
+                "status": "error",
+                "error": {
+                    "code": "DELTA_DISCONTINUITY",
+                    "message": (
+                        f"Delta follows seq {after_seq} ({delta['after_event_id']}) but "
+                        f"run {run_id} ends at seq {last_seq}"
+                    ),
+                },
+            }
+
+        prev_digest = delta.get("prev_digest")
+        stored = conn.execute(
+            "SELECT chain_digest FROM import_chains WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if prev_digest is not None and stored is not None and stored[0] != prev_digest:
+            return {
+                "status": "error",
+                "error": {
+                    "code": "CHAIN_MISMATCH",
+                    "message": (
+                        f"Delta prev_digest {prev_digest} does not match the last "
+                        f"imported chain digest {stored[0]}"
+                    ),
+                },
+            }
+
+        digest = _BundleDigest() if verify_digest else None
+        events_inserted, insert_error = _insert_events(
+            conn, events_data, run_id, run_id, digest, first_seq=after_seq + 1
+        )
+        if insert_error:
+            return insert_error
+        digests = read_digests()
+        if digest is not None:
+            digest_error = _check_digests(digests, digest.hexdigest(run_data), delta)
+            if digest_error:
+                conn.rollback()
+                return {
+                    "status": "error",
+                    "error": {"code": "DIGEST_MISMATCH", "message": digest_error},
+                }
+        chain_digest = _import_chain(digests, delta)
+        conn.execute("UPDATE runs SET status = ? WHERE run_id = ?", (run_data["status"], run_id))
+        _save_chain(conn, run_id, chain_digest)
+        conn.commit()
+    finally:
+        conn.close()
+
+    result: dict[str, Any] = {
+        "status": "ok",
+        "imported_run_id": run_id,
+        "events_inserted": events_inserted,
+    }
+    if chain_digest is not None:
+        result["chain_digest"] = chain_digest
+
+    if replay_after_import:
+        # Only the appended events need re-verification
+        replay_result = _replay_impl(db_path=db_path, run_id=run_id, strict=True, incremental=True)
+        result["replay_ok"] = replay_result["ok"]
+        if replay_result.get("violations"):
+            result["violations"] = replay_result["violations"]
+
+    return result
+
+
+def _insert_events(
+    conn: sqlite3.Connection,
+    events_data: Iterable[dict[str, Any]],
+    original_run_id: str,
+    target_run_id: str,
+    digest: _BundleDigest | None = None,
+    *,
+    first_seq: int | None = None,
+) -> tuple[int, dict[str, Any] | None]:
+    """
+    Insert bundle events under target_run_id; returns (count, error response).
+
+    Events are checked and, if a digest is given, hashed in the same single
+    pass. With first_seq, events must be numbered first_seq, first_seq + 1,
+    ... (delta continuity). On error the transaction is rolled back.
+    """
+    events_inserted = 0
+    for i, event in enumerate(events_data):
+        missing = _REQUIRED_EVENT_FIELDS.difference(event)
+        if missing:
+            conn.rollback()
+            return events_inserted, {
+                "status": "error",
+                "error": {
+                    "code": "INVALID_BUNDLE",
+                    "message": f"Missing events[{i}].{sorted(missing)[0]}",
+                },
+            }
+        if first_seq is not None and event["seq"] != first_seq + i:
+            conn.rollback()
+            return events_inserted, {
+                "status": "error",
+                "error": {
+                    "code": "DELTA_DISCONTINUITY",
+                    "message": (
+                        f"Delta events[{i}] has seq {event['seq']}, expected {first_seq + i}"
+                    ),
+                },
+            }
+        event_run_id = target_run_id  # Always use target run_id
+        event_id = event["event_id"]
+
+        # If we're remapping run_id, generate new event_id to avoid collision
+        if target_run_id != original_run_id:
+            event_id = str(uuid.uuid4())
+
+        payload_json = json.dumps(event["payload"], sort_keys=True, separators=(",", ":"))
+        if digest is not None:
+            # The digest covers the bundle as exported, before any remapping
+            digest.update_event(event, payload_json)
+
+        # Remap run_id references in payload if present
+        payload = event["payload"]
+        if target_run_id != original_run_id:
+            payload = _remap_run_id_in_payload(payload, original_run_id, target_run_id)
+            payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+        try:
+            conn.execute(
+                "INSERT INTO events(event_id, run_id, seq, type, payload_json, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    event_id,
+                    event_run_id,
+                    event["seq"],
+                    event["type"],
+                    payload_json,
+                    event["ts"],
+                ),
+            )
+            events_inserted += 1
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            return events_inserted, {
+                "status": "error",
+                "error": {
+                    "code": "SEQ_DUPLICATE",
+                    "message": f"Duplicate seq {event['seq']}: {e}",
+                },
+            }
+    return events_inserted, None
+
+
+def _event_id_at(conn: sqlite3.Connection, run_id: str, seq: int) -> str | None:
+    row = conn.execute(
+        "SELECT event_id FROM events WHERE run_id = ? AND seq = ?", (run_id, seq)
+    ).fetchone()
+    return None if row is None else str(row[0])
+
+
+def _last_seq(conn: sqlite3.Connection, run_id: str) -> int | None:
+    row = conn.execute("SELECT MAX(seq) FROM events WHERE run_id = ?", (run_id,)).fetchone()
+    return None if row[0] is None else int(row[0])
+
+
+def _check_header(digests: dict[str, Any], delta: dict[str, Any]) -> str | None:
+    """Check a delta header against the chain over the declared sha256."""
+    declared = digests.get("sha256")
+    if declared is None:
+        return "Bundle missing digests.sha256"
+    return _check_digests({"sha256": declared, "chain": digests.get("chain")}, declared, delta)
+
+
+def _import_chain(digests: dict[str, Any], delta: dict[str, Any] | None) -> str | None:
+    """
+    Chain digest of an imported bundle, or None if it declares no sha256.
+
+    The chain is recomputed from the sha256, so pre-chain bundles link too.
+    (A missing sha256 only gets this far with verify_digest=False.)
+    """
+    sha256 = digests.get("sha256")
+    return None if sha256 is None else compute_chain_digest(sha256, delta)
+
+
+def _save_chain(conn: sqlite3.Connection, run_id: str, chain_digest: str | None) -> None:
+    """Remember the last imported chain digest so the next delta can be linked."""
+    if chain_digest is None:
+        # An undigested import breaks the chain: the next delta is not linked
+        conn.execute("DELETE FROM import_chains WHERE run_id = ?", (run_id,))
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO import_chains(run_id, last_seq, chain_digest) VALUES (?, ?, ?)",
+        (run_id, _last_seq(conn, run_id), chain_digest),
+    )
+
+
+_REQUIRED_EVENT_FIELDS = frozenset(("event_id", "run_id", "seq", "type", "payload", "ts"))
+
+
 def _validate_bundle_structure(bundle: dict[str, Any]) -> str | None:
     """Validate required bundle fields."""
     if "bundle_version" not in bundle:
@@ -188,26 +536,13 @@ def _validate_bundle_structure(bundle: dict[str, Any]) -> str | None:
         if field not in run:
             return f"Missing run.{field}"
 
-    for i, event in enumerate(bundle["events"]):
-        required_event_fields = ["event_id", "run_id", "seq", "type", "payload", "ts"]
-        for field in required_event_fields:
-            if field not in event:
-                return f"Missing events[{i}].{field}"
-
-    return None
-
-
-def _verify_digest(bundle: dict[str, Any]) -> str | None:
-    """Verify bundle digest."""
-    if "digests" not in bundle or "sha256" not in bundle["digests"]:
-        return "Bundle missing digests.sha256"
-
-    expected = bundle["digests"]["sha256"]
-    actual = _compute_bundle_digest(bundle)
-
-    if actual != expected:
-        return f"Digest mismatch: expected {expected}, got {actual}"
+    delta = bundle.get("delta")
+    if delta is not None:
+        for field in ("after_seq", "after_event_id"):
+            if field not in delta:
+                return f"Missing delta.{field}"
 
+    # Per-event fields are checked in the insert pass (_insert_events)
     return None
 
 
@@ -266,4 +601,10 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
 
         CREATE UNIQUE INDEX IF NOT EXISTS ux_events_run_seq ON events(run_id, seq);
         CREATE INDEX IF NOT EXISTS ix_events_run ON events(run_id);
+
+        CREATE TABLE IF NOT EXISTS import_chains (
+          run_id TEXT PRIMARY KEY,
+          last_seq INTEGER,
+          chain_digest TEXT NOT NULL
+        );
     """)
@@ -0,0 +1,163 @@
+"""
+nexus-router-loadgen: drive tool.run concurrently against SyntheticAdapter.
+
+Measures router and event-store overhead apart from real tools: each run is
+an apply-mode plan of synthetic steps, executed on a thread pool. Prints a
+JSON report with throughput and run latency percentiles.
+
+Usage:
+    nexus-router-loadgen --runs 200 --concurrency 8 --steps 5 --latency-ms 2
+    nexus-router-loadgen --runs 500 --db /tmp/load.db --latency-dist lognormal --sigma 0.5
+
+By default each run uses its own in-memory store; --db shares one SQLite file
+(so store write contention is included).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .synthetic_adapter import LATENCY_DISTRIBUTIONS, SyntheticAdapter
+from .tool import run
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(p / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def build_request(steps: int, run_index: int) -> dict[str, Any]:
+    """Apply-mode request with `steps` synthetic calls."""
+    return {
+        "goal": f"loadgen run {run_index}",
+        "mode": "apply",
+        "policy": {"allow_apply": True},
+        "plan_override": [
+            {
+                "step_id": f"s{i}",
+                "intent": "synthetic",
+                "call": {"tool": "synthetic", "method": "op", "args": {"run": run_index, "i": i}},
+            }
+            for i in range(steps)
+        ],
+    }
+
+
+def run_load(
+    adapter: SyntheticAdapter,
+    *,
+    runs: int,
+    concurrency: int,
+    steps: int,
+    db_path: str = ":memory:",
+) -> dict[str, Any]:
+    """
+    Execute `runs` runs on `concurrency` threads and summarize.
+
+    Returns:
+        Report with throughput, run latency percentiles (ms), and the
+        router overhead estimate (wall time not spent in the adapter).
+    """
+    latencies_ms: list[float] = []
+    step_errors = 0
+
+    def one(i: int) -> tuple[float, int]:
+        start = time.perf_counter()
+        resp = run(build_request(steps, i), db_path=db_path, adapter=adapter)
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, sum(1 for r in resp["results"] if r["status"] != "ok")
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for elapsed_ms, errors in pool.map(one, range(runs)):
+            latencies_ms.append(elapsed_ms)
+            step_errors += errors
+    wall_s = time.perf_counter() - wall_start
+
+    latencies_ms.sort()
+    adapter_stats = adapter.stats()
+    total_steps = runs * steps
+    mean_run_ms = sum(latencies_ms) / len(latencies_ms) if latencies_ms else 0.0
+    mean_adapter_ms = adapter_stats["total_latency_ms"] / runs if runs else 0.0
+    return {
+        "runs": runs,
+        "steps_per_run": steps,
+        "concurrency": concurrency,
+        "db_path": db_path,
+        "wall_s": round(wall_s, 4),
+        "runs_per_s": round(runs / wall_s, 2) if wall_s else 0.0,
+        "steps_per_s": round(total_steps / wall_s, 2) if wall_s else 0.0,
+        "run_latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p95": round(percentile(latencies_ms, 95), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+            "max": round(latencies_ms[-1], 3) if latencies_ms else 0.0,
+            "mean": round(mean_run_ms, 3),
+        },
+        "router_overhead_ms_per_run": round(mean_run_ms - mean_adapter_ms, 3),
+        "step_errors": step_errors,
+        "adapter": adapter_stats,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="nexus-router-loadgen",
+        description="Concurrent load generator for nexus-router using SyntheticAdapter.",
+    )
+    parser.add_argument("--runs", type=int, default=100, help="total runs (default 100)")
+    parser.add_argument("--concurrency", type=int, default=4, help="worker threads (default 4)")
+    parser.add_argument("--steps", type=int, default=5, help="steps per run (default 5)")
+    parser.add_argument("--db", default=":memory:", help="SQLite path (default: per-run memory)")
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--sigma", type=float, default=0.0)
+    parser.add_argument("--spike-rate", type=float, default=0.0)
+    parser.add_argument("--spike-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output-bytes", type=int, default=0)
+    parser.add_argument("--cpu-burn-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.runs <= 0 or args.concurrency <= 0 or args.steps <= 0:
+        parser.error("--runs, --concurrency and --steps must be positive")
+
+    try:
+        adapter = SyntheticAdapter(
+            latency_ms=args.latency_ms,
+            latency_dist=args.latency_dist,
+            sigma=args.sigma,
+            spike_rate=args.spike_rate,
+            spike_ms=args.spike_ms,
+            error_rate=args.error_rate,
+            output_bytes=args.output_bytes,
+            cpu_burn_ms=args.cpu_burn_ms,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = run_load(
+        adapter,
+        runs=args.runs,
+        concurrency=args.concurrency,
+        steps=args.steps,
+        db_path=args.db,
+    )
+    json.dump({"benchmark": "loadgen", **report}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,535 @@
+"""
+Persistent MCP stdio client adapter (JSON-RPC 2.0).
+
+McpStdioAdapter launches an MCP server process once, performs the
+initialize handshake, and keeps the session alive. Each tool call is sent as
+a ``tools/call`` request; concurrent calls are multiplexed by JSON-RPC id over
+the one stdin/stdout pair, so many steps share one warm server.
+
+Transport: newline-delimited JSON-RPC messages on the server's stdin/stdout
+(stderr is drained and kept for diagnostics). Messages are written by a
+per-session writer thread, so a server that stops reading stdin stalls only
+that thread; callers still time out on their own deadline.
+
+Mapping:
+    (tool, method, args)  ->  tools/call {"name": name_template.format(...),
+                                          "arguments": args}
+
+Result conversion: ``structuredContent`` if present; otherwise a single text
+content block holding a JSON object is parsed; otherwise ``{"content": [...]}``.
+
+Usage:
+    from nexus_router.mcp_adapter import McpStdioAdapter
+
+    adapter = McpStdioAdapter(["python", "-m", "my_mcp_server"], timeout_s=30)
+    registry.register(adapter)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import queue
+import signal
+import subprocess
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import IO, Any
+
+from .dispatch import (
+    CAPABILITY_APPLY,
+    CAPABILITY_EXTERNAL,
+    CAPABILITY_TIMEOUT,
+    PendingCall,
+    _compute_args_digest,
+    default_redact_text,
+    map_spawn_error,
+)
+from .exceptions import NexusOperationalError
+from .metrics import SUBPROCESS_SPAWNS
+from .tracing import current_traceparent
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+# JSON-RPC "method not found"
+_RPC_METHOD_NOT_FOUND = -32601
+
+# Bytes of server stderr kept for error excerpts
+_STDERR_TAIL_BYTES = 8 * 1024
+
+
+class _McpSession:
+    """
+    One running MCP server process with a stdout reader routing responses by id
+    and a stdin writer draining an outbox.
+
+    Once failed (process exit, protocol violation), a session stays failed;
+    the adapter starts a new one.
+    """
+
+    def __init__(
+        self,
+        proc: subprocess.Popen[bytes],
+        *,
+        max_message_bytes: int,
+        redact_text: Callable[[str], str],
+    ) -> None:
+        self._proc = proc
+        self._max_message_bytes = max_message_bytes
+        self._redact_text = redact_text
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # (request id or None for notifications, encoded line); None stops the writer
+        self._outbox: queue.SimpleQueue[tuple[int | None, bytes] | None] = queue.SimpleQueue()
+        self._pending: dict[int, PendingCall] = {}
+        self._stderr_tail: deque[bytes] = deque()
+        self._stderr_size = 0
+        self.closed = False
+        self.server_info: dict[str, Any] = {}
+        threading.Thread(target=self._read_stdout, name="nexus-mcp-stdout", daemon=True).start()
+        threading.Thread(target=self._write_stdin, name="nexus-mcp-stdin", daemon=True).start()
+        threading.Thread(target=self._read_stderr, name="nexus-mcp-stderr", daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        return self._proc.pid
+
+    def request(self, method: str, params: dict[str, Any]) -> tuple[int, PendingCall]:
+        """
+        Queue a request for the writer. Returns (id, pending) without blocking.
+
+        If the server is gone, the pending call is already failed (NONZERO_EXIT).
+        """
+        req_id = next(self._ids)
+        pending = PendingCall()
+        with self._lock:
+            closed = self.closed
+            if not closed:
+                self._pending[req_id] = pending
+        if closed:
+            pending.failure = ("NONZERO_EXIT", "MCP server is not running", {})
+            pending.event.set()
+            return req_id, pending
+        self._outbox.put(
+            (req_id, _encode({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params}))
+        )
+        return req_id, pending
+
+    def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Queue a notification (no response). Raises BrokenPipeError if the session failed."""
+        if self.closed:
+            raise BrokenPipeError("MCP session is closed")
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._outbox.put((None, _encode(message)))
+
+    def discard(self, req_id: int) -> None:
+        """Forget a request (timed out); a late response is dropped."""
+        with self._lock:
+            self._pending.pop(req_id, None)
+
+    def stderr_excerpt(self) -> str:
+        with self._lock:
+            data = b"".join(self._stderr_tail)
+        return self._redact_text(data[-_STDERR_TAIL_BYTES:].decode("utf-8", errors="replace"))
+
+    def close(self) -> None:
+        """Terminate the server (whole process group on POSIX)."""
+        self._fail("NONZERO_EXIT", "MCP session closed", {})
+
+    def _write_stdin(self) -> None:
+        stdin = self._proc.stdin
+        assert stdin is not None  # Popen(stdin=PIPE)
+        while (item := self._outbox.get()) is not None:
+            req_id, line = item
+            if req_id is not None:
+                with self._lock:
+                    if req_id not in self._pending:
+                        continue  # Timed out before it was sent: never send it
+            try:
+                stdin.write(line)
+                stdin.flush()
+            except (OSError, ValueError):
+                self._fail_exited()
+                return
+
+    def _read_stdout(self) -> None:
+        stdout = self._proc.stdout
+        assert stdout is not None  # Popen(stdout=PIPE)
+        try:
+            while True:
+                line = stdout.readline(self._max_message_bytes + 1)
+                if not line:
+                    self._fail_exited()
+                    return
+                if len(line) > self._max_message_bytes:
+                    self._fail(
+                        "OUTPUT_TOO_LARGE",
+                        f"MCP message exceeded {self._max_message_bytes} bytes",
+                        {"stream": "stdout", "limit_bytes": self._max_message_bytes},
+                    )
+                    return
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError as e:
+                    self._fail(
+                        "INVALID_JSON_OUTPUT",
+                        f"MCP server wrote non-JSON to stdout: {e}",
+                        {"stdout_head": self._redact_text(line[:500].decode("utf-8", "replace"))},
+                    )
+                    return
+                if not isinstance(message, dict) or "id" not in message:
+                    continue  # Server notifications and requests are not handled
+                if "result" not in message and "error" not in message:
+                    continue  # Server-to-client request
+                req_id = message["id"]
+                if not isinstance(req_id, int) or isinstance(req_id, bool):
+                    continue  # Our ids are ints; anything else (null, str, list) is not ours
+                with self._lock:
+                    pending = self._pending.pop(req_id, None)
+                if pending is not None:
+                    pending.response = message
+                    pending.event.set()
+        except (OSError, ValueError):
+            self._fail_exited()
+
+    def _read_stderr(self) -> None:
+        stderr = self._proc.stderr
+        assert stderr is not None  # Popen(stderr=PIPE)
+        with contextlib.suppress(OSError, ValueError):
+            while chunk := os.read(stderr.fileno(), 4096):
+                with self._lock:
+                    self._stderr_tail.append(chunk)
+                    self._stderr_size += len(chunk)
+                    while self._stderr_size - len(self._stderr_tail[0]) >= _STDERR_TAIL_BYTES:
+                        self._stderr_size -= len(self._stderr_tail.popleft())
+
+    def _fail_exited(self) -> None:
+        """The server closed stdout: map its exit to NONZERO_EXIT."""
+        try:
+            returncode: int | None = self._proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            returncode = None
+        self._fail(
+            "NONZERO_EXIT",
+            f"MCP server exited (returncode={returncode})",
+            {"returncode": returncode, "stderr_excerpt": self.stderr_excerpt()},
+        )
+
+    def _fail(self, code: str, message: str, details: dict[str, Any]) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        self._outbox.put(None)
+        self._terminate()
+        for p in pending.values():
+            p.failure = (code, message, details)
+            p.event.set()
+
+    def _terminate(self) -> None:
+        proc = self._proc
+        if proc.poll() is None:
+            if os.name == "posix":
+                with contextlib.suppress(ProcessLookupError, PermissionError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+        streams: tuple[IO[bytes] | None, ...] = (proc.stdin, proc.stdout, proc.stderr)
+        for stream in streams:
+            if stream is not None:
+                with contextlib.suppress(OSError, ValueError):
+                    stream.close()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=5.0)
+
+
+class McpStdioAdapter:
+    """
+    Adapter that calls tools on a persistent MCP server over stdio.
+
+    The server is started lazily on the first call and reused; if it exits,
+    calls in flight fail and the next call starts a fresh server. Calls are
+    never resent after a crash.
+
+    Error codes (shared with SubprocessAdapter where they overlap):
+    - COMMAND_NOT_FOUND / PERMISSION_DENIED / OS_ERROR: cannot launch the server
+    - TIMEOUT: handshake or call exceeded its timeout (call is cancelled)
+    - NONZERO_EXIT: server exited (details: returncode, stderr_excerpt)
+    - INVALID_JSON_OUTPUT: server wrote a non-JSON line to stdout
+    - OUTPUT_TOO_LARGE: a message exceeded max_message_bytes
+    - METHOD_NOT_FOUND: JSON-RPC -32601
+    - TOOL_ERROR: JSON-RPC error or result with isError (redacted message)
+
+    Capabilities: apply, timeout, external
+    """
+
+    RedactTextFunc = Callable[[str], str]
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        adapter_id: str | None = None,
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+        timeout_s: float = 30.0,
+        init_timeout_s: float = 10.0,
+        name_template: str = "{method}",
+        protocol_version: str = MCP_PROTOCOL_VERSION,
+        client_info: dict[str, str] | None = None,
+        max_message_bytes: int = 64 * 1024 * 1024,
+        redact_text: RedactTextFunc | None = None,
+    ) -> None:
+        """
+        Initialize McpStdioAdapter.
+
+        Args:
+            command: Command that starts the MCP server.
+            adapter_id: Optional custom adapter ID. If None, derived from command.
+            cwd: Working directory for the server.
+            env: Environment variables (merged with os.environ).
+            timeout_s: Timeout for each tools/call.
+            init_timeout_s: Timeout for the initialize handshake.
+            name_template: MCP tool name for a call; {tool} and {method} are filled in.
+            protocol_version: MCP protocol version sent in initialize.
+            client_info: clientInfo sent in initialize.
+            max_message_bytes: Hard cap on one server message.
+            redact_text: Redaction for text in error details (default_redact_text).
+        """
+        if not command:
+            raise ValueError("command must be non-empty")
+        if max_message_bytes <= 0:
+            raise ValueError("max_message_bytes must be positive")
+
+        self._command = list(command)
+        self._cwd = cwd
+        self._env = env
+        self._timeout_s = timeout_s
+        self._init_timeout_s = init_timeout_s
+        self._name_template = name_template
+        self._protocol_version = protocol_version
+        self._client_info = client_info or {"name": "nexus-router", "version": "1"}
+        self._max_message_bytes = max_message_bytes
+        self._redact_text: McpStdioAdapter.RedactTextFunc = (
+            redact_text if redact_text is not None else default_redact_text
+        )
+        self._capabilities: frozenset[str] = frozenset(
+            {CAPABILITY_APPLY, CAPABILITY_TIMEOUT, CAPABILITY_EXTERNAL}
+        )
+        if adapter_id is not None:
+            self._adapter_id = adapter_id
+        else:
+            cmd_hash = hashlib.sha256(" ".join(self._command).encode()).hexdigest()[:6]
+            self._adapter_id = f"mcp:{os.path.basename(self._command[0])}:{cmd_hash}"
+        self._session: _McpSession | None = None
+        self._session_lock = threading.Lock()
+        self.sessions_started = 0
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "mcp_stdio"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._capabilities
+
+    @property
+    def server_info(self) -> dict[str, Any]:
+        """initialize result of the current session (empty before the first call)."""
+        session = self._session
+        return dict(session.server_info) if session is not None else {}
+
+    def close(self) -> None:
+        """Stop the server; calls in flight fail."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> McpStdioAdapter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        self.close()
+
+    def list_tools(self) -> list[dict[str, Any]]:
+        """Return the server's tools/list result."""
+        result = self._rpc("tools/list", {}, {"args_digest": _compute_args_digest({})})
+        tools = result.get("tools", [])
+        return list(tools) if isinstance(tools, list) else []
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Call an MCP tool.
+
+        Raises:
+            NexusOperationalError: See class docstring for error codes.
+        """
+        name = self._name_template.format(tool=tool, method=method)
+        base_details: dict[str, Any] = {"args_digest": _compute_args_digest(args), "name": name}
+        params: dict[str, Any] = {"name": name, "arguments": args}
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            params["_meta"] = {"traceparent": traceparent}
+        result = self._rpc("tools/call", params, base_details)
+
+        if result.get("isError"):
+            message = self._redact_text(_content_text(result)[:2000])
+            raise NexusOperationalError(
+                f"MCP tool error: {message}",
+                error_code="TOOL_ERROR",
+                details={**base_details, "message": message},
+            )
+        return _result_output(result)
+
+    def _rpc(
+        self, method: str, params: dict[str, Any], base_details: dict[str, Any]
+    ) -> dict[str, Any]:
+        session = self._ensure_session(base_details)
+        req_id, pending = session.request(method, params)
+        if not pending.event.wait(self._timeout_s):
+            session.discard(req_id)
+            with contextlib.suppress(OSError):
+                session.notify(
+                    "notifications/cancelled", {"requestId": req_id, "reason": "timeout"}
+                )
+            raise NexusOperationalError(
+                f"MCP {method} timed out after {self._timeout_s}s",
+                error_code="TIMEOUT",
+                details={**base_details, "timeout_s": self._timeout_s},
+            )
+        return self._unwrap(pending, base_details)
+
+    def _unwrap(self, pending: PendingCall, base_details: dict[str, Any]) -> dict[str, Any]:
+        if pending.failure is not None:
+            code, message, details = pending.failure
+            raise NexusOperationalError(
+                message, error_code=code, details={**base_details, **details}
+            )
+        response = pending.response or {}
+        if "error" in response:
+            error = response["error"] if isinstance(response["error"], dict) else {}
+            rpc_code = error.get("code")
+            message = self._redact_text(str(error.get("message", "")))
+            raise NexusOperationalError(
+                f"MCP error: {message}",
+                error_code="METHOD_NOT_FOUND"
+                if rpc_code == _RPC_METHOD_NOT_FOUND
+                else "TOOL_ERROR",
+                details={**base_details, "rpc_code": rpc_code, "message": message},
+            )
+        result = response.get("result")
+        if not isinstance(result, dict):
+            raise NexusOperationalError(
+                f"MCP result is not an object: {type(result).__name__}",
+                error_code="INVALID_JSON_OUTPUT",
+                details=base_details,
+            )
+        return result
+
+    def _ensure_session(self, base_details: dict[str, Any]) -> _McpSession:
+        """Return the live session, starting the server and handshaking if needed."""
+        with self._session_lock:
+            if self._session is not None and not self._session.closed:
+                return self._session
+            session = self._start(base_details)
+            _, pending = session.request(
+                "initialize",
+                {
+                    "protocolVersion": self._protocol_version,
+                    "capabilities": {},
+                    "clientInfo": self._client_info,
+                },
+            )
+            if not pending.event.wait(self._init_timeout_s):
+                session.close()
+                raise NexusOperationalError(
+                    f"MCP initialize timed out after {self._init_timeout_s}s",
+                    error_code="TIMEOUT",
+                    details={
+                        **base_details,
+                        "timeout_s": self._init_timeout_s,
+                        "phase": "initialize",
+                        "stderr_excerpt": session.stderr_excerpt(),
+                    },
+                )
+            try:
+                session.server_info = self._unwrap(pending, base_details)
+                session.notify("notifications/initialized")
+            except (NexusOperationalError, OSError):
+                session.close()
+                raise
+            self._session = session
+            self.sessions_started += 1
+            return session
+
+    def _start(self, base_details: dict[str, Any]) -> _McpSession:
+        run_env = {**os.environ, **self._env} if self._env is not None else None
+        try:
+            proc = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self._cwd,
+                env=run_env,
+                start_new_session=(os.name == "posix"),
+            )
+        except OSError as e:
+            raise map_spawn_error(self._command[0], e, base_details) from e
+        SUBPROCESS_SPAWNS.labels(self.adapter_kind).inc()
+        return _McpSession(
+            proc, max_message_bytes=self._max_message_bytes, redact_text=self._redact_text
+        )
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    """One newline-delimited JSON-RPC message."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _content_text(result: dict[str, Any]) -> str:
+    """Concatenate text content blocks of a tools/call result."""
+    content = result.get("content")
+    if not isinstance(content, list):
+        return ""
+    return "\n".join(
+        str(block.get("text", ""))
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def _result_output(result: dict[str, Any]) -> dict[str, Any]:
+    """Convert a tools/call result to an adapter output dict."""
+    structured = result.get("structuredContent")
+    if isinstance(structured, dict):
+        return structured
+    content = result.get("content")
+    if isinstance(content, list) and len(content) == 1:
+        block = content[0]
+        if isinstance(block, dict) and block.get("type") == "text":
+            with contextlib.suppress(ValueError):
+                parsed = json.loads(block.get("text", ""))
+                if isinstance(parsed, dict):
+                    return parsed
+    return {"content": content if isinstance(content, list) else []}
@@ -0,0 +1,412 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Dependency-free counters, gauges and fixed-bucket histograms. Label children
+are created once and cached, so the hot path is a dict lookup plus one
+uncontended per-series lock. labels() still builds a small key tuple per call;
+code on a hot path can keep the returned child and skip even that.
+
+The package instruments itself against the module-level REGISTRY:
+
+    nexus_router_runs_started_total{mode}
+    nexus_router_runs_finished_total{mode,outcome}      outcome: ok | error | bug
+    nexus_router_runs_in_progress
+    nexus_router_adapter_call_seconds{adapter_id,method,status}
+    nexus_router_adapter_calls_in_flight{adapter_id}
+    nexus_router_http_pool_waiters{adapter_id}          calls waiting for a pooled connection
+    nexus_router_function_pool_queued{adapter_id}       calls waiting for a FunctionAdapter worker
+    nexus_router_function_pool_running{adapter_id}      workers busy (incl. timed-out functions)
+    nexus_router_store_append_seconds
+    nexus_router_events_appended_total{type}
+    nexus_router_subprocess_spawns_total{adapter_kind}
+    nexus_router_replay_seconds
+    nexus_router_replays_total{result}                  result: ok | violations | not_found
+    nexus_router_import_seconds
+    nexus_router_imports_total{status}
+    nexus_router_imported_events_total
+
+Usage:
+    from nexus_router.metrics import render_prometheus, start_http_server
+
+    text = render_prometheus()
+    server = start_http_server(9464)   # GET http://127.0.0.1:9464/metrics
+    server.close()
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+# Seconds; suits both sub-millisecond appends and multi-second tool calls
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_lock", "bucket_counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        # Non-cumulative; the last slot is the +Inf overflow bucket
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+
+class _Metric(ABC):
+    """Base for a named metric family with optional labels."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """A fresh series for one label combination."""
+
+    def labels(self, *values: Any) -> Any:
+        """Child series for the given label values (created on first use)."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {len(key)} values"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabeled series."""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    """Distribution over fixed upper-bound buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        if list(buckets) != sorted(set(buckets)) or not buckets:
+            raise ValueError("buckets must be non-empty, sorted and unique")
+        self.buckets = tuple(float(b) for b in buckets)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe into the unlabeled series."""
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families, rendered together.
+
+    counter()/gauge()/histogram() return the existing family when the name is
+    already registered with the same type and labels, so modules can declare
+    the metrics they use independently.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            raise ValueError(f"Metric {metric.name} already registered with a different shape")
+        return existing
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))  # type: ignore[no-any-return]
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))  # type: ignore[no-any-return]
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))  # type: ignore[no-any-return]
+
+    def get(self, name: str) -> _Metric | None:
+        """Registered family by name."""
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, child in sorted(metric.children()):
+                pairs = list(zip(metric.labelnames, key, strict=True))
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    bounds = [*metric.buckets, math.inf]
+                    for bound, bucket_count in zip(bounds, child.bucket_counts, strict=True):
+                        cumulative += bucket_count
+                        labels = _labels([*pairs, ("le", _format(bound))])
+                        lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+                    lines.append(f"{metric.name}_sum{_labels(pairs)} {_format(child.sum)}")
+                    lines.append(f"{metric.name}_count{_labels(pairs)} {child.count}")
+                else:
+                    lines.append(f"{metric.name}{_labels(pairs)} {_format(child.value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def render_prometheus(registry: MetricsRegistry | None = None) -> str:
+    """Render the given registry (default: the package REGISTRY)."""
+    return (registry or REGISTRY).render_prometheus()
+
+
+class MetricsServer:
+    """Background HTTP server publishing GET /metrics."""
+
+    def __init__(self, server: ThreadingHTTPServer) -> None:
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="nexus-router-metrics", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return int(self._server.server_address[1])
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> MetricsServer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def start_http_server(
+    port: int = 9464, *, host: str = "127.0.0.1", registry: MetricsRegistry | None = None
+) -> MetricsServer:
+    """
+    Serve the registry at http://host:port/metrics on a daemon thread.
+
+    Binds to localhost by default; port 0 picks a free port (see .port).
+    """
+    target = registry or REGISTRY
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = target.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return MetricsServer(ThreadingHTTPServer((host, port), _Handler))
+
+
+# Package instrumentation (see module docstring)
+RUNS_STARTED = REGISTRY.counter(
+    "nexus_router_runs_started_total", "Runs started by Router.run", ("mode",)
+)
+RUNS_FINISHED = REGISTRY.counter(
+    "nexus_router_runs_finished_total",
+    "Runs finished, by outcome (ok, error, bug)",
+    ("mode", "outcome"),
+)
+RUNS_IN_PROGRESS = REGISTRY.gauge("nexus_router_runs_in_progress", "Runs currently executing")
+ADAPTER_CALL_SECONDS = REGISTRY.histogram(
+    "nexus_router_adapter_call_seconds",
+    "Adapter call latency in apply mode",
+    ("adapter_id", "method", "status"),
+)
+ADAPTER_CALLS_IN_FLIGHT = REGISTRY.gauge(
+    "nexus_router_adapter_calls_in_flight", "Adapter calls awaiting a result", ("adapter_id",)
+)
+HTTP_POOL_WAITERS = REGISTRY.gauge(
+    "nexus_router_http_pool_waiters",
+    "HttpAdapter calls waiting for a pooled connection",
+    ("adapter_id",),
+)
+FUNCTION_POOL_QUEUED = REGISTRY.gauge(
+    "nexus_router_function_pool_queued",
+    "FunctionAdapter calls waiting for a worker thread",
+    ("adapter_id",),
+)
+FUNCTION_POOL_RUNNING = REGISTRY.gauge(
+    "nexus_router_function_pool_running",
+    "FunctionAdapter worker threads busy, including timed-out functions",
+    ("adapter_id",),
+)
+STORE_APPEND_SECONDS = REGISTRY.histogram(
+    "nexus_router_store_append_seconds", "EventStore.append latency"
+)
+EVENTS_APPENDED = REGISTRY.counter(
+    "nexus_router_events_appended_total", "Events appended to the store", ("type",)
+)
+SUBPROCESS_SPAWNS = REGISTRY.counter(
+    "nexus_router_subprocess_spawns_total", "Tool processes started", ("adapter_kind",)
+)
+REPLAY_SECONDS = REGISTRY.histogram("nexus_router_replay_seconds", "replay() latency")
+REPLAYS = REGISTRY.counter(
+    "nexus_router_replays_total", "Replays, by result (ok, violations, not_found)", ("result",)
+)
+IMPORT_SECONDS = REGISTRY.histogram("nexus_router_import_seconds", "import_bundle() latency")
+IMPORTS = REGISTRY.counter("nexus_router_imports_total", "Bundle imports, by status", ("status",))
+IMPORTED_EVENTS = REGISTRY.counter(
+    "nexus_router_imported_events_total", "Events inserted by import_bundle()"
+)
@@ -0,0 +1,231 @@
+"""
+nexus-router.rerun: Re-execute a recorded run against current adapters.
+
+The recorded PLAN_CREATED plan and RUN_STARTED policy are replayed in apply
+mode into a scratch store, and each step's status, output and duration_ms are
+diffed against the original events. Recorded production runs thereby become a
+latency-regression benchmark for adapter and tool upgrades.
+
+Usage:
+    from nexus_router.rerun import rerun
+
+    report = rerun(db_path="prod.db", run_id=run_id, adapters=registry)
+    report["summary"]["ratio"]       # rerun_ms / original_ms over comparable steps
+    report["summary"]["regressions"] # steps slower than tolerance allows
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Any
+
+from . import events as E
+from .dispatch import AdapterRegistry, DispatchAdapter
+from .event_store import EventRow, EventStore
+from .provenance import sha256_canonical
+from .router import Router
+
+
+def rerun(
+    *,
+    db_path: str,
+    run_id: str,
+    adapter: DispatchAdapter | None = None,
+    adapters: AdapterRegistry | None = None,
+    policy: dict[str, Any] | None = None,
+    scratch_db_path: str = ":memory:",
+    tolerance: float = 0.2,
+    min_delta_ms: float = 1.0,
+) -> dict[str, Any]:
+    """
+    Re-execute a recorded run and diff it against the original.
+
+    Args:
+        db_path: Path to the SQLite database holding the original run.
+        run_id: The run ID to re-execute.
+        adapter: Adapter to execute with (as for tool.run).
+        adapters: Adapter registry; the originally selected adapter_id is
+            requested again when the registry has it.
+        policy: Policy override (default: the recorded policy). allow_apply is
+            always forced on, since the rerun executes in apply mode.
+        scratch_db_path: Store the rerun is recorded into (default in-memory).
+        tolerance: A step regresses when rerun duration exceeds the original
+            by more than this fraction...
+        min_delta_ms: ...and by more than this many milliseconds.
+
+    Returns:
+        Dict with ok, run_id, rerun_run_id, outcome, steps (per-step diff) and
+        summary; or ok=False with error if the run cannot be re-executed.
+    """
+    original = _load_run(db_path, run_id)
+    if "error" in original:
+        return {"ok": False, "error": original["error"]}
+
+    base_policy = policy if policy is not None else original["policy"]
+    request: dict[str, Any] = {
+        "goal": original["goal"],
+        "mode": "apply",
+        "policy": {**base_policy, "allow_apply": True},
+        "plan_override": original["plan"],
+    }
+    adapter_id = original["adapter_id"]
+    if adapters is not None and adapter_id is not None and adapter_id in adapters:
+        request["dispatch"] = {"adapter_id": adapter_id}
+
+    with EventStore(scratch_db_path) as store:
+        response = Router(store, adapter=adapter, adapters=adapters).run(request)
+        rerun_run_id = response["run"]["run_id"]
+        rerun_events = store.read_events(rerun_run_id)
+    rerun_steps = _step_records(rerun_events)
+
+    steps: list[dict[str, Any]] = []
+    for step in original["plan"]:
+        step_id = step["step_id"]
+        before = original["steps"].get(step_id)
+        after = rerun_steps.get(step_id)
+        steps.append(_diff_step(step, before, after, tolerance, min_delta_ms))
+
+    return {
+        "ok": True,
+        "run_id": run_id,
+        "rerun_run_id": rerun_run_id,
+        "outcome": {"original": original["outcome"], "rerun": _outcome(rerun_events)},
+        "steps": steps,
+        "summary": _summarize(steps),
+    }
+
+
+def _load_run(db_path: str, run_id: str) -> dict[str, Any]:
+    """Goal, policy, plan, adapter and per-step records of a recorded run."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        run_row = conn.execute(
+            "SELECT run_id, goal, status FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if run_row is None:
+            return {"error": {"code": "RUN_NOT_FOUND", "message": f"Run {run_id} not found"}}
+        events = [
+            EventRow(
+                event_id=row["event_id"],
+                run_id=run_id,
+                seq=row["seq"],
+                type=row["type"],
+                payload=json.loads(row["payload_json"]),
+                ts=row["ts"],
+            )
+            for row in conn.execute(
+                "SELECT event_id, seq, type, payload_json, ts FROM events "
+                "WHERE run_id = ? ORDER BY seq ASC",
+                (run_id,),
+            )
+        ]
+    finally:
+        conn.close()
+
+    by_type = {event.type: event.payload for event in events}
+    if E.PLAN_CREATED not in by_type:
+        return {
+            "error": {
+                "code": "NO_PLAN_CREATED",
+                "message": f"Run {run_id} has no PLAN_CREATED event to re-execute",
+            }
+        }
+    started = by_type.get(E.RUN_STARTED, {})
+    return {
+        "goal": started.get("goal", run_row["goal"]),
+        "policy": started.get("policy", {}),
+        "plan": by_type[E.PLAN_CREATED].get("plan", []),
+        "adapter_id": by_type.get(E.DISPATCH_SELECTED, {}).get("adapter_id"),
+        "outcome": _outcome(events),
+        "steps": _step_records(events),
+    }
+
+
+def _outcome(events: list[EventRow]) -> str | None:
+    """Recorded run outcome ("ok"/"error"), or None if the run never finished."""
+    for event in reversed(events):
+        if event.type == E.RUN_COMPLETED:
+            return "ok"
+        if event.type == E.RUN_FAILED:
+            return "error"
+    return None
+
+
+def _step_records(events: list[EventRow]) -> dict[str, dict[str, Any]]:
+    """step_id -> status, output digest, duration_ms and simulated flag."""
+    records: dict[str, dict[str, Any]] = {}
+    for event in events:
+        step_id = event.payload.get("step_id")
+        if not step_id:
+            continue
+        if event.type == E.TOOL_CALL_SUCCEEDED:
+            output = dict(event.payload.get("output") or {})
+            # Router annotation; an upgraded adapter may carry a different id
+            output.pop("adapter_id", None)
+            records[step_id] = {
+                "status": "ok",
+                "output_digest": sha256_canonical(output),
+                "duration_ms": event.payload.get("duration_ms"),
+                "simulated": bool(event.payload.get("simulated", False)),
+            }
+        elif event.type == E.TOOL_CALL_FAILED:
+            records[step_id] = {
+                "status": "error",
+                "error_code": event.payload.get("error_code"),
+                "output_digest": None,
+                "duration_ms": None,
+                "simulated": False,
+            }
+    return records
+
+
+def _diff_step(
+    step: dict[str, Any],
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+    tolerance: float,
+    min_delta_ms: float,
+) -> dict[str, Any]:
+    delta: float | None = None
+    regressed = False
+    # Simulated (dry_run) originals have no real latency to compare against
+    if before is not None and after is not None and not before["simulated"]:
+        before_ms = before.get("duration_ms")
+        after_ms = after.get("duration_ms")
+        if before_ms is not None and after_ms is not None:
+            delta = after_ms - before_ms
+            regressed = delta > min_delta_ms and delta > before_ms * tolerance
+    return {
+        "step_id": step["step_id"],
+        "method": step.get("call", {}).get("method"),
+        "original": before,
+        "rerun": after,
+        "status_changed": (before or {}).get("status") != (after or {}).get("status"),
+        "output_match": bool(
+            before
+            and after
+            and before["output_digest"] is not None
+            and before["output_digest"] == after["output_digest"]
+        ),
+        "duration_delta_ms": None if delta is None else round(delta, 3),
+        "regressed": regressed,
+    }
+
+
+def _summarize(steps: list[dict[str, Any]]) -> dict[str, Any]:
+    comparable = [s for s in steps if s["duration_delta_ms"] is not None]
+    original_ms = sum(s["original"]["duration_ms"] for s in comparable)
+    rerun_ms = sum(s["rerun"]["duration_ms"] for s in comparable)
+    return {
+        "steps": len(steps),
+        "outputs_matched": sum(1 for s in steps if s["output_match"]),
+        "outputs_differed": sum(1 for s in steps if not s["output_match"]),
+        "status_changed": sum(1 for s in steps if s["status_changed"]),
+        "comparable_steps": len(comparable),
+        "original_ms": round(original_ms, 3),
+        "rerun_ms": round(rerun_ms, 3),
+        "ratio": round(rerun_ms / original_ms, 4) if original_ms > 0 else None,
+        "regressions": sum(1 for s in steps if s["regressed"]),
+    }
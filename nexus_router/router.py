@@ -12,8 +12,17 @@ from .dispatch import (
 )
 from .event_store import EventStore
 from .exceptions import NexusBugError, NexusOperationalError
+from .metrics import (
+    ADAPTER_CALL_SECONDS,
+    ADAPTER_CALLS_IN_FLIGHT,
+    RUNS_FINISHED,
+    RUNS_IN_PROGRESS,
+    RUNS_STARTED,
+)
 from .policy import gate_apply
+from .profiling import NULL_PROFILER, PhaseProfiler, profile_options
 from .provenance import build_provenance_bundle
+from .tracing import NOOP_TRACER, Tracer, get_tracer, parse_traceparent
 
 
 def create_plan(request: dict[str, Any]) -> list[dict[str, Any]]:
@@ -79,21 +88,72 @@ class Router:
         # Default adapter (may be overridden by request dispatch)
         self.adapter: DispatchAdapter = self._registry.get_default()
 
-    def run(self, request: dict[str, Any]) -> dict[str, Any]:
+        # Resource usage reported by the adapter for the current step
+        self._last_resources: dict[str, Any] | None = None
+        # Cache hit flag reported by caching adapters for the current step
+        self._last_cache_hit: bool | None = None
+        # Phase timing for the current run (no-op unless profiling is requested)
+        self._profiler: PhaseProfiler = NULL_PROFILER
+        # Tracer and run span for the current run (no-op unless tracing is enabled)
+        self._tracer: Tracer = NOOP_TRACER
+        self._run_span: Any = None
+
+    def run(
+        self, request: dict[str, Any], *, profiler: PhaseProfiler | None = None
+    ) -> dict[str, Any]:
+        """
+        Execute a run and return the response.
+
+        Args:
+            request: Run request (v0.7 schema).
+            profiler: Profiler already timing earlier phases (tool.run passes one
+                covering validation and store open). If None, one is created when
+                the request sets "profile".
+        """
+        profile_enabled, record_profile = profile_options(request)
+        if profiler is None:
+            profiler = PhaseProfiler() if profile_enabled else NULL_PROFILER
+        self._profiler = profiler
+
+        mode = request.get("mode", "dry_run")
+        self._tracer = get_tracer()
+        parent = parse_traceparent(request.get("traceparent"))
+        RUNS_STARTED.labels(mode).inc()
+        RUNS_IN_PROGRESS.inc()
+        with self._tracer.start_span("nexus_router.run", {"mode": mode}, parent=parent) as span:
+            self._run_span = span
+            try:
+                return self._run(request, record_profile)
+            except Exception:
+                # Bug errors are recorded as RUN_FAILED and re-raised
+                RUNS_FINISHED.labels(mode, "bug").inc()
+                raise
+            finally:
+                RUNS_IN_PROGRESS.dec()
+
+    def _run(self, request: dict[str, Any], record_profile: bool) -> dict[str, Any]:
+        profiler = self._profiler
         mode = request.get("mode", "dry_run")
         goal = request["goal"]
         policy = request.get("policy", {})
         dispatch_config = request.get("dispatch", {})
 
-        run_id = self.store.create_run(mode=mode, goal=goal)
-        self.store.append(run_id, E.RUN_STARTED, {"mode": mode, "goal": goal})
+        with profiler.phase("create_run"):
+            run_id = self.store.create_run(mode=mode, goal=goal)
+        self._run_span.set_attribute("run_id", run_id)
+        started: dict[str, Any] = {"mode": mode, "goal": goal}
+        if policy:
+            # Recorded so the run can be re-executed (see rerun.py)
+            started["policy"] = policy
+        self._append(run_id, E.RUN_STARTED, {**started, **self._trace_fields()})
 
         # v0.7: Declarative adapter selection
         try:
-            adapter, selection_source = self._select_adapter(dispatch_config)
+            with profiler.phase("select_adapter"):
+                adapter, selection_source = self._select_adapter(dispatch_config)
         except NexusOperationalError as ex:
             # Adapter selection failed (unknown adapter or capability missing)
-            self.store.append(
+            self._append(
                 run_id,
                 E.RUN_FAILED,
                 {
@@ -103,12 +163,16 @@ class Router:
                     "details": ex.details,
                 },
             )
-            self.store.set_run_status(run_id, "FAILED")
-            return self._build_failed_response(
-                run_id=run_id,
-                mode=mode,
-                error_code=ex.error_code,
-                error_message=str(ex),
+            self._set_run_status(run_id, "FAILED")
+            RUNS_FINISHED.labels(mode, "error").inc()
+            self._run_span.set_attribute("outcome", "error")
+            return self._with_profile(
+                self._build_failed_response(
+                    run_id=run_id,
+                    mode=mode,
+                    error_code=ex.error_code,
+                    error_message=str(ex),
+                )
             )
 
         self.adapter = adapter
@@ -120,10 +184,11 @@ class Router:
             "capabilities": sorted(adapter.capabilities),
             "selection_source": selection_source,
         }
-        self.store.append(run_id, E.DISPATCH_SELECTED, dispatch_info)
+        self._append(run_id, E.DISPATCH_SELECTED, dispatch_info)
 
-        plan = create_plan(request)
-        self.store.append(run_id, E.PLAN_CREATED, {"plan": plan})
+        with profiler.phase("plan"):
+            plan = create_plan(request)
+        self._append(run_id, E.PLAN_CREATED, {"plan": plan})
 
         max_steps = policy.get("max_steps")
         outcome = "ok"
@@ -136,8 +201,8 @@ class Router:
                     "max_steps": max_steps_i,
                     "plan_steps": len(plan),
                 }
-                self.store.append(run_id, E.RUN_FAILED, fail_payload)
-                self.store.set_run_status(run_id, "FAILED")
+                self._append(run_id, E.RUN_FAILED, fail_payload)
+                self._set_run_status(run_id, "FAILED")
                 plan = plan[:max_steps_i]
 
         tools_used: list[str] = []
@@ -151,171 +216,254 @@ class Router:
             args = call.get("args", {})
             tools_used.append(method)
 
-            self.store.append(run_id, E.STEP_STARTED, {"step_id": step_id})
-            self.store.append(
-                run_id,
-                E.TOOL_CALL_REQUESTED,
-                {
-                    "step_id": step_id,
-                    "call": call,
-                    "adapter_id": self.adapter.adapter_id,
-                    "adapter_capabilities": sorted(self.adapter.capabilities),
-                },
-            )
-
-            try:
-                output, simulated, duration_ms = self._dispatch_call(
-                    mode=mode,
-                    policy=policy,
-                    tool=tool,
-                    method=method,
-                    args=args,
-                )
-
-                self.store.append(
-                    run_id,
-                    E.TOOL_CALL_SUCCEEDED,
-                    {
-                        "step_id": step_id,
-                        "simulated": simulated,
-                        "output": output,
-                        "adapter_id": self.adapter.adapter_id,
-                        "duration_ms": duration_ms,
-                    },
-                )
-                status = "ok"
-
-            except NexusOperationalError as ex:
-                # Operational error: record failure, continue to next step or end run
-                outcome = "error"
-                status = "error"
-                output = {}
-                self.store.append(
-                    run_id,
-                    E.TOOL_CALL_FAILED,
-                    {
-                        "step_id": step_id,
-                        "error_kind": "operational",
-                        "error_code": ex.error_code,
-                        "message": str(ex),
-                        "adapter_id": self.adapter.adapter_id,
-                    },
-                )
-                # Don't re-raise - run continues but will end as FAILED
-
-            except NexusBugError as ex:
-                # Bug error: record and re-raise
-                outcome = "error"
-                status = "error"
-                output = {}
-                self.store.append(
-                    run_id,
-                    E.TOOL_CALL_FAILED,
-                    {
-                        "step_id": step_id,
-                        "error_kind": "bug",
-                        "error_code": ex.error_code,
-                        "message": str(ex),
-                        "adapter_id": self.adapter.adapter_id,
-                    },
-                )
-                self.store.append(
-                    run_id,
-                    E.RUN_FAILED,
-                    {"reason": "bug_error", "step_id": step_id},
-                )
-                self.store.set_run_status(run_id, "FAILED")
-                raise
+            step_attributes = {"step_id": step_id, "tool": tool, "method": method}
+            with self._tracer.start_span("nexus_router.step", step_attributes) as step_span:
+                # Composite adapters (RoutingAdapter) resolve a concrete child per call
+                route_fields = self._route_fields(tool, method)
 
-            except PermissionError as ex:
-                # Legacy: policy gate failure
-                outcome = "error"
-                status = "error"
-                output = {}
-                self.store.append(
+                self._append(run_id, E.STEP_STARTED, {"step_id": step_id})
+                self._append(
                     run_id,
-                    E.TOOL_CALL_FAILED,
+                    E.TOOL_CALL_REQUESTED,
                     {
                         "step_id": step_id,
-                        "error_kind": "operational",
-                        "error_code": "PERMISSION_DENIED",
-                        "message": str(ex),
+                        "call": call,
                         "adapter_id": self.adapter.adapter_id,
+                        "adapter_capabilities": sorted(self.adapter.capabilities),
+                        **route_fields,
                     },
                 )
 
-            except Exception as ex:
-                # Unknown exception: treat as bug, record + re-raise
-                outcome = "error"
-                status = "error"
-                output = {}
-                self.store.append(
-                    run_id,
-                    E.TOOL_CALL_FAILED,
+                try:
+                    with profiler.phase("dispatch"):
+                        output, simulated, duration_ms = self._dispatch_call(
+                            mode=mode,
+                            policy=policy,
+                            tool=tool,
+                            method=method,
+                            args=args,
+                        )
+
+                    self._append(
+                        run_id,
+                        E.TOOL_CALL_SUCCEEDED,
+                        {
+                            "step_id": step_id,
+                            "simulated": simulated,
+                            "output": output,
+                            "adapter_id": self.adapter.adapter_id,
+                            **route_fields,
+                            "duration_ms": duration_ms,
+                            **self._resource_fields(),
+                            **self._cache_fields(),
+                        },
+                    )
+                    status = "ok"
+
+                except NexusOperationalError as ex:
+                    # Operational error: record failure, continue to next step or end run
+                    outcome = "error"
+                    status = "error"
+                    output = {}
+                    self._append(
+                        run_id,
+                        E.TOOL_CALL_FAILED,
+                        {
+                            "step_id": step_id,
+                            "error_kind": "operational",
+                            "error_code": ex.error_code,
+                            "message": str(ex),
+                            "adapter_id": self.adapter.adapter_id,
+                            **route_fields,
+                            **self._resource_fields(),
+                        },
+                    )
+                    # Don't re-raise - run continues but will end as FAILED
+
+                except NexusBugError as ex:
+                    # Bug error: record and re-raise
+                    outcome = "error"
+                    status = "error"
+                    output = {}
+                    self._append(
+                        run_id,
+                        E.TOOL_CALL_FAILED,
+                        {
+                            "step_id": step_id,
+                            "error_kind": "bug",
+                            "error_code": ex.error_code,
+                            "message": str(ex),
+                            "adapter_id": self.adapter.adapter_id,
+                            **route_fields,
+                            **self._resource_fields(),
+                        },
+                    )
+                    self._append(
+                        run_id,
+                        E.RUN_FAILED,
+                        {"reason": "bug_error", "step_id": step_id},
+                    )
+                    self._set_run_status(run_id, "FAILED")
+                    raise
+
+                except PermissionError as ex:
+                    # Legacy: policy gate failure
+                    outcome = "error"
+                    status = "error"
+                    output = {}
+                    self._append(
+                        run_id,
+                        E.TOOL_CALL_FAILED,
+                        {
+                            "step_id": step_id,
+                            "error_kind": "operational",
+                            "error_code": "PERMISSION_DENIED",
+                            "message": str(ex),
+                            "adapter_id": self.adapter.adapter_id,
+                            **route_fields,
+                            **self._resource_fields(),
+                        },
+                    )
+
+                except Exception as ex:
+                    # Unknown exception: treat as bug, record + re-raise
+                    outcome = "error"
+                    status = "error"
+                    output = {}
+                    self._append(
+                        run_id,
+                        E.TOOL_CALL_FAILED,
+                        {
+                            "step_id": step_id,
+                            "error_kind": "bug",
+                            "error_code": "UNKNOWN_ERROR",
+                            "message": repr(ex),
+                            "adapter_id": self.adapter.adapter_id,
+                            **route_fields,
+                            **self._resource_fields(),
+                        },
+                    )
+                    self._append(
+                        run_id,
+                        E.RUN_FAILED,
+                        {"reason": "unexpected_exception", "step_id": step_id},
+                    )
+                    self._set_run_status(run_id, "FAILED")
+                    raise
+
+                step_span.set_attribute("status", status)
+                self._append(run_id, E.STEP_COMPLETED, {"step_id": step_id, "status": status})
+                results.append(
                     {
                         "step_id": step_id,
-                        "error_kind": "bug",
-                        "error_code": "UNKNOWN_ERROR",
-                        "message": repr(ex),
-                        "adapter_id": self.adapter.adapter_id,
-                    },
-                )
-                self.store.append(
-                    run_id,
-                    E.RUN_FAILED,
-                    {"reason": "unexpected_exception", "step_id": step_id},
+                        "status": status,
+                        "simulated": (mode == "dry_run"),
+                        "output": output,
+                        "evidence": [],
+                    }
                 )
-                self.store.set_run_status(run_id, "FAILED")
-                raise
-
-            self.store.append(run_id, E.STEP_COMPLETED, {"step_id": step_id, "status": status})
-            results.append(
-                {
-                    "step_id": step_id,
-                    "status": status,
-                    "simulated": (mode == "dry_run"),
-                    "output": output,
-                    "evidence": [],
-                }
-            )
 
-        prov_bundle = build_provenance_bundle(run_id=run_id, request=request, results=results)
-        self.store.append(run_id, E.PROVENANCE_EMITTED, prov_bundle)
+        with profiler.phase("provenance"), self._tracer.start_span("nexus_router.provenance"):
+            prov_bundle = build_provenance_bundle(run_id=run_id, request=request, results=results)
+        self._append(run_id, E.PROVENANCE_EMITTED, prov_bundle)
 
         if outcome == "ok":
-            self.store.append(run_id, E.RUN_COMPLETED, {"outcome": "ok"})
-            self.store.set_run_status(run_id, "COMPLETED")
+            self._append(
+                run_id, E.RUN_COMPLETED, {"outcome": "ok", **self._profile_fields(record_profile)}
+            )
+            self._set_run_status(run_id, "COMPLETED")
         else:
             # Run already failed (max_steps or step error) - emit final failure event
-            self.store.append(run_id, E.RUN_FAILED, {"outcome": "error"})
-            self.store.set_run_status(run_id, "FAILED")
+            self._append(
+                run_id, E.RUN_FAILED, {"outcome": "error", **self._profile_fields(record_profile)}
+            )
+            self._set_run_status(run_id, "FAILED")
+
+        RUNS_FINISHED.labels(mode, outcome).inc()
+        self._run_span.set_attribute("outcome", outcome)
 
         tools_used_u = _unique_in_order(tools_used)
-        events_committed = len(self.store.read_events(run_id))
+        with profiler.phase("count_events"):
+            events_committed = len(self.store.read_events(run_id))
 
         applied_count = 0 if mode == "dry_run" else sum(1 for r in results if r["status"] == "ok")
         skipped_count = sum(1 for r in results if r["status"] != "ok")
 
-        return {
-            "summary": {
-                "mode": mode,
-                "steps": len(plan),
-                "tools_used": tools_used_u,
-                "outputs_total": len(results),
-                "outputs_applied": applied_count,
-                "outputs_skipped": skipped_count,
-                "adapter_id": self.adapter.adapter_id,
-            },
-            "dispatch": {
-                "adapter_id": self.adapter.adapter_id,
-                "adapter_kind": self.adapter.adapter_kind,
-                "selection_source": selection_source,
-            },
-            "run": {"run_id": run_id, "events_committed": events_committed},
-            "plan": plan,
-            "results": results,
-            "provenance": prov_bundle.get("provenance", {"artifacts": [], "records": []}),
-        }
+        with profiler.phase("response"):
+            response = {
+                "summary": {
+                    "mode": mode,
+                    "steps": len(plan),
+                    "tools_used": tools_used_u,
+                    "outputs_total": len(results),
+                    "outputs_applied": applied_count,
+                    "outputs_skipped": skipped_count,
+                    "adapter_id": self.adapter.adapter_id,
+                },
+                "dispatch": {
+                    "adapter_id": self.adapter.adapter_id,
+                    "adapter_kind": self.adapter.adapter_kind,
+                    "selection_source": selection_source,
+                },
+                "run": {"run_id": run_id, "events_committed": events_committed},
+                "plan": plan,
+                "results": results,
+                "provenance": prov_bundle.get("provenance", {"artifacts": [], "records": []}),
+            }
+        return self._with_profile(response)
+
+    def _append(self, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
+        """Append an event, timed as phase "append.<event_type>"."""
+        with (
+            self._profiler.phase(f"append.{event_type}"),
+            self._tracer.start_span("nexus_router.store.append", {"event_type": event_type}),
+        ):
+            self.store.append(run_id, event_type, payload)
+
+    def _set_run_status(self, run_id: str, status: str) -> None:
+        with self._profiler.phase("set_status"):
+            self.store.set_run_status(run_id, status)
+
+    def _trace_fields(self) -> dict[str, Any]:
+        """Optional "trace_id" field for the RUN_STARTED payload."""
+        trace_id = self._run_span.trace_id
+        if trace_id is None:
+            return {}
+        return {"trace_id": trace_id}
+
+    def _profile_fields(self, record: bool) -> dict[str, Any]:
+        """Optional "profile" field for the terminal event payload."""
+        if not record or not self._profiler.enabled:
+            return {}
+        return {"profile": self._profiler.to_dict()}
+
+    def _with_profile(self, response: dict[str, Any]) -> dict[str, Any]:
+        """Attach the timing breakdown to the response when profiling."""
+        if self._profiler.enabled:
+            response["profile"] = self._profiler.to_dict()
+        return response
+
+    def _resource_fields(self) -> dict[str, Any]:
+        """Optional "resources" field for TOOL_CALL_* payloads."""
+        if self._last_resources is None:
+            return {}
+        return {"resources": self._last_resources}
+
+    def _route_fields(self, tool: str, method: str) -> dict[str, Any]:
+        """Optional "child_adapter_id" field for TOOL_CALL_* payloads."""
+        resolve = getattr(self.adapter, "resolve", None)
+        if resolve is None:
+            return {}
+        child = resolve(tool, method)
+        if child is None:
+            return {}
+        return {"child_adapter_id": child.adapter_id}
+
+    def _cache_fields(self) -> dict[str, Any]:
+        """Optional "cache_hit" field for TOOL_CALL_SUCCEEDED payloads."""
+        if self._last_cache_hit is None:
+            return {}
+        return {"cache_hit": self._last_cache_hit}
 
     def _select_adapter(self, dispatch_config: dict[str, Any]) -> tuple[DispatchAdapter, str]:
         """
@@ -421,6 +569,9 @@ class Router:
         Raises:
             NexusOperationalError: If adapter lacks required capability for mode.
         """
+        self._last_resources = None
+        self._last_cache_hit = None
+
         if mode == "dry_run":
             # dry_run: never call adapter, return simulated output
             output: dict[str, Any] = {
@@ -446,9 +597,26 @@ class Router:
 
         gate_apply(policy)
 
+        adapter_id = self.adapter.adapter_id
+        in_flight = ADAPTER_CALLS_IN_FLIGHT.labels(adapter_id)
+        in_flight.inc()
+        call_status = "error"
         start_time = time.monotonic()
-        output = self.adapter.call(tool, method, args)
-        duration_ms = int((time.monotonic() - start_time) * 1000)
+        span_attributes = {"adapter_id": adapter_id, "tool": tool, "method": method}
+        try:
+            with self._tracer.start_span("nexus_router.adapter.call", span_attributes):
+                output = self.adapter.call(tool, method, args)
+            call_status = "ok"
+        finally:
+            elapsed_s = time.monotonic() - start_time
+            in_flight.dec()
+            ADAPTER_CALL_SECONDS.labels(adapter_id, method, call_status).observe(elapsed_s)
+            # Adapters that account for resources (e.g. SubprocessAdapter) expose
+            # them for the call just made; recorded on success and failure.
+            self._last_resources = getattr(self.adapter, "last_call_resources", None)
+            # Caching adapters (CachingAdapter) report whether the call was a hit
+            self._last_cache_hit = getattr(self.adapter, "last_call_cache_hit", None)
+        duration_ms = int(elapsed_s * 1000)
 
         # Ensure adapter_id is in output
         output["adapter_id"] = self.adapter.adapter_id
@@ -0,0 +1,162 @@
+"""
+Tool-routing composite adapter.
+
+A run binds to exactly one adapter. RoutingAdapter lets that one adapter
+front several children, so a single run can cover a heterogeneous plan
+instead of being split into one run per adapter.
+
+Routes are resolved through precomputed tables in O(1), most specific first:
+
+    "tool.method"  exact (tool, method)
+    "tool"         any method of tool (also accepted as "tool.*")
+    "*"            default for everything else
+
+The router records the concrete child as ``child_adapter_id`` in
+TOOL_CALL_* events.
+
+Usage:
+    from nexus_router.routing_adapter import RoutingAdapter
+
+    adapter = RoutingAdapter(
+        routes={"geo": http_adapter, "fs.write": subprocess_adapter, "*": null_adapter}
+    )
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from .dispatch import DispatchAdapter, _compute_args_digest
+from .exceptions import NexusOperationalError
+
+WILDCARD = "*"
+
+
+class RoutingAdapter:
+    """
+    Adapter that dispatches each call to a child adapter by tool/method.
+
+    Capabilities are the intersection of the children's, so capability
+    checks made for the run hold for every step. Per-call telemetry of the
+    child (last_call_resources, last_call_cache_hit) is passed through.
+
+    Error codes:
+    - NO_ROUTE: no route matches (tool, method) and there is no "*" route
+
+    Capabilities: intersection of child capabilities
+    """
+
+    def __init__(
+        self,
+        adapter_id: str = "routing",
+        *,
+        routes: Mapping[str, DispatchAdapter] | None = None,
+    ) -> None:
+        """
+        Initialize RoutingAdapter.
+
+        Args:
+            adapter_id: Adapter ID.
+            routes: Mapping of route pattern ("tool.method", "tool", "tool.*", "*")
+                to child adapter.
+        """
+        self._adapter_id = adapter_id
+        self._exact: dict[tuple[str, str], DispatchAdapter] = {}
+        self._by_tool: dict[str, DispatchAdapter] = {}
+        self._default: DispatchAdapter | None = None
+        self._capabilities: frozenset[str] = frozenset()
+        self._local = threading.local()
+        for pattern, child in (routes or {}).items():
+            self.add_route(pattern, child)
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "routing"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._capabilities
+
+    @property
+    def last_call_adapter_id(self) -> str | None:
+        """Child adapter that served this thread's last call."""
+        child: DispatchAdapter | None = getattr(self._local, "child", None)
+        return child.adapter_id if child is not None else None
+
+    @property
+    def last_call_resources(self) -> dict[str, Any] | None:
+        """last_call_resources of the child that served this thread's last call."""
+        child = getattr(self._local, "child", None)
+        resources: dict[str, Any] | None = getattr(child, "last_call_resources", None)
+        return resources
+
+    @property
+    def last_call_cache_hit(self) -> bool | None:
+        """last_call_cache_hit of the child that served this thread's last call."""
+        child = getattr(self._local, "child", None)
+        hit: bool | None = getattr(child, "last_call_cache_hit", None)
+        return hit
+
+    def add_route(self, pattern: str, child: DispatchAdapter) -> None:
+        """
+        Route calls matching pattern to child.
+
+        Raises:
+            ValueError: If the pattern is empty or already routed.
+        """
+        if not pattern:
+            raise ValueError("Route pattern must be non-empty")
+
+        if pattern == WILDCARD:
+            if self._default is not None:
+                raise ValueError("Duplicate route: '*'")
+            self._default = child
+        else:
+            tool, _, method = pattern.partition(".")
+            if method in ("", WILDCARD):
+                if tool in self._by_tool:
+                    raise ValueError(f"Duplicate route: '{tool}'")
+                self._by_tool[tool] = child
+            else:
+                if (tool, method) in self._exact:
+                    raise ValueError(f"Duplicate route: '{pattern}'")
+                self._exact[(tool, method)] = child
+
+        self._capabilities = frozenset.intersection(*(c.capabilities for c in self.children()))
+
+    def children(self) -> list[DispatchAdapter]:
+        """Distinct child adapters (exact routes, then tool routes, then "*")."""
+        seen: dict[int, DispatchAdapter] = {}
+        for child in (*self._exact.values(), *self._by_tool.values()):
+            seen.setdefault(id(child), child)
+        if self._default is not None:
+            seen.setdefault(id(self._default), self._default)
+        return list(seen.values())
+
+    def resolve(self, tool: str, method: str) -> DispatchAdapter | None:
+        """Child adapter for (tool, method), or None if nothing matches."""
+        child = self._exact.get((tool, method))
+        if child is None:
+            child = self._by_tool.get(tool, self._default)
+        return child
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        child = self.resolve(tool, method)
+        self._local.child = child
+        if child is None:
+            raise NexusOperationalError(
+                f"No route for {tool}.{method}",
+                error_code="NO_ROUTE",
+                details={
+                    "tool": tool,
+                    "method": method,
+                    "args_digest": _compute_args_digest(args),
+                },
+            )
+        return child.call(tool, method, args)
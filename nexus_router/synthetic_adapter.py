@@ -0,0 +1,169 @@
+"""
+Synthetic latency adapter for benchmarking.
+
+SyntheticAdapter stands in for a real tool with configurable cost:
+latency distribution (fixed, normal, lognormal) with tail spikes, error
+rate, output size and CPU burn. Unlike FakeAdapter it keeps only counters,
+so memory stays flat over millions of calls.
+
+With a seed, the sequence of sampled latencies/errors is reproducible.
+
+Usage:
+    from nexus_router.synthetic_adapter import SyntheticAdapter
+
+    adapter = SyntheticAdapter(latency_ms=20, latency_dist="lognormal", sigma=0.5,
+                               spike_rate=0.01, spike_ms=500, error_rate=0.001, seed=1)
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from typing import Any
+
+from .dispatch import CAPABILITY_APPLY, CAPABILITY_DRY_RUN
+from .exceptions import NexusOperationalError
+
+LATENCY_DISTRIBUTIONS = ("fixed", "normal", "lognormal")
+
+
+class SyntheticAdapter:
+    """
+    Adapter with synthetic latency, errors, output size and CPU cost.
+
+    Latency per call (milliseconds):
+    - fixed:     latency_ms
+    - normal:    N(latency_ms, sigma), clamped at 0 (sigma in ms)
+    - lognormal: latency_ms * exp(N(0, sigma)) (latency_ms is the median)
+    plus spike_ms with probability spike_rate.
+
+    Error codes:
+    - SYNTHETIC_ERROR: raised with probability error_rate (after the latency)
+
+    Capabilities: dry_run, apply
+    """
+
+    def __init__(
+        self,
+        adapter_id: str = "synthetic",
+        *,
+        latency_ms: float = 0.0,
+        latency_dist: str = "fixed",
+        sigma: float = 0.0,
+        spike_rate: float = 0.0,
+        spike_ms: float = 0.0,
+        error_rate: float = 0.0,
+        output_bytes: int = 0,
+        cpu_burn_ms: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize SyntheticAdapter.
+
+        Args:
+            adapter_id: Adapter ID.
+            latency_ms: Base latency (median for lognormal).
+            latency_dist: One of "fixed", "normal", "lognormal".
+            sigma: Spread: stddev in ms (normal) or shape (lognormal).
+            spike_rate: Probability [0, 1] of adding a tail spike.
+            spike_ms: Extra latency of a spike.
+            error_rate: Probability [0, 1] of raising SYNTHETIC_ERROR.
+            output_bytes: Size of the "payload" string in the output.
+            cpu_burn_ms: Busy-loop time per call (holds the GIL, unlike sleep).
+            seed: Seed for reproducible sampling.
+        """
+        if latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"latency_dist must be one of {LATENCY_DISTRIBUTIONS}, got {latency_dist!r}"
+            )
+        for name, rate in (("spike_rate", spike_rate), ("error_rate", error_rate)):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1]")
+        if min(latency_ms, sigma, spike_ms, cpu_burn_ms, output_bytes) < 0:
+            raise ValueError("latency, sigma, spike, cpu burn and output size must be >= 0")
+
+        self._adapter_id = adapter_id
+        self._latency_ms = latency_ms
+        self._latency_dist = latency_dist
+        self._sigma = sigma
+        self._spike_rate = spike_rate
+        self._spike_ms = spike_ms
+        self._error_rate = error_rate
+        self._payload = "x" * output_bytes
+        self._cpu_burn_ms = cpu_burn_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.spikes = 0
+        self.total_latency_ms = 0.0
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "synthetic"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return frozenset({CAPABILITY_DRY_RUN, CAPABILITY_APPLY})
+
+    def stats(self) -> dict[str, Any]:
+        """Counters: calls, errors, spikes, total_latency_ms (sampled, incl. CPU burn)."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "spikes": self.spikes,
+                "total_latency_ms": round(self.total_latency_ms, 3),
+            }
+
+    def sample_latency_ms(self) -> tuple[float, bool, bool]:
+        """Draw (latency_ms, spiked, failed) for one call."""
+        with self._lock:
+            rng = self._rng
+            if self._latency_dist == "normal":
+                latency = max(0.0, rng.gauss(self._latency_ms, self._sigma))
+            elif self._latency_dist == "lognormal":
+                latency = self._latency_ms * math.exp(rng.gauss(0.0, self._sigma))
+            else:
+                latency = self._latency_ms
+            spiked = self._spike_rate > 0 and rng.random() < self._spike_rate
+            if spiked:
+                latency += self._spike_ms
+            failed = self._error_rate > 0 and rng.random() < self._error_rate
+            self.calls += 1
+            self.spikes += spiked
+            self.errors += failed
+            self.total_latency_ms += latency + self._cpu_burn_ms
+        return latency, spiked, failed
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        latency_ms, spiked, failed = self.sample_latency_ms()
+
+        if self._cpu_burn_ms > 0:
+            deadline = time.perf_counter() + self._cpu_burn_ms / 1000
+            while time.perf_counter() < deadline:
+                pass
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000)
+
+        if failed:
+            raise NexusOperationalError(
+                f"Synthetic failure for {tool}.{method}",
+                error_code="SYNTHETIC_ERROR",
+                details={"latency_ms": round(latency_ms, 3), "spiked": spiked},
+            )
+        output: dict[str, Any] = {
+            "tool": tool,
+            "method": method,
+            "latency_ms": round(latency_ms, 3),
+            "spiked": spiked,
+        }
+        if self._payload:
+            output["payload"] = self._payload
+        return output
@@ -14,6 +14,8 @@ from .import_ import import_bundle as _import_impl
 from .inspect import inspect as _inspect_impl
 from .plugins import inspect_adapter as _inspect_adapter_impl
 from .plugins import validate_adapter as _validate_adapter_impl
+from .profiling import NULL_PROFILER, PhaseProfiler, profile_options
+from .replay import DEFAULT_SNAPSHOT_INTERVAL
 from .replay import replay as _replay_impl
 from .router import Router
 from .schema import validate
@@ -77,13 +79,18 @@ def run(
         ValueError: If both adapter and adapters are provided.
         NexusBugError: Re-raised after recording if adapter raises bug error.
     """
-    schema = _load_schema("nexus-router.run.request.v0.7.json")
-    validate(request, schema)
+    # Profiling starts before validation so schema and store costs are included
+    profiler = PhaseProfiler() if profile_options(request)[0] else NULL_PROFILER
+
+    with profiler.phase("validate"):
+        schema = _load_schema("nexus-router.run.request.v0.7.json")
+        validate(request, schema)
 
-    store = EventStore(db_path)
+    with profiler.phase("store_open"):
+        store = EventStore(db_path)
     try:
         router = Router(store, adapter=adapter, adapters=adapters)
-        return router.run(request)
+        return router.run(request, profiler=profiler)
     finally:
         store.close()
 
@@ -158,7 +165,9 @@ def replay(request: dict[str, Any]) -> dict[str, Any]:
     Args:
         request: Request dict conforming to nexus-router.replay.request.v0.2 schema.
                  Required: db_path, run_id
-                 Optional: strict (default True)
+                 Optional: strict (default True), incremental (default False),
+                           fast (default False), until_seq,
+                           snapshot_interval (default 1000)
 
     Returns:
         Response dict conforming to nexus-router.replay.response.v0.2 schema.
@@ -173,6 +182,10 @@ def replay(request: dict[str, Any]) -> dict[str, Any]:
         db_path=request["db_path"],
         run_id=request["run_id"],
         strict=request.get("strict", True),
+        incremental=request.get("incremental", False),
+        fast=request.get("fast", False),
+        until_seq=request.get("until_seq"),
+        snapshot_interval=request.get("snapshot_interval", DEFAULT_SNAPSHOT_INTERVAL),
     )
 
 
@@ -183,7 +196,8 @@ def export(request: dict[str, Any]) -> dict[str, Any]:
     Args:
         request: Request dict conforming to nexus-router.export.request.v0.3 schema.
                  Required: db_path, run_id
-                 Optional: include_provenance (default True), format (default bundle_v0_3)
+                 Optional: include_provenance (default True), format (default bundle_v0_3),
+                          after_seq and prev_digest (delta bundle)
 
     Returns:
         Response dict conforming to nexus-router.export.response.v0.3 schema.
@@ -198,6 +212,8 @@ def export(request: dict[str, Any]) -> dict[str, Any]:
         db_path=request["db_path"],
         run_id=request["run_id"],
         include_provenance=request.get("include_provenance", True),
+        after_seq=request.get("after_seq"),
+        prev_digest=request.get("prev_digest"),
     )
 
 
@@ -208,7 +224,8 @@ def import_bundle(request: dict[str, Any]) -> dict[str, Any]:
     Args:
         request: Request dict conforming to nexus-router.import.request.v0.3 schema.
                  Required: db_path, bundle
-                 Optional: mode (default reject_on_conflict), new_run_id,
+                 Optional: mode (default reject_on_conflict; "append" for delta
+                          bundles), new_run_id,
                           verify_digest (default True), replay_after_import (default True)
 
     Returns:
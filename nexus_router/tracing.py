@@ -0,0 +1,326 @@
+"""
+Dependency-free tracing spans, OpenTelemetry-compatible in shape.
+
+Spans carry W3C trace/span ids (32/16 hex chars), a parent span id, unix-nano
+start/end times, attributes and a status, and are handed to a pluggable
+exporter when they end. The current span is tracked in a ContextVar, so
+nested spans are parented automatically within a thread and across asyncio
+tasks (which copy the context). New threads start with an empty context:
+FunctionAdapter runs offloaded functions in a copy of the caller's context,
+and other code handing work to threads must do the same
+(contextvars.copy_context().run) to keep spans parented.
+
+Tracing is off by default: get_tracer() returns a no-op tracer whose spans
+are a shared inert object. Enable it process-wide with set_tracer().
+
+Instrumented spans:
+    nexus_router.run                run_id, mode
+    nexus_router.step               step_id, tool, method, status
+    nexus_router.adapter.call       adapter_id, tool, method, error_code
+    nexus_router.store.append       event_type
+    nexus_router.provenance
+
+The run's trace id is stored in RUN_STARTED ("trace_id"). A request may carry
+a W3C "traceparent" so router spans join the caller's trace; adapters that
+launch or call tools (subprocess, HTTP, MCP) propagate the current
+traceparent downstream.
+
+Usage:
+    from nexus_router.tracing import InMemorySpanExporter, Tracer, set_tracer
+
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    ...
+    [s.to_dict() for s in exporter.spans()]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "nexus_router_current_span", default=None
+)
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identity of a (possibly remote) span."""
+
+    trace_id: str
+    span_id: str
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value (sampled)."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    """Parse a W3C traceparent; None if absent or malformed (all-zero ids included)."""
+    if not value:
+        return None
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return SpanContext(trace_id=match.group(1), span_id=match.group(2))
+
+
+class SpanExporter(Protocol):
+    """Receives each span when it ends."""
+
+    def export(self, span: Span) -> None: ...
+
+
+class Span:
+    """A timed operation; use as a context manager or call end()."""
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        context: SpanContext,
+        parent_span_id: str | None,
+        attributes: dict[str, Any] | None,
+    ) -> None:
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.attributes: dict[str, Any] = dict(attributes) if attributes else {}
+        self.status = "OK"
+        self.status_message: str | None = None
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano: int | None = None
+        self._tracer = tracer
+        self._start_perf_ns = time.perf_counter_ns()
+        self._token: contextvars.Token[Span | None] | None = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.context.trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self.context.span_id
+
+    @property
+    def traceparent(self) -> str:
+        return self.context.traceparent
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = "ERROR"
+        self.status_message = message
+
+    def end(self) -> None:
+        """Stamp the end time and export (idempotent)."""
+        if self.end_time_unix_nano is not None:
+            return
+        elapsed = time.perf_counter_ns() - self._start_perf_ns
+        self.end_time_unix_nano = self.start_time_unix_nano + elapsed
+        self._tracer._export(self)
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: object
+    ) -> None:
+        if exc is not None and self.status == "OK":
+            self.set_error(f"{type(exc).__name__}: {exc}")
+            error_code = getattr(exc, "error_code", None)
+            if error_code is not None:
+                self.attributes.setdefault("error_code", error_code)
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON form (OTLP field names in snake_case)."""
+        end = self.end_time_unix_nano
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": end,
+            "duration_ms": None if end is None else (end - self.start_time_unix_nano) / 1e6,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+            "resource": {"service.name": self._tracer.service_name},
+        }
+
+
+class _NullSpan:
+    """Inert span returned by the no-op tracer."""
+
+    trace_id: str | None = None
+    span_id: str | None = None
+    traceparent: str | None = None
+
+    def __init__(self, parent: SpanContext | None = None) -> None:
+        # An incoming traceparent still identifies the run's trace
+        if parent is not None:
+            self.trace_id = parent.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter."""
+
+    enabled = True
+
+    def __init__(self, exporter: SpanExporter, *, service_name: str = "nexus-router") -> None:
+        self.exporter = exporter
+        self.service_name = service_name
+
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        *,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        """
+        New span, child of `parent` or else of the current span.
+
+        The span becomes current when entered as a context manager.
+        """
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        if parent is None:
+            context = SpanContext(trace_id=_new_id(128), span_id=_new_id(64))
+            parent_span_id = None
+        else:
+            context = SpanContext(trace_id=parent.trace_id, span_id=_new_id(64))
+            parent_span_id = parent.span_id
+        return Span(self, name, context, parent_span_id, attributes)
+
+    def _export(self, span: Span) -> None:
+        # Exporter failures must never fail a run
+        with contextlib.suppress(Exception):
+            self.exporter.export(span)
+
+
+class _NoopTracer:
+    enabled = False
+
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        *,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        return _NullSpan(parent) if parent is not None else _NULL_SPAN  # type: ignore[return-value]
+
+
+NOOP_TRACER: Tracer = _NoopTracer()  # type: ignore[assignment]
+_tracer: Tracer = NOOP_TRACER
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer (no-op unless set_tracer() was called)."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install a process-wide tracer; None restores the no-op tracer."""
+    global _tracer
+    _tracer = tracer if tracer is not None else NOOP_TRACER
+
+
+def current_span() -> Span | None:
+    """Span currently active in this context, if any."""
+    return _current_span.get()
+
+
+def current_traceparent() -> str | None:
+    """traceparent of the current span, for propagation to tools."""
+    span = _current_span.get()
+    return span.traceparent if span is not None else None
+
+
+def _new_id(bits: int) -> str:
+    value = random.getrandbits(bits)
+    while value == 0:
+        value = random.getrandbits(bits)
+    return f"{value:0{bits // 4}x}"
+
+
+class InMemorySpanExporter:
+    """Keeps the most recent `max_spans` spans (ring buffer); for tests and debugging."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonlSpanExporter:
+    """Appends one JSON object per span to a file."""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115 - closed in close()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> JsonlSpanExporter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,211 @@
+"""
+nexus-router.transfer: Database-to-database run copy without serialization.
+
+export_run/import_bundle move a run through Python dicts and JSON. copy_runs
+instead ATTACHes the source database to the destination connection and moves
+rows with INSERT ... SELECT inside one transaction, so payloads are copied as
+stored bytes and bulk moves run at SQLite speed.
+
+Usage:
+    from nexus_router.transfer import copy_runs
+
+    result = copy_runs(src_db="prod.db", dst_db="archive.db", status="COMPLETED")
+    result["runs_copied"], result["events_copied"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from .import_ import _ensure_schema
+
+CONFLICT_MODES = ("reject_on_conflict", "overwrite")
+
+
+def copy_runs(
+    *,
+    src_db: str,
+    dst_db: str,
+    run_ids: list[str] | None = None,
+    status: str | None = None,
+    since: str | None = None,
+    conflict_mode: str = "reject_on_conflict",
+    fingerprint: bool = True,
+    timeout_s: float = 5.0,
+) -> dict[str, Any]:
+    """
+    Copy runs and their events from one database file to another.
+
+    Everything happens in one transaction on the destination: either every
+    selected run is copied or none is. Only the destination is write-locked;
+    the source is read under a shared lock, so a live database with active
+    writers can be copied from without blocking them.
+
+    Args:
+        src_db: Path to the source SQLite database.
+        dst_db: Path to the destination database (created if missing).
+        run_ids: Only these runs (optional).
+        status: Only runs with this status, e.g. "COMPLETED" (optional).
+        since: Only runs created at or after this RFC3339 timestamp (optional).
+        conflict_mode: What to do with runs already in the destination:
+            - "reject_on_conflict": Leave them alone and report them as skipped
+            - "overwrite": Replace them with the source copy
+        fingerprint: Return a SHA-256 per copied run over its stored rows
+            (payload bytes as stored), to compare with another copy later.
+            The rows are copied verbatim, so this is not re-checked here.
+        timeout_s: How long to wait for a database lock (default 5s).
+
+    Returns:
+        Dict with ok, run_ids (copied), skipped, runs_copied, events_copied,
+        elapsed_ms and, with fingerprint, digests (run_id -> sha256); or
+        ok=False with error.
+    """
+    if conflict_mode not in CONFLICT_MODES:
+        raise ValueError(f"conflict_mode must be one of {CONFLICT_MODES}, got {conflict_mode!r}")
+    if not Path(src_db).exists():
+        # ATTACH would silently create an empty database
+        return {
+            "ok": False,
+            "error": {"code": "SOURCE_NOT_FOUND", "message": f"Database {src_db} not found"},
+        }
+    if Path(dst_db).resolve() == Path(src_db).resolve():
+        return {
+            "ok": False,
+            "error": {"code": "SAME_DATABASE", "message": "src_db and dst_db are the same file"},
+        }
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(dst_db, isolation_level=None, timeout=timeout_s)
+    try:
+        _ensure_schema(conn)
+        conn.execute("ATTACH DATABASE ? AS src", (src_db,))
+        # Deferred, not IMMEDIATE: after ATTACH that would write-lock the source
+        # too. A no-op write takes the destination's write lock up front.
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM main.runs WHERE 0")
+            result = _copy(conn, run_ids, status, since, conflict_mode, fingerprint)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        if not result["ok"]:
+            conn.execute("ROLLBACK")
+            return result
+        conn.execute("COMMIT")
+    except sqlite3.OperationalError as e:
+        return {"ok": False, "error": {"code": "DATABASE_ERROR", "message": str(e)}}
+    finally:
+        conn.close()
+
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def _copy(
+    conn: sqlite3.Connection,
+    run_ids: list[str] | None,
+    status: str | None,
+    since: str | None,
+    conflict_mode: str,
+    fingerprint: bool,
+) -> dict[str, Any]:
+    """Select, resolve conflicts and copy inside the caller's transaction."""
+    conditions: list[str] = []
+    params: list[Any] = []
+    if status is not None:
+        conditions.append("status = ?")
+        params.append(status)
+    if since is not None:
+        conditions.append("created_at >= ?")
+        params.append(since)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    conn.execute("DROP TABLE IF EXISTS temp.copy_ids")
+    conn.execute("CREATE TEMP TABLE copy_ids (run_id TEXT PRIMARY KEY)")
+    if run_ids is not None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.copy_ids(run_id) VALUES (?)", [(r,) for r in run_ids]
+        )
+        # Keep only requested ids that exist in the source and match the filters
+        conn.execute(
+            f"DELETE FROM temp.copy_ids WHERE run_id NOT IN (SELECT run_id FROM src.runs {where})",
+            params,
+        )
+    else:
+        conn.execute(
+            f"INSERT INTO temp.copy_ids(run_id) SELECT run_id FROM src.runs {where}", params
+        )
+
+    conflicts = [
+        row[0]
+        for row in conn.execute(
+            "SELECT run_id FROM temp.copy_ids WHERE run_id IN (SELECT run_id FROM main.runs) "
+            "ORDER BY run_id"
+        )
+    ]
+    skipped: list[str] = []
+    if conflicts:
+        if conflict_mode == "reject_on_conflict":
+            skipped = conflicts
+            conn.execute("DELETE FROM temp.copy_ids WHERE run_id IN (SELECT run_id FROM main.runs)")
+        else:
+            in_conflict = "run_id IN (SELECT run_id FROM temp.copy_ids)"
+            conn.execute(f"DELETE FROM main.events WHERE {in_conflict}")
+            conn.execute(f"DELETE FROM main.import_chains WHERE {in_conflict}")
+            conn.execute(f"DELETE FROM main.runs WHERE {in_conflict}")
+
+    runs_copied = conn.execute(
+        "INSERT INTO main.runs(run_id, mode, goal, status, created_at) "
+        "SELECT run_id, mode, goal, status, created_at FROM src.runs "
+        "WHERE run_id IN (SELECT run_id FROM temp.copy_ids)"
+    ).rowcount
+    try:
+        events_copied = conn.execute(
+            "INSERT INTO main.events(event_id, run_id, seq, type, payload_json, ts) "
+            "SELECT event_id, run_id, seq, type, payload_json, ts FROM src.events "
+            "WHERE run_id IN (SELECT run_id FROM temp.copy_ids)"
+        ).rowcount
+    except sqlite3.IntegrityError as e:
+        return {
+            "ok": False,
+            "error": {"code": "EVENT_CONFLICT", "message": f"Event already in destination: {e}"},
+        }
+
+    copied = [row[0] for row in conn.execute("SELECT run_id FROM temp.copy_ids ORDER BY run_id")]
+    result: dict[str, Any] = {
+        "ok": True,
+        "run_ids": copied,
+        "skipped": skipped,
+        "runs_copied": runs_copied,
+        "events_copied": events_copied,
+    }
+
+    if fingerprint:
+        result["digests"] = _stored_digests(conn)
+
+    conn.execute("DROP TABLE temp.copy_ids")
+    return result
+
+
+def _stored_digests(conn: sqlite3.Connection) -> dict[str, str]:
+    """SHA-256 per selected run over its stored run row and event rows (no JSON decode)."""
+    digests: dict[str, str] = {}
+    for run_id, mode, goal, status, created_at in conn.execute(
+        "SELECT run_id, mode, goal, status, created_at FROM main.runs "
+        "WHERE run_id IN (SELECT run_id FROM temp.copy_ids) ORDER BY run_id"
+    ):
+        h = hashlib.sha256("\x1f".join((run_id, mode, goal, status, created_at)).encode("utf-8"))
+        for seq, event_id, event_type, ts, payload_json in conn.execute(
+            "SELECT seq, event_id, type, ts, payload_json FROM main.events "
+            "WHERE run_id = ? ORDER BY seq",
+            (run_id,),
+        ):
+            h.update(f"\x1e{seq}\x1f{event_id}\x1f{event_type}\x1f{ts}\x1f".encode())
+            h.update(payload_json.encode("utf-8"))
+        digests[run_id] = h.hexdigest()
+    return digests
@@ -0,0 +1,419 @@
+"""
+Built-in Unix domain socket RPC adapter for co-located tool daemons.
+
+Stdlib-only. The adapter keeps one persistent connection to a local socket
+and multiplexes concurrent calls over it by request id, so a sidecar daemon
+serves tool calls without process spawning or TCP overhead.
+
+Wire format (both directions): 4-byte big-endian length, then a UTF-8 JSON
+object of that many bytes.
+
+    request:  {"id": 7, "tool": "...", "method": "...", "args": {...}}
+    response: {"id": 7, "result": {...}}
+          or  {"id": 7, "error": {"code": "...", "message": "..."}}
+
+Responses may arrive in any order. A broken connection fails every call in
+flight with CONNECTION_FAILED; the next call reconnects.
+
+Usage:
+    from nexus_router.unix_socket_adapter import UnixSocketAdapter
+
+    adapter = UnixSocketAdapter("/run/mytool.sock", timeout_s=10)
+    registry.register(adapter)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import select
+import socket
+import struct
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .dispatch import (
+    CAPABILITY_APPLY,
+    CAPABILITY_EXTERNAL,
+    CAPABILITY_TIMEOUT,
+    PendingCall,
+    _compute_args_digest,
+    default_redact_text,
+)
+from .exceptions import NexusOperationalError
+
+_HEADER = struct.Struct(">I")
+
+
+def encode_frame(obj: dict[str, Any]) -> bytes:
+    """Encode a JSON object as one length-prefixed frame."""
+    body = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes | None:
+    """Read exactly n bytes, or None on clean EOF before the first byte."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            if not buf:
+                return None
+            raise ConnectionResetError("connection closed mid-frame")
+        buf += chunk
+    return bytes(buf)
+
+
+class _Connection:
+    """
+    One socket plus a reader thread that routes response frames to callers.
+
+    Once failed, a connection stays failed; the adapter replaces it.
+    """
+
+    def __init__(self, sock: socket.socket, *, max_frame_bytes: int) -> None:
+        self._sock = sock
+        self._max_frame_bytes = max_frame_bytes
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, PendingCall] = {}
+        self.closed = False
+        self._reader = threading.Thread(
+            target=self._read_loop, name="nexus-unix-socket-reader", daemon=True
+        )
+        self._reader.start()
+
+    def send(self, req_id: int, frame: bytes, deadline: float) -> PendingCall:
+        """
+        Register a pending call and write its frame before the deadline.
+
+        Raises TimeoutError if the frame cannot be written in time (a partly
+        written frame drops the connection) and OSError on other failures.
+        """
+        pending = PendingCall()
+        with self._lock:
+            if self.closed:
+                raise ConnectionResetError("connection is closed")
+            self._pending[req_id] = pending
+        if not self._write_lock.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            self.discard(req_id)
+            raise TimeoutError("another call is still writing")
+        try:
+            self._write_all(frame, deadline)
+        except TimeoutError:
+            self._fail("CONNECTION_FAILED", "Send timed out; daemon is not reading", {})
+            raise
+        except OSError as e:
+            self._fail("CONNECTION_FAILED", f"Send failed: {type(e).__name__}", {})
+            raise
+        finally:
+            self._write_lock.release()
+        return pending
+
+    def _write_all(self, frame: bytes, deadline: float) -> None:
+        """Non-blocking writes gated by poll, so a full socket buffer cannot outlast the deadline."""
+        view = memoryview(frame)
+        poller: select.poll | None = None
+        while view:
+            try:
+                view = view[self._sock.send(view, socket.MSG_DONTWAIT) :]
+                continue
+            except BlockingIOError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("send deadline exceeded")
+            if poller is None:
+                poller = select.poll()
+                poller.register(self._sock, select.POLLOUT)
+            poller.poll(remaining * 1000)
+
+    def discard(self, req_id: int) -> None:
+        """Forget a call (e.g. timed out); a late response is dropped."""
+        with self._lock:
+            self._pending.pop(req_id, None)
+
+    def close(self) -> None:
+        self._fail("CONNECTION_FAILED", "Adapter closed", {})
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                header = _recv_exact(self._sock, _HEADER.size)
+                if header is None:
+                    self._fail("CONNECTION_FAILED", "Connection closed by peer", {})
+                    return
+                (length,) = _HEADER.unpack(header)
+                if length > self._max_frame_bytes:
+                    self._fail(
+                        "OUTPUT_TOO_LARGE",
+                        f"Response frame exceeded {self._max_frame_bytes} bytes",
+                        {"limit_bytes": self._max_frame_bytes, "frame_bytes": length},
+                    )
+                    return
+                body = _recv_exact(self._sock, length) if length else b""
+                if body is None:
+                    raise ConnectionResetError("connection closed mid-frame")
+                try:
+                    message = json.loads(body)
+                    req_id = message["id"]
+                    # Request ids are ints; anything else (incl. unhashable) is malformed
+                    if not isinstance(req_id, int) or isinstance(req_id, bool):
+                        raise TypeError(f"id is {type(req_id).__name__}")
+                except (ValueError, TypeError, KeyError) as e:
+                    self._fail(
+                        "PROTOCOL_ERROR",
+                        f"Malformed response frame: {type(e).__name__}",
+                        {"frame_bytes": length},
+                    )
+                    return
+                with self._lock:
+                    pending = self._pending.pop(req_id, None)
+                if pending is not None:
+                    pending.response = message
+                    pending.event.set()
+        except OSError as e:
+            self._fail(
+                "CONNECTION_FAILED",
+                f"Connection failed: {type(e).__name__}",
+                {"cause_type": type(e).__name__},
+            )
+
+    def _fail(self, code: str, message: str, details: dict[str, Any]) -> None:
+        """Mark closed and fail every call in flight with the same error."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        with contextlib.suppress(OSError):  # Already disconnected
+            self._sock.shutdown(socket.SHUT_RDWR)
+        self._sock.close()
+        for p in pending.values():
+            p.failure = (code, message, details)
+            p.event.set()
+
+
+class UnixSocketAdapter:
+    """
+    Adapter that dispatches tool calls to a local daemon over a Unix socket.
+
+    Mirrors SubprocessAdapter semantics:
+    - timeout_s bounds the whole call (reconnect, send, wait for response)
+    - max_frame_bytes caps a response frame (OUTPUT_TOO_LARGE)
+    - redaction hooks apply to error details; args_digest is in all errors
+
+    Calls already sent are never resent after a connection failure (the
+    daemon may have run them); only establishing the connection is retried,
+    up to reconnect_attempts times.
+
+    Error codes:
+    - TIMEOUT: no response within timeout_s
+    - CONNECTION_FAILED: cannot connect, or connection lost mid-call
+    - OUTPUT_TOO_LARGE: response frame exceeded max_frame_bytes
+    - PROTOCOL_ERROR: malformed frame (connection is dropped)
+    - INVALID_JSON: "result" is missing or not a JSON object
+    - TOOL_ERROR: daemon returned an error (details: remote_code, message)
+
+    Capabilities: apply, timeout, external
+    """
+
+    RedactTextFunc = Callable[[str], str]
+
+    def __init__(
+        self,
+        socket_path: str,
+        *,
+        adapter_id: str | None = None,
+        timeout_s: float = 30.0,
+        connect_timeout_s: float = 5.0,
+        reconnect_attempts: int = 3,
+        reconnect_backoff_s: float = 0.05,
+        max_frame_bytes: int = 64 * 1024 * 1024,
+        redact_text: RedactTextFunc | None = None,
+    ) -> None:
+        """
+        Initialize UnixSocketAdapter.
+
+        Args:
+            socket_path: Filesystem path of the daemon's Unix socket.
+            adapter_id: Optional custom adapter ID. Defaults to "unix:{socket_path}".
+            timeout_s: Timeout for the whole call in seconds.
+            connect_timeout_s: Timeout for each connection attempt.
+            reconnect_attempts: Connection attempts per call (at least 1).
+            reconnect_backoff_s: Initial delay between attempts (doubles each time).
+            max_frame_bytes: Hard cap on a response frame.
+            redact_text: Redaction for text in error details (default_redact_text).
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix domain sockets are not supported on this platform")
+        if reconnect_attempts <= 0:
+            raise ValueError("reconnect_attempts must be positive")
+        if max_frame_bytes <= 0:
+            raise ValueError("max_frame_bytes must be positive")
+
+        self._socket_path = socket_path
+        self._timeout_s = timeout_s
+        self._connect_timeout_s = connect_timeout_s
+        self._reconnect_attempts = reconnect_attempts
+        self._reconnect_backoff_s = reconnect_backoff_s
+        self._max_frame_bytes = max_frame_bytes
+        self._redact_text: UnixSocketAdapter.RedactTextFunc = (
+            redact_text if redact_text is not None else default_redact_text
+        )
+        self._adapter_id = adapter_id if adapter_id is not None else f"unix:{socket_path}"
+        self._capabilities: frozenset[str] = frozenset(
+            {CAPABILITY_APPLY, CAPABILITY_TIMEOUT, CAPABILITY_EXTERNAL}
+        )
+        self._ids = itertools.count(1)
+        self._conn: _Connection | None = None
+        self._conn_lock = threading.Lock()
+        self.connects = 0
+
+    @property
+    def adapter_id(self) -> str:
+        return self._adapter_id
+
+    @property
+    def adapter_kind(self) -> str:
+        return "unix_socket"
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self._capabilities
+
+    def close(self) -> None:
+        """Close the connection; calls in flight fail with CONNECTION_FAILED."""
+        with self._conn_lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def __enter__(self) -> UnixSocketAdapter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        self.close()
+
+    def call(self, tool: str, method: str, args: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute a tool call on the daemon.
+
+        Returns:
+            The "result" object from the response frame.
+
+        Raises:
+            NexusOperationalError: For timeout, connection failure, oversized or
+                malformed frames, or an error reported by the daemon.
+        """
+        deadline = time.monotonic() + self._timeout_s
+        base_details: dict[str, Any] = {
+            "args_digest": _compute_args_digest(args),
+            "socket_path": self._socket_path,
+        }
+        req_id = next(self._ids)
+        frame = encode_frame({"id": req_id, "tool": tool, "method": method, "args": args})
+
+        conn = self._connect(deadline, base_details)
+        try:
+            pending = conn.send(req_id, frame, deadline)
+        except TimeoutError as e:
+            raise NexusOperationalError(
+                f"Socket call timed out after {self._timeout_s}s",
+                error_code="TIMEOUT",
+                details={**base_details, "timeout_s": self._timeout_s, "phase": "send"},
+            ) from e
+        except OSError as e:
+            raise NexusOperationalError(
+                f"Connection failed: {type(e).__name__}",
+                error_code="CONNECTION_FAILED",
+                details={**base_details, "cause_type": type(e).__name__},
+            ) from e
+
+        if not pending.event.wait(max(deadline - time.monotonic(), 0)):
+            conn.discard(req_id)
+            raise NexusOperationalError(
+                f"Socket call timed out after {self._timeout_s}s",
+                error_code="TIMEOUT",
+                details={**base_details, "timeout_s": self._timeout_s},
+            )
+
+        if pending.failure is not None:
+            code, message, details = pending.failure
+            raise NexusOperationalError(
+                message, error_code=code, details={**base_details, **details}
+            )
+
+        response = pending.response or {}
+        if "error" in response:
+            error = response["error"] if isinstance(response["error"], dict) else {}
+            message = self._redact_text(str(error.get("message", "")))
+            raise NexusOperationalError(
+                f"Tool error from daemon: {message}",
+                error_code="TOOL_ERROR",
+                details={
+                    **base_details,
+                    "remote_code": str(error.get("code", "")),
+                    "message": message,
+                },
+            )
+
+        result = response.get("result")
+        if not isinstance(result, dict):
+            raise NexusOperationalError(
+                f"Response result is not a JSON object: {type(result).__name__}",
+                error_code="INVALID_JSON",
+                details=base_details,
+            )
+        return result
+
+    def _connect(self, deadline: float, base_details: dict[str, Any]) -> _Connection:
+        """Return the live connection, reconnecting with backoff if needed."""
+        with self._conn_lock:
+            if self._conn is not None and not self._conn.closed:
+                return self._conn
+
+            backoff = self._reconnect_backoff_s
+            last_error: OSError | None = None
+            for attempt in range(self._reconnect_attempts):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if attempt:
+                    time.sleep(min(backoff, remaining))
+                    backoff *= 2
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.settimeout(min(self._connect_timeout_s, max(remaining, 0.001)))
+                    sock.connect(self._socket_path)
+                except OSError as e:
+                    sock.close()
+                    last_error = e
+                    continue
+                # The reader thread blocks in recv; call deadlines are enforced
+                # by poll-gated writes and by waiting on the pending event,
+                # not by socket timeouts.
+                sock.settimeout(None)
+                self._conn = _Connection(sock, max_frame_bytes=self._max_frame_bytes)
+                self.connects += 1
+                return self._conn
+
+        cause = last_error if last_error is not None else TimeoutError("deadline exceeded")
+        raise NexusOperationalError(
+            f"Cannot connect to {self._socket_path}: {type(cause).__name__}",
+            error_code="CONNECTION_FAILED",
+            details={
+                **base_details,
+                "cause_type": type(cause).__name__,
+                "cause": self._redact_text(str(cause)),
+                "attempts": self._reconnect_attempts,
+            },
+        )
@@ -0,0 +1,39 @@
+"""Shared test helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def plan_request(
+    steps: int | list[tuple[str, str, dict[str, Any]]] = 2,
+    *,
+    mode: str = "apply",
+    goal: str = "test",
+    **fields: Any,
+) -> dict[str, Any]:
+    """
+    A run request with apply allowed and a plan_override of tool calls.
+
+    Args:
+        steps: (tool, method, args) per step, or a count of t.m calls with args {"i": i}.
+        mode: Run mode.
+        goal: Run goal.
+        **fields: Extra request fields (profile, traceparent, ...).
+    """
+    if isinstance(steps, int):
+        steps = [("t", "m", {"i": i}) for i in range(steps)]
+    return {
+        "goal": goal,
+        "mode": mode,
+        "policy": {"allow_apply": True},
+        "plan_override": [
+            {
+                "step_id": f"s{i}",
+                "intent": f"{tool}.{method}",
+                "call": {"tool": tool, "method": method, "args": args},
+            }
+            for i, (tool, method, args) in enumerate(steps)
+        ],
+        **fields,
+    }
@@ -13,6 +13,7 @@ Behavior controlled by args in the JSON payload:
     - "simulate_exit_code": exit with specified code
     - "simulate_invalid_json": print non-JSON output
     - "simulate_stderr": write to stderr (but still succeed)
+    - "simulate_flood_stdout" / "simulate_flood_stderr": write N bytes to the stream
     - Otherwise: echo back the payload as JSON
 """
 
@@ -67,6 +68,17 @@ def main() -> int:
         print("This is not valid JSON {{{")
         return 0
 
+    # Simulate a flood of output on either stream
+    flood_stdout = tool_args.get("simulate_flood_stdout")
+    if flood_stdout:
+        sys.stdout.buffer.write(b"x" * int(flood_stdout))
+        sys.stdout.flush()
+        return 0
+    flood_stderr = tool_args.get("simulate_flood_stderr")
+    if flood_stderr:
+        sys.stderr.buffer.write(b"e" * int(flood_stderr))
+        sys.stderr.flush()
+
     # Simulate stderr output (but still succeed)
     if tool_args.get("simulate_stderr"):
         print(tool_args["simulate_stderr"], file=sys.stderr)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Fake MCP stdio server for testing McpStdioAdapter.
+
+Speaks newline-delimited JSON-RPC 2.0. Each request is handled on its own
+thread, so responses can be out of order. Behavior is driven by tool name:
+
+- echo: structuredContent {"echo": arguments, "pid": ..., "initialized": ...}
+- text_json: single text block containing a JSON object
+- text_plain: single plain-text block
+- sleep: sleeps arguments["s"] seconds, then echoes
+- fail: result with isError=true (text contains a secret)
+- crash: writes to stderr and exits with code 3
+- garbage: writes a non-JSON line to stdout
+- bad_id: sends a response with a list id, then echoes
+- anything else: JSON-RPC error -32601
+
+Flags:
+- --hang-init: never answer initialize
+- --stop-reading: stop reading stdin after the handshake
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+_write_lock = threading.Lock()
+_state = {"initialized": False}
+
+
+def _send(message: dict[str, Any]) -> None:
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def _result(req_id: Any, result: dict[str, Any]) -> None:
+    _send({"jsonrpc": "2.0", "id": req_id, "result": result})
+
+
+def _call_tool(req_id: Any, params: dict[str, Any]) -> None:
+    name = params.get("name")
+    args = params.get("arguments", {})
+
+    if name == "sleep":
+        time.sleep(args.get("s", 0))
+        name = "echo"
+    if name == "echo":
+        _result(
+            req_id,
+            {
+                "content": [{"type": "text", "text": "ok"}],
+                "structuredContent": {
+                    "echo": args,
+                    "pid": os.getpid(),
+                    "initialized": _state["initialized"],
+                },
+            },
+        )
+    elif name == "text_json":
+        _result(req_id, {"content": [{"type": "text", "text": json.dumps({"value": 42})}]})
+    elif name == "text_plain":
+        _result(req_id, {"content": [{"type": "text", "text": "hello"}]})
+    elif name == "fail":
+        _result(
+            req_id,
+            {"content": [{"type": "text", "text": "failed: api_key=sk-secret"}], "isError": True},
+        )
+    elif name == "crash":
+        sys.stderr.write("fatal: crashing on purpose\n")
+        sys.stderr.flush()
+        os._exit(3)
+    elif name == "bad_id":
+        _result([req_id], {})
+        _call_tool(req_id, {"name": "echo", "arguments": args})
+    elif name == "garbage":
+        with _write_lock:
+            sys.stdout.write("this is not json\n")
+            sys.stdout.flush()
+    else:
+        _send(
+            {
+                "jsonrpc": "2.0",
+                "id": req_id,
+                "error": {"code": -32601, "message": f"Unknown tool: {name}"},
+            }
+        )
+
+
+def main() -> None:
+    hang_init = "--hang-init" in sys.argv
+    stop_reading = "--stop-reading" in sys.argv
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        message = json.loads(line)
+        method = message.get("method")
+        req_id = message.get("id")
+
+        if method == "initialize":
+            if not hang_init:
+                _result(
+                    req_id,
+                    {
+                        "protocolVersion": message["params"]["protocolVersion"],
+                        "capabilities": {"tools": {}},
+                        "serverInfo": {"name": "fake-mcp", "version": "0.1"},
+                    },
+                )
+        elif method == "notifications/initialized":
+            _state["initialized"] = True
+            if stop_reading:
+                time.sleep(60)
+        elif method == "notifications/cancelled":
+            pass
+        elif method == "tools/list":
+            _result(req_id, {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]})
+        elif method == "tools/call":
+            threading.Thread(target=_call_tool, args=(req_id, message["params"])).start()
+        elif req_id is not None:
+            _send(
+                {
+                    "jsonrpc": "2.0",
+                    "id": req_id,
+                    "error": {"code": -32601, "message": f"Unknown method: {method}"},
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Tests for AsyncSubprocessAdapter."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from nexus_router import events as E
+from nexus_router.dispatch import AsyncSubprocessAdapter, SubprocessAdapter
+from nexus_router.event_store import EventStore
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.tool import run
+
+ECHO_TOOL = Path(__file__).parent / "fixtures" / "echo_tool.py"
+
+
+def _adapter(**kwargs: object) -> AsyncSubprocessAdapter:
+    return AsyncSubprocessAdapter(
+        [sys.executable, str(ECHO_TOOL)],
+        adapter_id="async-echo",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestAsyncSubprocessAdapterBasics:
+    """Identity and capability tests."""
+
+    def test_kind_and_capabilities(self) -> None:
+        """Adapter kind differs from SubprocessAdapter; capabilities match."""
+        adapter = _adapter()
+        sync = SubprocessAdapter([sys.executable, str(ECHO_TOOL)])
+        assert adapter.adapter_kind == "async_subprocess"
+        assert adapter.capabilities == sync.capabilities
+
+    def test_derived_adapter_id(self) -> None:
+        """Derived adapter_id is prefixed and stable."""
+        cmd = [sys.executable, str(ECHO_TOOL)]
+        a1 = AsyncSubprocessAdapter(cmd)
+        a2 = AsyncSubprocessAdapter(cmd)
+        assert a1.adapter_id == a2.adapter_id
+        assert a1.adapter_id.startswith("async-subprocess:")
+
+
+class TestAsyncSubprocessAdapterCalls:
+    """Tests for acall() success and error mapping."""
+
+    def test_acall_success(self) -> None:
+        """acall returns parsed JSON."""
+        result = asyncio.run(_adapter().acall("t", "m", {"key": "value"}))
+        assert result["success"] is True
+        assert result["received_args"] == {"key": "value"}
+
+    def test_concurrent_acalls(self) -> None:
+        """Many calls can be supervised concurrently from one loop."""
+        adapter = _adapter()
+
+        async def main() -> list[dict[str, object]]:
+            return await asyncio.gather(*(adapter.acall("t", "m", {"i": i}) for i in range(8)))
+
+        results = asyncio.run(main())
+        assert [r["received_args"] for r in results] == [{"i": i} for i in range(8)]
+
+    def test_sync_call_wraps_acall(self) -> None:
+        """call() works outside an event loop."""
+        assert _adapter().call("t", "m", {})["success"] is True
+
+    def test_timeout(self) -> None:
+        """Timeout maps to TIMEOUT with the same details as SubprocessAdapter."""
+        adapter = _adapter(timeout_s=0.5)
+        start = time.monotonic()
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {"simulate_timeout": True})
+        assert time.monotonic() - start < 5
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert exc_info.value.details["timeout_s"] == 0.5
+        assert "args_digest" in exc_info.value.details
+
+    def test_nonzero_exit_redacts_stderr(self) -> None:
+        """NONZERO_EXIT carries a redacted stderr excerpt."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            _adapter().call(
+                "t", "m", {"simulate_exit_code": 3, "stderr_message": "password=hunter2"}
+            )
+        assert exc_info.value.error_code == "NONZERO_EXIT"
+        assert exc_info.value.details["returncode"] == 3
+        assert "hunter2" not in exc_info.value.details["stderr_excerpt"]
+
+    def test_invalid_json(self) -> None:
+        """Invalid JSON maps to INVALID_JSON_OUTPUT."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            _adapter().call("t", "m", {"simulate_invalid_json": True})
+        assert exc_info.value.error_code == "INVALID_JSON_OUTPUT"
+
+    def test_output_too_large(self) -> None:
+        """Byte caps apply to the async reader too."""
+        adapter = _adapter(max_stdout_bytes=4096)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {"simulate_flood_stdout": 10_000_000})
+        assert exc_info.value.error_code == "OUTPUT_TOO_LARGE"
+        assert exc_info.value.details["stream"] == "stdout"
+
+    def test_resources(self) -> None:
+        """Byte counts are recorded (no rusage: asyncio reaps the child)."""
+        adapter = _adapter()
+        adapter.call("t", "m", {"key": "value"})
+        res = adapter.last_call_resources
+        assert res is not None
+        assert res["stdout_bytes"] > 0
+        assert "user_cpu_ms" not in res
+
+    def test_command_not_found(self) -> None:
+        """Missing command maps to COMMAND_NOT_FOUND."""
+        adapter = AsyncSubprocessAdapter(["nonexistent_command_12345"])
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {})
+        assert exc_info.value.error_code == "COMMAND_NOT_FOUND"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+class TestAsyncSubprocessProcessGroup:
+    """Tests for process-group cleanup."""
+
+    def _spawn_grandchild_script(self, pid_file: Path) -> list[str]:
+        script = (
+            "import subprocess, sys, time\n"
+            "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            f"open({str(pid_file)!r}, 'w').write(str(p.pid))\n"
+            "time.sleep(60)\n"
+        )
+        return [sys.executable, "-c", script]
+
+    def _wait_gone(self, pid: int) -> bool:
+        for _ in range(100):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            # Zombies still answer kill(0); check /proc state when available
+            stat = Path(f"/proc/{pid}/stat")
+            if stat.exists() and stat.read_text().split()[2] == "Z":
+                return True
+            time.sleep(0.05)
+        return False
+
+    def test_timeout_kills_grandchildren(self, tmp_path: Path) -> None:
+        """Timeout kills the whole process group, not just the direct child."""
+        pid_file = tmp_path / "grandchild.pid"
+        adapter = AsyncSubprocessAdapter(self._spawn_grandchild_script(pid_file), timeout_s=1.0)
+        start = time.monotonic()
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {})
+        # A surviving grandchild would hold the pipes open until it exits
+        assert time.monotonic() - start < 10
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert self._wait_gone(int(pid_file.read_text()))
+
+    def test_cancellation_kills_child(self, tmp_path: Path) -> None:
+        """Cancelling acall() kills the process group."""
+        pid_file = tmp_path / "grandchild.pid"
+        adapter = AsyncSubprocessAdapter(self._spawn_grandchild_script(pid_file), timeout_s=30)
+
+        async def main() -> None:
+            task = asyncio.create_task(adapter.acall("t", "m", {}))
+            for _ in range(100):
+                if pid_file.exists() and pid_file.read_text():
+                    break
+                await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert self._wait_gone(int(pid_file.read_text()))
+
+
+class TestAsyncSubprocessAdapterRouter:
+    """Integration with the router."""
+
+    def test_apply_mode(self, tmp_path: Path) -> None:
+        """Router drives the adapter through call()."""
+        resp = run(
+            {
+                "goal": "async subprocess",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "echo",
+                        "call": {"tool": "t", "method": "m", "args": {"x": 1}},
+                    }
+                ],
+            },
+            db_path=str(tmp_path / "test.db"),
+            adapter=_adapter(),
+        )
+        assert resp["results"][0]["status"] == "ok"
+        assert resp["dispatch"]["adapter_kind"] == "async_subprocess"
+        with EventStore(str(tmp_path / "test.db")) as store:
+            (succeeded,) = [
+                e
+                for e in store.read_events(resp["run"]["run_id"])
+                if e.type == E.TOOL_CALL_SUCCEEDED
+            ]
+        assert succeeded.payload["resources"]["stdout_bytes"] > 0
@@ -0,0 +1,252 @@
+"""Tests for CachingAdapter (LRU + TTL memoization of adapter calls)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.caching_adapter import CachingAdapter, args_cache_digest
+from nexus_router.dispatch import FakeAdapter
+from nexus_router.event_store import EventStore
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.tool import run
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_adapter(adapter_id: str = "fake") -> tuple[FakeAdapter, list[dict[str, Any]]]:
+    inner = FakeAdapter(adapter_id=adapter_id)
+    inner.set_default_response(lambda t, m, a: {"tool": t, "method": m, "args": a})
+    return inner, inner.call_log
+
+
+class TestCacheKey:
+    """Tests for the canonical args digest."""
+
+    def test_key_order_independent(self) -> None:
+        """Dict key order does not change the digest."""
+        assert args_cache_digest({"a": 1, "b": 2}) == args_cache_digest({"b": 2, "a": 1})
+        assert args_cache_digest({"a": 1}) != args_cache_digest({"a": 2})
+
+    def test_unserializable_args(self) -> None:
+        """Non-JSON args have no digest (and are never cached)."""
+        assert args_cache_digest({"x": object()}) is None
+
+
+class TestCachingAdapter:
+    """Tests for hit/miss, LRU, TTL and opt-in behavior."""
+
+    def test_identity_passthrough(self) -> None:
+        """Identity and capabilities come from the wrapped adapter."""
+        inner, _ = _counting_adapter("lookup")
+        adapter = CachingAdapter(inner)
+        assert adapter.adapter_id == "lookup"
+        assert adapter.adapter_kind == "caching"
+        assert adapter.capabilities == inner.capabilities
+        assert adapter.inner is inner
+
+    def test_hit_and_miss(self) -> None:
+        """Identical calls are served from the cache."""
+        inner, log = _counting_adapter()
+        adapter = CachingAdapter(inner)
+        first = adapter.call("t", "m", {"a": 1, "b": 2})
+        assert adapter.last_call_cache_hit is False
+        second = adapter.call("t", "m", {"b": 2, "a": 1})
+        assert adapter.last_call_cache_hit is True
+        assert first == second
+        assert len(log) == 1
+        assert adapter.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_hits_return_fresh_copies(self) -> None:
+        """Mutating a returned output does not affect the cache."""
+        inner, _ = _counting_adapter()
+        adapter = CachingAdapter(inner)
+        adapter.call("t", "m", {"a": 1})["adapter_id"] = "mutated"
+        assert "adapter_id" not in adapter.call("t", "m", {"a": 1})
+
+    def test_lru_eviction(self) -> None:
+        """Least recently used entries are evicted past max_entries."""
+        inner, log = _counting_adapter()
+        adapter = CachingAdapter(inner, max_entries=2)
+        adapter.call("t", "m", {"i": 1})
+        adapter.call("t", "m", {"i": 2})
+        adapter.call("t", "m", {"i": 1})  # refresh 1
+        adapter.call("t", "m", {"i": 3})  # evicts 2
+        adapter.call("t", "m", {"i": 1})
+        assert adapter.last_call_cache_hit is True
+        adapter.call("t", "m", {"i": 2})
+        assert adapter.last_call_cache_hit is False
+        assert adapter.stats()["evictions"] == 2
+        assert len(log) == 4
+
+    def test_ttl_expiry(self) -> None:
+        """Entries older than ttl_s are re-fetched."""
+        inner, log = _counting_adapter()
+        clock = _Clock()
+        adapter = CachingAdapter(inner, ttl_s=10, clock=clock)
+        adapter.call("t", "m", {})
+        clock.now += 9
+        adapter.call("t", "m", {})
+        assert adapter.last_call_cache_hit is True
+        clock.now += 1
+        adapter.call("t", "m", {})
+        assert adapter.last_call_cache_hit is False
+        assert len(log) == 2
+
+    def test_method_opt_in(self) -> None:
+        """Only listed methods are cached; others report no cache flag."""
+        inner, log = _counting_adapter()
+        adapter = CachingAdapter(inner, methods=["geo.lookup", "dns.*"])
+        assert adapter.is_cacheable("geo", "lookup")
+        assert adapter.is_cacheable("dns", "resolve")
+        assert not adapter.is_cacheable("geo", "update")
+
+        adapter.call("geo", "update", {})
+        assert adapter.last_call_cache_hit is None
+        adapter.call("geo", "update", {})
+        adapter.call("dns", "resolve", {"host": "a"})
+        adapter.call("dns", "resolve", {"host": "a"})
+        assert adapter.last_call_cache_hit is True
+        assert len(log) == 3
+
+    def test_failures_not_cached(self) -> None:
+        """Errors propagate and are not memoized."""
+        inner = FakeAdapter()
+        inner.set_operational_error("t", "m", "boom", error_code="TOOL_ERROR")
+        adapter = CachingAdapter(inner)
+        for _ in range(2):
+            with pytest.raises(NexusOperationalError):
+                adapter.call("t", "m", {})
+        assert len(inner.call_log) == 2
+        assert adapter.stats()["size"] == 0
+
+    def test_key_includes_adapter_id(self, tmp_path: Path) -> None:
+        """Adapters sharing a cache table don't see each other's entries."""
+        db_path = str(tmp_path / "cache.db")
+        a_inner, _ = _counting_adapter("a")
+        b_inner, b_log = _counting_adapter("b")
+        a = CachingAdapter(a_inner, db_path=db_path)
+        b = CachingAdapter(b_inner, db_path=db_path)
+        a.call("t", "m", {})
+        b.call("t", "m", {})
+        assert b.last_call_cache_hit is False
+        assert len(b_log) == 1
+        a.close()
+        b.close()
+
+    def test_invalid_config(self) -> None:
+        """Non-positive limits raise ValueError."""
+        inner, _ = _counting_adapter()
+        with pytest.raises(ValueError):
+            CachingAdapter(inner, max_entries=0)
+        with pytest.raises(ValueError):
+            CachingAdapter(inner, ttl_s=0)
+
+
+class TestCachingAdapterPersistence:
+    """Tests for the SQLite tool_cache table."""
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """A new adapter instance is served from the persisted table."""
+        db_path = str(tmp_path / "cache.db")
+        inner, log = _counting_adapter()
+        first = CachingAdapter(inner, db_path=db_path)
+        first.call("t", "m", {"q": "x"})
+        first.close()
+
+        second = CachingAdapter(inner, db_path=db_path)
+        assert second.call("t", "m", {"q": "x"})["args"] == {"q": "x"}
+        assert second.last_call_cache_hit is True
+        assert len(log) == 1
+        second.close()
+
+    def test_persisted_ttl(self, tmp_path: Path) -> None:
+        """Expired persisted rows are ignored and deleted."""
+        db_path = str(tmp_path / "cache.db")
+        inner, log = _counting_adapter()
+        clock = _Clock()
+        first = CachingAdapter(inner, db_path=db_path, ttl_s=5, clock=clock)
+        first.call("t", "m", {})
+        first.close()
+
+        clock.now += 5
+        second = CachingAdapter(inner, db_path=db_path, ttl_s=5, clock=clock)
+        second.call("t", "m", {})
+        assert second.last_call_cache_hit is False
+        assert len(log) == 2
+        second.close()
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear() drops memory and persisted entries."""
+        db_path = str(tmp_path / "cache.db")
+        inner, log = _counting_adapter()
+        adapter = CachingAdapter(inner, db_path=db_path)
+        adapter.call("t", "m", {})
+        adapter.clear()
+        adapter.call("t", "m", {})
+        assert adapter.last_call_cache_hit is False
+        assert len(log) == 2
+        adapter.close()
+
+
+class TestCachingAdapterRouter:
+    """Integration with the router."""
+
+    def _run(self, db_path: str, adapter: Any) -> dict[str, Any]:
+        return run(
+            {
+                "goal": "cached lookups",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": f"s{i}",
+                        "intent": "lookup",
+                        "call": {"tool": "geo", "method": "lookup", "args": {"ip": "10.0.0.1"}},
+                    }
+                    for i in range(2)
+                ],
+            },
+            db_path=db_path,
+            adapter=adapter,
+        )
+
+    def test_cache_hit_in_events(self, tmp_path: Path) -> None:
+        """TOOL_CALL_SUCCEEDED carries cache_hit for caching adapters."""
+        db_path = str(tmp_path / "test.db")
+        inner, log = _counting_adapter()
+        # The cache table may live in the event store database
+        adapter = CachingAdapter(inner, db_path=db_path)
+        resp = self._run(db_path, adapter)
+        adapter.close()
+
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        succeeded = [e.payload for e in events if e.type == "TOOL_CALL_SUCCEEDED"]
+        assert [p["cache_hit"] for p in succeeded] == [False, True]
+        assert succeeded[1]["output"]["adapter_id"] == "fake"
+        assert len(log) == 1
+
+    def test_no_cache_field_without_caching(self, tmp_path: Path) -> None:
+        """Plain adapters produce no cache_hit field."""
+        db_path = str(tmp_path / "test.db")
+        inner, _ = _counting_adapter()
+        resp = self._run(db_path, inner)
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        succeeded = next(e for e in events if e.type == "TOOL_CALL_SUCCEEDED")
+        assert "cache_hit" not in succeeded.payload
@@ -0,0 +1,160 @@
+"""Tests for CassetteAdapter (record-and-replay from the event log)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from conftest import plan_request
+
+from nexus_router.cassette_adapter import CassetteAdapter
+from nexus_router.dispatch import FakeAdapter
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.export import export_run, export_run_to_file
+from nexus_router.tool import run
+
+STEPS = [
+    ("geo", "lookup", {"ip": "10.0.0.1"}),
+    ("geo", "lookup", {"ip": "10.0.0.2"}),
+    ("db", "write", {"row": 1}),
+]
+
+
+@pytest.fixture
+def recorded(tmp_path: Path) -> tuple[str, str]:
+    """A recorded run: two successes and one adapter failure."""
+    db_path = str(tmp_path / "prod.db")
+    live = FakeAdapter(adapter_id="live")
+    live.set_response("geo", "lookup", lambda a: {"country": "NZ", "ip": a["ip"]})
+    live.set_operational_error("db", "write", "disk full", error_code="TOOL_ERROR")
+    resp = run(plan_request(STEPS), db_path=db_path, adapter=live)
+    return db_path, resp["run"]["run_id"]
+
+
+class TestCassetteFromEventStore:
+    """Tests for building cassettes from an event store."""
+
+    def test_replays_outputs(self, recorded: tuple[str, str]) -> None:
+        """Recorded outputs are served without the original adapter."""
+        db_path, run_id = recorded
+        cassette = CassetteAdapter.from_event_store(db_path, run_ids=run_id)
+        assert len(cassette) == 3
+        assert cassette.call("geo", "lookup", {"ip": "10.0.0.2"}) == {
+            "country": "NZ",
+            "ip": "10.0.0.2",
+        }
+
+    def test_replays_failures(self, recorded: tuple[str, str]) -> None:
+        """Recorded operational failures re-raise with their error_code."""
+        db_path, run_id = recorded
+        cassette = CassetteAdapter.from_event_store(db_path, run_ids=run_id)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            cassette.call("db", "write", {"row": 1})
+        assert exc_info.value.error_code == "TOOL_ERROR"
+        assert exc_info.value.details["replayed"] is True
+
+    def test_exclude_failures(self, recorded: tuple[str, str]) -> None:
+        """include_failures=False records successes only."""
+        db_path, _ = recorded
+        cassette = CassetteAdapter.from_event_store(db_path, include_failures=False)
+        assert len(cassette) == 2
+
+    def test_miss(self, recorded: tuple[str, str]) -> None:
+        """Unrecorded calls -> CASSETTE_MISS."""
+        db_path, run_id = recorded
+        cassette = CassetteAdapter.from_event_store(db_path, run_ids=[run_id])
+        with pytest.raises(NexusOperationalError) as exc_info:
+            cassette.call("geo", "lookup", {"ip": "192.168.0.1"})
+        assert exc_info.value.error_code == "CASSETTE_MISS"
+        assert cassette.misses == 1
+
+    def test_dry_run_not_recorded(self, tmp_path: Path) -> None:
+        """Simulated dry_run outputs are not real results."""
+        db_path = str(tmp_path / "dry.db")
+        run(plan_request(STEPS, mode="dry_run"), db_path=db_path)
+        assert len(CassetteAdapter.from_event_store(db_path)) == 0
+
+    def test_fallback_records(self, recorded: tuple[str, str]) -> None:
+        """Misses go to the fallback adapter and are recorded."""
+        db_path, run_id = recorded
+        fallback = FakeAdapter()
+        fallback.set_default_response({"fresh": True})
+        cassette = CassetteAdapter.from_event_store(db_path, run_ids=run_id, fallback=fallback)
+        assert cassette.call("new", "m", {}) == {"fresh": True}
+        assert cassette.call("new", "m", {}) == {"fresh": True}
+        assert len(fallback.call_log) == 1
+
+
+class TestCassetteOrdering:
+    """Tests for repeated keys."""
+
+    def test_outcomes_served_in_order(self) -> None:
+        """Repeated recordings are served in order; the last repeats."""
+        cassette = CassetteAdapter()
+        cassette.record("job", "status", {"id": 1}, {"state": "running"})
+        cassette.record("job", "status", {"id": 1}, {"state": "done"})
+        states = [cassette.call("job", "status", {"id": 1})["state"] for _ in range(3)]
+        assert states == ["running", "done", "done"]
+        cassette.rewind()
+        assert cassette.call("job", "status", {"id": 1})["state"] == "running"
+
+    def test_outputs_are_copies(self) -> None:
+        """Each replay returns a fresh object."""
+        cassette = CassetteAdapter()
+        cassette.record("t", "m", {}, {"v": 1})
+        cassette.call("t", "m", {})["v"] = 2
+        assert cassette.call("t", "m", {}) == {"v": 1}
+
+
+class TestCassetteFromBundle:
+    """Tests for building cassettes from export bundles."""
+
+    def test_from_bundle_dict_and_file(self, recorded: tuple[str, str], tmp_path: Path) -> None:
+        """Bundles work as dicts and as JSON files."""
+        db_path, run_id = recorded
+        bundle = export_run(db_path=db_path, run_id=run_id)["artifact"]
+        path = tmp_path / "bundle.json"
+        path.write_text(json.dumps(bundle))
+
+        for source in (bundle, path):
+            cassette = CassetteAdapter.from_bundle(source)
+            assert cassette.call("geo", "lookup", {"ip": "10.0.0.1"})["country"] == "NZ"
+
+    def test_from_compressed_bundle_file(self, recorded: tuple[str, str], tmp_path: Path) -> None:
+        """gzip bundle files from export_run_to_file load directly."""
+        db_path, run_id = recorded
+        path = str(tmp_path / "bundle.jsonl.gz")
+        export_run_to_file(db_path=db_path, run_id=run_id, path=path)
+
+        cassette = CassetteAdapter.from_bundle(path)
+        assert cassette.call("geo", "lookup", {"ip": "10.0.0.1"})["country"] == "NZ"
+
+    def test_tampered_bundle_rejected(self, recorded: tuple[str, str]) -> None:
+        """Digest mismatch raises ValueError unless verification is disabled."""
+        db_path, run_id = recorded
+        bundle = export_run(db_path=db_path, run_id=run_id)["artifact"]
+        bundle["events"] = bundle["events"][:-1]
+        with pytest.raises(ValueError):
+            CassetteAdapter.from_bundle(bundle)
+        assert len(CassetteAdapter.from_bundle(bundle, verify_digest=False)) == 3
+
+
+class TestCassetteRouter:
+    """Re-running a recorded workload through the router."""
+
+    def test_rerun_matches_original(self, recorded: tuple[str, str], tmp_path: Path) -> None:
+        """A replayed run produces the same results as the recording."""
+        db_path, run_id = recorded
+        cassette = CassetteAdapter.from_event_store(db_path, run_ids=run_id)
+        original = export_run(db_path=db_path, run_id=run_id)["artifact"]
+        resp = run(plan_request(STEPS), db_path=str(tmp_path / "replay.db"), adapter=cassette)
+
+        orig_outputs = [
+            e["payload"]["output"]["country"]
+            for e in original["events"]
+            if e["type"] == "TOOL_CALL_SUCCEEDED"
+        ]
+        assert [r["status"] for r in resp["results"]] == ["ok", "ok", "error"]
+        assert [r["output"]["country"] for r in resp["results"][:2]] == orig_outputs
+        assert resp["results"][0]["output"]["adapter_id"] == "cassette"
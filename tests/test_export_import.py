@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import time
 from importlib import resources
 from pathlib import Path
 from typing import Any, cast
 
 import jsonschema
-
+import pytest
+
+from nexus_router import events as E
+from nexus_router import import_
+from nexus_router.event_store import EventStore
+from nexus_router.export import (
+    _compute_bundle_digest,
+    compute_chain_digest,
+    export_run_to_file,
+    export_runs_since,
+    load_bundle,
+)
+from nexus_router.import_ import import_bundle_file
 from nexus_router.tool import export, import_bundle, replay, run
 
 
@@ -366,6 +380,27 @@ class TestImportGoldenFixtures:
         # Should succeed despite invalid digest
         assert import_resp["status"] == "ok"
 
+    @pytest.mark.parametrize("digests", [None, {}])
+    def test_import_unverified_without_sha256(
+        self, tmp_path: Path, digests: dict[str, Any] | None
+    ) -> None:
+        """An unverified bundle without digests.sha256 imports, with no chain digest."""
+        source_db = str(tmp_path / "source.db")
+        resp = run({"goal": "no digest", "mode": "dry_run", "plan_override": []}, db_path=source_db)
+        bundle = export({"db_path": source_db, "run_id": resp["run"]["run_id"]})["artifact"]
+        if digests is None:
+            del bundle["digests"]
+        else:
+            bundle["digests"] = digests
+
+        # The tool schema requires digests; the library call does not
+        import_resp = import_.import_bundle(
+            db_path=str(tmp_path / "target.db"), bundle=bundle, verify_digest=False
+        )
+        jsonschema.validate(import_resp, IMPORT_RESPONSE_SCHEMA)
+        assert import_resp["status"] == "ok"
+        assert "chain_digest" not in import_resp
+
 
 class TestRoundTrip:
     """End-to-end round trip tests."""
@@ -453,3 +488,441 @@ class TestRoundTrip:
 
         assert original_replay["ok"] is True
         assert remapped_replay["ok"] is True
+
+
+def _start_run(db_path: str) -> tuple[str, int]:
+    """A run that has planned one step but not executed it yet; returns (run_id, last seq)."""
+    plan = [{"step_id": "s1", "intent": "i", "call": {"tool": "t", "method": "m", "args": {}}}]
+    with EventStore(db_path) as store:
+        run_id = store.create_run(mode="dry_run", goal="sync")
+        store.append(run_id, E.RUN_STARTED, {"mode": "dry_run", "goal": "sync"})
+        last = store.append(run_id, E.PLAN_CREATED, {"plan": plan})
+    return run_id, last.seq
+
+
+def _finish_run(db_path: str, run_id: str) -> None:
+    with EventStore(db_path) as store:
+        store.append(run_id, E.STEP_STARTED, {"step_id": "s1"})
+        store.append(
+            run_id,
+            E.TOOL_CALL_REQUESTED,
+            {"step_id": "s1", "call": {"tool": "t", "method": "m", "args": {}}},
+        )
+        store.append(
+            run_id, E.TOOL_CALL_SUCCEEDED, {"step_id": "s1", "simulated": True, "output": {}}
+        )
+        store.append(run_id, E.STEP_COMPLETED, {"step_id": "s1", "status": "ok"})
+        store.append(run_id, E.RUN_COMPLETED, {"outcome": "ok"})
+        store.set_run_status(run_id, "COMPLETED")
+
+
+class TestDeltaSync:
+    """Delta bundles (after_seq) and append-mode import."""
+
+    def _sync_base(self, tmp_path: Path) -> tuple[str, str, str, int, str]:
+        source_db = str(tmp_path / "source.db")
+        target_db = str(tmp_path / "target.db")
+        run_id, last_seq = _start_run(source_db)
+        bundle = export({"db_path": source_db, "run_id": run_id})["artifact"]
+        resp = import_bundle({"db_path": target_db, "bundle": bundle, "mode": "append"})
+        assert resp["status"] == "ok"
+        assert resp["chain_digest"] == bundle["digests"]["sha256"]
+        return source_db, target_db, run_id, last_seq, resp["chain_digest"]
+
+    def test_delta_roundtrip(self, tmp_path: Path) -> None:
+        """Events after the synced seq are appended and the run replays clean."""
+        source_db, target_db, run_id, last_seq, chain = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+
+        export_resp = export(
+            {"db_path": source_db, "run_id": run_id, "after_seq": last_seq, "prev_digest": chain}
+        )
+        jsonschema.validate(export_resp, EXPORT_RESPONSE_SCHEMA)
+        delta = export_resp["artifact"]
+        assert [e["seq"] for e in delta["events"]] == list(range(last_seq + 1, last_seq + 6))
+        assert delta["delta"]["after_seq"] == last_seq
+        assert delta["delta"]["prev_digest"] == chain
+        assert delta["digests"]["chain"] != delta["digests"]["sha256"]
+
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        jsonschema.validate(resp, IMPORT_RESPONSE_SCHEMA)
+        assert resp["status"] == "ok"
+        assert resp["events_inserted"] == 5
+        assert resp["replay_ok"] is True
+        assert resp["chain_digest"] == delta["digests"]["chain"]
+
+        source_view = replay({"db_path": source_db, "run_id": run_id})["run_view"]
+        target_view = replay({"db_path": target_db, "run_id": run_id})["run_view"]
+        assert target_view == source_view
+
+    def test_delta_reapplied_is_skipped(self, tmp_path: Path) -> None:
+        """Importing the same delta twice is a no-op."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq})["artifact"]
+        import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        assert resp["status"] == "skipped"
+        assert resp["conflict"]["reason"] == "delta_already_applied"
+
+    def test_delta_gap_rejected(self, tmp_path: Path) -> None:
+        """A delta that does not start at the target's last seq is refused."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq + 2})[
+            "artifact"
+        ]
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        assert resp["status"] == "error"
+        assert resp["error"]["code"] == "DELTA_DISCONTINUITY"
+
+    @pytest.mark.parametrize("drop", [0, 2])
+    def test_delta_seq_gap_rejected_before_commit(self, tmp_path: Path, drop: int) -> None:
+        """A delta missing an event (digests recomputed) is rolled back, not committed."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq})["artifact"]
+        del delta["events"][drop]
+        sha = _compute_bundle_digest(delta)
+        delta["digests"] = {"sha256": sha, "chain": compute_chain_digest(sha, delta["delta"])}
+
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        assert resp["status"] == "error"
+        assert resp["error"]["code"] == "DELTA_DISCONTINUITY"
+        assert f"expected {last_seq + 1 + drop}" in resp["error"]["message"]
+        with EventStore(target_db) as store:
+            assert store.read_events(run_id)[-1].seq == last_seq
+
+    def test_chain_mismatch_rejected(self, tmp_path: Path) -> None:
+        """A delta linked to a different previous bundle is refused."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+        delta = export(
+            {"db_path": source_db, "run_id": run_id, "after_seq": last_seq, "prev_digest": "f" * 64}
+        )["artifact"]
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        assert resp["error"]["code"] == "CHAIN_MISMATCH"
+
+    def test_tampered_delta_header_rejected(self, tmp_path: Path) -> None:
+        """The delta header is covered by the chain digest."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        _finish_run(source_db, run_id)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq})["artifact"]
+        delta["delta"]["after_seq"] = last_seq - 1
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "append"})
+        assert resp["error"]["code"] == "DIGEST_MISMATCH"
+
+    def test_delta_requires_append_mode(self, tmp_path: Path) -> None:
+        """Delta bundles cannot be imported as whole runs."""
+        source_db, target_db, run_id, last_seq, _ = self._sync_base(tmp_path)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq})["artifact"]
+        resp = import_bundle({"db_path": target_db, "bundle": delta, "mode": "overwrite"})
+        assert resp["error"]["code"] == "INVALID_BUNDLE"
+
+    def test_delta_without_base_run(self, tmp_path: Path) -> None:
+        """Appending to a run the target has never seen fails."""
+        source_db = str(tmp_path / "source.db")
+        run_id, last_seq = _start_run(source_db)
+        delta = export({"db_path": source_db, "run_id": run_id, "after_seq": last_seq})["artifact"]
+        resp = import_bundle(
+            {"db_path": str(tmp_path / "empty.db"), "bundle": delta, "mode": "append"}
+        )
+        assert resp["error"]["code"] == "DELTA_BASE_MISSING"
+
+    def test_export_unknown_after_seq(self, tmp_path: Path) -> None:
+        """after_seq must name an existing event."""
+        source_db = str(tmp_path / "source.db")
+        run_id, _ = _start_run(source_db)
+        resp = export({"db_path": source_db, "run_id": run_id, "after_seq": 99})
+        assert resp["ok"] is False
+        assert resp["error"]["code"] == "SEQ_NOT_FOUND"
+
+    def test_export_runs_since(self, tmp_path: Path) -> None:
+        """Runs created at or after `since` are exported as full bundles."""
+        source_db = str(tmp_path / "source.db")
+        target_db = str(tmp_path / "target.db")
+        first, _ = _start_run(source_db)
+        since = export({"db_path": source_db, "run_id": first})["artifact"]["run"]["created_at"]
+        time.sleep(0.005)
+        second, _ = _start_run(source_db)
+
+        resp = export_runs_since(db_path=source_db, since=since)
+        assert [a["run"]["run_id"] for a in resp["artifacts"]] == [first, second]
+        later = export_runs_since(db_path=source_db, since=resp["until"])
+        assert [a["run"]["run_id"] for a in later["artifacts"]] == [second]
+
+        statuses = [
+            import_bundle({"db_path": target_db, "bundle": a, "mode": "append"})["status"]
+            for a in resp["artifacts"] + later["artifacts"]
+        ]
+        assert statuses == ["ok", "ok", "skipped"]
+
+
+def _repetitive_run(db_path: str, steps: int = 20) -> str:
+    request = {
+        "goal": "compress",
+        "mode": "dry_run",
+        "plan_override": [
+            {
+                "step_id": f"s{i}",
+                "intent": "same call",
+                "call": {"tool": "tool", "method": "method", "args": {"query": "x" * 200}},
+            }
+            for i in range(steps)
+        ],
+    }
+    return str(run(request, db_path=db_path)["run"]["run_id"])
+
+
+class TestBundleFiles:
+    """export_run_to_file / load_bundle / import_bundle_file."""
+
+    @pytest.mark.parametrize("compression", ["gzip", "none"])
+    def test_file_matches_export_run(self, tmp_path: Path, compression: str) -> None:
+        """A bundle file loads back to the export_run artifact with the same digests."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path)
+        path = str(tmp_path / "bundle.jsonl")
+
+        result = export_run_to_file(
+            db_path=db_path, run_id=run_id, path=path, compression=compression
+        )
+        assert result["ok"]
+        artifact = export({"db_path": db_path, "run_id": run_id})["artifact"]
+        assert result["digests"] == artifact["digests"]
+        assert result["events"] == len(artifact["events"])
+
+        loaded = load_bundle(path)
+        jsonschema.validate({"ok": True, "artifact": loaded}, EXPORT_RESPONSE_SCHEMA)
+        for bundle in (loaded, artifact):
+            bundle.pop("exported_at")
+        assert loaded == artifact
+
+    def test_gzip_compresses_repetitive_runs(self, tmp_path: Path) -> None:
+        """Duplicated calls and capabilities compress well."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path)
+        plain = export_run_to_file(
+            db_path=db_path, run_id=run_id, path=str(tmp_path / "b.jsonl"), compression="none"
+        )
+        gz = export_run_to_file(db_path=db_path, run_id=run_id, path=str(tmp_path / "b.gz"))
+        assert gz["bytes"] * 5 < plain["bytes"]
+
+    def test_import_bundle_file(self, tmp_path: Path) -> None:
+        """A compressed file imports and replays like the dict bundle."""
+        source_db = str(tmp_path / "source.db")
+        run_id = _repetitive_run(source_db, steps=2)
+        path = str(tmp_path / "bundle.jsonl.gz")
+        export_run_to_file(db_path=source_db, run_id=run_id, path=path)
+
+        resp = import_bundle_file(db_path=str(tmp_path / "target.db"), path=path)
+        jsonschema.validate(resp, IMPORT_RESPONSE_SCHEMA)
+        assert resp["status"] == "ok"
+        assert resp["imported_run_id"] == run_id
+        assert resp["replay_ok"] is True
+
+    def test_plain_json_file(self, tmp_path: Path) -> None:
+        """Pretty-printed JSON bundles are accepted too."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path, steps=1)
+        artifact = export({"db_path": db_path, "run_id": run_id})["artifact"]
+        path = tmp_path / "bundle.json"
+        path.write_text(json.dumps(artifact, indent=2))
+        assert load_bundle(str(path))["digests"] == artifact["digests"]
+
+    def test_tampered_file_rejected(self, tmp_path: Path) -> None:
+        """An edited event line fails digest verification."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path, steps=1)
+        path = tmp_path / "bundle.jsonl"
+        export_run_to_file(db_path=db_path, run_id=run_id, path=str(path), compression="none")
+        path.write_text(path.read_text().replace('"intent":"same call"', '"intent":"edited"'))
+
+        with pytest.raises(ValueError, match="Digest mismatch"):
+            load_bundle(str(path))
+        resp = import_bundle_file(db_path=str(tmp_path / "target.db"), path=str(path))
+        assert resp["error"]["code"] == "DIGEST_MISMATCH"
+        with EventStore(str(tmp_path / "target.db")) as store:
+            assert store.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 0
+        assert (
+            import_bundle_file(
+                db_path=str(tmp_path / "target.db"), path=str(path), verify_digest=False
+            )["status"]
+            == "ok"
+        )
+
+    def test_truncated_file_rejected(self, tmp_path: Path) -> None:
+        """A file without its trailer is refused."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path, steps=1)
+        path = tmp_path / "bundle.jsonl"
+        export_run_to_file(db_path=db_path, run_id=run_id, path=str(path), compression="none")
+        path.write_text("".join(path.read_text().splitlines(keepends=True)[:-1]))
+
+        resp = import_bundle_file(db_path=str(tmp_path / "target.db"), path=str(path))
+        assert resp["error"]["code"] == "INVALID_BUNDLE"
+
+    def test_truncated_gzip_rejected(self, tmp_path: Path) -> None:
+        """A cut-off compressed stream is a malformed bundle, not an EOFError."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path)
+        path = tmp_path / "bundle.jsonl.gz"
+        export_run_to_file(db_path=db_path, run_id=run_id, path=str(path))
+        path.write_bytes(path.read_bytes()[: path.stat().st_size // 2])
+
+        with pytest.raises(ValueError, match="truncated or corrupt"):
+            load_bundle(str(path))
+        resp = import_bundle_file(db_path=str(tmp_path / "target.db"), path=str(path))
+        assert resp["error"]["code"] == "INVALID_BUNDLE"
+
+    def test_non_object_line_rejected(self, tmp_path: Path) -> None:
+        """Every line after the header must be a JSON object."""
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path, steps=1)
+        path = tmp_path / "bundle.jsonl"
+        export_run_to_file(db_path=db_path, run_id=run_id, path=str(path), compression="none")
+        lines = path.read_text().splitlines(keepends=True)
+        path.write_text("".join([lines[0], "[1, 2]\n", *lines[1:]]))
+
+        with pytest.raises(ValueError, match="line 2 is not a JSON object"):
+            load_bundle(str(path))
+        resp = import_bundle_file(db_path=str(tmp_path / "target.db"), path=str(path))
+        assert resp["error"]["code"] == "INVALID_BUNDLE"
+
+    def test_delta_file(self, tmp_path: Path) -> None:
+        """Delta bundles can be written as files and appended."""
+        source_db, target_db = str(tmp_path / "source.db"), str(tmp_path / "target.db")
+        run_id, last_seq = _start_run(source_db)
+        base = str(tmp_path / "base.gz")
+        export_run_to_file(db_path=source_db, run_id=run_id, path=base)
+        chain = import_bundle_file(db_path=target_db, path=base, mode="append")["chain_digest"]
+        _finish_run(source_db, run_id)
+
+        delta = str(tmp_path / "delta.gz")
+        export_run_to_file(
+            db_path=source_db, run_id=run_id, path=delta, after_seq=last_seq, prev_digest=chain
+        )
+        resp = import_bundle_file(db_path=target_db, path=delta, mode="append")
+        assert resp["status"] == "ok"
+        assert resp["events_inserted"] == 5
+
+    def test_trailer_count_mismatch_rolled_back(self, tmp_path: Path) -> None:
+        """Events are inserted as they are read; a bad trailer rolls them back."""
+        db_path, target_db = str(tmp_path / "source.db"), str(tmp_path / "target.db")
+        run_id = _repetitive_run(db_path, steps=2)
+        path = tmp_path / "bundle.jsonl"
+        export_run_to_file(db_path=db_path, run_id=run_id, path=str(path), compression="none")
+        lines = path.read_text().splitlines(keepends=True)
+        trailer = json.loads(lines[-1])
+        trailer["event_count"] += 1
+        path.write_text("".join([*lines[:-1], json.dumps(trailer) + "\n"]))
+
+        resp = import_bundle_file(db_path=target_db, path=str(path), verify_digest=False)
+        assert resp["error"]["code"] == "INVALID_BUNDLE"
+        assert "trailer says" in resp["error"]["message"]
+        with EventStore(target_db) as store:
+            assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+            assert store.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 0
+
+    def test_delta_file_reapplied_is_skipped(self, tmp_path: Path) -> None:
+        """The already-applied check works on streamed delta events."""
+        source_db, target_db = str(tmp_path / "source.db"), str(tmp_path / "target.db")
+        run_id, last_seq = _start_run(source_db)
+        base = str(tmp_path / "base.gz")
+        export_run_to_file(db_path=source_db, run_id=run_id, path=base)
+        import_bundle_file(db_path=target_db, path=base, mode="append")
+        _finish_run(source_db, run_id)
+        delta = str(tmp_path / "delta.gz")
+        export_run_to_file(db_path=source_db, run_id=run_id, path=delta, after_seq=last_seq)
+        assert import_bundle_file(db_path=target_db, path=delta, mode="append")["status"] == "ok"
+
+        resp = import_bundle_file(db_path=target_db, path=delta, mode="append")
+        assert resp["status"] == "skipped"
+        assert resp["conflict"]["reason"] == "delta_already_applied"
+
+    def test_zstd(self, tmp_path: Path) -> None:
+        """zstd bundle files round-trip when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        db_path = str(tmp_path / "source.db")
+        run_id = _repetitive_run(db_path)
+        path = str(tmp_path / "bundle.zst")
+        result = export_run_to_file(db_path=db_path, run_id=run_id, path=path, compression="zstd")
+        assert load_bundle(path)["digests"] == result["digests"]
+
+    def test_errors(self, tmp_path: Path) -> None:
+        """Unknown runs return RUN_NOT_FOUND; unknown compressions raise."""
+        db_path = str(tmp_path / "source.db")
+        _repetitive_run(db_path, steps=1)
+        path = str(tmp_path / "bundle.gz")
+        result = export_run_to_file(db_path=db_path, run_id="missing", path=path)
+        assert result["error"]["code"] == "RUN_NOT_FOUND"
+        assert not Path(path).exists()
+        with pytest.raises(ValueError):
+            export_run_to_file(db_path=db_path, run_id="missing", path=path, compression="lz4")
+
+
+class TestStreamingDigest:
+    """Digest verification fused with the insert pass."""
+
+    def _bundle(self, tmp_path: Path) -> dict[str, Any]:
+        db_path = str(tmp_path / "source.db")
+        request = {
+            "goal": "digest ünïcode",
+            "mode": "dry_run",
+            "plan_override": [
+                {
+                    "step_id": "s1",
+                    "intent": "i",
+                    "call": {"tool": "t", "method": "m", "args": {"text": "é\u2028", "f": 0.1}},
+                }
+            ],
+        }
+        run_id = run(request, db_path=db_path)["run"]["run_id"]
+        return cast(dict[str, Any], export({"db_path": db_path, "run_id": run_id})["artifact"])
+
+    def _run_count(self, db_path: str) -> int:
+        conn = sqlite3.connect(db_path)
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+        finally:
+            conn.close()
+
+    def test_matches_full_digest(self, tmp_path: Path) -> None:
+        """The incremental digest equals the whole-bundle digest (non-ASCII, floats)."""
+        bundle = self._bundle(tmp_path)
+        assert _compute_bundle_digest(bundle) == bundle["digests"]["sha256"]
+        resp = import_bundle({"db_path": str(tmp_path / "target.db"), "bundle": bundle})
+        assert resp["status"] == "ok"
+
+    def test_mismatch_rolls_back(self, tmp_path: Path) -> None:
+        """A mismatching digest leaves no partial run behind."""
+        bundle = self._bundle(tmp_path)
+        bundle["events"][-1]["payload"]["outcome"] = "tampered"
+        target_db = str(tmp_path / "target.db")
+
+        resp = import_bundle({"db_path": target_db, "bundle": bundle})
+        assert resp["error"]["code"] == "DIGEST_MISMATCH"
+        assert self._run_count(target_db) == 0
+
+    def test_overwrite_mismatch_keeps_existing_run(self, tmp_path: Path) -> None:
+        """A failed overwrite does not delete the run it would replace."""
+        bundle = self._bundle(tmp_path)
+        target_db = str(tmp_path / "target.db")
+        import_bundle({"db_path": target_db, "bundle": bundle})
+
+        bundle["events"][0]["payload"]["goal"] = "tampered"
+        resp = import_bundle({"db_path": target_db, "bundle": bundle, "mode": "overwrite"})
+        assert resp["error"]["code"] == "DIGEST_MISMATCH"
+        replayed = replay({"db_path": target_db, "run_id": bundle["run"]["run_id"]})
+        assert replayed["ok"] is True
+
+    def test_missing_event_field_rolls_back(self, tmp_path: Path) -> None:
+        """Malformed events found mid-insert abort the whole import."""
+        bundle = self._bundle(tmp_path)
+        del bundle["events"][3]["ts"]
+        target_db = str(tmp_path / "target.db")
+
+        resp = import_bundle({"db_path": target_db, "bundle": bundle, "verify_digest": False})
+        assert resp["error"] == {"code": "INVALID_BUNDLE", "message": "Missing events[3].ts"}
+        assert self._run_count(target_db) == 0
@@ -0,0 +1,263 @@
+"""Tests for FunctionAdapter."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.dispatch import (
+    CAPABILITY_APPLY,
+    CAPABILITY_TIMEOUT,
+    AdapterRegistry,
+    FunctionAdapter,
+)
+from nexus_router.exceptions import NexusBugError, NexusOperationalError
+from nexus_router.metrics import FUNCTION_POOL_QUEUED, FUNCTION_POOL_RUNNING
+from nexus_router.tool import run
+
+
+def _add(args: dict[str, Any]) -> dict[str, Any]:
+    return {"sum": args["a"] + args["b"]}
+
+
+class TestFunctionAdapterRegistration:
+    """Tests for registration and identity."""
+
+    def test_defaults(self) -> None:
+        """Default id/kind/capabilities."""
+        adapter = FunctionAdapter()
+        assert adapter.adapter_id == "function"
+        assert adapter.adapter_kind == "function"
+        assert adapter.capabilities == frozenset({CAPABILITY_APPLY})
+
+    def test_timeout_capability_when_default_timeout(self) -> None:
+        """A default timeout adds the timeout capability."""
+        adapter = FunctionAdapter(timeout_s=1.0)
+        assert CAPABILITY_TIMEOUT in adapter.capabilities
+
+    def test_register_and_decorator(self) -> None:
+        """register() and the decorator both add functions."""
+        adapter = FunctionAdapter()
+        adapter.register("math", "add", _add)
+
+        @adapter.function("math", "neg")
+        def neg(args: dict[str, Any]) -> dict[str, Any]:
+            return {"value": -args["x"]}
+
+        assert adapter.list_functions() == [("math", "add"), ("math", "neg")]
+        assert neg({"x": 1}) == {"value": -1}
+
+    def test_register_non_callable_raises(self) -> None:
+        """Non-callables are rejected at registration."""
+        with pytest.raises(TypeError):
+            FunctionAdapter().register("t", "m", "nope")  # type: ignore[arg-type]
+
+    def test_invalid_max_workers(self) -> None:
+        """max_workers must be positive."""
+        with pytest.raises(ValueError):
+            FunctionAdapter(max_workers=0)
+
+
+class TestFunctionAdapterCalls:
+    """Tests for call() behavior and error mapping."""
+
+    def test_inline_call(self) -> None:
+        """Functions without timeout/offload run on the calling thread."""
+        adapter = FunctionAdapter()
+        caller = threading.get_ident()
+        seen: list[int] = []
+
+        def f(args: dict[str, Any]) -> dict[str, Any]:
+            seen.append(threading.get_ident())
+            return {"ok": True}
+
+        adapter.register("t", "m", f)
+        assert adapter.call("t", "m", {}) == {"ok": True}
+        assert seen == [caller]
+
+    def test_offload_runs_on_pool(self) -> None:
+        """offload=True runs the function on a worker thread."""
+        with FunctionAdapter() as adapter:
+            seen: list[int] = []
+            adapter.register(
+                "t", "m", lambda a: seen.append(threading.get_ident()) or {}, offload=True
+            )
+            adapter.call("t", "m", {})
+            assert seen and seen[0] != threading.get_ident()
+
+    def test_output_is_copied(self) -> None:
+        """Returned dict is a copy, so router annotations don't leak back."""
+        shared = {"v": 1}
+        adapter = FunctionAdapter()
+        adapter.register("t", "m", lambda a: shared)
+        out = adapter.call("t", "m", {})
+        out["adapter_id"] = "x"
+        assert "adapter_id" not in shared
+
+    def test_unknown_method(self) -> None:
+        """Unregistered (tool, method) -> METHOD_NOT_FOUND."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            FunctionAdapter().call("t", "missing", {"a": 1})
+        assert exc_info.value.error_code == "METHOD_NOT_FOUND"
+        assert "args_digest" in exc_info.value.details
+
+    def test_exception_maps_to_tool_error(self) -> None:
+        """Arbitrary exceptions map to TOOL_ERROR with redacted message."""
+
+        def boom(args: dict[str, Any]) -> dict[str, Any]:
+            raise RuntimeError("failed with password=hunter2")
+
+        adapter = FunctionAdapter()
+        adapter.register("t", "m", boom)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {})
+        details = exc_info.value.details
+        assert exc_info.value.error_code == "TOOL_ERROR"
+        assert details["exception_type"] == "RuntimeError"
+        assert "hunter2" not in details["message"]
+
+    def test_nexus_errors_pass_through(self) -> None:
+        """NexusOperationalError / NexusBugError are not re-wrapped."""
+
+        def op(args: dict[str, Any]) -> dict[str, Any]:
+            raise NexusOperationalError("nope", error_code="CUSTOM")
+
+        def bug(args: dict[str, Any]) -> dict[str, Any]:
+            raise NexusBugError("bug")
+
+        adapter = FunctionAdapter()
+        adapter.register("t", "op", op)
+        adapter.register("t", "bug", bug)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "op", {})
+        assert exc_info.value.error_code == "CUSTOM"
+        with pytest.raises(NexusBugError):
+            adapter.call("t", "bug", {})
+
+    def test_non_dict_output(self) -> None:
+        """Non-dict output -> INVALID_OUTPUT."""
+        adapter = FunctionAdapter()
+        adapter.register("t", "m", lambda a: [1, 2])  # type: ignore[arg-type,return-value]
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {})
+        assert exc_info.value.error_code == "INVALID_OUTPUT"
+
+    def test_timeout(self) -> None:
+        """Slow functions raise TIMEOUT without blocking the caller."""
+        release = threading.Event()
+        with FunctionAdapter(timeout_s=0.1) as adapter:
+            adapter.register("t", "slow", lambda a: release.wait(5) and {})
+            start = time.monotonic()
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "slow", {})
+            release.set()
+        assert time.monotonic() - start < 2
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert exc_info.value.details["timeout_s"] == 0.1
+
+    def test_per_function_timeout_overrides_default(self) -> None:
+        """Per-function timeout_s takes precedence."""
+        with FunctionAdapter(timeout_s=0.05) as adapter:
+            adapter.register("t", "m", lambda a: time.sleep(0.2) or {"ok": 1}, timeout_s=2.0)
+            assert adapter.call("t", "m", {}) == {"ok": 1}
+
+    def test_timeout_starts_when_function_runs(self) -> None:
+        """Time spent queued for a worker does not count against the function."""
+        with FunctionAdapter(timeout_s=0.5, max_workers=1) as adapter:
+            adapter.register("t", "m", lambda a: time.sleep(0.3) or {"ok": 1})
+            with ThreadPoolExecutor(max_workers=2) as callers:
+                results = list(callers.map(lambda _: adapter.call("t", "m", {}), range(2)))
+        # The second call waited ~0.3s for the worker, then ran for 0.3s
+        assert results == [{"ok": 1}, {"ok": 1}]
+
+    def test_pool_exhausted_by_hung_functions(self) -> None:
+        """More hung calls than max_workers: queued calls fail with POOL_EXHAUSTED."""
+        release = threading.Event()
+        with FunctionAdapter(timeout_s=0.1, max_workers=2) as adapter:
+            adapter.register("t", "hang", lambda a: release.wait(5) and {})
+            errors: list[str] = []
+            for _ in range(2):
+                with pytest.raises(NexusOperationalError) as exc_info:
+                    adapter.call("t", "hang", {})
+                errors.append(exc_info.value.error_code)
+            assert adapter.pool_stats() == {"max_workers": 2, "running": 2, "queued": 0}
+
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "hang", {})
+            errors.append(exc_info.value.error_code)
+            details = exc_info.value.details
+            assert adapter.pool_stats()["queued"] == 0
+
+            release.set()
+            adapter.register("t", "fast", lambda a: {"ok": 1})
+            deadline = time.monotonic() + 2
+            while adapter.pool_stats()["running"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert adapter.call("t", "fast", {}) == {"ok": 1}
+
+        assert errors == ["TIMEOUT", "TIMEOUT", "POOL_EXHAUSTED"]
+        assert details["running"] == 2
+        assert details["max_workers"] == 2
+
+    def test_pool_gauges(self) -> None:
+        """Queued and running calls are exported as per-adapter gauges."""
+        queued = FUNCTION_POOL_QUEUED.labels("fn-gauges")
+        running = FUNCTION_POOL_RUNNING.labels("fn-gauges")
+        release = threading.Event()
+        with FunctionAdapter("fn-gauges", max_workers=1) as adapter:
+            adapter.register("t", "block", lambda a: release.wait(5) and {}, offload=True)
+            callers = [
+                threading.Thread(target=adapter.call, args=("t", "block", {})) for _ in range(3)
+            ]
+            for t in callers:
+                t.start()
+            deadline = time.monotonic() + 2
+            while queued.value < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert (running.value, queued.value) == (1, 2)
+            release.set()
+            for t in callers:
+                t.join()
+        assert (running.value, queued.value) == (0, 0)
+
+
+class TestFunctionAdapterRouter:
+    """Integration with the router and registry."""
+
+    def test_apply_mode(self, tmp_path: Path) -> None:
+        """Apply-mode runs dispatch to the registered function."""
+        adapter = FunctionAdapter()
+        adapter.register("math", "add", _add)
+        registry = AdapterRegistry(default_adapter_id="function")
+        registry.register(adapter)
+
+        resp = run(
+            {
+                "goal": "function adapter",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "add",
+                        "call": {"tool": "math", "method": "add", "args": {"a": 2, "b": 3}},
+                    },
+                    {
+                        "step_id": "s2",
+                        "intent": "missing",
+                        "call": {"tool": "math", "method": "mul", "args": {}},
+                    },
+                ],
+            },
+            db_path=str(tmp_path / "test.db"),
+            adapters=registry,
+        )
+
+        assert resp["results"][0]["output"]["sum"] == 5
+        assert resp["results"][0]["output"]["adapter_id"] == "function"
+        assert resp["results"][1]["status"] == "error"
@@ -0,0 +1,322 @@
+"""Tests for HttpAdapter (keep-alive pooled HTTP dispatch)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.dispatch import CAPABILITY_APPLY, CAPABILITY_EXTERNAL, CAPABILITY_TIMEOUT
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.http_adapter import ADAPTER_MANIFEST, HttpAdapter, create_adapter
+from nexus_router.metrics import HTTP_POOL_WAITERS
+from nexus_router.plugins import validate_adapter
+from nexus_router.tool import run
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Local stand-in for a tool server. Behavior is driven by the method name."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        server: _ToolServer = self.server  # type: ignore[assignment]
+        server.peers.add(self.client_address)
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length))
+        method = request["method"]
+        server.handled.append(method)
+
+        if method == "slow":
+            time.sleep(request["args"].get("s", 1.0))
+        if method == "status":
+            self._send(503, b"overloaded password=hunter2")
+        elif method == "badjson":
+            self._send(200, b"not json")
+        elif method == "big":
+            self._send(200, b"[" + b"1," * 50_000 + b"1]")
+        elif method == "close":
+            self._send(200, json.dumps({"closed": True}).encode(), close=True)
+        elif method == "drop":
+            # Advertise keep-alive, then close anyway (like an idle-timeout reaper)
+            self._send(200, json.dumps({"dropped": True}).encode())
+            self.close_connection = True
+        elif method == "reset":
+            # Act on the request, then hang up without a response
+            self.close_connection = True
+        else:
+            body = {"path": self.path, "received": request}
+            self._send(200, json.dumps(body).encode())
+
+    def _send(self, status: int, body: bytes, *, close: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _ToolServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.peers: set[tuple[str, int]] = set()
+        self.handled: list[str] = []
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        pass  # Clients hanging up mid-response (timeouts, size caps) are expected
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> Iterator[_ToolServer]:
+    srv = _ToolServer()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+class TestHttpAdapterBasics:
+    """Identity, capability and config tests."""
+
+    def test_identity_and_capabilities(self, server: _ToolServer) -> None:
+        """Default id is http:{netloc}; capabilities include timeout/external."""
+        adapter = HttpAdapter(server.url)
+        assert adapter.adapter_id == f"http:127.0.0.1:{server.server_address[1]}"
+        assert adapter.adapter_kind == "http"
+        assert adapter.capabilities == frozenset(
+            {CAPABILITY_APPLY, CAPABILITY_TIMEOUT, CAPABILITY_EXTERNAL}
+        )
+
+    def test_invalid_config(self) -> None:
+        """Bad URL or limits raise ValueError."""
+        with pytest.raises(ValueError):
+            HttpAdapter("ftp://example.com")
+        with pytest.raises(ValueError):
+            HttpAdapter("http://example.com", max_connections=0)
+        with pytest.raises(ValueError):
+            create_adapter()
+
+    def test_manifest_validates(self, server: _ToolServer) -> None:
+        """create_adapter + ADAPTER_MANIFEST pass validate_adapter."""
+        assert create_adapter(base_url=server.url, timeout_s="5").adapter_kind == "http"
+        result = validate_adapter(
+            "nexus_router.http_adapter:create_adapter", {"base_url": server.url}
+        )
+        assert result.ok, result.to_dict()
+        assert ADAPTER_MANIFEST["kind"] == "http"
+
+
+class TestHttpAdapterCalls:
+    """Tests for call() success and error mapping."""
+
+    def test_success_and_path(self, server: _ToolServer) -> None:
+        """Payload and path follow the documented contract."""
+        with HttpAdapter(server.url + "/api") as adapter:
+            out = adapter.call("my tool", "run", {"x": 1})
+        assert out["path"] == "/api/my%20tool/run"
+        assert out["received"] == {"tool": "my tool", "method": "run", "args": {"x": 1}}
+
+    def test_keep_alive_reuses_connection(self, server: _ToolServer) -> None:
+        """Sequential calls share one TCP connection."""
+        with HttpAdapter(server.url) as adapter:
+            for i in range(5):
+                adapter.call("t", "m", {"i": i})
+            stats = adapter.pool_stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 4
+        assert len(server.peers) == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX fd numbering")
+    def test_keep_alive_with_high_fds(self, server: _ToolServer) -> None:
+        """Connections are still reused once socket fds exceed select()'s 1024 limit."""
+        resource = pytest.importorskip("resource")
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY and soft < 1300:
+            pytest.skip("RLIMIT_NOFILE too low")
+        pipes = [os.pipe() for _ in range(550)]
+        try:
+            with HttpAdapter(server.url) as adapter:
+                for i in range(5):
+                    adapter.call("t", "m", {"i": i})
+                stats = adapter.pool_stats()
+        finally:
+            for r, w in pipes:
+                os.close(r)
+                os.close(w)
+        assert stats["created"] == 1
+        assert stats["reused"] == 4
+
+    def test_pool_size_limit(self, server: _ToolServer) -> None:
+        """Concurrent calls never open more than max_connections."""
+        with HttpAdapter(server.url, max_connections=2) as adapter:
+            threads = [
+                threading.Thread(target=adapter.call, args=("t", "m", {"i": i})) for i in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            stats = adapter.pool_stats()
+        assert stats["created"] <= 2
+        assert stats["in_use"] == 0
+        assert stats["waiting"] == 0
+
+    def test_pool_waiters_gauge(self, server: _ToolServer) -> None:
+        """Calls blocked on a full pool show up in pool_stats and the waiters gauge."""
+        gauge = HTTP_POOL_WAITERS.labels("http-waiters")
+        with HttpAdapter(server.url, adapter_id="http-waiters", max_connections=1) as adapter:
+            threads = [
+                threading.Thread(target=adapter.call, args=("t", "slow", {"s": 0.3}))
+                for _ in range(3)
+            ]
+            for t in threads:
+                t.start()
+            deadline = time.monotonic() + 2
+            while adapter.pool_stats()["waiting"] < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert adapter.pool_stats()["waiting"] == 2
+            assert gauge.value == 2
+            for t in threads:
+                t.join()
+        assert gauge.value == 0
+
+    def test_idle_eviction(self, server: _ToolServer) -> None:
+        """Idle connections past idle_timeout_s are closed."""
+        with HttpAdapter(server.url, idle_timeout_s=0.05) as adapter:
+            adapter.call("t", "m", {})
+            time.sleep(0.1)
+            assert adapter.evict_idle() == 1
+            adapter.call("t", "m", {})
+            assert adapter.pool_stats()["created"] == 2
+
+    def test_server_close_not_reused(self, server: _ToolServer) -> None:
+        """Connection: close responses are not returned to the pool."""
+        with HttpAdapter(server.url) as adapter:
+            assert adapter.call("t", "close", {}) == {"closed": True}
+            assert adapter.pool_stats()["idle"] == 0
+            adapter.call("t", "m", {})
+            assert adapter.pool_stats()["created"] == 2
+
+    def test_stale_connection_replaced(self, server: _ToolServer) -> None:
+        """A pooled connection closed by the server is replaced before sending."""
+        with HttpAdapter(server.url) as adapter:
+            assert adapter.call("t", "drop", {}) == {"dropped": True}
+            time.sleep(0.05)  # Let the server finish closing its end
+            assert adapter.call("t", "m", {"again": True})["received"]["args"] == {"again": True}
+            assert adapter.pool_stats()["created"] == 2
+
+    def test_stale_connection_used_when_check_disabled(self, server: _ToolServer) -> None:
+        """check_stale=False surfaces the dropped connection as CONNECTION_FAILED."""
+        with HttpAdapter(server.url, check_stale=False) as adapter:
+            adapter.call("t", "drop", {})
+            time.sleep(0.05)
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "m", {})
+        assert exc_info.value.error_code == "CONNECTION_FAILED"
+
+    def test_no_resend_after_request_sent(self, server: _ToolServer) -> None:
+        """A connection dropped after the request was sent is not retried."""
+        with HttpAdapter(server.url) as adapter:
+            adapter.call("t", "m", {})
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "reset", {})
+        assert exc_info.value.error_code == "CONNECTION_FAILED"
+        assert server.handled == ["m", "reset"]
+
+    def test_http_error_redacted(self, server: _ToolServer) -> None:
+        """Non-2xx -> HTTP_ERROR with status and redacted body excerpt."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            HttpAdapter(server.url).call("t", "status", {"a": 1})
+        details = exc_info.value.details
+        assert exc_info.value.error_code == "HTTP_ERROR"
+        assert details["status"] == 503
+        assert "hunter2" not in details["body_excerpt"]
+        assert "args_digest" in details
+
+    def test_invalid_json(self, server: _ToolServer) -> None:
+        """Non-JSON or non-object body -> INVALID_JSON."""
+        adapter = HttpAdapter(server.url)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "badjson", {})
+        assert exc_info.value.error_code == "INVALID_JSON"
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "big", {})
+        assert exc_info.value.error_code == "INVALID_JSON"
+
+    def test_output_too_large(self, server: _ToolServer) -> None:
+        """Body over max_response_bytes -> OUTPUT_TOO_LARGE, connection dropped."""
+        adapter = HttpAdapter(server.url, max_response_bytes=1024)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "big", {})
+        assert exc_info.value.error_code == "OUTPUT_TOO_LARGE"
+        assert exc_info.value.details["limit_bytes"] == 1024
+        assert adapter.pool_stats()["idle"] == 0
+
+    def test_timeout(self, server: _ToolServer) -> None:
+        """Slow responses -> TIMEOUT bounded by timeout_s."""
+        adapter = HttpAdapter(server.url, timeout_s=0.2)
+        start = time.monotonic()
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "slow", {})
+        assert time.monotonic() - start < 1.0
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert exc_info.value.details["timeout_s"] == 0.2
+
+    def test_connection_failed(self) -> None:
+        """Nothing listening -> CONNECTION_FAILED."""
+        srv = _ToolServer()
+        url = srv.url
+        srv.server_close()
+        with pytest.raises(NexusOperationalError) as exc_info:
+            HttpAdapter(url, timeout_s=2).call("t", "m", {})
+        assert exc_info.value.error_code == "CONNECTION_FAILED"
+
+
+class TestHttpAdapterRouter:
+    """Integration with the router."""
+
+    def test_apply_mode(self, server: _ToolServer, tmp_path: Path) -> None:
+        """Router drives the adapter through call()."""
+        resp = run(
+            {
+                "goal": "http adapter",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": f"s{i}",
+                        "intent": "echo",
+                        "call": {"tool": "t", "method": "m", "args": {"i": i}},
+                    }
+                    for i in range(3)
+                ],
+            },
+            db_path=str(tmp_path / "test.db"),
+            adapter=HttpAdapter(server.url),
+        )
+        assert [r["status"] for r in resp["results"]] == ["ok"] * 3
+        assert resp["dispatch"]["adapter_kind"] == "http"
+        assert len(server.peers) == 1
@@ -0,0 +1,220 @@
+"""Tests for McpStdioAdapter against a fake MCP stdio server."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.mcp_adapter import McpStdioAdapter
+from nexus_router.tool import run
+
+FAKE_MCP = Path(__file__).parent / "fixtures" / "fake_mcp_server.py"
+
+
+@pytest.fixture
+def adapter() -> Iterator[McpStdioAdapter]:
+    with McpStdioAdapter([sys.executable, str(FAKE_MCP)], adapter_id="mcp-fake") as a:
+        yield a
+
+
+class TestMcpAdapterBasics:
+    """Identity and config tests."""
+
+    def test_identity(self) -> None:
+        """Derived id is stable and prefixed."""
+        cmd = [sys.executable, str(FAKE_MCP)]
+        a1, a2 = McpStdioAdapter(cmd), McpStdioAdapter(cmd)
+        assert a1.adapter_id == a2.adapter_id
+        assert a1.adapter_id.startswith("mcp:")
+        assert a1.adapter_kind == "mcp_stdio"
+        assert a1.capabilities == frozenset({"apply", "timeout", "external"})
+
+    def test_invalid_config(self) -> None:
+        """Empty command raises ValueError."""
+        with pytest.raises(ValueError):
+            McpStdioAdapter([])
+
+
+class TestMcpAdapterSession:
+    """Handshake and session reuse."""
+
+    def test_handshake_and_reuse(self, adapter: McpStdioAdapter) -> None:
+        """One server process serves many calls after initialize/initialized."""
+        first = adapter.call("srv", "echo", {"i": 1})
+        second = adapter.call("srv", "echo", {"i": 2})
+        assert first["echo"] == {"i": 1}
+        assert first["initialized"] is True
+        assert first["pid"] == second["pid"]
+        assert adapter.sessions_started == 1
+        assert adapter.server_info["serverInfo"]["name"] == "fake-mcp"
+
+    def test_list_tools(self, adapter: McpStdioAdapter) -> None:
+        """tools/list is available."""
+        assert [t["name"] for t in adapter.list_tools()] == ["echo"]
+
+    def test_multiplexed_calls(self, adapter: McpStdioAdapter) -> None:
+        """Concurrent calls share the session and are matched by id."""
+        results: dict[int, dict[str, Any]] = {}
+        delays = [0.3, 0.2, 0.1, 0.0]
+
+        def worker(i: int) -> None:
+            results[i] = adapter.call("srv", "sleep", {"s": delays[i], "i": i})
+
+        adapter.call("srv", "echo", {})  # Warm up: exclude startup from timing
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(delays))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - start < sum(delays)
+        assert {i: r["echo"]["i"] for i, r in results.items()} == {0: 0, 1: 1, 2: 2, 3: 3}
+        assert adapter.sessions_started == 1
+
+    def test_name_template(self) -> None:
+        """name_template maps (tool, method) to the MCP tool name."""
+        with McpStdioAdapter([sys.executable, str(FAKE_MCP)], name_template="{tool}") as adapter:
+            assert adapter.call("echo", "ignored", {"x": 1})["echo"] == {"x": 1}
+
+
+class TestMcpAdapterResults:
+    """Result conversion."""
+
+    def test_text_json_parsed(self, adapter: McpStdioAdapter) -> None:
+        """A single JSON text block becomes the output object."""
+        assert adapter.call("srv", "text_json", {}) == {"value": 42}
+
+    def test_plain_text_wrapped(self, adapter: McpStdioAdapter) -> None:
+        """Other content is returned under "content"."""
+        assert adapter.call("srv", "text_plain", {}) == {
+            "content": [{"type": "text", "text": "hello"}]
+        }
+
+
+class TestMcpAdapterErrors:
+    """Error mapping to the existing error codes."""
+
+    def test_tool_error_redacted(self, adapter: McpStdioAdapter) -> None:
+        """isError results -> TOOL_ERROR with redacted message."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("srv", "fail", {})
+        assert exc_info.value.error_code == "TOOL_ERROR"
+        assert "sk-secret" not in exc_info.value.details["message"]
+
+    def test_unknown_tool(self, adapter: McpStdioAdapter) -> None:
+        """JSON-RPC -32601 -> METHOD_NOT_FOUND."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("srv", "nope", {})
+        assert exc_info.value.error_code == "METHOD_NOT_FOUND"
+        assert exc_info.value.details["rpc_code"] == -32601
+
+    def test_timeout_keeps_session(self) -> None:
+        """Call timeout -> TIMEOUT; the session stays warm."""
+        with McpStdioAdapter([sys.executable, str(FAKE_MCP)], timeout_s=0.3) as adapter:
+            adapter.call("srv", "echo", {})
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("srv", "sleep", {"s": 1})
+            assert exc_info.value.error_code == "TIMEOUT"
+            assert "args_digest" in exc_info.value.details
+            adapter.call("srv", "echo", {})
+            assert adapter.sessions_started == 1
+
+    def test_crash_then_restart(self, adapter: McpStdioAdapter) -> None:
+        """Server exit -> NONZERO_EXIT with stderr; next call restarts the server."""
+        pid = adapter.call("srv", "echo", {})["pid"]
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("srv", "crash", {})
+        assert exc_info.value.error_code == "NONZERO_EXIT"
+        assert exc_info.value.details["returncode"] == 3
+        assert "crashing on purpose" in exc_info.value.details["stderr_excerpt"]
+
+        assert adapter.call("srv", "echo", {})["pid"] != pid
+        assert adapter.sessions_started == 2
+
+    def test_invalid_json_output(self, adapter: McpStdioAdapter) -> None:
+        """Non-JSON on stdout -> INVALID_JSON_OUTPUT."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("srv", "garbage", {})
+        assert exc_info.value.error_code == "INVALID_JSON_OUTPUT"
+
+    def test_non_int_response_id_ignored(self) -> None:
+        """A response with a list id is skipped; the reader keeps routing responses."""
+        with McpStdioAdapter([sys.executable, str(FAKE_MCP)], timeout_s=5) as adapter:
+            assert adapter.call("srv", "bad_id", {"x": 1})["echo"] == {"x": 1}
+            assert adapter.call("srv", "echo", {})["initialized"] is True
+
+    def test_stalled_stdin_does_not_block_callers(self) -> None:
+        """A server that stops reading stdin cannot hold callers past timeout_s."""
+        cmd = [sys.executable, str(FAKE_MCP), "--stop-reading"]
+        errors: list[str] = []
+
+        def call(size: int) -> None:
+            try:
+                adapter.call("srv", "echo", {"blob": "x" * size})
+            except NexusOperationalError as e:
+                errors.append(e.error_code)
+
+        with McpStdioAdapter(cmd, timeout_s=0.5) as adapter:
+            start = time.monotonic()
+            # The first call fills the pipe buffer; the rest queue behind it
+            threads = [
+                threading.Thread(target=call, args=(size,)) for size in (8 * 1024 * 1024, 10, 10)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+            elapsed = time.monotonic() - start
+        assert not any(t.is_alive() for t in threads)
+        assert elapsed < 3
+        assert errors == ["TIMEOUT"] * 3
+
+    def test_init_timeout(self) -> None:
+        """A server that never answers initialize -> TIMEOUT."""
+        adapter = McpStdioAdapter(
+            [sys.executable, str(FAKE_MCP), "--hang-init"], init_timeout_s=0.5
+        )
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("srv", "echo", {})
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert exc_info.value.details["phase"] == "initialize"
+
+    def test_command_not_found(self) -> None:
+        """Missing executable -> COMMAND_NOT_FOUND."""
+        with pytest.raises(NexusOperationalError) as exc_info:
+            McpStdioAdapter(["nonexistent_command_12345"]).call("srv", "echo", {})
+        assert exc_info.value.error_code == "COMMAND_NOT_FOUND"
+
+
+class TestMcpAdapterRouter:
+    """Integration with the router."""
+
+    def test_steps_share_server(self, adapter: McpStdioAdapter, tmp_path: Path) -> None:
+        """All steps of a run hit the same warm server."""
+        resp = run(
+            {
+                "goal": "mcp",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": f"s{i}",
+                        "intent": "echo",
+                        "call": {"tool": "srv", "method": "echo", "args": {"i": i}},
+                    }
+                    for i in range(3)
+                ],
+            },
+            db_path=str(tmp_path / "test.db"),
+            adapter=adapter,
+        )
+        pids = {r["output"]["pid"] for r in resp["results"]}
+        assert len(pids) == 1
+        assert resp["dispatch"]["adapter_kind"] == "mcp_stdio"
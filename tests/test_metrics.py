@@ -0,0 +1,211 @@
+"""Tests for the metrics registry, Prometheus rendering and package instrumentation."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import plan_request
+
+from nexus_router import metrics
+from nexus_router.dispatch import SubprocessAdapter
+from nexus_router.export import export_run
+from nexus_router.import_ import import_bundle
+from nexus_router.metrics import MetricsRegistry, render_prometheus, start_http_server
+from nexus_router.replay import replay
+from nexus_router.synthetic_adapter import SyntheticAdapter
+from nexus_router.tool import run
+
+ECHO_TOOL = Path(__file__).parent / "fixtures" / "echo_tool.py"
+
+
+def _value(metric: Any, *labels: str) -> float:
+    return float(metric.labels(*labels).value)
+
+
+def _metrics_request(steps: int = 1) -> dict[str, Any]:
+    # A method name of its own keeps these label sets apart from other tests
+    return plan_request([("t", "metrics_m", {})] * steps)
+
+
+class TestRegistry:
+    """Metric primitives."""
+
+    def test_counter_and_gauge(self) -> None:
+        """Counters only go up; gauges go both ways."""
+        registry = MetricsRegistry()
+        counter = registry.counter("c_total", "help", ("k",))
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        assert _value(counter, "a") == 3
+        with pytest.raises(ValueError):
+            counter.labels("a").inc(-1)
+
+        gauge = registry.gauge("g", "help")
+        gauge.inc(5)
+        gauge.dec(2)
+        assert gauge.labels().value == 3
+        gauge.set(7)
+        assert gauge.labels().value == 7
+
+    def test_histogram_buckets(self) -> None:
+        """Observations land in the first bucket whose bound is >= value."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("h_seconds", "help", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        child = histogram.labels()
+        assert child.bucket_counts == [2, 1, 1]
+        assert child.count == 4
+        assert child.sum == pytest.approx(5.65)
+
+    def test_get_or_create(self) -> None:
+        """Re-registering returns the same family; a different shape is rejected."""
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "help", ("a",))
+        assert registry.counter("x_total", "help", ("a",)) is first
+        with pytest.raises(ValueError):
+            registry.counter("x_total", "help", ("b",))
+        with pytest.raises(ValueError):
+            registry.gauge("x_total", "help", ("a",))
+
+    def test_label_arity(self) -> None:
+        """Wrong number of label values raises ValueError."""
+        counter = MetricsRegistry().counter("y_total", "help", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+
+    def test_threaded_increments(self) -> None:
+        """Concurrent increments are not lost."""
+        counter = MetricsRegistry().counter("t_total", "help")
+
+        def worker() -> None:
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert counter.labels().value == 80_000
+
+
+class TestRendering:
+    """Prometheus text exposition."""
+
+    def test_render(self) -> None:
+        """HELP/TYPE headers, cumulative buckets, +Inf, sum and count."""
+        registry = MetricsRegistry()
+        registry.counter("req_total", "Requests", ("code",)).labels("200").inc(3)
+        histogram = registry.histogram("lat_seconds", "Latency", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(2.0)
+        text = render_prometheus(registry)
+        assert "# HELP req_total Requests\n# TYPE req_total counter\n" in text
+        assert 'req_total{code="200"} 3\n' in text
+        assert "# TYPE lat_seconds histogram\n" in text
+        assert 'lat_seconds_bucket{le="0.1"} 1\n' in text
+        assert 'lat_seconds_bucket{le="1"} 1\n' in text
+        assert 'lat_seconds_bucket{le="+Inf"} 2\n' in text
+        assert "lat_seconds_sum 2.05\n" in text
+        assert "lat_seconds_count 2\n" in text
+
+    def test_label_escaping(self) -> None:
+        """Backslash, quote and newline are escaped in label values."""
+        registry = MetricsRegistry()
+        registry.counter("e_total", "help", ("v",)).labels('a"b\\c\nd').inc()
+        assert 'e_total{v="a\\"b\\\\c\\nd"} 1' in registry.render_prometheus()
+
+    def test_http_endpoint(self) -> None:
+        """GET /metrics serves the registry; other paths are 404."""
+        registry = MetricsRegistry()
+        registry.counter("served_total", "help").inc()
+        with start_http_server(0, registry=registry) as server:
+            url = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as resp:
+                assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert "served_total 1" in resp.read().decode()
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+            assert exc_info.value.code == 404
+
+
+class TestInstrumentation:
+    """Package metrics move when the router, store, replay and import run."""
+
+    def test_run_metrics(self) -> None:
+        """Runs, adapter calls and appends are counted."""
+        started = _value(metrics.RUNS_STARTED, "apply")
+        finished = _value(metrics.RUNS_FINISHED, "apply", "ok")
+        calls = metrics.ADAPTER_CALL_SECONDS.labels("synthetic", "metrics_m", "ok").count
+        appended = _value(metrics.EVENTS_APPENDED, "STEP_STARTED")
+
+        run(_metrics_request(3), adapter=SyntheticAdapter())
+
+        assert _value(metrics.RUNS_STARTED, "apply") == started + 1
+        assert _value(metrics.RUNS_FINISHED, "apply", "ok") == finished + 1
+        assert metrics.ADAPTER_CALL_SECONDS.labels("synthetic", "metrics_m", "ok").count == (
+            calls + 3
+        )
+        assert _value(metrics.EVENTS_APPENDED, "STEP_STARTED") == appended + 3
+        assert metrics.RUNS_IN_PROGRESS.labels().value == 0
+        assert _value(metrics.ADAPTER_CALLS_IN_FLIGHT, "synthetic") == 0
+
+    def test_failed_calls(self) -> None:
+        """Adapter errors are labeled status=error and the run outcome=error."""
+        failed = _value(metrics.RUNS_FINISHED, "apply", "error")
+        errors = metrics.ADAPTER_CALL_SECONDS.labels("synthetic", "metrics_m", "error").count
+        run(_metrics_request(), adapter=SyntheticAdapter(error_rate=1.0))
+        assert _value(metrics.RUNS_FINISHED, "apply", "error") == failed + 1
+        assert metrics.ADAPTER_CALL_SECONDS.labels("synthetic", "metrics_m", "error").count == (
+            errors + 1
+        )
+
+    def test_subprocess_spawns(self) -> None:
+        """Each SubprocessAdapter call counts one spawn."""
+        before = _value(metrics.SUBPROCESS_SPAWNS, "subprocess")
+        SubprocessAdapter([sys.executable, str(ECHO_TOOL)]).call("t", "echo", {})
+        assert _value(metrics.SUBPROCESS_SPAWNS, "subprocess") == before + 1
+
+    def test_replay_and_import(self, tmp_path: Path) -> None:
+        """replay() and import_bundle() record latency and outcome."""
+        db_path = str(tmp_path / "src.db")
+        run_id = run(_metrics_request(), db_path=db_path, adapter=SyntheticAdapter())["run"][
+            "run_id"
+        ]
+
+        replays_ok = _value(metrics.REPLAYS, "ok")
+        not_found = _value(metrics.REPLAYS, "not_found")
+        replay_count = metrics.REPLAY_SECONDS.labels().count
+        replay(db_path=db_path, run_id=run_id)
+        replay(db_path=db_path, run_id="missing")
+        assert _value(metrics.REPLAYS, "ok") == replays_ok + 1
+        assert _value(metrics.REPLAYS, "not_found") == not_found + 1
+        assert metrics.REPLAY_SECONDS.labels().count == replay_count + 2
+
+        imports_ok = _value(metrics.IMPORTS, "ok")
+        imported = metrics.IMPORTED_EVENTS.labels().value
+        bundle = export_run(db_path=db_path, run_id=run_id)["artifact"]
+        result = import_bundle(db_path=str(tmp_path / "dst.db"), bundle=bundle)
+        assert _value(metrics.IMPORTS, "ok") == imports_ok + 1
+        assert metrics.IMPORTED_EVENTS.labels().value == imported + result["events_inserted"]
+
+    def test_default_registry_renders(self) -> None:
+        """The package registry renders every declared family."""
+        text = render_prometheus()
+        for name in (
+            "nexus_router_runs_started_total",
+            "nexus_router_runs_in_progress",
+            "nexus_router_adapter_call_seconds",
+            "nexus_router_store_append_seconds",
+            "nexus_router_subprocess_spawns_total",
+            "nexus_router_replay_seconds",
+            "nexus_router_imports_total",
+        ):
+            assert f"# TYPE {name} " in text
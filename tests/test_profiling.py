@@ -0,0 +1,143 @@
+"""Tests for the opt-in per-phase run profile."""
+
+from __future__ import annotations
+
+import json
+from importlib import resources
+from pathlib import Path
+
+import jsonschema
+import pytest
+from conftest import plan_request
+
+from nexus_router.event_store import EventStore
+from nexus_router.profiling import NULL_PROFILER, PhaseProfiler, profile_options
+from nexus_router.replay import replay
+from nexus_router.router import Router
+from nexus_router.synthetic_adapter import SyntheticAdapter
+from nexus_router.tool import run
+
+
+class TestPhaseProfiler:
+    """Profiler primitives."""
+
+    def test_accumulates(self) -> None:
+        """count, total and max are tracked per phase in first-seen order."""
+        profiler = PhaseProfiler()
+        profiler.add("b", 2_000_000)
+        profiler.add("a", 1_000_000)
+        profiler.add("b", 4_000_000)
+        result = profiler.to_dict()
+        assert list(result["phases"]) == ["b", "a"]
+        assert result["phases"]["b"] == {"count": 2, "total_ms": 6.0, "max_ms": 4.0}
+
+    def test_phase_context(self) -> None:
+        """phase() records time even when the block raises."""
+        profiler = PhaseProfiler()
+        with pytest.raises(RuntimeError), profiler.phase("boom"):
+            raise RuntimeError
+        assert profiler.to_dict()["phases"]["boom"]["count"] == 1
+
+    def test_null_profiler(self) -> None:
+        """The disabled profiler records nothing."""
+        with NULL_PROFILER.phase("x"):
+            pass
+        assert not NULL_PROFILER.enabled
+        assert NULL_PROFILER.to_dict()["phases"] == {}
+
+    def test_profile_options(self) -> None:
+        """Boolean and object forms of the request flag."""
+        assert profile_options({}) == (False, False)
+        assert profile_options({"profile": True}) == (True, False)
+        assert profile_options({"profile": {}}) == (True, False)
+        assert profile_options({"profile": {"record_event": True}}) == (True, True)
+
+
+class TestRunProfile:
+    """profile flag on tool.run / Router.run."""
+
+    def test_disabled_by_default(self) -> None:
+        """No profile key unless requested."""
+        assert "profile" not in run(plan_request(), adapter=SyntheticAdapter())
+
+    def test_phases_reported(self) -> None:
+        """All router phases appear, including validation and store open."""
+        resp = run(plan_request(profile=True), adapter=SyntheticAdapter())
+        phases = resp["profile"]["phases"]
+        for name in (
+            "validate",
+            "store_open",
+            "create_run",
+            "select_adapter",
+            "plan",
+            "dispatch",
+            "provenance",
+            "count_events",
+            "response",
+            "append.RUN_STARTED",
+            "append.TOOL_CALL_SUCCEEDED",
+        ):
+            assert name in phases, name
+        assert phases["dispatch"]["count"] == 2
+        assert phases["append.STEP_STARTED"]["count"] == 2
+        assert resp["profile"]["total_ms"] >= sum(p["total_ms"] for p in phases.values()) - 0.1
+
+    def test_dispatch_time_attributed(self) -> None:
+        """Slow tools show up under dispatch, not the router phases."""
+        resp = run(plan_request(1, profile=True), adapter=SyntheticAdapter(latency_ms=30))
+        phases = resp["profile"]["phases"]
+        assert phases["dispatch"]["total_ms"] >= 30
+        assert phases["provenance"]["total_ms"] < 30
+
+    def test_response_matches_schema(self) -> None:
+        """Profiled responses conform to the response schema."""
+        with (
+            resources.files("nexus_router")
+            .joinpath("schemas/nexus-router.run.response.v0.7.json")
+            .open("r", encoding="utf-8") as f
+        ):
+            schema = json.load(f)
+        jsonschema.validate(run(plan_request(profile=True), adapter=SyntheticAdapter()), schema)
+
+    def test_invalid_flag_rejected(self) -> None:
+        """Unknown profile options fail request validation."""
+        with pytest.raises(jsonschema.ValidationError):
+            run(plan_request(profile={"record": True}), adapter=SyntheticAdapter())
+
+    def test_record_event(self, tmp_path: Path) -> None:
+        """record_event stores the profile in the terminal event; replay stays clean."""
+        db_path = str(tmp_path / "test.db")
+        resp = run(
+            plan_request(profile={"record_event": True}),
+            db_path=db_path,
+            adapter=SyntheticAdapter(),
+        )
+        run_id = resp["run"]["run_id"]
+        with EventStore(db_path) as store:
+            terminal = store.read_events(run_id)[-1]
+        assert terminal.type == "RUN_COMPLETED"
+        assert "dispatch" in terminal.payload["profile"]["phases"]
+        assert replay(db_path=db_path, run_id=run_id)["ok"]
+
+    def test_not_recorded_by_default(self, tmp_path: Path) -> None:
+        """profile: true only returns the profile."""
+        db_path = str(tmp_path / "test.db")
+        resp = run(plan_request(profile=True), db_path=db_path, adapter=SyntheticAdapter())
+        with EventStore(db_path) as store:
+            terminal = store.read_events(resp["run"]["run_id"])[-1]
+        assert terminal.payload == {"outcome": "ok"}
+
+    def test_router_direct(self) -> None:
+        """Router.run creates its own profiler (no validation phase)."""
+        with EventStore(":memory:") as store:
+            resp = Router(store, adapter=SyntheticAdapter()).run(plan_request(profile=True))
+        assert "validate" not in resp["profile"]["phases"]
+        assert "dispatch" in resp["profile"]["phases"]
+
+    def test_failed_selection_profiled(self) -> None:
+        """Runs that fail adapter selection still return a profile."""
+        request = plan_request(profile=True)
+        request["dispatch"] = {"adapter_id": "missing"}
+        resp = run(request, adapter=SyntheticAdapter())
+        assert resp["error"]["code"] == "UNKNOWN_ADAPTER"
+        assert "select_adapter" in resp["profile"]["phases"]
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from importlib import resources
 from pathlib import Path
 from typing import Any, cast
 
 import jsonschema
+import pytest
 
 from nexus_router import events as E
+from nexus_router import replay as replay_mod
 from nexus_router.event_store import EventStore
+from nexus_router.replay import replay_all, run_view_at
 from nexus_router.tool import replay, run
 
 
@@ -259,3 +263,447 @@ class TestReplayPropertyBased:
 
             assert replay_resp["ok"] is True, f"Case {i} failed: {replay_resp['violations']}"
             assert replay_resp["violations"] == []
+
+
+class TestReplayAll:
+    """Bulk verification with replay_all."""
+
+    def _make_db(self, tmp_path: Path, runs: int = 5) -> tuple[str, list[str]]:
+        db_path = str(tmp_path / "bulk.db")
+        run_ids = []
+        for i in range(runs):
+            resp = run(
+                {
+                    "goal": f"bulk {i}",
+                    "mode": "dry_run",
+                    "plan_override": [
+                        {
+                            "step_id": "s1",
+                            "intent": "x",
+                            "call": {"tool": "t", "method": "m", "args": {}},
+                        }
+                    ],
+                },
+                db_path=db_path,
+            )
+            run_ids.append(resp["run"]["run_id"])
+        return db_path, run_ids
+
+    def _corrupt(self, db_path: str, run_id: str) -> None:
+        """Drop PLAN_CREATED: SEQ_GAP and NO_PLAN_CREATED."""
+        with EventStore(db_path) as store:
+            store.conn.execute(
+                "DELETE FROM events WHERE run_id = ? AND type = ?", (run_id, E.PLAN_CREATED)
+            )
+            store.conn.commit()
+
+    def test_all_ok(self, tmp_path: Path) -> None:
+        """A clean database reports every run ok."""
+        db_path, run_ids = self._make_db(tmp_path)
+        report = replay_all(db_path=db_path, workers=1)
+        assert report["ok"] is True
+        assert report["runs_checked"] == len(run_ids)
+        assert report["runs_ok"] == len(run_ids)
+        assert report["violations_by_code"] == {}
+        assert report["failed_runs"] == []
+
+    def test_violations_aggregated(self, tmp_path: Path) -> None:
+        """Violations are counted by code and failing runs listed."""
+        db_path, run_ids = self._make_db(tmp_path)
+        self._corrupt(db_path, run_ids[1])
+        self._corrupt(db_path, run_ids[3])
+        report = replay_all(db_path=db_path, workers=1, chunk_size=2)
+        assert report["ok"] is False
+        assert report["runs_with_violations"] == 2
+        assert report["violations_by_code"] == {"NO_PLAN_CREATED": 2, "SEQ_GAP": 2}
+        assert report["failed_runs"] == [
+            {"run_id": rid, "codes": ["NO_PLAN_CREATED", "SEQ_GAP"]}
+            for rid in sorted((run_ids[1], run_ids[3]))
+        ]
+        assert replay_all(db_path=db_path, workers=1, strict=False)["ok"] is True
+        assert len(replay_all(db_path=db_path, workers=1, max_failed_runs=1)["failed_runs"]) == 1
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Worker processes produce the same report as in-process replay."""
+        db_path, run_ids = self._make_db(tmp_path, runs=7)
+        self._corrupt(db_path, run_ids[4])
+        serial = replay_all(db_path=db_path, workers=1, chunk_size=2)
+        parallel = replay_all(db_path=db_path, workers=2, chunk_size=2)
+        for key in ("ok", "runs_checked", "violations_by_code", "failed_runs"):
+            assert parallel[key] == serial[key]
+        assert parallel["workers"] == 2
+
+    def test_filters(self, tmp_path: Path) -> None:
+        """status and run_ids narrow the runs verified."""
+        db_path, run_ids = self._make_db(tmp_path, runs=3)
+        assert replay_all(db_path=db_path, workers=1, status="FAILED")["runs_checked"] == 0
+        report = replay_all(db_path=db_path, workers=1, run_ids=[run_ids[0], "missing"])
+        assert report["runs_checked"] == 2
+        assert report["violations_by_code"] == {"RUN_NOT_FOUND": 1}
+
+    def test_read_only(self, tmp_path: Path) -> None:
+        """A missing database is not created; :memory: is rejected."""
+        missing = tmp_path / "missing.db"
+        with pytest.raises(sqlite3.OperationalError):
+            replay_all(db_path=str(missing), workers=1)
+        assert not missing.exists()
+        with pytest.raises(ValueError):
+            replay_all(db_path=":memory:")
+
+
+class TestReplayIncremental:
+    """Incremental replay from persisted verification checkpoints."""
+
+    def _start_run(self, db_path: str) -> str:
+        with EventStore(db_path) as store:
+            run_id = store.create_run(mode="apply", goal="incremental")
+            store.append(run_id, E.RUN_STARTED, {"mode": "apply", "goal": "incremental"})
+            store.append(run_id, E.PLAN_CREATED, {"plan": []})
+            store.append(run_id, E.STEP_STARTED, {"step_id": "s1"})
+        return run_id
+
+    def _finish_run(self, db_path: str, run_id: str) -> None:
+        with EventStore(db_path) as store:
+            store.append(
+                run_id,
+                E.TOOL_CALL_REQUESTED,
+                {"step_id": "s1", "call": {"tool": "t", "method": "m", "args": {}}},
+            )
+            store.append(run_id, E.TOOL_CALL_SUCCEEDED, {"step_id": "s1"})
+            store.append(run_id, E.STEP_COMPLETED, {"step_id": "s1", "status": "ok"})
+            store.append(run_id, E.RUN_COMPLETED, {"outcome": "ok"})
+            store.set_run_status(run_id, "COMPLETED")
+
+    def test_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        """A second incremental replay validates no events and returns the same view."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._start_run(db_path)
+        self._finish_run(db_path, run_id)
+
+        first = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert first["ok"] is True
+        assert first["checkpoint"]["resumed_from_seq"] is None
+        assert first["checkpoint"]["events_replayed"] == 7
+
+        second = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        jsonschema.validate(second, REPLAY_RESPONSE_SCHEMA)
+        assert second["checkpoint"]["resumed_from_seq"] == 6
+        assert second["checkpoint"]["events_replayed"] == 0
+        assert second["checkpoint"]["digest"] == first["checkpoint"]["digest"]
+        assert second["run_view"] == first["run_view"]
+
+        full = replay({"db_path": db_path, "run_id": run_id})
+        assert "checkpoint" not in full
+        assert full["run_view"] == second["run_view"]
+
+    def test_validates_only_new_events(self, tmp_path: Path) -> None:
+        """Events appended after a checkpoint are checked with the resumed state."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._start_run(db_path)
+
+        partial = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert [v["code"] for v in partial["violations"]] == ["NO_TERMINAL_EVENT"]
+        assert partial["checkpoint"]["last_seq"] == 2
+
+        self._finish_run(db_path, run_id)
+        resumed = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert resumed["ok"] is True
+        assert resumed["checkpoint"]["resumed_from_seq"] == 2
+        assert resumed["checkpoint"]["events_replayed"] == 4
+        assert resumed["run_view"]["steps"]["s1"]["started_seq"] == 2
+        assert resumed["run_view"] == replay({"db_path": db_path, "run_id": run_id})["run_view"]
+
+        # The rolling digest does not depend on how the events were batched
+        with EventStore(db_path) as store:
+            store.conn.execute("DELETE FROM replay_checkpoints")
+            store.conn.commit()
+        fresh = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert fresh["checkpoint"]["digest"] == resumed["checkpoint"]["digest"]
+
+    def test_violations_persist(self, tmp_path: Path) -> None:
+        """Violations found before the checkpoint are still reported after resuming."""
+        db_path = str(tmp_path / "test.db")
+        with EventStore(db_path) as store:
+            run_id = store.create_run(mode="dry_run", goal="bad")
+            store.append(run_id, E.RUN_STARTED, {"mode": "dry_run", "goal": "bad"})
+            store.append(run_id, E.STEP_COMPLETED, {"step_id": "ghost", "status": "ok"})
+
+        first = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        second = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert second["checkpoint"]["events_replayed"] == 0
+        assert second["violations"] == first["violations"]
+        assert "STEP_COMPLETED_WITHOUT_START" in {v["code"] for v in second["violations"]}
+
+    def test_stale_checkpoint_ignored(self, tmp_path: Path) -> None:
+        """A checkpoint whose tail event no longer matches is discarded."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._start_run(db_path)
+        replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+
+        with EventStore(db_path) as store:
+            store.conn.execute(
+                "UPDATE events SET event_id = 'replaced' WHERE run_id = ? AND seq = 2", (run_id,)
+            )
+            store.conn.commit()
+        response = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert response["checkpoint"]["resumed_from_seq"] is None
+        assert response["checkpoint"]["events_replayed"] == 3
+
+    def test_loading_does_not_create_schema(self, tmp_path: Path) -> None:
+        """Looking up a checkpoint leaves a database without one untouched."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._start_run(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            assert replay_mod._load_checkpoint(conn, run_id) is None
+            assert not replay_mod._table_exists(conn, "replay_checkpoints")
+        finally:
+            conn.close()
+        replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        with EventStore(db_path) as store:
+            assert store.conn.execute("SELECT COUNT(*) FROM replay_checkpoints").fetchone() == (1,)
+
+
+def _insert_events(db_path: str, events: list[tuple[int, str, dict[str, Any]]]) -> str:
+    """Create a run with raw (seq, type, payload) events, bypassing append()."""
+    with EventStore(db_path) as store:
+        run_id = store.create_run(mode="apply", goal="raw")
+        for seq, event_type, payload in events:
+            store.conn.execute(
+                "INSERT INTO events(event_id, run_id, seq, type, payload_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (f"{run_id}-{seq}", run_id, seq, event_type, json.dumps(payload)),
+            )
+        store.conn.commit()
+    return run_id
+
+
+_CALL = {"tool": "t", "method": "m", "args": {}}
+_FAST_PATH_CASES: dict[str, list[tuple[int, str, dict[str, Any]]]] = {
+    "clean": [
+        (0, E.RUN_STARTED, {"mode": "apply", "goal": "g"}),
+        (1, E.DISPATCH_SELECTED, {"adapter_id": "a"}),
+        (2, E.PLAN_CREATED, {"plan": []}),
+        (3, E.STEP_STARTED, {"step_id": "s1"}),
+        (4, E.TOOL_CALL_REQUESTED, {"step_id": "s1", "call": _CALL}),
+        (5, E.TOOL_CALL_FAILED, {"step_id": "s1"}),
+        (6, E.STEP_COMPLETED, {"step_id": "s1", "status": "error"}),
+        (7, E.PROVENANCE_EMITTED, {}),
+        (8, E.RUN_FAILED, {"outcome": "error"}),
+    ],
+    "empty": [],
+    "gaps_and_order": [
+        (1, E.PLAN_CREATED, {}),
+        (2, E.RUN_STARTED, {"mode": "dry_run", "goal": "late"}),
+        (5, E.TOOL_CALL_REQUESTED, {"step_id": "s9", "call": _CALL}),
+        (6, E.TOOL_CALL_SUCCEEDED, {"step_id": "s9"}),
+        (9, E.STEP_COMPLETED, {"step_id": "s9", "status": "ok"}),
+    ],
+    "negative_seq": [
+        (-1, E.RUN_STARTED, {"mode": "apply", "goal": "g"}),
+        (0, E.PLAN_CREATED, {}),
+        (1, E.RUN_COMPLETED, {}),
+    ],
+    "repeated_steps": [
+        (0, E.RUN_STARTED, {"mode": "apply", "goal": "g"}),
+        (1, E.PLAN_CREATED, {}),
+        (2, E.STEP_STARTED, {"step_id": "s1"}),
+        (3, E.STEP_COMPLETED, {"step_id": "s1", "status": "ok"}),
+        (4, E.TOOL_CALL_REQUESTED, {"step_id": "s1", "call": {"method": "late"}}),
+        (5, E.STEP_STARTED, {"step_id": "s1"}),
+        (6, E.STEP_STARTED, {}),
+        (7, E.TOOL_CALL_REQUESTED, {"call": {"method": "other"}}),
+        (8, E.STEP_COMPLETED, {"step_id": "s1", "status": "ok"}),
+        (9, E.RUN_STARTED, {"mode": "apply", "goal": "again"}),
+        (10, E.RUN_COMPLETED, {}),
+    ],
+}
+
+
+class TestReplayFastPath:
+    """The SQL fast path must match the Python path exactly."""
+
+    @pytest.mark.parametrize("case", sorted(_FAST_PATH_CASES))
+    def test_matches_python_path(self, tmp_path: Path, case: str) -> None:
+        """Same ok, run_view and ordered violations on each fixture."""
+        db_path = str(tmp_path / "test.db")
+        run_id = _insert_events(db_path, _FAST_PATH_CASES[case])
+        slow = replay({"db_path": db_path, "run_id": run_id})
+        fast = replay({"db_path": db_path, "run_id": run_id, "fast": True})
+        assert fast == slow
+
+    def test_matches_on_routed_runs(self, tmp_path: Path) -> None:
+        """Runs recorded by the router replay identically on both paths."""
+        db_path = str(tmp_path / "test.db")
+        for mode in ("dry_run", "apply"):
+            resp = run(
+                {
+                    "goal": mode,
+                    "mode": mode,
+                    "policy": {"allow_apply": True},
+                    "plan_override": [
+                        {
+                            "step_id": f"s{i}",
+                            "intent": "x",
+                            "call": {"tool": "t", "method": f"m{i % 2}", "args": {}},
+                        }
+                        for i in range(4)
+                    ],
+                },
+                db_path=db_path,
+            )
+            run_id = resp["run"]["run_id"]
+            slow = replay({"db_path": db_path, "run_id": run_id})
+            assert replay({"db_path": db_path, "run_id": run_id, "fast": True}) == slow
+
+    def test_incremental(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """fast=True with incremental reads the new rows once: same digest and view."""
+        db_path = str(tmp_path / "test.db")
+        # The rows fetched for the digest are checked in Python; no second SQL pass
+        monkeypatch.setattr(replay_mod, "_apply_events_sql", None)
+        events = _FAST_PATH_CASES["repeated_steps"]
+        run_id = _insert_events(db_path, events[:5])
+        replay({"db_path": db_path, "run_id": run_id, "incremental": True, "fast": True})
+        with EventStore(db_path) as store:
+            for seq, event_type, payload in events[5:]:
+                store.conn.execute(
+                    "INSERT INTO events(event_id, run_id, seq, type, payload_json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (f"{run_id}-{seq}", run_id, seq, event_type, json.dumps(payload)),
+                )
+            store.conn.commit()
+        fast = replay({"db_path": db_path, "run_id": run_id, "incremental": True, "fast": True})
+        assert fast["checkpoint"]["resumed_from_seq"] == 4
+        assert fast["checkpoint"]["events_replayed"] == 6
+
+        slow = replay({"db_path": db_path, "run_id": run_id})
+        assert fast["run_view"] == slow["run_view"]
+        assert fast["violations"] == slow["violations"]
+
+        with EventStore(db_path) as store:
+            store.conn.execute("DELETE FROM replay_checkpoints")
+            store.conn.commit()
+        fresh = replay({"db_path": db_path, "run_id": run_id, "incremental": True})
+        assert fresh["checkpoint"]["digest"] == fast["checkpoint"]["digest"]
+
+    def test_replay_all_fast(self, tmp_path: Path) -> None:
+        """replay_all(fast=True) reports the same as the Python path."""
+        db_path = str(tmp_path / "test.db")
+        for events in _FAST_PATH_CASES.values():
+            _insert_events(db_path, events)
+        slow = replay_all(db_path=db_path, workers=1)
+        fast = replay_all(db_path=db_path, workers=1, fast=True)
+        assert fast["violations_by_code"] == slow["violations_by_code"]
+        assert fast["failed_runs"] == slow["failed_runs"]
+
+
+class TestReplayUntilSeq:
+    """Point-in-time reconstruction backed by state snapshots."""
+
+    def _long_run(self, db_path: str, steps: int = 12) -> str:
+        with EventStore(db_path) as store:
+            run_id = store.create_run(mode="apply", goal="long")
+            store.append(run_id, E.RUN_STARTED, {"mode": "apply", "goal": "long"})
+            store.append(run_id, E.PLAN_CREATED, {"plan": []})
+            for i in range(steps):
+                step_id = f"s{i}"
+                store.append(run_id, E.STEP_STARTED, {"step_id": step_id})
+                store.append(
+                    run_id,
+                    E.TOOL_CALL_REQUESTED,
+                    {"step_id": step_id, "call": {"tool": "t", "method": f"m{i % 3}"}},
+                )
+                store.append(run_id, E.TOOL_CALL_SUCCEEDED, {"step_id": step_id})
+                store.append(run_id, E.STEP_COMPLETED, {"step_id": step_id, "status": "ok"})
+            store.append(run_id, E.RUN_COMPLETED, {"outcome": "ok"})
+            store.set_run_status(run_id, "COMPLETED")
+        return run_id  # 51 events for 12 steps
+
+    def _replay(self, db_path: str, run_id: str, **kwargs: Any) -> dict[str, Any]:
+        return replay({"db_path": db_path, "run_id": run_id, **kwargs})
+
+    def test_prefix_view(self, tmp_path: Path) -> None:
+        """The view as of seq N reflects only events up to N."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        response = self._replay(db_path, run_id, until_seq=9)
+        jsonschema.validate(response, REPLAY_RESPONSE_SCHEMA)
+        view = response["run_view"]
+        assert sorted(view["steps"]) == ["s0", "s1"]
+        assert view["steps"]["s1"]["completed_seq"] == 9
+        assert view["terminal_event_type"] is None
+        # Cut-off prefixes skip whole-run checks such as NO_TERMINAL_EVENT
+        assert response["ok"] is True
+        assert response["snapshot"] == {"until_seq": 9, "from_seq": None, "events_replayed": 10}
+
+    def test_matches_full_replay_at_end(self, tmp_path: Path) -> None:
+        """until_seq at or past the last event equals a full replay."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        full = self._replay(db_path, run_id)
+        for until_seq in (50, 10_000):
+            response = self._replay(db_path, run_id, until_seq=until_seq, snapshot_interval=8)
+            assert response["run_view"] == full["run_view"]
+            assert response["violations"] == full["violations"]
+
+    def test_starts_from_nearest_snapshot(self, tmp_path: Path) -> None:
+        """Snapshots written by one reconstruction shorten the next."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        first = self._replay(db_path, run_id, until_seq=45, snapshot_interval=10)
+        assert first["snapshot"]["from_seq"] is None
+
+        second = self._replay(db_path, run_id, until_seq=37, snapshot_interval=10)
+        assert second["snapshot"]["from_seq"] == 30
+        assert second["snapshot"]["events_replayed"] == 7
+
+        baseline = self._replay(db_path, run_id, until_seq=37, snapshot_interval=0)
+        assert baseline["snapshot"]["from_seq"] is None
+        assert second["run_view"] == baseline["run_view"]
+        assert second["violations"] == baseline["violations"]
+
+        fast = self._replay(db_path, run_id, until_seq=37, snapshot_interval=10, fast=True)
+        assert fast["run_view"] == baseline["run_view"]
+
+    def test_stale_snapshot_ignored(self, tmp_path: Path) -> None:
+        """A snapshot whose event no longer matches falls back to an earlier one."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        self._replay(db_path, run_id, until_seq=45, snapshot_interval=10)
+        with EventStore(db_path) as store:
+            store.conn.execute(
+                "UPDATE events SET event_id = 'replaced' WHERE run_id = ? AND seq = 40", (run_id,)
+            )
+            store.conn.commit()
+        response = self._replay(db_path, run_id, until_seq=45, snapshot_interval=10)
+        assert response["snapshot"]["from_seq"] == 30
+
+    def test_no_schema_without_snapshots(self, tmp_path: Path) -> None:
+        """A reconstruction that stores no snapshot does not create the table."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        self._replay(db_path, run_id, until_seq=5, snapshot_interval=10)
+        conn = sqlite3.connect(db_path)
+        try:
+            assert not replay_mod._table_exists(conn, "replay_snapshots")
+        finally:
+            conn.close()
+
+    def test_run_view_at(self, tmp_path: Path) -> None:
+        """run_view_at returns a RunView object, or None for unknown runs."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path)
+        view = run_view_at(db_path=db_path, run_id=run_id, seq=6)
+        assert view is not None
+        assert list(view.steps) == ["s0", "s1"]
+        assert view.steps["s1"].started_seq == 6
+        assert view.tools_used == ["m0"]
+        assert run_view_at(db_path=db_path, run_id="missing", seq=5) is None
+
+    def test_rejects_incremental(self, tmp_path: Path) -> None:
+        """until_seq and incremental are mutually exclusive."""
+        db_path = str(tmp_path / "test.db")
+        run_id = self._long_run(db_path, steps=1)
+        with pytest.raises(ValueError):
+            self._replay(db_path, run_id, until_seq=1, incremental=True)
@@ -0,0 +1,177 @@
+"""Tests for re-executing recorded runs (rerun harness)."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+from conftest import plan_request
+
+from nexus_router.dispatch import AdapterRegistry, FunctionAdapter
+from nexus_router.event_store import EventStore
+from nexus_router.rerun import rerun
+from nexus_router.synthetic_adapter import SyntheticAdapter
+from nexus_router.tool import run
+
+
+def _calc_request(steps: int = 3, mode: str = "apply") -> dict[str, Any]:
+    return plan_request([("calc", "double", {"x": i}) for i in range(steps)], mode=mode)
+
+
+def _function_adapter(factor: int = 2, sleep_s: float = 0.0) -> FunctionAdapter:
+    adapter = FunctionAdapter()
+
+    def double(args: dict[str, Any]) -> dict[str, Any]:
+        if sleep_s:
+            time.sleep(sleep_s)
+        return {"y": args["x"] * factor}
+
+    adapter.register("calc", "double", double)
+    return adapter
+
+
+def _record(tmp_path: Path, request: dict[str, Any], adapter: Any) -> tuple[str, str]:
+    db_path = str(tmp_path / "prod.db")
+    run_id = run(request, db_path=db_path, adapter=adapter)["run"]["run_id"]
+    return db_path, run_id
+
+
+class TestRerun:
+    """rerun() re-executes the recorded plan and diffs the results."""
+
+    def test_identical_outputs(self, tmp_path: Path) -> None:
+        """Same adapter behaviour: every output matches, nothing changes."""
+        db_path, run_id = _record(tmp_path, _calc_request(), _function_adapter())
+        report = rerun(db_path=db_path, run_id=run_id, adapter=_function_adapter())
+
+        assert report["ok"]
+        assert report["run_id"] == run_id
+        assert report["rerun_run_id"] != run_id
+        assert report["outcome"] == {"original": "ok", "rerun": "ok"}
+        assert [s["step_id"] for s in report["steps"]] == ["s0", "s1", "s2"]
+        assert all(s["output_match"] for s in report["steps"])
+        assert all(s["method"] == "double" for s in report["steps"])
+        summary = report["summary"]
+        assert summary["steps"] == 3
+        assert summary["outputs_matched"] == 3
+        assert summary["outputs_differed"] == 0
+        assert summary["status_changed"] == 0
+        assert summary["comparable_steps"] == 3
+
+    def test_adapter_id_ignored_in_output_match(self, tmp_path: Path) -> None:
+        """An adapter with a different id but identical output still matches."""
+        db_path, run_id = _record(tmp_path, _calc_request(), _function_adapter())
+        upgraded = FunctionAdapter("function-v2")
+        upgraded.register("calc", "double", lambda a: {"y": a["x"] * 2})
+        report = rerun(db_path=db_path, run_id=run_id, adapter=upgraded)
+
+        assert all(s["output_match"] for s in report["steps"])
+        assert report["summary"]["outputs_differed"] == 0
+
+    def test_changed_output_detected(self, tmp_path: Path) -> None:
+        """An adapter upgrade that changes results is reported per step."""
+        db_path, run_id = _record(tmp_path, _calc_request(), _function_adapter())
+        report = rerun(db_path=db_path, run_id=run_id, adapter=_function_adapter(factor=3))
+
+        by_step = {s["step_id"]: s for s in report["steps"]}
+        # x=0 doubles and triples to the same value
+        assert by_step["s0"]["output_match"]
+        assert not by_step["s1"]["output_match"]
+        assert report["summary"]["outputs_differed"] == 2
+
+    def test_durations_and_regression(self, tmp_path: Path) -> None:
+        """Per-step duration_ms is diffed; slower steps are flagged."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=2), _function_adapter())
+        report = rerun(db_path=db_path, run_id=run_id, adapter=_function_adapter(sleep_s=0.02))
+
+        for step in report["steps"]:
+            assert step["original"]["duration_ms"] is not None
+            assert step["rerun"]["duration_ms"] >= 20
+            assert step["duration_delta_ms"] > 0
+            assert step["regressed"]
+        summary = report["summary"]
+        assert summary["regressions"] == 2
+        assert summary["rerun_ms"] > summary["original_ms"]
+        assert summary["ratio"] is None or summary["ratio"] > 1
+
+    def test_tolerance(self, tmp_path: Path) -> None:
+        """Deltas within tolerance / min_delta_ms are not regressions."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=2), _function_adapter())
+        report = rerun(
+            db_path=db_path,
+            run_id=run_id,
+            adapter=_function_adapter(sleep_s=0.02),
+            min_delta_ms=1000.0,
+        )
+        assert report["summary"]["regressions"] == 0
+
+    def test_status_change(self, tmp_path: Path) -> None:
+        """A step that now fails is reported with its error code."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=1), _function_adapter())
+        report = rerun(db_path=db_path, run_id=run_id, adapter=SyntheticAdapter(error_rate=1.0))
+        (step,) = report["steps"]
+        assert step["status_changed"]
+        assert step["rerun"]["status"] == "error"
+        assert step["rerun"]["error_code"] == "SYNTHETIC_ERROR"
+        assert step["duration_delta_ms"] is None
+        assert not step["regressed"]
+        assert report["outcome"]["rerun"] == "error"
+
+    def test_dry_run_original_not_comparable(self, tmp_path: Path) -> None:
+        """Simulated originals have no latency baseline."""
+        db_path, run_id = _record(tmp_path, _calc_request(mode="dry_run"), _function_adapter())
+        report = rerun(db_path=db_path, run_id=run_id, adapter=_function_adapter())
+        assert all(s["original"]["simulated"] for s in report["steps"])
+        assert all(s["duration_delta_ms"] is None for s in report["steps"])
+        assert report["summary"]["comparable_steps"] == 0
+        assert report["summary"]["ratio"] is None
+
+    def test_recorded_policy_applied(self, tmp_path: Path) -> None:
+        """The recorded policy (max_steps) is honoured on rerun."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=2), _function_adapter())
+        with EventStore(db_path) as store:
+            started = store.read_events(run_id)[0]
+        assert started.payload["policy"] == {"allow_apply": True}
+
+        report = rerun(
+            db_path=db_path,
+            run_id=run_id,
+            adapter=_function_adapter(),
+            policy={"max_steps": 1},
+        )
+        assert report["outcome"]["rerun"] == "error"
+        # max_steps truncates the plan: the second step is never executed
+        assert report["steps"][0]["output_match"]
+        assert report["steps"][1]["rerun"] is None
+        assert report["steps"][1]["status_changed"]
+
+    def test_registry_reuses_adapter_id(self, tmp_path: Path) -> None:
+        """With a registry, the originally selected adapter is requested again."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=1), _function_adapter())
+        registry = AdapterRegistry(default_adapter_id="other")
+        registry.register(SyntheticAdapter(adapter_id="other"))
+        registry.register(_function_adapter())
+
+        report = rerun(db_path=db_path, run_id=run_id, adapters=registry)
+        assert report["ok"]
+        assert report["summary"]["outputs_matched"] == 1
+
+    def test_scratch_db(self, tmp_path: Path) -> None:
+        """The rerun is recorded in scratch_db_path, not the source database."""
+        db_path, run_id = _record(tmp_path, _calc_request(steps=1), _function_adapter())
+        scratch = str(tmp_path / "scratch.db")
+        report = rerun(
+            db_path=db_path, run_id=run_id, adapter=_function_adapter(), scratch_db_path=scratch
+        )
+        with EventStore(scratch) as store:
+            assert store.read_events(report["rerun_run_id"])
+        with EventStore(db_path) as store:
+            assert store.read_events(report["rerun_run_id"]) == []
+
+    def test_run_not_found(self, tmp_path: Path) -> None:
+        """Unknown run ids return RUN_NOT_FOUND."""
+        db_path, _ = _record(tmp_path, _calc_request(steps=1), _function_adapter())
+        report = rerun(db_path=db_path, run_id="missing", adapter=_function_adapter())
+        assert not report["ok"]
+        assert report["error"]["code"] == "RUN_NOT_FOUND"
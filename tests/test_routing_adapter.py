@@ -0,0 +1,178 @@
+"""Tests for RoutingAdapter (per-tool/method child dispatch)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.dispatch import (
+    CAPABILITY_APPLY,
+    AdapterRegistry,
+    FakeAdapter,
+    NullAdapter,
+)
+from nexus_router.event_store import EventStore
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.routing_adapter import RoutingAdapter
+from nexus_router.tool import run
+
+
+def _fake(adapter_id: str, **caps: Any) -> FakeAdapter:
+    adapter = FakeAdapter(adapter_id=adapter_id, **caps)
+    adapter.set_default_response(lambda t, m, a: {"served_by": adapter_id})
+    return adapter
+
+
+class TestRoutingResolution:
+    """Tests for route tables and precedence."""
+
+    def test_precedence(self) -> None:
+        """Exact beats tool beats wildcard."""
+        exact, by_tool, default = _fake("exact"), _fake("tool"), _fake("default")
+        adapter = RoutingAdapter(routes={"geo.lookup": exact, "geo": by_tool, "*": default})
+        assert adapter.resolve("geo", "lookup") is exact
+        assert adapter.resolve("geo", "other") is by_tool
+        assert adapter.resolve("fs", "read") is default
+
+    def test_tool_star_alias(self) -> None:
+        """'tool.*' is the same as 'tool'."""
+        child = _fake("c")
+        adapter = RoutingAdapter(routes={"geo.*": child})
+        assert adapter.resolve("geo", "anything") is child
+        assert adapter.resolve("fs", "read") is None
+
+    def test_duplicate_routes_rejected(self) -> None:
+        """Registering the same pattern twice raises ValueError."""
+        adapter = RoutingAdapter(routes={"geo": _fake("a")})
+        with pytest.raises(ValueError):
+            adapter.add_route("geo.*", _fake("b"))
+        with pytest.raises(ValueError):
+            adapter.add_route("", _fake("b"))
+
+    def test_capability_intersection(self) -> None:
+        """Capabilities are the intersection of distinct children."""
+        both = _fake("both")
+        apply_only = _fake("apply", capabilities=frozenset({CAPABILITY_APPLY}))
+        adapter = RoutingAdapter(routes={"a": both, "b": both, "c": apply_only})
+        assert adapter.capabilities == frozenset({CAPABILITY_APPLY})
+        assert len(adapter.children()) == 2
+        assert RoutingAdapter().capabilities == frozenset()
+
+    def test_no_route(self) -> None:
+        """Unmatched calls without '*' raise NO_ROUTE."""
+        adapter = RoutingAdapter(routes={"geo": _fake("geo")})
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("fs", "read", {})
+        assert exc_info.value.error_code == "NO_ROUTE"
+        assert adapter.last_call_adapter_id is None
+
+
+class TestRoutingCalls:
+    """Tests for delegation and telemetry pass-through."""
+
+    def test_delegates(self) -> None:
+        """Calls go to the resolved child."""
+        adapter = RoutingAdapter(routes={"geo": _fake("geo"), "*": _fake("rest")})
+        assert adapter.call("geo", "lookup", {}) == {"served_by": "geo"}
+        assert adapter.last_call_adapter_id == "geo"
+        assert adapter.call("fs", "read", {}) == {"served_by": "rest"}
+        assert adapter.last_call_adapter_id == "rest"
+
+    def test_passes_through_child_telemetry(self) -> None:
+        """last_call_resources / last_call_cache_hit come from the child."""
+
+        class _Telemetry(FakeAdapter):
+            @property
+            def last_call_resources(self) -> dict[str, Any]:
+                return {"stdout_bytes": 3}
+
+            @property
+            def last_call_cache_hit(self) -> bool:
+                return True
+
+        child = _Telemetry()
+        child.set_default_response({})
+        adapter = RoutingAdapter(routes={"*": child})
+        adapter.call("t", "m", {})
+        assert adapter.last_call_resources == {"stdout_bytes": 3}
+        assert adapter.last_call_cache_hit is True
+
+
+class TestRoutingAdapterRouter:
+    """One run covering a heterogeneous plan."""
+
+    def test_mixed_plan_single_run(self, tmp_path: Path) -> None:
+        """TOOL_CALL_* events record the concrete child adapter."""
+        db_path = str(tmp_path / "test.db")
+        geo, files = _fake("geo-http"), _fake("fs-subprocess")
+        files.set_operational_error("fs", "write", "read-only", error_code="TOOL_ERROR")
+        adapter = RoutingAdapter("mixed", routes={"geo": geo, "fs": files})
+        registry = AdapterRegistry(default_adapter_id="mixed")
+        registry.register(adapter)
+
+        resp = run(
+            {
+                "goal": "mixed plan",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "lookup",
+                        "call": {"tool": "geo", "method": "lookup", "args": {}},
+                    },
+                    {
+                        "step_id": "s2",
+                        "intent": "write",
+                        "call": {"tool": "fs", "method": "write", "args": {}},
+                    },
+                ],
+            },
+            db_path=db_path,
+            adapters=registry,
+        )
+        assert resp["results"][0]["output"]["served_by"] == "geo-http"
+        assert resp["results"][0]["output"]["adapter_id"] == "mixed"
+
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        by_type: dict[str, list[dict[str, Any]]] = {}
+        for e in events:
+            by_type.setdefault(e.type, []).append(e.payload)
+        assert [p["child_adapter_id"] for p in by_type["TOOL_CALL_REQUESTED"]] == [
+            "geo-http",
+            "fs-subprocess",
+        ]
+        assert by_type["TOOL_CALL_SUCCEEDED"][0]["child_adapter_id"] == "geo-http"
+        assert by_type["TOOL_CALL_FAILED"][0]["child_adapter_id"] == "fs-subprocess"
+        assert by_type["TOOL_CALL_FAILED"][0]["adapter_id"] == "mixed"
+
+    def test_plain_adapter_has_no_child_field(self, tmp_path: Path) -> None:
+        """Non-routing adapters produce no child_adapter_id."""
+        db_path = str(tmp_path / "test.db")
+        resp = run(
+            {
+                "goal": "plain",
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "x",
+                        "call": {"tool": "t", "method": "m", "args": {}},
+                    }
+                ],
+            },
+            db_path=db_path,
+            adapter=NullAdapter(),
+        )
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        requested = next(e for e in events if e.type == "TOOL_CALL_REQUESTED")
+        assert "child_adapter_id" not in requested.payload
@@ -11,6 +11,7 @@ import pytest
 
 from nexus_router.dispatch import (
     SubprocessAdapter,
+    _is_sensitive_key,
     default_redact_args,
     default_redact_text,
 )
@@ -900,3 +901,265 @@ class TestEnhancedJsonErrorDetails:
         head, tail = adapter._excerpt_head_tail(long_text, head=500, tail=200)
         assert head == "A" * 500
         assert tail == "C" * 200
+
+
+# =============================================================================
+# v1.2 Tests
+# =============================================================================
+
+
+class TestBoundedCapture:
+    """Tests for streaming stdout/stderr capture with hard byte caps (v1.2)."""
+
+    def test_invalid_byte_caps_raise(self) -> None:
+        """Non-positive byte caps are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            SubprocessAdapter([sys.executable, str(ECHO_TOOL)], max_stdout_bytes=0)
+
+    def test_stdout_over_cap_raises_output_too_large(self) -> None:
+        """stdout beyond max_stdout_bytes fails fast with OUTPUT_TOO_LARGE."""
+        adapter = SubprocessAdapter(
+            [sys.executable, str(ECHO_TOOL)],
+            adapter_id="echo-flood",
+            max_stdout_bytes=4096,
+        )
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("tool", "method", {"simulate_flood_stdout": 10_000_000})
+
+        details = exc_info.value.details
+        assert exc_info.value.error_code == "OUTPUT_TOO_LARGE"
+        assert details["stream"] == "stdout"
+        assert details["limit_bytes"] == 4096
+        assert details["bytes_read"] > 4096
+        assert "args_digest" in details
+
+    def test_stderr_over_cap_raises_output_too_large(self) -> None:
+        """stderr beyond max_stderr_bytes fails fast with OUTPUT_TOO_LARGE."""
+        adapter = SubprocessAdapter(
+            [sys.executable, str(ECHO_TOOL)],
+            adapter_id="echo-flood",
+            max_stderr_bytes=1024,
+        )
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("tool", "method", {"simulate_flood_stderr": 1_000_000})
+
+        assert exc_info.value.error_code == "OUTPUT_TOO_LARGE"
+        assert exc_info.value.details["stream"] == "stderr"
+
+    def test_output_within_cap_succeeds(self) -> None:
+        """Output under the caps parses normally."""
+        adapter = SubprocessAdapter(
+            [sys.executable, str(ECHO_TOOL)],
+            adapter_id="echo-flood",
+            max_stderr_bytes=4096,
+        )
+        result = adapter.call("tool", "method", {"simulate_flood_stderr": 1000})
+        assert result["success"] is True
+
+    def test_output_too_large_excerpt_is_truncated(self) -> None:
+        """Overflow excerpt respects max_stdout_chars."""
+        adapter = SubprocessAdapter(
+            [sys.executable, str(ECHO_TOOL)],
+            adapter_id="echo-flood",
+            max_stdout_bytes=4096,
+            max_stdout_chars=100,
+        )
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("tool", "method", {"simulate_flood_stdout": 100_000})
+
+        assert len(exc_info.value.details["excerpt"]) <= 140
+
+    def test_non_utf8_stdout_is_invalid_json(self) -> None:
+        """Undecodable stdout maps to INVALID_JSON_OUTPUT, not a bug."""
+        script = "import sys; sys.stdout.buffer.write(b'\\xff\\xfe\\x00{')"
+        adapter = SubprocessAdapter([sys.executable, "-c", script], adapter_id="bad-bytes")
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("tool", "method", {})
+
+        assert exc_info.value.error_code == "INVALID_JSON_OUTPUT"
+        assert exc_info.value.details["stdout_len"] == 4
+
+
+class TestSinglePassRedaction:
+    """Tests for the single-pass text / copy-on-write args redaction (v1.2)."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Authorization: Bearer abc.def", "Authorization: Bearer [REDACTED]"),
+            ("api_key=sk-1 api-key: 'xyz'", "api_key=[REDACTED] api-key: [REDACTED]"),
+            ("PASSWORD: hunter2", "PASSWORD=[REDACTED]"),
+            ("my_token=abc rest", "my_token=[REDACTED] rest"),
+            ("authorization=basic123", "authorization=[REDACTED]"),
+            ("cookie='a' secret=\"b\"", "cookie=[REDACTED] secret=[REDACTED]"),
+            ("nothing to see here", "nothing to see here"),
+        ],
+    )
+    def test_redact_text_cases(self, text: str, expected: str) -> None:
+        """Single pass produces the same output as the legacy four passes."""
+        assert default_redact_text(text) == expected
+
+    def test_bearer_value_after_key_is_consumed(self) -> None:
+        """A Bearer token used as a key value does not leak."""
+        for text in ("token=Bearer abc123", "api_key: Bearer abc123"):
+            assert "abc123" not in default_redact_text(text)
+
+    def test_redact_text_large_input(self) -> None:
+        """Secrets are found throughout multi-MB text."""
+        text = ("ok line\n" * 100_000 + "password=p1\n") * 3
+        redacted = default_redact_text(text)
+        assert "p1" not in redacted
+        assert redacted.count("password=[REDACTED]") == 3
+
+    def test_redact_args_returns_same_object_when_clean(self) -> None:
+        """Nothing sensitive: the original object is returned (no copy)."""
+        args = {"a": {"b": [1, {"c": 2}]}, "d": "x"}
+        assert default_redact_args(args) is args
+
+    def test_redact_args_copy_on_write(self) -> None:
+        """Only containers on the path to a secret are copied."""
+        clean = {"big": list(range(10))}
+        args = {"clean": clean, "nested": {"password": "p"}}
+        redacted = default_redact_args(args)
+        assert redacted is not args
+        assert redacted["clean"] is clean
+        assert redacted["nested"]["password"] == "[REDACTED]"
+        assert args["nested"]["password"] == "p"  # input untouched
+
+    def test_redact_args_list_copy_on_write(self) -> None:
+        """Lists are copied only when an element changes."""
+        args = {"items": [{"token": "t"}, {"name": "n"}]}
+        redacted = default_redact_args(args)
+        assert redacted["items"] is not args["items"]
+        assert redacted["items"][1] is args["items"][1]
+        assert args["items"][0]["token"] == "t"
+
+    def test_sensitive_key_results_are_cached(self) -> None:
+        """Per-key match results are memoized."""
+        _is_sensitive_key.cache_clear()
+        default_redact_args({"api_key": 1, "name": 2})
+        default_redact_args({"api_key": 1, "name": 2})
+        info = _is_sensitive_key.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+
+class TestResourceAccounting:
+    """Tests for per-call resource accounting (v1.2)."""
+
+    def test_resources_after_success(self) -> None:
+        """Successful call records byte counts (and rusage on POSIX)."""
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)], adapter_id="echo-res")
+        assert adapter.last_call_resources is None
+
+        adapter.call("tool", "method", {"simulate_stderr": "warn"})
+        res = adapter.last_call_resources
+
+        assert res is not None
+        assert res["stdout_bytes"] > 0
+        assert res["stderr_bytes"] == len("warn\n")
+        if hasattr(os, "wait4"):
+            assert res["user_cpu_ms"] >= 0
+            assert res["system_cpu_ms"] >= 0
+            assert res["max_rss_kb"] > 0
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="rusage requires os.wait4")
+    def test_cpu_bound_child_reports_user_time(self) -> None:
+        """CPU burn shows up as user CPU time."""
+        script = (
+            "import json, time\n"
+            "end = time.process_time() + 0.3\n"
+            "while time.process_time() < end: pass\n"
+            "print(json.dumps({'ok': True}))\n"
+        )
+        adapter = SubprocessAdapter([sys.executable, "-c", script], adapter_id="burn")
+        adapter.call("tool", "method", {})
+        res = adapter.last_call_resources
+        assert res is not None
+        assert res["user_cpu_ms"] + res["system_cpu_ms"] >= 250
+
+    def test_resources_after_failure(self) -> None:
+        """Failed calls still record resources."""
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)], adapter_id="echo-res")
+        with pytest.raises(NexusOperationalError):
+            adapter.call("tool", "method", {"simulate_exit_code": 1, "stderr_message": "boom"})
+        res = adapter.last_call_resources
+        assert res is not None
+        assert res["stderr_bytes"] == len("boom\n")
+
+    def test_resources_reset_when_spawn_fails(self) -> None:
+        """No process, no resources."""
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)], adapter_id="echo-res")
+        adapter.call("tool", "method", {})
+        adapter._base_cmd = ["nonexistent_command_12345"]
+        with pytest.raises(NexusOperationalError):
+            adapter.call("tool", "method", {})
+        assert adapter.last_call_resources is None
+
+    def test_resources_recorded_in_events(self, tmp_path: Path) -> None:
+        """Router records resources in TOOL_CALL_SUCCEEDED / TOOL_CALL_FAILED."""
+        from nexus_router.event_store import EventStore
+
+        db_path = str(tmp_path / "test.db")
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)], adapter_id="echo-res")
+        resp = run(
+            {
+                "goal": "resources",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "ok",
+                        "call": {"tool": "t", "method": "m", "args": {}},
+                    },
+                    {
+                        "step_id": "s2",
+                        "intent": "fail",
+                        "call": {"tool": "t", "method": "m", "args": {"simulate_exit_code": 2}},
+                    },
+                ],
+            },
+            db_path=db_path,
+            adapter=adapter,
+        )
+
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        succeeded = next(e for e in events if e.type == "TOOL_CALL_SUCCEEDED")
+        failed = next(e for e in events if e.type == "TOOL_CALL_FAILED")
+        assert succeeded.payload["resources"]["stdout_bytes"] > 0
+        assert "stderr_bytes" in failed.payload["resources"]
+
+    def test_adapters_without_accounting_omit_resources(self, tmp_path: Path) -> None:
+        """Adapters without last_call_resources produce no resources field."""
+        from nexus_router.dispatch import FakeAdapter
+        from nexus_router.event_store import EventStore
+
+        db_path = str(tmp_path / "test.db")
+        resp = run(
+            {
+                "goal": "no resources",
+                "mode": "apply",
+                "policy": {"allow_apply": True},
+                "plan_override": [
+                    {
+                        "step_id": "s1",
+                        "intent": "ok",
+                        "call": {"tool": "t", "method": "m", "args": {}},
+                    }
+                ],
+            },
+            db_path=db_path,
+            adapter=FakeAdapter(),
+        )
+        store = EventStore(db_path)
+        try:
+            events = store.read_events(resp["run"]["run_id"])
+        finally:
+            store.close()
+        succeeded = next(e for e in events if e.type == "TOOL_CALL_SUCCEEDED")
+        assert "resources" not in succeeded.payload
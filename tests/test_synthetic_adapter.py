@@ -0,0 +1,182 @@
+"""Tests for SyntheticAdapter and the nexus-router-loadgen script."""
+
+from __future__ import annotations
+
+import json
+import math
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from nexus_router.event_store import EventStore
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.loadgen import main, percentile, run_load
+from nexus_router.synthetic_adapter import SyntheticAdapter
+
+
+def _sample(adapter: SyntheticAdapter, n: int) -> list[float]:
+    return [adapter.sample_latency_ms()[0] for _ in range(n)]
+
+
+class TestSyntheticAdapterConfig:
+    """Identity and validation."""
+
+    def test_identity(self) -> None:
+        """Default id/kind and capabilities."""
+        adapter = SyntheticAdapter()
+        assert adapter.adapter_id == "synthetic"
+        assert adapter.adapter_kind == "synthetic"
+        assert adapter.capabilities == frozenset({"dry_run", "apply"})
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"latency_dist": "uniform"},
+            {"error_rate": 1.5},
+            {"spike_rate": -0.1},
+            {"latency_ms": -1},
+            {"output_bytes": -1},
+        ],
+    )
+    def test_invalid_config(self, kwargs: dict[str, object]) -> None:
+        """Bad distributions, rates and sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            SyntheticAdapter(**kwargs)  # type: ignore[arg-type]
+
+
+class TestSyntheticAdapterSampling:
+    """Latency distributions, spikes and errors."""
+
+    def test_fixed(self) -> None:
+        """Fixed distribution always returns latency_ms."""
+        assert set(_sample(SyntheticAdapter(latency_ms=5), 50)) == {5}
+
+    def test_normal(self) -> None:
+        """Normal distribution centers on latency_ms and never goes negative."""
+        samples = _sample(
+            SyntheticAdapter(latency_ms=10, latency_dist="normal", sigma=2, seed=1), 2000
+        )
+        assert statistics.mean(samples) == pytest.approx(10, abs=0.3)
+        assert min(samples) >= 0
+        wide = _sample(SyntheticAdapter(latency_ms=1, latency_dist="normal", sigma=5, seed=1), 200)
+        assert min(wide) == 0
+
+    def test_lognormal_median(self) -> None:
+        """Lognormal median is latency_ms with a long right tail."""
+        samples = _sample(
+            SyntheticAdapter(latency_ms=10, latency_dist="lognormal", sigma=0.5, seed=2), 4000
+        )
+        assert statistics.median(samples) == pytest.approx(10, rel=0.05)
+        assert statistics.mean(samples) > statistics.median(samples)
+        assert max(samples) > 10 * math.exp(1.0)
+
+    def test_seed_reproducible(self) -> None:
+        """The same seed yields the same sequence."""
+
+        def make() -> SyntheticAdapter:
+            return SyntheticAdapter(
+                latency_ms=3, latency_dist="lognormal", sigma=1, spike_rate=0.2, seed=7
+            )
+
+        assert _sample(make(), 100) == _sample(make(), 100)
+
+    def test_spikes(self) -> None:
+        """Spikes add spike_ms at roughly spike_rate."""
+        adapter = SyntheticAdapter(latency_ms=1, spike_rate=0.1, spike_ms=100, seed=3)
+        samples = _sample(adapter, 2000)
+        assert set(samples) == {1, 101}
+        assert adapter.stats()["spikes"] == samples.count(101)
+        assert 0.07 < adapter.stats()["spikes"] / 2000 < 0.13
+
+    def test_error_rate(self) -> None:
+        """Errors raise SYNTHETIC_ERROR at roughly error_rate."""
+        adapter = SyntheticAdapter(error_rate=0.25, seed=4)
+        failures = 0
+        for _ in range(1000):
+            try:
+                adapter.call("t", "m", {})
+            except NexusOperationalError as e:
+                assert e.error_code == "SYNTHETIC_ERROR"
+                failures += 1
+        assert failures == adapter.stats()["errors"]
+        assert 200 < failures < 300
+
+
+class TestSyntheticAdapterCall:
+    """Output size, latency and CPU burn."""
+
+    def test_output_bytes(self) -> None:
+        """output_bytes controls the payload size."""
+        output = SyntheticAdapter(output_bytes=4096).call("t", "m", {})
+        assert len(output["payload"]) == 4096
+        assert "payload" not in SyntheticAdapter().call("t", "m", {})
+
+    def test_sleeps_and_burns(self) -> None:
+        """Latency and CPU burn both take wall time; only CPU burn takes CPU time."""
+        adapter = SyntheticAdapter(latency_ms=20, cpu_burn_ms=30)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        adapter.call("t", "m", {})
+        burn_cpu = time.thread_time() - cpu
+        assert time.perf_counter() - wall >= 0.05
+        assert adapter.stats()["total_latency_ms"] == 50
+
+        # The burn loop runs to a wall-clock deadline, so on a loaded machine
+        # it may get little CPU; it still gets more than an equal sleep does.
+        cpu = time.thread_time()
+        SyntheticAdapter(latency_ms=50).call("t", "m", {})
+        sleep_cpu = time.thread_time() - cpu
+        assert burn_cpu > 0
+        assert burn_cpu > sleep_cpu
+
+    def test_no_call_log(self) -> None:
+        """Only counters are kept."""
+        adapter = SyntheticAdapter()
+        for i in range(100):
+            adapter.call("t", "m", {"i": i})
+        assert adapter.stats()["calls"] == 100
+        assert not hasattr(adapter, "call_log")
+
+
+class TestLoadgen:
+    """Load generator."""
+
+    def test_percentile(self) -> None:
+        """Nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_run_load_shared_db(self, tmp_path: Path) -> None:
+        """Concurrent runs against one SQLite file all land in the store."""
+        adapter = SyntheticAdapter(error_rate=0.1, seed=5)
+        report = run_load(
+            adapter, runs=20, concurrency=4, steps=3, db_path=str(tmp_path / "load.db")
+        )
+        assert report["runs"] == 20
+        assert report["adapter"]["calls"] == 60
+        assert report["step_errors"] == report["adapter"]["errors"]
+        latency = report["run_latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+        store = EventStore(str(tmp_path / "load.db"))
+        assert store.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 20
+
+    def test_main_prints_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """main() prints a JSON report and exits 0."""
+        code = main(["--runs", "6", "--concurrency", "2", "--steps", "2", "--latency-ms", "0"])
+        assert code == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["benchmark"] == "loadgen"
+        assert report["runs_per_s"] > 0
+        assert report["steps_per_s"] == pytest.approx(report["runs_per_s"] * 2, rel=0.01)
+
+    def test_main_rejects_bad_args(self) -> None:
+        """Invalid arguments exit via argparse."""
+        with pytest.raises(SystemExit):
+            main(["--runs", "0"])
+        with pytest.raises(SystemExit):
+            main(["--error-rate", "2"])
@@ -0,0 +1,259 @@
+"""Tests for tracing spans, exporters and trace propagation."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+import pytest
+from conftest import plan_request
+
+from nexus_router.dispatch import FunctionAdapter, SubprocessAdapter
+from nexus_router.event_store import EventStore
+from nexus_router.replay import replay
+from nexus_router.synthetic_adapter import SyntheticAdapter
+from nexus_router.tool import run
+from nexus_router.tracing import (
+    NOOP_TRACER,
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    Span,
+    Tracer,
+    current_traceparent,
+    get_tracer,
+    parse_traceparent,
+    set_tracer,
+)
+
+ECHO_TOOL = Path(__file__).parent / "fixtures" / "echo_tool.py"
+CALLER_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+CALLER_SPAN_ID = "00f067aa0ba902b7"
+CALLER_TRACEPARENT = f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-01"
+
+
+def _by_name(spans: list[Span], name: str) -> list[Span]:
+    return [s for s in spans if s.name == name]
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    try:
+        yield exporter
+    finally:
+        set_tracer(None)
+
+
+class TestTraceparent:
+    """W3C traceparent parsing."""
+
+    def test_parse(self) -> None:
+        """A valid header yields its trace and parent span ids."""
+        context = parse_traceparent(CALLER_TRACEPARENT)
+        assert context is not None
+        assert context.trace_id == CALLER_TRACE_ID
+        assert context.span_id == CALLER_SPAN_ID
+        assert context.traceparent == CALLER_TRACEPARENT
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "garbage",
+            f"01-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-01",
+            f"00-{'0' * 32}-{CALLER_SPAN_ID}-01",
+            f"00-{CALLER_TRACE_ID}-{'0' * 16}-01",
+        ],
+    )
+    def test_invalid(self, value: str | None) -> None:
+        """Malformed, unsupported-version and all-zero ids are ignored."""
+        assert parse_traceparent(value) is None
+
+
+class TestTracer:
+    """Span creation and exporters."""
+
+    def test_default_is_noop(self) -> None:
+        """Without set_tracer() spans are inert and nothing becomes current."""
+        assert get_tracer() is NOOP_TRACER
+        with get_tracer().start_span("x") as span:
+            assert span.trace_id is None
+            assert current_traceparent() is None
+
+    def test_nesting(self, exporter: InMemorySpanExporter) -> None:
+        """Entered spans become current and parent their children."""
+        tracer = get_tracer()
+        with tracer.start_span("outer") as outer:
+            assert current_traceparent() == outer.traceparent
+            with tracer.start_span("inner", {"k": 1}) as inner:
+                pass
+        assert current_traceparent() is None
+        assert [s.name for s in exporter.spans()] == ["inner", "outer"]
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id is None
+        assert len(outer.trace_id) == 32 and len(outer.span_id) == 16
+        assert outer.end_time_unix_nano is not None
+        assert outer.end_time_unix_nano >= inner.end_time_unix_nano  # type: ignore[operator]
+
+    def test_exception_marks_error(self, exporter: InMemorySpanExporter) -> None:
+        """An exception escaping a span sets ERROR status and propagates."""
+        with pytest.raises(RuntimeError), get_tracer().start_span("boom"):
+            raise RuntimeError("bad")
+        (span,) = exporter.spans()
+        assert span.status == "ERROR"
+        assert span.status_message == "RuntimeError: bad"
+
+    def test_exporter_failure_ignored(self) -> None:
+        """A failing exporter never breaks the traced code."""
+
+        class Broken:
+            def export(self, span: Span) -> None:
+                raise OSError("disk full")
+
+        with Tracer(Broken()).start_span("x"):
+            pass
+
+    def test_ring_buffer(self) -> None:
+        """InMemorySpanExporter keeps only the most recent spans."""
+        exporter = InMemorySpanExporter(max_spans=3)
+        tracer = Tracer(exporter)
+        for i in range(5):
+            tracer.start_span(f"s{i}").end()
+        assert [s.name for s in exporter.spans()] == ["s2", "s3", "s4"]
+        exporter.clear()
+        assert exporter.spans() == []
+
+    def test_jsonl_exporter(self, tmp_path: Path) -> None:
+        """JsonlSpanExporter writes one OTLP-shaped object per line."""
+        path = tmp_path / "spans.jsonl"
+        with JsonlSpanExporter(str(path)) as jsonl:
+            tracer = Tracer(jsonl, service_name="svc")
+            with tracer.start_span("a", {"n": 1}), tracer.start_span("b"):
+                pass
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [d["name"] for d in lines] == ["b", "a"]
+        assert lines[0]["parent_span_id"] == lines[1]["span_id"]
+        assert lines[1]["attributes"] == {"n": 1}
+        assert lines[1]["status"] == {"code": "OK", "message": None}
+        assert lines[1]["resource"] == {"service.name": "svc"}
+        assert lines[1]["duration_ms"] >= 0
+
+
+class TestRouterSpans:
+    """Spans emitted by Router.run."""
+
+    def test_span_tree(self, exporter: InMemorySpanExporter) -> None:
+        """run > step > adapter.call, with store appends and provenance."""
+        resp = run(plan_request(2), adapter=SyntheticAdapter())
+        spans = exporter.spans()
+
+        (run_span,) = _by_name(spans, "nexus_router.run")
+        assert run_span.parent_span_id is None
+        assert run_span.attributes["run_id"] == resp["run"]["run_id"]
+        assert run_span.attributes["mode"] == "apply"
+        assert {s.trace_id for s in spans} == {run_span.trace_id}
+
+        steps = _by_name(spans, "nexus_router.step")
+        assert [s.attributes["step_id"] for s in steps] == ["s0", "s1"]
+        assert all(s.parent_span_id == run_span.span_id for s in steps)
+        assert all(s.attributes["status"] == "ok" for s in steps)
+
+        calls = _by_name(spans, "nexus_router.adapter.call")
+        assert [c.parent_span_id for c in calls] == [s.span_id for s in steps]
+        assert calls[0].attributes["adapter_id"] == "synthetic"
+
+        appends = _by_name(spans, "nexus_router.store.append")
+        assert "RUN_STARTED" in {a.attributes["event_type"] for a in appends}
+        assert len(_by_name(spans, "nexus_router.provenance")) == 1
+
+    def test_trace_id_recorded(self, exporter: InMemorySpanExporter, tmp_path: Path) -> None:
+        """RUN_STARTED stores the trace id; replay still passes."""
+        db_path = str(tmp_path / "test.db")
+        run_id = run(plan_request(), db_path=db_path, adapter=SyntheticAdapter())["run"]["run_id"]
+        (run_span,) = _by_name(exporter.spans(), "nexus_router.run")
+        with EventStore(db_path) as store:
+            started = store.read_events(run_id)[0]
+        assert started.type == "RUN_STARTED"
+        assert started.payload["trace_id"] == run_span.trace_id
+        assert replay(db_path=db_path, run_id=run_id)["ok"]
+
+    def test_no_trace_id_when_disabled(self, tmp_path: Path) -> None:
+        """Without a tracer or traceparent RUN_STARTED is unchanged."""
+        db_path = str(tmp_path / "test.db")
+        run_id = run(plan_request(), db_path=db_path, adapter=SyntheticAdapter())["run"]["run_id"]
+        with EventStore(db_path) as store:
+            assert "trace_id" not in store.read_events(run_id)[0].payload
+
+    def test_joins_caller_trace(self, exporter: InMemorySpanExporter) -> None:
+        """An incoming traceparent parents the run span."""
+        run(plan_request(traceparent=CALLER_TRACEPARENT), adapter=SyntheticAdapter())
+        (run_span,) = _by_name(exporter.spans(), "nexus_router.run")
+        assert run_span.trace_id == CALLER_TRACE_ID
+        assert run_span.parent_span_id == CALLER_SPAN_ID
+
+    def test_traceparent_without_tracer(self, tmp_path: Path) -> None:
+        """The caller's trace id is recorded even when tracing is off."""
+        db_path = str(tmp_path / "test.db")
+        request = plan_request(traceparent=CALLER_TRACEPARENT)
+        run_id = run(request, db_path=db_path, adapter=SyntheticAdapter())["run"]["run_id"]
+        with EventStore(db_path) as store:
+            assert store.read_events(run_id)[0].payload["trace_id"] == CALLER_TRACE_ID
+
+    def test_invalid_traceparent_rejected(self) -> None:
+        """A malformed traceparent fails request validation."""
+        with pytest.raises(jsonschema.ValidationError):
+            run(plan_request(traceparent="nope"), adapter=SyntheticAdapter())
+
+    def test_adapter_error(self, exporter: InMemorySpanExporter) -> None:
+        """Failed calls mark the adapter.call span ERROR with the error code."""
+        run(plan_request(1), adapter=SyntheticAdapter(error_rate=1.0))
+        (call,) = _by_name(exporter.spans(), "nexus_router.adapter.call")
+        assert call.status == "ERROR"
+        assert call.attributes["error_code"] == "SYNTHETIC_ERROR"
+        (step,) = _by_name(exporter.spans(), "nexus_router.step")
+        assert step.attributes["status"] == "error"
+
+
+class TestPropagation:
+    """traceparent handed to tools."""
+
+    def test_subprocess_env(self, exporter: InMemorySpanExporter) -> None:
+        """SubprocessAdapter sets TRACEPARENT while a span is active."""
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)])
+        _, env = adapter._prepare_command("t", "m", "args.json")
+        assert env is None
+        with get_tracer().start_span("call") as span:
+            _, env = adapter._prepare_command("t", "m", "args.json")
+        assert env is not None
+        assert env["TRACEPARENT"] == span.traceparent
+
+    def test_function_adapter_pool_keeps_parent(self, exporter: InMemorySpanExporter) -> None:
+        """Offloaded FunctionAdapter calls run in the caller's context."""
+        seen: list[str | None] = []
+
+        def tool(args: dict[str, Any]) -> dict[str, Any]:
+            seen.append(current_traceparent())
+            with get_tracer().start_span("inside"):
+                return {}
+
+        with FunctionAdapter() as adapter:
+            adapter.register("t", "m", tool, offload=True)
+            with get_tracer().start_span("call") as outer:
+                adapter.call("t", "m", {})
+        (inside,) = _by_name(exporter.spans(), "inside")
+        assert seen == [outer.traceparent]
+        assert inside.parent_span_id == outer.span_id
+
+    def test_subprocess_call(self, exporter: InMemorySpanExporter) -> None:
+        """A real subprocess call still succeeds with the propagated env."""
+        adapter = SubprocessAdapter([sys.executable, str(ECHO_TOOL)])
+        with get_tracer().start_span("call"):
+            result = adapter.call("t", "echo", {"x": 1})
+        assert result is not None
@@ -0,0 +1,174 @@
+"""Tests for database-to-database run copy (copy_runs)."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from nexus_router.export import export_run
+from nexus_router.replay import replay
+from nexus_router.tool import run
+from nexus_router.transfer import copy_runs
+
+
+def _make_runs(db_path: str, count: int = 3) -> list[str]:
+    run_ids = []
+    for i in range(count):
+        request = {
+            "goal": f"copy {i}",
+            "mode": "dry_run",
+            "plan_override": [
+                {
+                    "step_id": "s1",
+                    "intent": "i",
+                    "call": {"tool": "t", "method": "m", "args": {"i": i, "text": "é\\n"}},
+                }
+            ],
+        }
+        run_ids.append(run(request, db_path=db_path)["run"]["run_id"])
+    return run_ids
+
+
+def _bundle(db_path: str, run_id: str) -> dict:
+    artifact = export_run(db_path=db_path, run_id=run_id, include_provenance=False)["artifact"]
+    artifact.pop("exported_at")
+    return artifact
+
+
+class TestCopyRuns:
+    """copy_runs() moves runs with ATTACH + INSERT ... SELECT."""
+
+    def test_copy_all(self, tmp_path: Path) -> None:
+        """All runs are copied byte-for-byte and replay cleanly."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        run_ids = _make_runs(src)
+
+        result = copy_runs(src_db=src, dst_db=dst)
+        assert result["ok"]
+        assert result["runs_copied"] == 3
+        assert result["run_ids"] == sorted(run_ids)
+        assert result["skipped"] == []
+        assert set(result["digests"]) == set(run_ids)
+        assert result["elapsed_ms"] >= 0
+        # The fingerprint depends only on the stored rows, not on the database
+        again = copy_runs(src_db=src, dst_db=str(tmp_path / "dst2.db"))
+        assert again["digests"] == result["digests"]
+        assert "digests" not in copy_runs(
+            src_db=src, dst_db=str(tmp_path / "dst3.db"), fingerprint=False
+        )
+
+        conn = sqlite3.connect(dst)
+        (events,) = conn.execute("SELECT COUNT(*) FROM events").fetchone()
+        conn.close()
+        assert result["events_copied"] == events
+        for run_id in run_ids:
+            assert _bundle(dst, run_id) == _bundle(src, run_id)
+            assert replay(db_path=dst, run_id=run_id)["ok"]
+
+    def test_filters(self, tmp_path: Path) -> None:
+        """run_ids and status narrow the selection; unknown ids are ignored."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        run_ids = _make_runs(src)
+
+        result = copy_runs(src_db=src, dst_db=dst, run_ids=[run_ids[0], "missing"])
+        assert result["run_ids"] == [run_ids[0]]
+
+        assert copy_runs(src_db=src, dst_db=dst, status="FAILED")["runs_copied"] == 0
+
+    def test_reject_on_conflict(self, tmp_path: Path) -> None:
+        """Runs already in the destination are skipped and left untouched."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        run_ids = _make_runs(src)
+        copy_runs(src_db=src, dst_db=dst, run_ids=run_ids[:1])
+
+        result = copy_runs(src_db=src, dst_db=dst)
+        assert result["ok"]
+        assert result["skipped"] == [run_ids[0]]
+        assert result["runs_copied"] == 2
+
+    def test_overwrite(self, tmp_path: Path) -> None:
+        """overwrite replaces destination runs with the source copy."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        (run_id,) = _make_runs(src, 1)
+        copy_runs(src_db=src, dst_db=dst)
+        conn = sqlite3.connect(dst)
+        conn.execute("UPDATE runs SET goal = 'changed' WHERE run_id = ?", (run_id,))
+        conn.commit()
+        conn.close()
+
+        result = copy_runs(src_db=src, dst_db=dst, conflict_mode="overwrite")
+        assert result["runs_copied"] == 1
+        assert _bundle(dst, run_id) == _bundle(src, run_id)
+
+    def test_event_conflict_rolls_back(self, tmp_path: Path) -> None:
+        """A failing insert leaves the destination unchanged."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        run_ids = _make_runs(src, 2)
+        copy_runs(src_db=src, dst_db=dst, run_ids=run_ids[:1])
+        # Same event ids under a different run id
+        conn = sqlite3.connect(dst)
+        conn.execute("UPDATE runs SET run_id = 'other' WHERE run_id = ?", (run_ids[0],))
+        conn.execute("UPDATE events SET run_id = 'other'")
+        conn.commit()
+        conn.close()
+
+        result = copy_runs(src_db=src, dst_db=dst)
+        assert not result["ok"]
+        assert result["error"]["code"] == "EVENT_CONFLICT"
+        conn = sqlite3.connect(dst)
+        assert conn.execute("SELECT run_id FROM runs").fetchall() == [("other",)]
+        conn.close()
+
+    def test_source_with_active_writer(self, tmp_path: Path) -> None:
+        """The source is only read: a write transaction on it does not block the copy."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        run_ids = _make_runs(src, 2)
+        writer = sqlite3.connect(src, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            result = copy_runs(src_db=src, dst_db=dst, timeout_s=0.5)
+            # ...and the copy does not hold the source's write lock afterwards either
+            writer.execute("DELETE FROM events WHERE 0")
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        assert result["ok"], result
+        assert result["run_ids"] == sorted(run_ids)
+
+    def test_destination_locked(self, tmp_path: Path) -> None:
+        """A write-locked destination is reported as an error, not raised."""
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        _make_runs(src, 1)
+        copy_runs(src_db=src, dst_db=dst, run_ids=[])  # Create the schema
+        writer = sqlite3.connect(dst, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            result = copy_runs(src_db=src, dst_db=dst, timeout_s=0.1)
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        assert result["ok"] is False
+        assert result["error"]["code"] == "DATABASE_ERROR"
+        assert "locked" in result["error"]["message"]
+        conn = sqlite3.connect(dst)
+        assert conn.execute("SELECT COUNT(*) FROM runs").fetchone() == (0,)
+        conn.close()
+
+    def test_source_not_found(self, tmp_path: Path) -> None:
+        """A missing source is an error, not an empty copy."""
+        result = copy_runs(src_db=str(tmp_path / "nope.db"), dst_db=str(tmp_path / "dst.db"))
+        assert result["error"]["code"] == "SOURCE_NOT_FOUND"
+        assert not (tmp_path / "nope.db").exists()
+
+    def test_same_database(self, tmp_path: Path) -> None:
+        """Copying a database onto itself is refused."""
+        src = str(tmp_path / "src.db")
+        _make_runs(src, 1)
+        assert copy_runs(src_db=src, dst_db=src)["error"]["code"] == "SAME_DATABASE"
+
+    def test_invalid_conflict_mode(self, tmp_path: Path) -> None:
+        """new_run_id needs payload remapping and is not supported."""
+        with pytest.raises(ValueError):
+            copy_runs(src_db="a.db", dst_db="b.db", conflict_mode="new_run_id")
@@ -0,0 +1,324 @@
+"""Tests for UnixSocketAdapter (length-prefixed JSON over a Unix socket)."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import shutil
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus_router.dispatch import AdapterRegistry
+from nexus_router.exceptions import NexusOperationalError
+from nexus_router.tool import run
+from nexus_router.unix_socket_adapter import UnixSocketAdapter, encode_frame
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+
+
+class _DaemonHandler(socketserver.BaseRequestHandler):
+    """Stand-in tool daemon. Each request is served on its own thread, so
+    responses can come back out of order."""
+
+    def handle(self) -> None:
+        write_lock = threading.Lock()
+        sock: socket.socket = self.request
+        while True:
+            header = self._recv(sock, 4)
+            if header is None:
+                return
+            body = self._recv(sock, struct.unpack(">I", header)[0]) or b""
+            request = json.loads(body)
+            if request["method"] == "crash":
+                sock.shutdown(socket.SHUT_RDWR)
+                return
+            threading.Thread(
+                target=self._respond, args=(sock, write_lock, request), daemon=True
+            ).start()
+
+    def _respond(self, sock: socket.socket, lock: threading.Lock, request: dict[str, Any]) -> None:
+        method, args, req_id = request["method"], request["args"], request["id"]
+        if method == "sleep":
+            time.sleep(args["s"])
+        if method == "fail":
+            frame = encode_frame(
+                {"id": req_id, "error": {"code": "E_BAD", "message": "token=abc123 bad"}}
+            )
+        elif method == "list":
+            frame = encode_frame({"id": req_id, "result": [1, 2]})  # type: ignore[dict-item]
+        elif method == "big":
+            frame = encode_frame({"id": req_id, "result": {"blob": "x" * 10_000}})
+        elif method == "badid":
+            frame = encode_frame({"id": [req_id], "result": {}})
+        else:
+            frame = encode_frame({"id": req_id, "result": {"echo": args, "tool": request["tool"]}})
+        with lock, contextlib.suppress(OSError):
+            sock.sendall(frame)
+
+    @staticmethod
+    def _recv(sock: socket.socket, n: int) -> bytes | None:
+        buf = b""
+        while len(buf) < n:
+            chunk = sock.recv(n - len(buf))
+            if not chunk:
+                return None
+            buf += chunk
+        return buf
+
+
+class _Daemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, _DaemonHandler)
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        Path(str(self.server_address)).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def sock_path() -> Iterator[str]:
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    d = tempfile.mkdtemp(prefix="nx")
+    try:
+        yield str(Path(d) / "tool.sock")
+    finally:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(sock_path: str) -> Iterator[_Daemon]:
+    srv = _Daemon(sock_path)
+    try:
+        yield srv
+    finally:
+        srv.stop()
+
+
+class TestUnixSocketAdapterBasics:
+    """Identity and config tests."""
+
+    def test_identity(self, sock_path: str) -> None:
+        """Default id derives from the socket path."""
+        adapter = UnixSocketAdapter(sock_path)
+        assert adapter.adapter_id == f"unix:{sock_path}"
+        assert adapter.adapter_kind == "unix_socket"
+        assert adapter.capabilities == frozenset({"apply", "timeout", "external"})
+
+    def test_invalid_config(self, sock_path: str) -> None:
+        """Non-positive limits raise ValueError."""
+        with pytest.raises(ValueError):
+            UnixSocketAdapter(sock_path, reconnect_attempts=0)
+        with pytest.raises(ValueError):
+            UnixSocketAdapter(sock_path, max_frame_bytes=0)
+
+    def test_frame_encoding(self) -> None:
+        """Frames are a big-endian length followed by JSON."""
+        frame = encode_frame({"id": 1})
+        assert struct.unpack(">I", frame[:4])[0] == len(frame) - 4
+        assert json.loads(frame[4:]) == {"id": 1}
+
+
+class TestUnixSocketAdapterCalls:
+    """Tests for call() success, multiplexing and error mapping."""
+
+    def test_success(self, daemon: _Daemon, sock_path: str) -> None:
+        """Calls return the result object."""
+        with UnixSocketAdapter(sock_path) as adapter:
+            assert adapter.call("t", "m", {"x": 1}) == {"echo": {"x": 1}, "tool": "t"}
+
+    def test_persistent_connection(self, daemon: _Daemon, sock_path: str) -> None:
+        """Sequential calls share one connection."""
+        with UnixSocketAdapter(sock_path) as adapter:
+            for i in range(5):
+                adapter.call("t", "m", {"i": i})
+            assert adapter.connects == 1
+
+    def test_multiplexed_out_of_order(self, daemon: _Daemon, sock_path: str) -> None:
+        """Concurrent calls on one connection are matched by request id."""
+        results: dict[int, dict[str, Any]] = {}
+        delays = [0.3, 0.2, 0.1, 0.0]
+        with UnixSocketAdapter(sock_path) as adapter:
+
+            def worker(i: int) -> None:
+                results[i] = adapter.call("t", "sleep", {"s": delays[i], "i": i})
+
+            start = time.monotonic()
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(delays))]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.monotonic() - start
+            assert adapter.connects == 1
+        assert {i: r["echo"]["i"] for i, r in results.items()} == {0: 0, 1: 1, 2: 2, 3: 3}
+        assert elapsed < sum(delays)
+
+    def test_timeout(self, daemon: _Daemon, sock_path: str) -> None:
+        """Slow responses -> TIMEOUT; the connection stays usable."""
+        with UnixSocketAdapter(sock_path, timeout_s=0.1) as adapter:
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "sleep", {"s": 0.5})
+            assert exc_info.value.error_code == "TIMEOUT"
+            assert "args_digest" in exc_info.value.details
+            assert adapter.call("t", "m", {})["tool"] == "t"
+            assert adapter.connects == 1
+
+    def test_tool_error_redacted(self, daemon: _Daemon, sock_path: str) -> None:
+        """Daemon errors -> TOOL_ERROR with remote code and redacted message."""
+        with (
+            UnixSocketAdapter(sock_path) as adapter,
+            pytest.raises(NexusOperationalError) as exc_info,
+        ):
+            adapter.call("t", "fail", {})
+        details = exc_info.value.details
+        assert exc_info.value.error_code == "TOOL_ERROR"
+        assert details["remote_code"] == "E_BAD"
+        assert "abc123" not in details["message"]
+
+    def test_non_object_result(self, daemon: _Daemon, sock_path: str) -> None:
+        """Non-object result -> INVALID_JSON."""
+        with (
+            UnixSocketAdapter(sock_path) as adapter,
+            pytest.raises(NexusOperationalError) as exc_info,
+        ):
+            adapter.call("t", "list", {})
+        assert exc_info.value.error_code == "INVALID_JSON"
+
+    def test_frame_too_large(self, daemon: _Daemon, sock_path: str) -> None:
+        """Oversized frames -> OUTPUT_TOO_LARGE; next call reconnects."""
+        with UnixSocketAdapter(sock_path, max_frame_bytes=1024) as adapter:
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "big", {})
+            assert exc_info.value.error_code == "OUTPUT_TOO_LARGE"
+            assert exc_info.value.details["limit_bytes"] == 1024
+            assert adapter.call("t", "m", {})["tool"] == "t"
+            assert adapter.connects == 2
+
+    def test_unhashable_id(self, daemon: _Daemon, sock_path: str) -> None:
+        """A non-int response id -> PROTOCOL_ERROR at once, not a hung reader."""
+        with UnixSocketAdapter(sock_path, timeout_s=5) as adapter:
+            start = time.monotonic()
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "badid", {})
+            assert exc_info.value.error_code == "PROTOCOL_ERROR"
+            assert time.monotonic() - start < 2
+            assert adapter.call("t", "m", {})["tool"] == "t"
+            assert adapter.connects == 2
+
+    def test_connection_lost_then_reconnect(self, daemon: _Daemon, sock_path: str) -> None:
+        """A dropped connection fails calls in flight; the next call reconnects."""
+        with UnixSocketAdapter(sock_path) as adapter:
+            with pytest.raises(NexusOperationalError) as exc_info:
+                adapter.call("t", "crash", {})
+            assert exc_info.value.error_code == "CONNECTION_FAILED"
+            assert adapter.call("t", "m", {})["tool"] == "t"
+            assert adapter.connects == 2
+
+    def test_daemon_restart(self, sock_path: str) -> None:
+        """Calls succeed against a restarted daemon on the same path."""
+        first = _Daemon(sock_path)
+        adapter = UnixSocketAdapter(sock_path)
+        try:
+            adapter.call("t", "m", {})
+        finally:
+            first.stop()
+        second = _Daemon(sock_path)
+        try:
+            # The old connection may or may not have noticed the close yet
+            try:
+                adapter.call("t", "m", {})
+            except NexusOperationalError as e:
+                assert e.error_code == "CONNECTION_FAILED"
+            assert adapter.call("t", "m", {"again": 1})["echo"] == {"again": 1}
+        finally:
+            adapter.close()
+            second.stop()
+
+    def test_send_bounded_when_daemon_stops_reading(self, sock_path: str) -> None:
+        """A daemon that accepts but never reads cannot block send past timeout_s."""
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(sock_path)
+        listener.listen(1)
+        accepted: list[socket.socket] = []
+        threading.Thread(target=lambda: accepted.append(listener.accept()[0]), daemon=True).start()
+        blob = {"blob": "x" * (8 * 1024 * 1024)}  # Far beyond the socket buffer
+        errors: list[str] = []
+
+        def call() -> None:
+            try:
+                adapter.call("t", "m", blob)
+            except NexusOperationalError as e:
+                errors.append(e.error_code)
+
+        adapter = UnixSocketAdapter(sock_path, timeout_s=0.3)
+        try:
+            start = time.monotonic()
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+            elapsed = time.monotonic() - start
+        finally:
+            adapter.close()
+            for conn in accepted:
+                conn.close()
+            listener.close()
+        assert not any(t.is_alive() for t in threads)
+        assert elapsed < 2
+        assert "TIMEOUT" in errors
+        assert len(errors) == 3
+
+    def test_connect_failure(self, sock_path: str) -> None:
+        """No daemon -> CONNECTION_FAILED after all attempts."""
+        adapter = UnixSocketAdapter(sock_path, reconnect_attempts=2, reconnect_backoff_s=0.01)
+        with pytest.raises(NexusOperationalError) as exc_info:
+            adapter.call("t", "m", {})
+        assert exc_info.value.error_code == "CONNECTION_FAILED"
+        assert exc_info.value.details["attempts"] == 2
+
+
+class TestUnixSocketAdapterRouter:
+    """Integration with AdapterRegistry and the router."""
+
+    def test_registry_apply_mode(self, daemon: _Daemon, sock_path: str, tmp_path: Path) -> None:
+        """Registered adapter serves apply-mode runs."""
+        adapter = UnixSocketAdapter(sock_path, adapter_id="sidecar")
+        registry = AdapterRegistry(default_adapter_id="sidecar")
+        registry.register(adapter)
+        try:
+            resp = run(
+                {
+                    "goal": "unix socket adapter",
+                    "mode": "apply",
+                    "policy": {"allow_apply": True},
+                    "plan_override": [
+                        {
+                            "step_id": "s1",
+                            "intent": "echo",
+                            "call": {"tool": "t", "method": "m", "args": {"x": 1}},
+                        }
+                    ],
+                },
+                db_path=str(tmp_path / "test.db"),
+                adapters=registry,
+            )
+        finally:
+            adapter.close()
+        assert resp["results"][0]["status"] == "ok"
+        assert resp["results"][0]["output"]["echo"] == {"x": 1}
+        assert resp["dispatch"]["adapter_kind"] == "unix_socket"